@@ -0,0 +1,85 @@
+import numpy as np
+
+
+def lu_factor(B):
+    """
+    Factorisation LU avec pivot partiel : P B = L U.
+    L (diagonale unité) et U sont stockés dans une seule matrice, `perm` décrit P.
+    """
+    lu = np.array(B, dtype=np.float64, copy=True)
+    m = lu.shape[0]
+    perm = np.arange(m)
+    for k in range(m):
+        p = k + int(np.argmax(np.abs(lu[k:, k])))
+        if abs(lu[p, k]) < 1e-12:
+            raise np.linalg.LinAlgError("Matrice de base singulière")
+        if p != k:
+            lu[[k, p]] = lu[[p, k]]
+            perm[[k, p]] = perm[[p, k]]
+        lu[k + 1:, k] /= lu[k, k]
+        lu[k + 1:, k + 1:] -= np.outer(lu[k + 1:, k], lu[k, k + 1:])
+    return lu, perm
+
+
+def lu_solve(factor, b, trans: bool = False):
+    """Résout B x = b (ou B^T x = b si `trans`) à partir de la sortie de lu_factor"""
+    lu, perm = factor
+    m = lu.shape[0]
+    if not trans:
+        x = np.asarray(b, dtype=np.float64)[perm].copy()
+        for i in range(1, m):
+            x[i] -= lu[i, :i] @ x[:i]
+        for i in range(m - 1, -1, -1):
+            x[i] = (x[i] - lu[i, i + 1:] @ x[i + 1:]) / lu[i, i]
+        return x
+
+    # B^T = U^T L^T P : on résout U^T z = b, puis L^T w = z, puis x = P^T w
+    z = np.array(b, dtype=np.float64, copy=True)
+    for i in range(m):
+        z[i] = (z[i] - lu[:i, i] @ z[:i]) / lu[i, i]
+    for i in range(m - 2, -1, -1):
+        z[i] -= lu[i + 1:, i] @ z[i + 1:]
+    x = np.empty(m)
+    x[perm] = z
+    return x
+
+
+class BasisFactorization:
+    """
+    Inverse de base sous forme produit : B^-1 = E_k ... E_1 (L U)^-1.
+    Chaque changement de base ajoute une matrice êta ; au-delà de
+    `refactor_every` mises à jour, la base doit être refactorisée.
+    """
+
+    def __init__(self, B, refactor_every: int = 50):
+        self.refactor_every = refactor_every
+        self.refactor(B)
+
+    def refactor(self, B) -> None:
+        """Recalcule la factorisation LU de la base et vide le fichier êta"""
+        self.factor = lu_factor(B)
+        self.etas = []
+
+    @property
+    def needs_refactor(self) -> bool:
+        return len(self.etas) >= self.refactor_every
+
+    def ftran(self, a):
+        """Calcule B^-1 a"""
+        x = lu_solve(self.factor, a)
+        for r, d in self.etas:
+            xr = x[r] / d[r]
+            x -= xr * d
+            x[r] = xr
+        return x
+
+    def btran(self, c):
+        """Calcule B^-T c (ligne c^T B^-1)"""
+        w = np.array(c, dtype=np.float64, copy=True)
+        for r, d in reversed(self.etas):
+            w[r] = (w[r] - (w @ d - w[r] * d[r])) / d[r]
+        return lu_solve(self.factor, w, trans=True)
+
+    def update(self, row: int, direction) -> None:
+        """Enregistre le pivot (ligne `row`, colonne B^-1 a_q = `direction`)"""
+        self.etas.append((row, np.array(direction, dtype=np.float64, copy=True)))
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Résolution en lot, non interactive.
+
+Lit des problèmes au format de VariableManager.save_to_file (un fichier .json
+par problème dans un répertoire, ou une ligne JSON par problème dans un .jsonl),
+les résout en parallèle dans un ProcessPoolExecutor et écrit un résultat JSON
+par ligne, dans l'ordre d'entrée ou dans l'ordre de fin de calcul.
+
+    python batch_solve.py problemes/ -o resultats.jsonl
+    python batch_solve.py problemes.jsonl -o resultats.jsonl --order completion
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from bounded_method import bounds_as_constraints
+from method_selection import METHODS, select_method
+from sparse_problem import SparseProblem
+from problem import Problem
+from presolve import Presolve
+from scaling import solve_scaled
+
+
+def suggest_method(problem) -> str:
+    """Méthode suggérée pour un problème (clé de METHODS), voir method_selection.select_method"""
+    return select_method(problem).key
+
+
+def problem_from_record(record: dict):
+    """
+    Problème contenu dans un enregistrement JSON (format dense, creux ou dictionnaire brut).
+    Un problème dense est validé une fois (Problem) puis figé pour être partagé sans copie.
+    """
+    if "sparse" in record:
+        return SparseProblem.from_json_dict(record["sparse"])
+    return Problem.from_json_dict(record).freeze()
+
+
+def iter_records(source: str):
+    """
+    Parcourt les problèmes un par un, sans jamais tout charger en mémoire.
+    Renvoie des couples (origine, enregistrement JSON).
+    """
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            path = os.path.join(source, name)
+            if name.endswith(".json") and os.path.isfile(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    yield path, json.load(f)
+        return
+
+    with open(source, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if line.strip():
+                yield f"{source}:{line_number}", json.loads(line)
+
+
+def solve_record(index: int, origin: str, record: dict, method: str = None, presolve: bool = False,
+                 scale: bool = False, time_limit: float = None, max_iterations: int = None) -> dict:
+    """Résout un enregistrement (exécuté dans un processus du pool, sans sortie console)"""
+    try:
+        problem = problem_from_record(record)
+        selection = None if method else select_method(problem)
+        key = method or selection.key
+        options = dict({} if method else selection.options)
+        if time_limit is not None:
+            options["time_limit"] = time_limit
+        if max_iterations is not None and key != "8":
+            # Pour les points intérieurs, max_iterations borne déjà la méthode de Newton
+            options["max_iterations"] = max_iterations
+        dense = not isinstance(problem, SparseProblem)
+        if dense and key != "7" and problem.get("bounds") is not None:
+            # Les autres méthodes ne connaissent que x >= 0 : les bornes deviennent des lignes
+            problem = bounds_as_constraints(problem)
+
+        def solve(variables):
+            if scale and dense:
+                return solve_scaled(variables, METHODS[key][1], **options)
+            return METHODS[key][1](variables, **options).solve()
+
+        if presolve and dense and problem.get("bounds") is None:
+            reduction = Presolve(problem)
+            reduced = reduction.run()
+            result = reduction.postsolve(None if reduced is None else solve(reduced))
+        else:
+            result = solve(problem)
+        solved = {"index": index, "source": origin, **result.to_dict()}
+        if selection is not None:
+            # Méthode choisie automatiquement : les raisons accompagnent le résultat
+            solved["selection"] = selection.reasons
+        return solved
+    except Exception as e:
+        return {"index": index, "source": origin, "method": None, "status": "error", "error": str(e)}
+
+
+def batch_solve(source: str, output, workers: int = None, order: str = "input",
+                method: str = None, max_pending: int = None, presolve: bool = False,
+                scale: bool = False, time_limit: float = None, max_iterations: int = None) -> dict:
+    """
+    Résout tous les problèmes de `source` et écrit une ligne JSON par résultat dans `output`.
+
+    order : "input" (ordre des problèmes) ou "completion" (ordre de fin de calcul)
+    method : clé de METHODS pour forcer une méthode, sinon choix automatique (select_method)
+    max_pending : nombre maximal de problèmes en vol (soumis ou en attente d'écriture),
+                  ce qui borne la mémoire quel que soit le nombre de problèmes
+    presolve : réduire chaque problème (format dense) avant de le résoudre
+    scale : mettre à l'échelle lignes et colonnes (format dense) avant de résoudre
+    time_limit, max_iterations : budget de chaque résolution ; un problème qui le dépasse
+                                 est écrit avec le statut "limit_reached" et sa dernière base
+    Renvoie le nombre de résultats par statut.
+    """
+    if order not in ("input", "completion"):
+        raise ValueError(f"Ordre inconnu: {order}")
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 4 * workers
+    counts = {}
+    pending = set()
+    finished = {}  # Résultats arrivés avant leur tour (ordre d'entrée uniquement)
+    next_index = 0
+
+    def write(result):
+        output.write(json.dumps(result, ensure_ascii=False) + "\n")
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+
+    def collect(block):
+        nonlocal next_index
+        done, _ = wait(pending, return_when=FIRST_COMPLETED) if block else (
+            {f for f in pending if f.done()}, None)
+        for future in done:
+            pending.discard(future)
+            result = future.result()
+            if order == "completion":
+                write(result)
+            else:
+                finished[result["index"]] = result
+        while next_index in finished:
+            write(finished.pop(next_index))
+            next_index += 1
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for index, (origin, record) in enumerate(iter_records(source)):
+            # En ordre d'entrée, un problème lent en tête retient les suivants :
+            # on compte donc aussi ceux qui attendent d'être écrits
+            while len(pending) + len(finished) >= max_pending:
+                collect(block=True)
+            pending.add(executor.submit(solve_record, index, origin, record, method, presolve, scale,
+                                         time_limit, max_iterations))
+            collect(block=False)
+        while pending:
+            collect(block=True)
+    return counts
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Résolution en lot de problèmes de programmation linéaire")
+    parser.add_argument("source", help="répertoire de fichiers .json ou fichier .jsonl")
+    parser.add_argument("-o", "--output", default="-", help="fichier JSONL de résultats (- pour la sortie standard)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="nombre de processus (défaut: tous les cœurs)")
+    parser.add_argument("--order", choices=("input", "completion"), default="input",
+                        help="ordre d'écriture des résultats")
+    parser.add_argument("--method", choices=sorted(METHODS), default=None,
+                        help="forcer une méthode (1: Standard, 2: Grand M, 3: Deux Phases, 4: Révisé, 5: Dual, 6: Exact, 7: Borné, 8: Point Intérieur)")
+    parser.add_argument("--presolve", action="store_true",
+                        help="réduire les problèmes avant résolution (présolve/postsolve)")
+    parser.add_argument("--scale", action="store_true",
+                        help="mettre à l'échelle lignes et colonnes avant résolution")
+    parser.add_argument("--time-limit", type=float, default=None,
+                        help="durée maximale de chaque résolution, en secondes")
+    parser.add_argument("--max-iterations", type=int, default=None,
+                        help="nombre maximal d'itérations de chaque résolution")
+    args = parser.parse_args(argv)
+
+    if args.output == "-":
+        counts = batch_solve(args.source, sys.stdout, args.workers, args.order, args.method,
+                             presolve=args.presolve, scale=args.scale,
+                             time_limit=args.time_limit, max_iterations=args.max_iterations)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            counts = batch_solve(args.source, f, args.workers, args.order, args.method,
+                                 presolve=args.presolve, scale=args.scale,
+                                 time_limit=args.time_limit, max_iterations=args.max_iterations)
+    summary = ", ".join(f"{status}: {count}" for status, count in sorted(counts.items()))
+    print(f"✅ {sum(counts.values())} problème(s) résolu(s) ({summary})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
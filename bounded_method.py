@@ -0,0 +1,202 @@
+import time
+
+import numpy as np
+
+from revised_method import RevisedSimplexMethod
+from solver_events import IterationEvent
+from sparse_problem import SparseProblem, parse_bounds
+
+
+class BoundedSimplexMethod(RevisedSimplexMethod):
+    """
+    Simplexe à variables bornées : lower <= x <= upper sans aucune ligne supplémentaire.
+
+    Les bornes viennent de la clé "bounds" du dictionnaire `variables` (une paire
+    [inférieure, supérieure] par variable, None pour +∞) ou d'un SparseProblem.
+    Le problème est translaté (x = lower + x', 0 <= x' <= u = upper - lower) ; une variable
+    hors base est à sa borne inférieure ou supérieure (`at_upper`), et le test du rapport
+    tient compte de trois limites : une variable de base qui atteint 0, une variable de base
+    qui atteint sa borne supérieure, ou l'entrante qui change de borne sans changement de base.
+    """
+
+    METHOD = "Simplexe Borné"
+
+    def load_problem(self) -> SparseProblem:
+        """Problème translaté b - A lower ; les bornes supérieures u = upper - lower sont conservées"""
+        problem = self.variables if isinstance(self.variables, SparseProblem) \
+            else SparseProblem.from_variables(self.variables)
+        self.lower = problem.lower.copy()
+        self.upper = problem.upper.copy()
+        return SparseProblem(problem.n, problem.rows, problem.cols, problem.vals,
+                             problem.b - problem.matvec(self.lower), problem.c, problem.constraints_info,
+                             problem.constant + float(problem.c @ self.lower), problem.objective_type)
+
+    def build_standard_form(self):
+        super().build_standard_form()
+        # Bornes supérieures de toutes les colonnes (écarts et artificielles : +∞)
+        self.width = np.full(len(self.c), np.inf)
+        self.width[:self.n] = self.upper - self.lower
+        self.at_upper = np.zeros(len(self.c), dtype=bool)
+
+    def basic_rhs(self):
+        """b - Σ a_j u_j pour les variables hors base à leur borne supérieure (toujours structurelles)"""
+        if not self.at_upper.any():
+            return self.b
+        x = np.where(self.at_upper[:self.n], self.width[:self.n], 0.0)
+        return self.b - self.problem.matvec(x) * self.row_sign
+
+    def primal_values(self):
+        x = super().primal_values()
+        x[self.at_upper] = self.width[self.at_upper]
+        return x
+
+    def solve(self, observer=None):
+        result = super().solve(observer)
+        result.method = self.METHOD
+        if self.x is not None:
+            # Retour aux variables d'origine : x = lower + x'
+            self.x[:self.n] += self.lower
+            result.x = self.x[:self.n].tolist()
+        return result
+
+    def apply_warm_start(self) -> bool:
+        # Une base seule ne dit pas quelles variables hors base sont à leur borne supérieure
+        return False
+
+    def optimize(self, cost, allowed, observer=None) -> str:
+        """Boucle du simplexe borné pour un vecteur de coûts donné (maximisation)"""
+        while True:
+            stop = self.budget.exhausted(self.iteration)
+            if stop:
+                return stop
+            if self.factor.needs_refactor:
+                self.refactorize()
+
+            y = self.factor.btran(cost[self.basis])
+            reduced = cost - self.price(y)
+            reduced[self.basis] = 0.0
+            reduced[~allowed] = 0.0
+            # Une variable à sa borne supérieure améliore Z en diminuant (coût réduit négatif)
+            gain = np.where(self.at_upper, -reduced, reduced)
+            q = int(np.argmax(gain))
+            if gain[q] <= self.tol:
+                return "optimal"
+            step_sign = -1.0 if self.at_upper[q] else 1.0
+
+            direction = self.factor.ftran(self.column(q))
+            # x_B(t) = x_B - t · delta, t >= 0 étant le déplacement de l'entrante
+            delta = step_sign * direction
+            ratios = np.full(len(delta), np.inf)
+            falling = delta > self.tol
+            np.divide(self.xB, delta, out=ratios, where=falling)
+            rising = (delta < -self.tol) & np.isfinite(self.width[self.basis])
+            np.divide(self.xB - self.width[self.basis], delta, out=ratios, where=rising)
+            r = int(np.argmin(ratios))
+            theta = min(ratios[r], self.width[q])
+            if np.isinf(theta):
+                return "unbounded"
+
+            self.xB -= theta * delta
+            if theta == self.width[q] and theta <= ratios[r]:
+                # Changement de borne de l'entrante : la base ne change pas
+                self.at_upper[q] = not self.at_upper[q]
+                leaving = q
+            else:
+                leaving = self.basis[r]
+                self.at_upper[leaving] = bool(delta[r] < 0)
+                self.xB[r] = self.width[q] - theta if self.at_upper[q] else theta
+                self.at_upper[q] = False
+                self.basis[r] = q
+                self.factor.update(r, direction)
+            self.iteration += 1
+
+            if self.events:
+                phase_one = allowed.all() and self.artificial.any()
+                self.events.emit(IterationEvent(
+                    method=self.METHOD,
+                    iteration=self.iteration,
+                    entering=self.names[q],
+                    leaving=self.names[leaving],
+                    objective=float(cost @ self.primal_values()),
+                    primal_infeasibility=float(self.xB[self.artificial[self.basis]].sum()),
+                    dual_infeasibility=float(gain[gain > self.tol].sum()),
+                    elapsed=time.perf_counter() - self.start,
+                    phase=1 if phase_one else 2,
+                ))
+            if observer is not None:
+                self.leaving = leaving
+                self.current_objective = float(cost @ self.primal_values())
+                observer(self, self.iteration, r, q)
+
+    def drive_out_artificials(self):
+        super().drive_out_artificials()
+        # Une variable entrée en base n'est plus à une borne
+        if self.at_upper[self.basis].any():
+            self.at_upper[self.basis] = False
+            self.xB = self.factor.ftran(self.basic_rhs())
+
+    def run(self):
+        """Exécute le simplexe borné et affiche la solution"""
+        print(f"\n{'='*60}")
+        print("MÉTHODE DU SIMPLEXE À VARIABLES BORNÉES")
+        print(f"{'='*60}")
+        self.solve(observer=self.print_iteration)
+        self.display_results()
+
+    def print_iteration(self, solver, iteration: int, row: int, col: int):
+        if self.leaving == col:
+            print(f"Itération {iteration} : {self.names[col]} passe à "
+                  f"{'sa borne supérieure' if self.at_upper[col] else 'sa borne inférieure'}, "
+                  f"Z = {self.current_objective:.6f}")
+        else:
+            super().print_iteration(solver, iteration, row, col)
+
+    def display_results(self):
+        super().display_results()
+        if self.status == "optimal":
+            at_bound = [f"x{j+1}" for j in np.flatnonzero(self.at_upper[:self.n])]
+            if at_bound:
+                print(f"\nVariables à leur borne supérieure: {', '.join(at_bound)}")
+
+
+def bounds_as_constraints(variables: dict) -> dict:
+    """
+    Copie du problème où les bornes de la clé "bounds" deviennent des contraintes
+    (x_j <= upper, x_j >= lower), pour les méthodes qui ne gèrent pas les bornes.
+    Ces méthodes supposant x >= 0, une borne inférieure négative est refusée.
+    """
+    n = variables["nombres_variables_base"]
+    lower, upper = parse_bounds(variables.get("bounds"), n)
+    if (lower < 0).any():
+        raise ValueError("Borne inférieure négative : seul BoundedSimplexMethod la prend en charge")
+    expanded = {key: value for key, value in variables.items() if key != "bounds"}
+    equations = [list(eq) for eq in variables["equations"].values()]
+    constraints_info = list(variables.get("constraints_info") or ["<="] * len(equations))
+    for j in range(n):
+        for value, sense, needed in ((upper[j], "<=", np.isfinite(upper[j])), (lower[j], ">=", lower[j] > 0)):
+            if needed:
+                row = [0.0] * n
+                row[j] = 1.0
+                equations.append([float(value)] + row)
+                constraints_info.append(sense)
+    expanded["equations"] = {f"equation_{i+1}": eq for i, eq in enumerate(equations)}
+    expanded["nb_equations"] = len(equations)
+    expanded["constraints_info"] = constraints_info
+    return expanded
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    # Max Z = 3x1 + 5x2, 3x1 + 2x2 <= 18, avec 0 <= x1 <= 4 et 0 <= x2 <= 6 en bornes
+    variables_bornees = {
+        "tab_optimisation": [0, 3, 5],
+        "nombres_variables_base": 2,
+        "equations": {
+            "equation_1": [18, 3, 2],
+        },
+        "nb_equations": 1,
+        "constraints_info": ["<="],
+        "bounds": [[0, 4], [0, 6]],
+    }
+
+    BoundedSimplexMethod(variables_bornees).run()
@@ -11,6 +11,14 @@ from enhanced_variables import interactive_problem_builder, VariableManager, enh
 from tab_method import SimplexMethodTab
 from grand_M_method import GrandMMethod
 from dual_method import DualMethod
+from revised_method import RevisedSimplexMethod
+from two_phase_method import TwoPhaseMethod
+from dual_simplex_method import DualSimplexMethod
+from exact_method import ExactSimplexMethod
+from bounded_method import BoundedSimplexMethod
+from interior_point import InteriorPointMethod
+from method_selection import select_method
+from solve_budget import CancellationToken, cancel_on_interrupt, STOPPED
 from colorama import init, Fore, Style
 
 init()
@@ -20,6 +28,11 @@ class LinearProgrammingSolver:
         self.variable_manager = VariableManager()
         self.current_problem = None
         self.current_method = None
+        # Index du problème courant dans l'historique et base finale de sa dernière résolution
+        self.current_index = None
+        self.last_basis = None
+        # Ctrl+C pendant une résolution l'arrête proprement (dernière base conservée)
+        self.cancel_token = CancellationToken()
     
     def main_menu(self):
         """Menu principal de l'application"""
@@ -79,6 +92,8 @@ class LinearProgrammingSolver:
                 
                 # Sauvegarde automatique dans l'historique
                 index = self.variable_manager.save_problem(variables, method)
+                self.current_index = index
+                self.last_basis = None
                 print(f"✅ Problème créé et sauvegardé (index: {index})")
                 
                 # Affichage du problème
@@ -105,6 +120,8 @@ class LinearProgrammingSolver:
             if variables:
                 self.current_problem = variables
                 self.current_method = variables.get("method_type", "Chargé")
+                self.current_index = len(self.variable_manager.history) - 1
+                self.last_basis = self.variable_manager.get_basis(self.current_index)
                 enhanced_display_simplex_tableau(variables, 0, self.current_method)
         
         elif choice == "2":
@@ -116,6 +133,8 @@ class LinearProgrammingSolver:
                     if variables:
                         self.current_problem = variables
                         self.current_method = self.variable_manager.history[index]["method"]
+                        self.current_index = index
+                        self.last_basis = self.variable_manager.get_basis(index)
                         print(f"✅ Problème {index} chargé")
                         enhanced_display_simplex_tableau(variables, 0, self.current_method)
                     else:
@@ -198,27 +217,23 @@ class LinearProgrammingSolver:
         
         print(f"\n{Fore.CYAN}🔍 RÉSOLUTION DU PROBLÈME{Style.RESET_ALL}")
         
-        # Déterminer la méthode appropriée
-        constraints_info = self.current_problem.get("constraints_info", [])
-        has_equality = "=" in constraints_info
-        has_greater_equal = ">=" in constraints_info
-        
         print("Méthodes de résolution disponibles:")
-        methods = ["1. Simplexe Standard"]
-        
-        if has_equality or has_greater_equal:
-            methods.extend(["2. Grand M", "3. Deux Phases (non implémenté)"])
+        methods = ["1. Simplexe Standard", "2. Grand M", "3. Deux Phases",
+                   "4. Simplexe Révisé (factorisation LU)",
+                   "5. Simplexe Dual (réoptimisation)",
+                   "6. Simplexe Exact (optimum certifié)",
+                   "7. Simplexe Borné (bornes des variables sans lignes)",
+                   "8. Point Intérieur (grands problèmes creux)"]
         
         for method in methods:
             print(f"  {method}")
         
-        # Suggestion automatique
-        if has_equality or has_greater_equal:
-            suggested = "2"
-            print(f"\n💡 Méthode suggérée: Grand M (contraintes d'égalité ou ≥ détectées)")
-        else:
-            suggested = "1"
-            print(f"\n💡 Méthode suggérée: Simplexe Standard")
+        # Choix automatique (même règle que la résolution en lot), avec ses raisons
+        selection = select_method(self.current_problem)
+        suggested = selection.key
+        print(f"\n💡 Méthode suggérée: {selection.name}")
+        for reason in selection.reasons:
+            print(f"   • {reason}")
         
         choice = input(f"Votre choix [{suggested}]: ") or suggested
         
@@ -228,7 +243,17 @@ class LinearProgrammingSolver:
             elif choice == "2":
                 self.solve_with_grand_m()
             elif choice == "3":
-                print(f"{Fore.YELLOW}⚠️ Méthode des deux phases non encore implémentée{Style.RESET_ALL}")
+                self.solve_with_two_phase()
+            elif choice == "4":
+                self.solve_with_revised_simplex()
+            elif choice == "5":
+                self.solve_with_dual_simplex()
+            elif choice == "6":
+                self.solve_with_exact_simplex()
+            elif choice == "7":
+                self.solve_with_bounded_simplex()
+            elif choice == "8":
+                self.solve_with_interior_point()
             else:
                 print(f"{Fore.RED}❌ Choix invalide{Style.RESET_ALL}")
         except Exception as e:
@@ -238,23 +263,105 @@ class LinearProgrammingSolver:
         """Résout avec la méthode du simplexe standard"""
         print(f"\n{Fore.GREEN}🚀 Résolution par Simplexe Standard{Style.RESET_ALL}")
         
-        # Copie pour éviter de modifier l'original
-        import copy
-        problem_copy = copy.deepcopy(self.current_problem)
-        
-        solver = SimplexMethodTab(problem_copy)
-        solver.run()
+        # Le simplexe standard ne modifie pas le dictionnaire du problème
+        solver = SimplexMethodTab(self.current_problem, warm_start=self.last_basis,
+                                  cancel=self.cancel_token)
+        self.run_solver(solver)
     
     def solve_with_grand_m(self):
         """Résout avec la méthode du Grand M"""
         print(f"\n{Fore.GREEN}🚀 Résolution par Grand M{Style.RESET_ALL}")
         
-        # Copie pour éviter de modifier l'original
-        import copy
-        problem_copy = copy.deepcopy(self.current_problem)
+        # Le Grand M ne modifie pas le dictionnaire du problème
+        solver = GrandMMethod(self.current_problem, warm_start=self.last_basis,
+                              cancel=self.cancel_token)
+        self.run_solver(solver)
+    
+    def solve_with_two_phase(self):
+        """Résout avec la méthode des deux phases"""
+        print(f"\n{Fore.GREEN}🚀 Résolution par Deux Phases{Style.RESET_ALL}")
+        
+        # La méthode des deux phases ne modifie pas le dictionnaire du problème
+        solver = TwoPhaseMethod(self.current_problem, warm_start=self.last_basis,
+                                cancel=self.cancel_token)
+        self.run_solver(solver)
+    
+    def solve_with_revised_simplex(self):
+        """Résout avec le simplexe révisé (base factorisée)"""
+        print(f"\n{Fore.GREEN}🚀 Résolution par Simplexe Révisé{Style.RESET_ALL}")
         
-        solver = GrandMMethod(problem_copy)
-        solver.run()
+        # Le simplexe révisé ne modifie pas le dictionnaire du problème
+        solver = RevisedSimplexMethod(self.current_problem, warm_start=self.last_basis,
+                                      cancel=self.cancel_token)
+        self.run_solver(solver)
+    
+    def run_solver(self, solver):
+        """Exécute `solver.run()` ; Ctrl+C l'arrête à l'itération suivante au lieu de quitter"""
+        print(f"{Fore.CYAN}(Ctrl+C : arrêter la résolution et garder la dernière base){Style.RESET_ALL}")
+        self.cancel_token.reset()
+        with cancel_on_interrupt(self.cancel_token):
+            solver.run()
+        self.remember_basis(solver)
+    
+    def remember_basis(self, solver):
+        """Garde la base optimale (et la note dans l'historique) pour la prochaine résolution"""
+        if solver.warm_started:
+            print(f"{Fore.CYAN}♻️  Démarrage à chaud depuis la base précédente{Style.RESET_ALL}")
+        if solver.result is not None and solver.result.status in STOPPED and solver.result.basis:
+            # Une résolution interrompue reprendra depuis sa dernière base
+            self.last_basis = solver.result.basis
+        if solver.result is not None and solver.result.is_optimal:
+            self.last_basis = solver.result.basis
+            if self.current_index is not None:
+                self.variable_manager.set_basis(self.current_index, self.last_basis)
+    
+    def solve_with_dual_simplex(self):
+        """Résout avec le simplexe dual puis propose de modifier des seconds membres"""
+        print(f"\n{Fore.GREEN}🚀 Résolution par Simplexe Dual{Style.RESET_ALL}")
+        
+        # Le simplexe dual ne modifie pas le dictionnaire du problème
+        solver = DualSimplexMethod(self.current_problem, warm_start=self.last_basis,
+                                   cancel=self.cancel_token)
+        self.run_solver(solver)
+        
+        # Réoptimisation à chaud : on repart de la base optimale à chaque modification
+        while solver.status == "optimal":
+            answer = input("\nModifier un second membre (ex: 2=150, Entrée pour terminer): ").strip()
+            if not answer:
+                break
+            try:
+                index, value = answer.split("=")
+                solver.change_rhs(int(index) - 1, float(value))
+            except (ValueError, IndexError):
+                print(f"{Fore.RED}❌ Format attendu: numéro_contrainte=valeur{Style.RESET_ALL}")
+                continue
+            result = solver.reoptimize()
+            print(result.summary())
+    
+    def solve_with_exact_simplex(self):
+        """Résout en arithmétique exacte (pivots entiers de Bareiss) et certifie l'optimum"""
+        print(f"\n{Fore.GREEN}🚀 Résolution par Simplexe Exact{Style.RESET_ALL}")
+        
+        # Le simplexe exact ne modifie pas le dictionnaire du problème
+        solver = ExactSimplexMethod(self.current_problem, warm_start=self.last_basis,
+                                    cancel=self.cancel_token)
+        self.run_solver(solver)
+    
+    def solve_with_bounded_simplex(self):
+        """Résout avec le simplexe à variables bornées (clé "bounds" du problème)"""
+        print(f"\n{Fore.GREEN}🚀 Résolution par Simplexe Borné{Style.RESET_ALL}")
+        
+        # Le simplexe borné ne modifie pas le dictionnaire du problème
+        solver = BoundedSimplexMethod(self.current_problem, cancel=self.cancel_token)
+        self.run_solver(solver)
+    
+    def solve_with_interior_point(self):
+        """Résout par points intérieurs (Mehrotra), puis crossover vers une base optimale"""
+        print(f"\n{Fore.GREEN}🚀 Résolution par Point Intérieur{Style.RESET_ALL}")
+        
+        # La méthode des points intérieurs ne modifie pas le dictionnaire du problème
+        solver = InteriorPointMethod(self.current_problem, cancel=self.cancel_token)
+        self.run_solver(solver)
     
     def dual_analysis(self):
         """Effectue une analyse primal-dual"""
@@ -271,11 +378,10 @@ class LinearProgrammingSolver:
             print("L'analyse duale sera effectuée après conversion en forme standard.{Style.RESET_ALL}")
         
         try:
-            import copy
-            problem_copy = copy.deepcopy(self.current_problem)
-            
-            dual_analyzer = DualMethod(problem_copy)
-            dual_analyzer.run_complete_analysis()
+            dual_analyzer = DualMethod(self.current_problem, cancel=self.cancel_token)
+            self.cancel_token.reset()
+            with cancel_on_interrupt(self.cancel_token):
+                dual_analyzer.run_complete_analysis()
         except Exception as e:
             print(f"{Fore.RED}❌ Erreur lors de l'analyse duale: {e}{Style.RESET_ALL}")
     
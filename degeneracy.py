@@ -0,0 +1,101 @@
+import numpy as np
+
+from pricing import BlandPricing
+
+PERTURBATIONS = ("off", "auto", "always")
+
+
+class DegeneracyGuard:
+    """
+    Garde-fous d'une boucle du simplexe sur un TableauEngine contre la dégénérescence et le cyclage.
+
+    - Stagnation : `stall_limit` pivots consécutifs sans variation de Z (pivots dégénérés).
+    - Perturbation : les valeurs de base reçoivent un décalage aléatoire positif borné
+      (magnitude · (1 + |b_i|)), ce qui départage les rapports sans perdre la réalisabilité.
+      Le décalage est suivi par les pivots (`engine.shadow`) et retiré en fin de boucle ;
+      si des valeurs de base deviennent négatives, quelques pivots du simplexe dual
+      (la base optimale reste duale-réalisable) rétablissent la réalisabilité.
+      "always" : dès le départ, "auto" : à la première stagnation, "off" : jamais.
+    - Règle de Bland : si la stagnation persiste, la règle de pivot passe à Bland, qui ne cycle pas.
+
+    Les limites d'itérations et de temps sont celles du SolveBudget du solveur (solve_budget.py).
+    """
+
+    def __init__(self, perturbation: str = "auto", stall_limit: int = 50, magnitude: float = 1e-7, seed: int = 0):
+        if perturbation not in PERTURBATIONS:
+            raise ValueError(f"Perturbation inconnue: {perturbation}")
+        self.perturbation = perturbation
+        self.stall_limit = stall_limit
+        self.magnitude = magnitude
+        self.rng = np.random.default_rng(seed)
+        self.perturbed = False
+        self.switched_to_bland = False
+        self.stalled_pivots = 0
+        self.last_objective = None
+        self.cleanup_pivots = 0
+        # Décisions prises pendant la résolution (affichées par les méthodes run)
+        self.notes = []
+
+    def reset(self, engine) -> None:
+        """Début d'une boucle de pivots"""
+        self.stalled_pivots = 0
+        self.switched_to_bland = False
+        self.last_objective = float(engine.objective[0])
+        if self.perturbation == "always":
+            self.perturb(engine)
+
+    def perturb(self, engine) -> None:
+        """Décale les valeurs de base vers le haut (réalisabilité conservée, quelle que soit la base)"""
+        epsilon = self.magnitude * (1.0 + np.abs(engine.rhs)) * self.rng.uniform(0.5, 1.0, engine.m)
+        engine.tableau[:engine.m, 0] += epsilon
+        engine.shadow = np.append(epsilon, 0.0)
+        self.perturbed = True
+
+    def after_pivot(self, engine, pricing):
+        """Suit la stagnation de Z après un pivot ; renvoie la règle de pivot pour la suite"""
+        objective = float(engine.objective[0])
+        if abs(objective - self.last_objective) > engine.tol * (1.0 + abs(objective)):
+            self.stalled_pivots = 0
+        else:
+            self.stalled_pivots += 1
+        self.last_objective = objective
+        if self.stalled_pivots < self.stall_limit:
+            return pricing
+
+        self.stalled_pivots = 0
+        if self.perturbation == "auto" and not self.perturbed:
+            self.notes.append(f"Stagnation ({self.stall_limit} pivots dégénérés) : perturbation des seconds membres")
+            self.perturb(engine)
+            return pricing
+        if not self.switched_to_bland:
+            self.notes.append(f"Stagnation ({self.stall_limit} pivots dégénérés) : passage à la règle de Bland")
+            self.switched_to_bland = True
+            bland = BlandPricing()
+            bland.reset(engine)
+            return bland
+        return pricing
+
+    def finish(self, engine, optimal: bool = True) -> bool:
+        """
+        Retire la perturbation. Si la base est optimale (`optimal`), les valeurs de base devenues
+        négatives sont corrigées par le simplexe dual ; renvoie Faux si c'est impossible
+        (problème d'origine non réalisable).
+        """
+        if not self.perturbed:
+            return True
+        engine.tableau[:, 0] -= engine.shadow
+        engine.shadow = None
+        self.perturbed = False
+        rhs = engine.rhs
+        rhs[(rhs < 0) & (rhs > -engine.tol)] = 0.0
+        if not optimal:
+            return True
+        while True:
+            row = engine.leaving_row()
+            if row == -1:
+                return True
+            col = engine.dual_ratio_test(row)
+            if col == -1:
+                return False
+            engine.pivot(row, col)
+            self.cleanup_pivots += 1
@@ -1,20 +1,37 @@
 from variables import display_simplex_tableau
 from tab_method import SimplexMethodTab
-import copy
+from revised_method import RevisedSimplexMethod
+from dual_simplex_method import DualSimplexMethod
+from sparse_problem import SparseProblem
+from solver_events import SolverEvents
+import dataclasses
 
 class DualMethod:
-    def __init__(self, primal_variables: dict):
+    def __init__(self, primal_variables: dict, cancel=None):
         self.primal_variables = primal_variables
+        # Jeton d'annulation transmis aux résolutions primale et duale
+        self.cancel = cancel
         self.dual_variables = None
+        # Solveurs de la dernière analyse complète (résultats dans .result)
+        self.primal_solver = None
+        self.dual_solver = None
+        self.events = SolverEvents()
+        # Construction silencieuse : l'affichage est fait par run_complete_analysis
         self.construct_dual()
         
-    def construct_dual(self):
-        """Construit le problème dual à partir du problème primal"""
-        print(f"\n{'='*60}")
-        print("CONSTRUCTION DU PROBLÈME DUAL")
-        print(f"{'='*60}")
-        
-        # Extraire les données du problème primal
+    def subscribe(self, callback):
+        """Abonne `callback(IterationEvent)` aux itérations des résolutions primale et duale"""
+        return self.events.subscribe(callback)
+    
+    def forward_events(self, solver, label):
+        """Relaie les événements d'un solveur interne en précisant le problème résolu"""
+        if self.events:
+            solver.subscribe(lambda event: self.events.emit(
+                dataclasses.replace(event, method=f"{event.method} ({label})")))
+        return solver
+        
+    def primal_data(self):
+        """Coefficients c, matrice A et seconds membres b du problème primal (dense)"""
         primal_c = self.primal_variables["tab_optimisation"][1:]  # Coefficients fonction objectif
         primal_equations = list(self.primal_variables["equations"].values())
         primal_b = [eq[0] for eq in primal_equations]  # Membres de droite
@@ -23,12 +40,19 @@ class DualMethod:
         primal_A = []
         for eq in primal_equations:
             primal_A.append(eq[1:self.primal_variables["nombres_variables_base"] + 1])
+        return primal_c, primal_A, primal_b
+        
+    def construct_dual(self):
+        """Construit le problème dual à partir du problème primal (sans affichage)"""
+        if isinstance(self.primal_variables, SparseProblem):
+            self.dual_variables = self.primal_variables.dual()
+            return
         
-        self.display_primal_problem(primal_c, primal_A, primal_b)
+        primal_c, primal_A, primal_b = self.primal_data()
         
         # Construction du dual
         # Nombre de variables duales = nombre de contraintes primales
-        dual_n = len(primal_equations)
+        dual_n = len(primal_A)
         
         # Coefficients de la fonction objectif du dual = membres de droite du primal
         dual_c = primal_b.copy()
@@ -59,8 +83,29 @@ class DualMethod:
             "constraints_info": [">="] * len(dual_equations)  # Toutes les contraintes sont >=
         }
         
-        self.display_dual_problem(dual_c, dual_A, dual_b)
+    def display_problems(self):
+        """Affiche les problèmes primal et dual construits par construct_dual"""
+        print(f"\n{'='*60}")
+        print("CONSTRUCTION DU PROBLÈME DUAL")
+        print(f"{'='*60}")
         
+        if isinstance(self.primal_variables, SparseProblem):
+            self.display_sparse_problems()
+            return
+        
+        self.display_primal_problem(*self.primal_data())
+        dual_A = list(self.dual_variables["equations"].values())
+        dual_c = [-c for c in self.dual_variables["tab_optimisation"][1:]]
+        self.display_dual_problem(dual_c, dual_A, [eq[0] for eq in dual_A])
+        
+    def display_sparse_problems(self):
+        """Affiche la taille des problèmes creux primal et dual"""
+        primal = self.primal_variables
+        print(f"\nPROBLÈME PRIMAL (creux): {primal.m} contraintes, {primal.n} variables, "
+              f"{primal.nnz} coefficients non nuls ({primal.density:.2%})")
+        print(f"PROBLÈME DUAL (creux): {self.dual_variables.m} contraintes ≥, "
+              f"{self.dual_variables.n} variables y_i ≥ 0")
+    
     def display_primal_problem(self, c, A, b):
         """Affiche le problème primal"""
         print("\nPROBLÈME PRIMAL:")
@@ -118,32 +163,35 @@ class DualMethod:
                 print(f" + {-coeff}y{i+1}" if -coeff >= 0 else f" - {abs(-coeff)}y{i+1}", end="")
         print()
     
+    def make_dual_solver(self):
+        """Solveur du dual : simplexe révisé s'il est creux, simplexe dual sinon"""
+        if isinstance(self.dual_variables, SparseProblem):
+            return self.forward_events(RevisedSimplexMethod(self.dual_variables, cancel=self.cancel), "dual")
+        # Contraintes >= et coûts -b : la base d'écarts est duale-réalisable dès que b >= 0,
+        # le simplexe dual résout directement le problème sans phase 1
+        return self.forward_events(DualSimplexMethod(self.dual_variables, cancel=self.cancel), "dual")
+    
+    def make_primal_solver(self):
+        """Solveur du primal : simplexe révisé s'il est creux, simplexe standard sinon"""
+        if isinstance(self.primal_variables, SparseProblem):
+            return self.forward_events(RevisedSimplexMethod(self.primal_variables, cancel=self.cancel), "primal")
+        # Le simplexe ne modifie pas le problème : aucune copie n'est nécessaire
+        return self.forward_events(SimplexMethodTab(self.primal_variables, cancel=self.cancel), "primal")
+    
     def solve_dual(self):
         """Résout le problème dual"""
         print(f"\n{'='*60}")
         print("RÉSOLUTION DU PROBLÈME DUAL")
         print(f"{'='*60}")
         
-        # Pour résoudre les contraintes >=, on les convertit en <=
-        # a1*y1 + a2*y2 + ... >= b devient -a1*y1 - a2*y2 - ... <= -b
-        converted_equations = {}
-        for key, equation in self.dual_variables["equations"].items():
-            converted_eq = [-equation[0]]  # -b
-            converted_eq.extend([-x for x in equation[1:]])  # -coefficients
-            converted_equations[key] = converted_eq
-        
-        dual_for_simplex = {
-            "tab_optimisation": self.dual_variables["tab_optimisation"],
-            "nombres_variables_base": self.dual_variables["nombres_variables_base"],
-            "equations": converted_equations,
-            "nb_equations": self.dual_variables["nb_equations"]
-        }
-        
-        print("Résolution du dual par la méthode du simplexe:")
-        simplex_dual = SimplexMethodTab(dual_for_simplex)
+        if isinstance(self.dual_variables, SparseProblem):
+            print("Résolution du dual creux par le simplexe révisé:")
+        else:
+            print("Résolution du dual par le simplexe dual:")
+        simplex_dual = self.make_dual_solver()
         simplex_dual.run()
         
-        return dual_for_simplex
+        return simplex_dual
     
     def solve_primal(self):
         """Résout le problème primal pour comparaison"""
@@ -151,21 +199,39 @@ class DualMethod:
         print("RÉSOLUTION DU PROBLÈME PRIMAL")
         print(f"{'='*60}")
         
-        print("Résolution du primal par la méthode du simplexe:")
-        simplex_primal = SimplexMethodTab(copy.deepcopy(self.primal_variables))
+        if isinstance(self.primal_variables, SparseProblem):
+            print("Résolution du primal creux par le simplexe révisé:")
+        else:
+            print("Résolution du primal par la méthode du simplexe:")
+        simplex_primal = self.make_primal_solver()
         simplex_primal.run()
         
-        return self.primal_variables
+        return simplex_primal
     
-    def compare_solutions(self, primal_result, dual_result):
-        """Compare les solutions primale et duale"""
+    def solve(self):
+        """
+        Résout le primal puis le dual sans aucune entrée/sortie.
+        Renvoie les deux SolveResult (primal, dual) ; le dual est un Max -W, W* = -dual.objective.
+        """
+        self.primal_solver = self.make_primal_solver()
+        primal = self.primal_solver.solve()
+        self.dual_solver = self.make_dual_solver()
+        dual = self.dual_solver.solve()
+        return primal, dual
+    
+    def compare_solutions(self, primal_solver, dual_solver):
+        """Compare les solutions primale et duale (lues dans les SolveResult, sans parcourir les tableaux)"""
         print(f"\n{'='*60}")
         print("COMPARAISON DES SOLUTIONS")
         print(f"{'='*60}")
         
-        primal_z = primal_result["tab_optimisation"][0]
-        dual_w = -dual_result["tab_optimisation"][0]  # Rappel: on a maximisé -W
+        primal, dual = primal_solver.result, dual_solver.result
+        if not primal.is_optimal or not dual.is_optimal:
+            print(f"❌ Comparaison impossible (primal: {primal.status}, dual: {dual.status})")
+            return
         
+        primal_z = primal.objective
+        dual_w = -dual.objective  # Rappel: on a maximisé -W
         print(f"Valeur optimale du primal (Z): {primal_z:.6f}")
         print(f"Valeur optimale du dual (W): {dual_w:.6f}")
         print(f"Différence |Z - W|: {abs(primal_z - dual_w):.10f}")
@@ -175,28 +241,13 @@ class DualMethod:
         else:
             print("❌ Problème dans les calculs - les valeurs devraient être égales")
         
-        # Extraction des solutions
         print("\nSOLUTION PRIMALE:")
-        primal_equations = list(primal_result["equations"].values())
-        for j in range(1, self.primal_variables["nombres_variables_base"] + 1):
-            value = 0
-            for i, eq in enumerate(primal_equations):
-                if j < len(eq) and abs(eq[j] - 1.0) < 1e-10:
-                    others_zero = all(abs(other_eq[j]) < 1e-10 for k, other_eq in enumerate(primal_equations) if k != i)
-                    if others_zero:
-                        value = eq[0]
-            print(f"  x{j} = {value:.6f}")
+        for j, value in enumerate(primal.x):
+            print(f"  x{j+1} = {value:.6f}")
         
         print("\nSOLUTION DUALE:")
-        dual_equations = list(dual_result["equations"].values())
-        for j in range(1, self.dual_variables["nombres_variables_base"] + 1):
-            value = 0
-            for i, eq in enumerate(dual_equations):
-                if j < len(eq) and abs(eq[j] - 1.0) < 1e-10:
-                    others_zero = all(abs(other_eq[j]) < 1e-10 for k, other_eq in enumerate(dual_equations) if k != i)
-                    if others_zero:
-                        value = eq[0]
-            print(f"  y{j} = {value:.6f}")
+        for j, value in enumerate(dual.x):
+            print(f"  y{j+1} = {value:.6f}")
     
     def run_complete_analysis(self):
         """Exécute l'analyse complète primal-dual"""
@@ -204,12 +255,14 @@ class DualMethod:
         print("ANALYSE COMPLÈTE PRIMAL-DUAL")
         print(f"{'='*80}")
         
+        self.display_problems()
+        
         # Résolution des deux problèmes
-        primal_result = self.solve_primal()
-        dual_result = self.solve_dual()
+        self.primal_solver = self.solve_primal()
+        self.dual_solver = self.solve_dual()
         
         # Comparaison
-        self.compare_solutions(primal_result, dual_result)
+        self.compare_solutions(self.primal_solver, self.dual_solver)
         
         # Analyse économique
         self.economic_interpretation()
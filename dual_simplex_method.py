@@ -0,0 +1,278 @@
+import time
+
+import numpy as np
+
+from tableau_engine import TableauEngine
+from solver_result import SolveResult, basis_columns
+from solver_events import IterationEvent, SolverEvents
+from solve_budget import STOPPED, SolveBudget
+
+
+class DualSimplexMethod:
+    """
+    Algorithme du simplexe dual sur le tableau NumPy.
+
+    Toutes les contraintes sont ramenées à des lignes <= avec une variable d'écart
+    (>= : ligne multipliée par -1, = : deux lignes). La base d'écart est donc toujours
+    disponible ; si elle n'est pas duale-réalisable (un coût c_j > 0), on ajoute la
+    contrainte artificielle bornante somme(x) <= M et on y pivote une fois, ce qui
+    rend tous les coûts réduits positifs (méthode de la contrainte artificielle).
+
+    Après une résolution, `change_rhs` et `add_constraint` modifient le problème sans
+    toucher aux coûts réduits : la base reste duale-réalisable et `reoptimize()` repart
+    de la base optimale précédente, en quelques pivots seulement.
+    """
+
+    def __init__(self, variables: dict, tol: float = 1e-9, big_bound: float = None, warm_start=None,
+                 max_iterations: int = None, time_limit: float = None, cancel=None):
+        self.variables = variables
+        # Base d'une résolution précédente (SolveResult ou liste de noms) pour un démarrage à chaud
+        self.warm_start = warm_start
+        self.warm_started = False
+        self.n = variables["nombres_variables_base"]
+        self.tol = tol
+        self.big_bound = big_bound
+        # Limites (par appel de reoptimize) et jeton d'annulation (CancellationToken)
+        self.budget = SolveBudget(max_iterations, time_limit, cancel)
+        self.iteration = 0
+        self.status = None
+        self.engine = None
+        self.result = None
+        self.events = SolverEvents()
+        self.start = None
+
+    def subscribe(self, callback):
+        """Abonne `callback(IterationEvent)` aux itérations du solveur"""
+        return self.events.subscribe(callback)
+
+    def run(self):
+        """Exécute le simplexe dual et affiche la solution"""
+        print(f"\n{'='*60}")
+        print("MÉTHODE DU SIMPLEXE DUAL")
+        print(f"{'='*60}")
+        self.solve(observer=self.print_iteration)
+        self.display_results()
+
+    def build_tableau(self):
+        """Tableau initial : lignes <= avec écarts, base d'écart, contrainte bornante si nécessaire"""
+        n = self.n
+        equations = list(self.variables["equations"].values())
+        senses = self.variables.get("constraints_info") or ["<="] * len(equations)
+        objective = self.variables["tab_optimisation"]
+        self.constant = float(objective[0])
+        self.c = np.array(objective[1:n + 1], dtype=np.float64)
+
+        rows, self.b = [], []
+        self.constraint_rows = []  # Pour chaque contrainte d'origine : [(ligne, signe), ...]
+        self.names = [f"x{j+1}" for j in range(n)]
+        for i, (equation, sense) in enumerate(zip(equations, senses)):
+            a = np.array(equation[1:n + 1], dtype=np.float64)
+            signs = {"<=": [1.0], ">=": [-1.0], "=": [1.0, -1.0]}[sense]
+            self.constraint_rows.append([])
+            for k, sign in enumerate(signs):
+                self.constraint_rows[i].append((len(rows), sign))
+                rows.append(sign * a)
+                self.b.append(sign * float(equation[0]))
+                self.names.append(f"s{i+1}" + "'" * k)
+        self.senses = list(senses)
+
+        self.bound_row = None
+        # Tolérance de réalisabilité des seconds membres : avec la contrainte bornante,
+        # les erreurs d'arrondi sont proportionnelles à M et non plus de l'ordre de tol
+        self.rhs_tol = self.tol
+        if (self.c > self.tol).any():
+            bound = self.big_bound or 1e6 * (1.0 + max([abs(v) for v in self.b], default=0.0))
+            self.bound_row = len(rows)
+            rows.append(np.ones(n))
+            self.b.append(bound)
+            self.rhs_tol = max(self.tol, 1e-12 * bound)
+            self.names.append("sM")
+
+        m = len(rows)
+        self.b = np.array(self.b)
+        tableau = np.zeros((m + 1, 1 + n + m))
+        tableau[:m, 0] = self.b
+        if m:
+            tableau[:m, 1:n + 1] = np.array(rows)
+        tableau[:m, 1 + n:] = np.eye(m)
+        tableau[m, 0] = self.constant
+        tableau[m, 1:n + 1] = -self.c
+        self.engine = TableauEngine(tableau, self.tol, np.arange(1 + n, 1 + n + m))
+
+        if self.bound_row is not None:
+            # Un pivot sur la contrainte bornante rend la base duale-réalisable
+            self.engine.pivot(self.bound_row, int(np.argmax(self.c)) + 1)
+
+    def slack_columns(self):
+        """Colonnes d'écart : la ligne k du tableau a son écart en colonne 1 + n + k"""
+        return np.arange(1 + self.n, 1 + self.n + self.engine.m)
+
+    def solve(self, observer=None) -> SolveResult:
+        """
+        Résout à partir de la base d'écart, sans aucune sortie console.
+        `observer(solver, iteration, row, col)` est appelé après chaque pivot.
+        """
+        self.start = time.perf_counter()
+        self.iteration = 0
+        self.build_tableau()
+        if self.warm_start is not None:
+            # Le simplexe dual peut repartir de toute base duale-réalisable
+            self.warm_started = self.engine.warm_start(
+                basis_columns(self.warm_start, self.names), feasibility="dual")
+        return self.reoptimize(observer)
+
+    def reoptimize(self, observer=None) -> SolveResult:
+        """Itérations du simplexe dual depuis la base courante (supposée duale-réalisable)"""
+        start = time.perf_counter()
+        self.start = self.start or start
+        first_iteration = self.iteration
+        self.budget.begin(start)
+        self.status = self.iterate(observer, first_iteration)
+        if self.status == "optimal" and self.bound_row is not None:
+            # Contrainte bornante active avec un prix dual positif : le vrai problème est non borné
+            if self.engine.objective[1 + self.n + self.bound_row] > self.tol:
+                self.status = "unbounded"
+
+        self.result = SolveResult(
+            method="Simplexe Dual",
+            status=self.status,
+            iterations=self.iteration - first_iteration,
+            basis=[self.names[col - 1] for col in self.engine.basis],
+        )
+        if self.status == "optimal":
+            self.result.objective = float(self.engine.objective[0])
+            self.result.x = self.engine.primal_values(self.n).tolist()
+            self.result.duals = self.constraint_duals().tolist()
+        self.result.timings = {"iterations": time.perf_counter() - start,
+                               "total": time.perf_counter() - self.start}
+        self.start = None
+        return self.result
+
+    def iterate(self, observer=None, first_iteration: int = 0) -> str:
+        """Boucle du simplexe dual : ligne du second membre le plus négatif, test des rapports dual"""
+        engine = self.engine
+        while True:
+            stop = self.budget.exhausted(self.iteration - first_iteration)
+            if stop:
+                return stop
+            row = engine.leaving_row()
+            if row == -1 or engine.rhs[row] >= -self.rhs_tol:
+                return "optimal"
+            col = engine.dual_ratio_test(row)
+            if col == -1:
+                return "infeasible"
+
+            self.iteration += 1
+            leaving = engine.basis[row]
+            engine.pivot(row, col)
+            if self.events:
+                self.events.emit(IterationEvent(
+                    method="Simplexe Dual",
+                    iteration=self.iteration,
+                    entering=self.names[col - 1],
+                    leaving=self.names[leaving - 1],
+                    objective=float(engine.objective[0]),
+                    primal_infeasibility=engine.primal_infeasibility(),
+                    dual_infeasibility=engine.dual_infeasibility(),
+                    elapsed=time.perf_counter() - self.start,
+                ))
+            if observer is not None:
+                observer(self, self.iteration, row, col)
+
+    def constraint_duals(self):
+        """Prix duaux des contraintes d'origine (somme signée des prix des lignes <=)"""
+        y = self.engine.objective[self.slack_columns()]
+        return np.array([sum(sign * y[row] for row, sign in rows) for rows in self.constraint_rows])
+
+    def change_rhs(self, constraint: int, value: float) -> None:
+        """
+        Modifie le second membre de la contrainte `constraint` (indice d'origine).
+        Les seconds membres sont recalculés par B⁻¹ b, lu dans les colonnes d'écart ;
+        les coûts réduits ne changent pas, la base reste duale-réalisable.
+        """
+        for row, sign in self.constraint_rows[constraint]:
+            self.b[row] = sign * value
+        engine = self.engine
+        slack = self.slack_columns()
+        engine.tableau[:engine.m, 0] = engine.tableau[:engine.m, slack] @ self.b
+        engine.objective[0] = self.constant + engine.objective[slack] @ self.b
+
+    def add_constraint(self, coefficients, rhs: float, sense: str = "<=") -> int:
+        """
+        Ajoute une contrainte au problème déjà résolu et renvoie son indice.
+        La nouvelle ligne est exprimée dans la base courante, son écart entre en base.
+        """
+        a = np.asarray(coefficients, dtype=np.float64)
+        index = len(self.constraint_rows)
+        signs = {"<=": [1.0], ">=": [-1.0], "=": [1.0, -1.0]}[sense]
+        self.constraint_rows.append([])
+        self.senses.append(sense)
+        engine = self.engine
+        for k, sign in enumerate(signs):
+            engine.add_columns(1)
+            row = np.zeros(engine.tableau.shape[1])
+            row[0] = sign * rhs
+            row[1:self.n + 1] = sign * a
+            row[-1] = 1.0
+            row -= row[engine.basis] @ engine.tableau[:engine.m]
+            self.constraint_rows[index].append((engine.m, sign))
+            self.b = np.append(self.b, sign * rhs)
+            self.names.append(f"s{index+1}" + "'" * k)
+            engine.add_row(row, engine.tableau.shape[1] - 1)
+        return index
+
+    def print_iteration(self, solver, iteration: int, row: int, col: int):
+        """Observateur d'affichage : variable entrante/sortante et valeur courante"""
+        print(f"Itération {iteration} : ligne {row}, entrante {self.names[col - 1]}, "
+              f"Z = {self.engine.objective[0]:.6f}, infaisabilité = {self.engine.primal_infeasibility():.6f}")
+
+    def display_results(self):
+        """Affiche la solution finale"""
+        print(f"\n{'='*60}")
+        print("ANALYSE DE LA SOLUTION FINALE")
+        print(f"{'='*60}")
+
+        if self.status == "infeasible":
+            print("\n❌ PROBLÈME NON RÉALISABLE")
+            print("Aucune variable ne peut entrer en base pour corriger une ligne négative.")
+            return
+        if self.status == "unbounded":
+            print("Solution illimitée!")
+            return
+        if self.status in STOPPED:
+            # Base duale-réalisable mais pas encore réalisable : pas de solution à afficher
+            print(f"\n⏱️  Arrêt avant l'optimum : {self.budget.reason}")
+            print(f"Dernière base: {', '.join(self.result.basis)}")
+            return
+
+        print("\n✅ SOLUTION OPTIMALE TROUVÉE")
+        print(f"Valeur optimale: Z = {self.result.objective:.6f}")
+        print(f"Itérations: {self.result.iterations}")
+        print("\nVariables de décision:")
+        for j, value in enumerate(self.result.x):
+            print(f"  x{j+1} = {value:.6f}")
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    # Min Z = 2x1 + 3x2  (Max -2x1 - 3x2)
+    # x1 + x2 >= 4
+    # x1 + 3x2 >= 6
+    variables_dual = {
+        "tab_optimisation": [0, -2, -3],
+        "nombres_variables_base": 2,
+        "equations": {
+            "equation_1": [4, 1, 1],
+            "equation_2": [6, 1, 3],
+        },
+        "nb_equations": 2,
+        "constraints_info": [">=", ">="]
+    }
+
+    dual_simplex = DualSimplexMethod(variables_dual)
+    dual_simplex.run()
+
+    # Réoptimisation après changement de capacité, à partir de la base optimale
+    dual_simplex.change_rhs(0, 8)
+    result = dual_simplex.reoptimize()
+    print(f"\nAprès b1 = 8 : Z = {result.objective:.6f} en {result.iterations} pivot(s)")
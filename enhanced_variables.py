@@ -3,6 +3,7 @@ from colorama import init, Fore, Style
 import json
 import os
 from datetime import datetime
+from sparse_problem import SparseProblem
 
 # Initialiser colorama
 init()
@@ -12,8 +13,8 @@ class VariableManager:
         self.history = []
         self.current_problem = None
         
-    def save_problem(self, variables, method_name, filename=None):
-        """Sauvegarde un problème avec métadonnées"""
+    def save_problem(self, variables, method_name, filename=None, basis=None):
+        """Sauvegarde un problème avec métadonnées (et la base finale pour un démarrage à chaud)"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         problem_data = {
@@ -26,6 +27,8 @@ class VariableManager:
                 "constraints_types": variables.get("constraints_info", [])
             }
         }
+        if basis is not None:
+            problem_data["basis"] = list(basis)
         
         self.history.append(problem_data)
         
@@ -55,6 +58,9 @@ class VariableManager:
             with open(filename, 'r', encoding='utf-8') as f:
                 problem_data = json.load(f)
             
+            if "sparse" in problem_data:
+                # Les méthodes tabulaires (et get_problem) travaillent sur le dictionnaire dense
+                problem_data["variables"] = SparseProblem.from_json_dict(problem_data["sparse"]).to_variables()
             self.history.append(problem_data)
             print(f"✅ Problème chargé depuis {filename}")
             return problem_data["variables"]
@@ -62,6 +68,41 @@ class VariableManager:
             print(f"❌ Erreur lors du chargement: {e}")
             return None
     
+    def save_sparse_to_file(self, problem, filename, method_name="Creux"):
+        """Sauvegarde un SparseProblem au format JSON creux (triplets, sans colonnes d'écart)"""
+        self.save_to_file({
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "method": method_name,
+            "sparse": problem.to_json_dict(),
+            "metadata": {
+                "nb_variables": problem.n,
+                "nb_contraintes": problem.m,
+                "constraints_types": list(problem.constraints_info)
+            }
+        }, filename)
+    
+    def load_sparse_from_file(self, filename):
+        """
+        Charge un problème sous forme de SparseProblem, sans jamais densifier.
+        Accepte le format creux comme l'ancien format dense (les zéros sont ignorés).
+        """
+        if not filename.endswith('.json'):
+            filename += '.json'
+        
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                problem_data = json.load(f)
+            
+            if "sparse" in problem_data:
+                problem = SparseProblem.from_json_dict(problem_data["sparse"])
+            else:
+                problem = SparseProblem.from_variables(problem_data["variables"])
+            print(f"✅ Problème creux chargé depuis {filename} ({problem.nnz} coefficients non nuls)")
+            return problem
+        except Exception as e:
+            print(f"❌ Erreur lors du chargement: {e}")
+            return None
+    
     def list_history(self):
         """Affiche l'historique des problèmes"""
         if not self.history:
@@ -84,6 +125,17 @@ class VariableManager:
         if 0 <= index < len(self.history):
             return self.history[index]["variables"]
         return None
+    
+    def set_basis(self, index, basis):
+        """Mémorise la base finale d'une résolution (noms des variables de base)"""
+        if 0 <= index < len(self.history):
+            self.history[index]["basis"] = list(basis)
+    
+    def get_basis(self, index):
+        """Base mémorisée pour un démarrage à chaud, None si le problème n'a pas été résolu"""
+        if 0 <= index < len(self.history):
+            return self.history[index].get("basis")
+        return None
 
 def enhanced_tab_var(nombres_variables_base: int, nb_equations: int, method_type="Simplexe Standard") -> dict:
     """Version améliorée de tab_var avec plus d'options"""
@@ -0,0 +1,335 @@
+import time
+from fractions import Fraction
+from math import lcm
+
+import numpy as np
+
+from solver_result import SolveResult, basis_columns
+from two_phase_method import TwoPhaseMethod
+from solve_budget import STOPPED, SolveBudget
+
+
+def to_fraction(value) -> Fraction:
+    """Valeur exacte d'une donnée : les flottants sont lus comme le décimal affiché (0.1 -> 1/10)"""
+    if isinstance(value, float):
+        return Fraction(repr(float(value)))  # float() : repr des flottants numpy
+    return Fraction(value)
+
+
+class ExactSimplexMethod:
+    """
+    Simplexe en arithmétique exacte, sans Fraction dans la boucle.
+
+    Chaque ligne est multipliée par le PPCM de ses dénominateurs : le tableau ne contient
+    que des entiers Python, avec un dénominateur commun D (le dernier pivot). Le pivot de
+    Bareiss (sans fraction) garde tous les coefficients entiers :
+        T[i, j] <- (p * T[i, j] - T[i, q] * T[r, j]) / D   (division exacte)
+    Aucune tolérance n'est utilisée : les signes et les rapports sont comparés exactement.
+
+    Par défaut, une résolution flottante (deux phases) fournit la base de départ ; le
+    simplexe exact ne fait alors que vérifier cette base et la corriger si nécessaire.
+    `certify()` contrôle enfin l'optimum sur les données d'origine en Fraction
+    (réalisabilité primale et duale, égalité des valeurs primale et duale).
+    """
+
+    def __init__(self, variables: dict, warm_start=None, float_start: bool = True, max_degenerate: int = 50,
+                 max_iterations: int = None, time_limit: float = None, cancel=None):
+        self.variables = variables
+        self.n = variables["nombres_variables_base"]
+        # Base approchée (SolveResult ou liste de noms), vérifiée puis corrigée exactement
+        self.warm_start = warm_start
+        self.warm_started = False
+        self.float_start = float_start
+        # Au-delà de ce nombre de pivots dégénérés consécutifs, la règle de Bland est imposée
+        self.max_degenerate = max_degenerate
+        # Limites d'itérations / de temps et jeton d'annulation (CancellationToken)
+        self.budget = SolveBudget(max_iterations, time_limit, cancel)
+        self.iteration = 0
+        self.status = None
+        self.certified = False
+        self.exact_objective = None
+        self.exact_x = None
+        self.exact_duals = None
+        self.result = None
+
+    def run(self):
+        """Exécute le simplexe exact et affiche la solution certifiée"""
+        print(f"\n{'='*60}")
+        print("SIMPLEXE EXACT (PIVOTS DE BAREISS)")
+        print(f"{'='*60}")
+        self.solve(observer=self.print_iteration)
+        self.display_results()
+
+    def build(self):
+        """Forme standard entière : écart (<=), surplus + artificielle (>=), artificielle (=)"""
+        n = self.n
+        equations = list(self.variables["equations"].values())
+        senses = list(self.variables.get("constraints_info") or ["<="] * len(equations))
+        self.a = [[to_fraction(v) for v in eq[1:n + 1]] for eq in equations]
+        self.b = [to_fraction(eq[0]) for eq in equations]
+        self.c = [to_fraction(v) for v in self.variables["tab_optimisation"][1:n + 1]]
+        self.constant = to_fraction(self.variables["tab_optimisation"][0])
+        self.senses = senses
+        m = len(equations)
+
+        # Second membre positif : ligne multipliée par -1, sens inversé
+        self.row_sign = [-1 if b < 0 else 1 for b in self.b]
+        flipped = [{"<=": ">=", ">=": "<=", "=": "="}[s] if sign < 0 else s
+                   for s, sign in zip(senses, self.row_sign)]
+
+        self.names = [f"x{j+1}" for j in range(n)]
+        slack = [None] * m
+        unit = [None] * m  # Colonne +1 de chaque ligne (écart ou artificielle) : lit les prix duaux
+        for i, s in enumerate(flipped):
+            if s in ("<=", ">="):
+                slack[i] = 1 + len(self.names)
+                self.names.append(f"s{i+1}")
+        self.first_artificial = 1 + len(self.names)
+        for i, s in enumerate(flipped):
+            if s in (">=", "="):
+                unit[i] = 1 + len(self.names)
+                self.names.append(f"a{i+1}")
+            else:
+                unit[i] = slack[i]
+        self.unit_columns = unit
+        width = 1 + len(self.names)
+
+        T = np.zeros((m + 1, width), dtype=object)
+        T[:] = 0
+        self.row_scale = []
+        for i in range(m):
+            row = [self.b[i]] + self.a[i]
+            row = [self.row_sign[i] * v for v in row]
+            scale = lcm(*[v.denominator for v in row])
+            self.row_scale.append(scale)
+            for j, v in enumerate(row):
+                T[i, j] = int(v * scale)
+            if slack[i] is not None:
+                T[i, slack[i]] = 1 if flipped[i] == "<=" else -1
+            if flipped[i] in (">=", "="):
+                T[i, unit[i]] = 1
+        self.objective_scale = lcm(*[v.denominator for v in self.c + [self.constant]])
+        self.T = T
+        self.D = 1
+        self.m = m
+        self.basis = list(unit)
+
+    def pivot(self, r: int, q: int):
+        """Pivot de Bareiss : toutes les entrées restent entières, D devient le pivot"""
+        T = self.T
+        p = T[r, q]
+        pivot_row = T[r].copy()
+        new = (p * T - np.outer(T[:, q], pivot_row)) // self.D
+        new[r] = pivot_row
+        if p < 0:
+            # On garde D > 0 : les signes des entrées sont alors ceux des vraies valeurs
+            new, p = -new, -p
+        self.T, self.D = new, p
+        self.basis[r] = q
+
+    def set_objective(self, costs):
+        """Ligne objectif (coûts entiers `costs`, maximisation) exprimée dans la base courante"""
+        row = np.array([0] + [-int(v) for v in costs[1:]], dtype=object)
+        row[0] = int(costs[0])
+        obj = self.D * row
+        for i, col in enumerate(self.basis):
+            if row[col] != 0:
+                obj = obj - row[col] * self.T[i]
+        self.T[self.m] = obj
+
+    def iterate(self, allowed, observer=None) -> str:
+        """Simplexe primal exact sur la ligne objectif courante"""
+        T, m = self.T, self.m
+        degenerate = 0
+        while True:
+            stop = self.budget.exhausted(self.iteration)
+            if stop:
+                return stop
+            T = self.T
+            costs = T[m, 1:]
+            candidates = [j + 1 for j in range(len(costs)) if allowed[j] and costs[j] < 0]
+            if not candidates:
+                return "optimal"
+            bland = degenerate >= self.max_degenerate
+            q = candidates[0] if bland else min(candidates, key=lambda j: T[m, j])
+
+            best = None
+            for i in range(m):
+                if T[i, q] > 0:
+                    # Comparaison exacte T[i,0]/T[i,q] < T[best,0]/T[best,q]
+                    if best is None or T[i, 0] * T[best, q] < T[best, 0] * T[i, q] or (
+                            T[i, 0] * T[best, q] == T[best, 0] * T[i, q] and self.basis[i] < self.basis[best]):
+                        best = i
+            if best is None:
+                return "unbounded"
+
+            degenerate = degenerate + 1 if T[best, 0] == 0 else 0
+            self.iteration += 1
+            self.pivot(best, q)
+            if observer is not None:
+                observer(self, self.iteration, best, q)
+
+    def crash(self, cols):
+        """Fait entrer en base les colonnes d'une base approchée (résolution flottante)"""
+        targets = set(cols)
+        for q in cols:
+            if q in self.basis:
+                continue
+            rows = [i for i in range(self.m) if self.basis[i] not in targets and self.T[i, q] != 0]
+            if rows:
+                self.pivot(rows[0], q)
+
+    def solve(self, observer=None) -> SolveResult:
+        """Résout exactement et renvoie un SolveResult (valeurs converties en float)"""
+        start = time.perf_counter()
+        self.budget.begin(start)
+        self.build()
+        initial = (self.T.copy(), self.D, list(self.basis))
+
+        warm = self.warm_start
+        if warm is None and self.float_start:
+            approximate = TwoPhaseMethod(self.variables, cancel=self.budget.token,
+                                         time_limit=self.budget.time_limit).solve()
+            if approximate.is_optimal:
+                warm = approximate
+        if warm is not None:
+            self.crash([j for j in basis_columns(warm, self.names) if j < self.first_artificial])
+            self.warm_started = all(self.T[i, 0] >= 0 for i in range(self.m))
+            if not self.warm_started:
+                self.T, self.D, self.basis = initial[0], initial[1], list(initial[2])
+        setup_done = time.perf_counter()
+
+        allowed_all = [True] * (len(self.names))
+        self.status = None
+        artificial_rows = [i for i, col in enumerate(self.basis) if col >= self.first_artificial]
+        if any(self.T[i, 0] != 0 for i in artificial_rows):
+            phase_one = [0] * (1 + len(self.names))
+            for col in range(self.first_artificial, 1 + len(self.names)):
+                phase_one[col] = -1
+            self.set_objective(phase_one)
+            stop = self.iterate(allowed_all, observer)
+            if stop in STOPPED:
+                self.status = stop
+            elif self.T[self.m, 0] != 0:
+                self.status = "infeasible"
+        if self.status is None:
+            self.drive_out_artificials()
+            costs = [v * self.objective_scale for v in [self.constant] + self.c]
+            costs += [0] * (len(self.names) - self.n)
+            self.set_objective(costs)
+            allowed = [j + 1 < self.first_artificial for j in range(len(self.names))]
+            self.status = self.iterate(allowed, observer)
+        iterations_done = time.perf_counter()
+
+        self.result = SolveResult(
+            method="Simplexe Exact",
+            status=self.status,
+            iterations=self.iteration,
+            basis=[self.names[col - 1] for col in self.basis],
+        )
+        if self.status == "optimal":
+            self.extract_solution()
+            self.certified = self.certify()
+            self.result.objective = float(self.exact_objective)
+            self.result.x = [float(v) for v in self.exact_x]
+            self.result.duals = [float(v) for v in self.exact_duals]
+        self.result.timings = {
+            "setup": setup_done - start,
+            "iterations": iterations_done - setup_done,
+            "total": time.perf_counter() - start,
+        }
+        return self.result
+
+    def drive_out_artificials(self):
+        """Sort les artificielles restées en base (valeur nulle) quand une colonne réelle le permet"""
+        for i, col in enumerate(self.basis):
+            if col < self.first_artificial:
+                continue
+            for q in range(1, self.first_artificial):
+                if q not in self.basis and self.T[i, q] != 0:
+                    self.pivot(i, q)
+                    break
+
+    def extract_solution(self):
+        """Solution, valeur et prix duaux exacts lus dans le tableau entier (valeur = T / D)"""
+        m, D = self.m, self.D
+        scale = self.objective_scale
+        self.exact_x = [Fraction(0)] * self.n
+        for i, col in enumerate(self.basis):
+            if col <= self.n:
+                self.exact_x[col - 1] = Fraction(self.T[i, 0], D)
+        self.exact_objective = Fraction(self.T[m, 0], D * scale)
+        self.exact_duals = [Fraction(self.T[m, self.unit_columns[i]] * self.row_scale[i] * self.row_sign[i], D * scale)
+                            for i in range(m)]
+
+    def certify(self) -> bool:
+        """
+        Certificat d'optimalité sur les données d'origine (Fraction, aucune tolérance) :
+        x réalisable, y de signe correct et réalisable pour le dual, c·x = b·y.
+        """
+        x, y = self.exact_x, self.exact_duals
+        if any(v < 0 for v in x):
+            return False
+        for a, b, sense, yi in zip(self.a, self.b, self.senses, y):
+            lhs = sum(aj * xj for aj, xj in zip(a, x))
+            if (sense == "<=" and (lhs > b or yi < 0)) or (sense == ">=" and (lhs < b or yi > 0)) \
+                    or (sense == "=" and lhs != b):
+                return False
+        for j in range(self.n):
+            if sum(a[j] * yi for a, yi in zip(self.a, y)) < self.c[j]:
+                return False
+        primal = self.constant + sum(cj * xj for cj, xj in zip(self.c, x))
+        dual = self.constant + sum(bi * yi for bi, yi in zip(self.b, y))
+        return primal == dual == self.exact_objective
+
+    def print_iteration(self, solver, iteration: int, row: int, col: int):
+        """Observateur d'affichage : pivot et taille du dénominateur commun"""
+        print(f"Itération {iteration} : entrante {self.names[col - 1]}, ligne {row}, "
+              f"D = {self.D} ({self.D.bit_length()} bits)")
+
+    def display_results(self):
+        """Affiche la solution exacte"""
+        print(f"\n{'='*60}")
+        print("ANALYSE DE LA SOLUTION FINALE")
+        print(f"{'='*60}")
+
+        if self.status == "infeasible":
+            print("\n❌ PROBLÈME NON RÉALISABLE")
+            return
+        if self.status == "unbounded":
+            print("Solution illimitée!")
+            return
+        if self.status in STOPPED:
+            print(f"\n⏱️  Arrêt avant l'optimum : {self.budget.reason}")
+            return
+
+        print("\n✅ SOLUTION OPTIMALE " + ("CERTIFIÉE" if self.certified else "NON CERTIFIÉE"))
+        print(f"Valeur optimale: Z = {self.exact_objective} ({float(self.exact_objective):.6f})")
+        print("\nVariables de décision:")
+        for j, value in enumerate(self.exact_x):
+            print(f"  x{j+1} = {value}")
+        print("\nPrix duaux:")
+        for i, value in enumerate(self.exact_duals):
+            print(f"  y{i+1} = {value}")
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    # Max Z = 3x1 + 5x2
+    # x1 ≤ 4
+    # 2x2 ≤ 12
+    # 3x1 + 2x2 = 18
+    variables_exact = {
+        "tab_optimisation": [0, 3, 5],
+        "nombres_variables_base": 2,
+        "equations": {
+            "equation_1": [4, 1, 0],
+            "equation_2": [12, 0, 2],
+            "equation_3": [18, 3, 2],
+        },
+        "nb_equations": 3,
+        "constraints_info": ["<=", "<=", "="]
+    }
+
+    exact = ExactSimplexMethod(variables_exact)
+    exact.run()
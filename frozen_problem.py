@@ -0,0 +1,129 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import numpy as np
+
+
+def _readonly(array) -> np.ndarray:
+    array = np.array(array, dtype=np.float64)
+    array.setflags(write=False)
+    return array
+
+
+def _freeze_value(value):
+    """Valeur annexe figée (listes -> tuples), pour les clés autres que les coefficients"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze_value(item) for key, item in value.items()})
+    return value
+
+
+class FrozenProblem(Mapping):
+    """
+    Problème en lecture seule, partagé sans copie par toutes les résolutions (threads de la GUI,
+    comparaisons simultanées). Il se lit comme le dictionnaire `variables` habituel :
+
+    - "tab_optimisation" : ndarray en lecture seule [c0, c1..cn] ;
+    - "equations" : equation_i -> ligne [b_i, a_i1..a_in], vue en lecture seule d'une
+      seule matrice m x (n+1) ;
+    - "constraints_info", "bounds" et les autres listes : tuples.
+
+    Toute écriture lève une erreur : un solveur ne peut pas modifier la donnée partagée.
+    Chaque solveur travaille dans son propre espace dérivé (StandardForm, tableau, base),
+    et `replace(**changes)` produit un nouveau problème qui partage les données non modifiées.
+    """
+
+    def __init__(self, variables):
+        n = variables["nombres_variables_base"]
+        equations = variables["equations"]
+        rows = np.zeros((len(equations), n + 1))
+        for i, equation in enumerate(equations.values()):
+            rows[i] = equation[:n + 1]
+        self.rows = _readonly(rows)
+        data = {key: _freeze_value(value) for key, value in variables.items()
+                if key not in ("tab_optimisation", "equations")}
+        data["tab_optimisation"] = _readonly(variables["tab_optimisation"][:n + 1])
+        data["equations"] = MappingProxyType(dict(zip(equations.keys(), self.rows)))
+        data["nb_equations"] = len(equations)
+        self._data = data
+
+    @classmethod
+    def from_rows(cls, rows, tab_optimisation, **extra) -> "FrozenProblem":
+        """
+        Construit le problème directement depuis la matrice [b | A] (m x (n+1)) et
+        [c0, c1..cn], sans passer par une liste par ligne ; `extra` : autres clés.
+        """
+        problem = cls.__new__(cls)
+        problem.rows = _readonly(rows)
+        data = {key: _freeze_value(value) for key, value in extra.items()}
+        data["tab_optimisation"] = _readonly(tab_optimisation)
+        data["nombres_variables_base"] = problem.rows.shape[1] - 1
+        data["equations"] = MappingProxyType({f"equation_{i+1}": row for i, row in enumerate(problem.rows)})
+        data["nb_equations"] = len(problem.rows)
+        problem._data = data
+        return problem
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"FrozenProblem({self._data['nb_equations']} contrainte(s), " \
+               f"{self._data['nombres_variables_base']} variable(s))"
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # Immuable : une copie serait identique, on partage l'instance
+        return self
+
+    def __reduce__(self):
+        return FrozenProblem, (self.to_variables(),)
+
+    def replace(self, **changes) -> "FrozenProblem":
+        """
+        Copie sur écriture : nouveau problème où seules les clés `changes` sont remplacées,
+        la matrice des contraintes étant partagée si "equations" n'en fait pas partie.
+        """
+        if "equations" in changes or "nombres_variables_base" in changes:
+            return FrozenProblem({**self.to_variables(), **changes})
+        problem = FrozenProblem.__new__(FrozenProblem)
+        problem.rows = self.rows
+        data = dict(self._data)
+        for key, value in changes.items():
+            data[key] = _readonly(value) if key == "tab_optimisation" else _freeze_value(value)
+        problem._data = data
+        return problem
+
+    def to_variables(self) -> dict:
+        """Dictionnaire `variables` modifiable (listes Python neuves)"""
+        def thaw(value):
+            if isinstance(value, tuple):
+                return [thaw(item) for item in value]
+            if isinstance(value, Mapping):
+                return {key: thaw(item) for key, item in value.items()}
+            if isinstance(value, np.ndarray):
+                return value.tolist()
+            return value
+        return {key: thaw(value) for key, value in self._data.items()}
+
+
+def freeze_problem(problem):
+    """
+    Version figée de `problem` (dictionnaire `variables`), à construire une fois par problème
+    puis à partager entre les résolutions. Un FrozenProblem est renvoyé tel quel, de même qu'un
+    SparseProblem (ses tableaux ne sont jamais modifiés par les solveurs) ; un Problem est
+    figé par Problem.freeze.
+    """
+    if hasattr(problem, "freeze"):
+        return problem.freeze()
+    if isinstance(problem, FrozenProblem) or not isinstance(problem, Mapping):
+        return problem
+    return FrozenProblem(problem)
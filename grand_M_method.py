@@ -1,14 +1,46 @@
 from variables import display_simplex_tableau
-import copy
-from fractions import Fraction
+from tableau_engine import TableauEngine
+from solver_result import SolveResult, basis_columns, duals_from_basis
+from solver_events import IterationEvent, SolverEvents
+from pricing import make_pricing
+from degeneracy import DegeneracyGuard
+from solve_budget import STOPPED, SolveBudget
+from standard_form import ARTIFICIAL, StandardForm
+import time
+import numpy as np
 
 class GrandMMethod:
-    def __init__(self, variables: dict):
+    def __init__(self, variables: dict, pricing=None, warm_start=None, max_iterations=None, time_limit=None,
+                 perturbation="auto", cancel=None):
         self.variables = variables
+        # Base d'une résolution précédente (SolveResult ou liste de noms) pour un démarrage à chaud
+        self.warm_start = warm_start
+        self.warm_started = False
+        # Règle de choix de la variable entrante (nom de pricing.PRICING_RULES ou instance)
+        self.pricing = make_pricing(pricing)
+        # Stagnation (perturbation puis Bland)
+        self.guard = DegeneracyGuard(perturbation)
+        # Limites d'itérations / de temps et jeton d'annulation (CancellationToken)
+        self.budget = SolveBudget(max_iterations, time_limit, cancel)
         self.n = variables["nombres_variables_base"]
         self.M = 1000  # Valeur de M (très grande)
         self.artificial_vars = []
+        self.redundant_rows = []
+        self.initial_basis = []
+        self.column_names = []
+        # Forme standard (le dictionnaire `variables` n'est jamais modifié) et son tableau
+        # courant sous forme de dictionnaire, pour l'affichage
+        self.form = None
+        self.tableau_variables = None
         self.iteration = 0
+        self.engine = None
+        self.status = None
+        self.result = None
+        self.events = SolverEvents()
+        
+    def subscribe(self, callback):
+        """Abonne `callback(IterationEvent)` aux itérations du solveur"""
+        return self.events.subscribe(callback)
         
     def run(self):
         """Exécute la méthode du Grand M"""
@@ -16,179 +48,218 @@ class GrandMMethod:
         print("MÉTHODE DU GRAND M")
         print(f"{'='*60}")
         
-        # Ajout des variables d'écart et artificielles
-        self.add_slack_and_artificial_variables()
+        self.solve(observer=self.print_iteration, on_start=self.print_initial_tableau)
+        for note in self.guard.notes:
+            print(f"⚠️  {note}")
+        if self.status == "unbounded":
+            print("Solution illimitée!")
+            return
+        if self.status in STOPPED:
+            print(f"⏱️  Arrêt avant l'optimum : {self.budget.reason}")
+            return
         
-        # Modification de la fonction objectif
-        self.modify_objective_function()
+        self.analyze_final_solution()
+    
+    def solve(self, observer=None, on_start=None) -> SolveResult:
+        """
+        Résout sans aucune entrée/sortie et renvoie un SolveResult.
+        `observer(solver, iteration, row, col)` est appelé après chaque pivot s'il est fourni.
+        """
+        start = time.perf_counter()
         
-        # Rendre le tableau propre
-        self.make_tableau_proper()
+        # Variables d'écart, de surplus et artificielles, pénalité M et ligne objectif propre
+        self.engine = TableauEngine(self.build_tableau(), basis=self.initial_basis)
+        if self.warm_start is not None:
+            self.warm_started = self.engine.warm_start(basis_columns(self.warm_start, self.column_names))
+        self.pricing.reset(self.engine)
+        self.guard.reset(self.engine)
+        self.budget.begin(start)
+        setup_done = time.perf_counter()
+        if on_start is not None:
+            on_start(self)
         
-        # Affichage du tableau initial
-        print("\nTableau initial après introduction des variables artificielles:")
-        display_simplex_tableau(self.variables, 0)
+        self.status = self.iterate(start, observer)
+        if self.status == "optimal" and not self.artificial_left() and self.basic_artificial_rows().size:
+            # Artificielles restées en base à zéro : on les sort, puis on reprend sans elles
+            self.drive_out_artificials()
+            self.pricing.reset(self.engine)
+            self.guard.reset(self.engine)
+            self.status = self.iterate(start, observer)
+        iterations_done = time.perf_counter()
+        
+        self.engine.write_back(self.tableau_variables)
+        basis = self.engine.basis
+        artificial_left = self.artificial_left()
+        # Artificielle non nulle à l'optimum, ou rayon sans qu'elles soient sorties : non réalisable
+        if self.status in ("optimal", "unbounded") and artificial_left:
+            self.status = "infeasible"
         
-        # Itérations du simplexe
+        self.result = SolveResult(
+            method="Grand M",
+            status=self.status,
+            iterations=self.iteration,
+            basis=[self.column_names[col - 1] for col in basis],
+        )
+        if self.status == "optimal":
+            self.result.objective = float(self.engine.objective[0])
+            self.result.x = self.engine.primal_values(self.n).tolist()
+            self.result.duals = self.compute_duals()
+        elif self.status in STOPPED and not artificial_left and self.engine.primal_infeasibility() == 0.0:
+            # Dernier sommet visité, s'il est réalisable pour le problème d'origine
+            self.result.objective = float(self.engine.objective[0])
+            self.result.x = self.engine.primal_values(self.n).tolist()
+        self.result.timings = {
+            "setup": setup_done - start,
+            "iterations": iterations_done - setup_done,
+            "total": time.perf_counter() - start,
+        }
+        return self.result
+    
+    def iterate(self, start, observer=None) -> str:
+        """Itérations du simplexe jusqu'à l'optimum, un rayon ou l'épuisement du budget ; renvoie le statut"""
+        status = "optimal"
         while self.can_iterate():
-            self.iteration += 1
-            print(f"\n{'='*20} Itération {self.iteration} {'='*20}")
-            
+            stop = self.budget.exhausted(self.iteration)
+            if stop:
+                status = stop
+                break
             col = self.find_pivot_column()
             if col == -1:
                 break
-                
+            
             pivot_row = self.find_pivot_row(col)
             if pivot_row == -1:
-                print("Solution illimitée!")
-                return
-                
-            print(f"Colonne pivot : {col}")
-            print(f"Ligne pivot : {pivot_row}")
+                status = "unbounded"
+                break
             
-            self.pivot_operation(pivot_row, col)
-            display_simplex_tableau(self.variables, self.iteration)
-        
-        self.analyze_final_solution()
+            self.iteration += 1
+            leaving = self.engine.basis[pivot_row]
+            self.pricing.update(self.engine, pivot_row, col)
+            self.engine.pivot(pivot_row, col)
+            self.pricing = self.guard.after_pivot(self.engine, self.pricing)
+            if self.events:
+                self.emit_iteration(leaving, col, start)
+            if observer is not None:
+                observer(self, self.iteration, pivot_row, col)
+        if not self.guard.finish(self.engine, optimal=status == "optimal"):
+            status = "infeasible"
+        self.iteration += self.guard.cleanup_pivots
+        self.guard.cleanup_pivots = 0
+        return status
     
-    def add_slack_and_artificial_variables(self):
-        """Ajoute les variables d'écart et artificielles selon le type de contrainte"""
-        constraints_info = self.variables.get("constraints_info", [])
-        equations = list(self.variables["equations"].values())
-        
-        # Si pas d'info sur les contraintes, on assume toutes ≤
-        if not constraints_info:
-            constraints_info = ["<="] * len(equations)
-        
-        slack_count = 0
-        artificial_count = 0
-        
-        # Modification de la fonction objectif pour inclure les nouvelles variables
-        original_vars = len(self.variables["tab_optimisation"])
-        
-        for i, constraint_type in enumerate(constraints_info):
-            if constraint_type == "<=":
-                # Variable d'écart
-                self.variables["tab_optimisation"].append(0)
-                slack_count += 1
-            elif constraint_type == ">=":
-                # Variable d'écart (négative) + variable artificielle
-                self.variables["tab_optimisation"].append(0)  # Variable d'écart
-                self.variables["tab_optimisation"].append(-self.M)  # Variable artificielle
-                self.artificial_vars.append(original_vars + slack_count + artificial_count + 1)
-                slack_count += 1
-                artificial_count += 1
-            elif constraint_type == "=":
-                # Variable artificielle seulement
-                self.variables["tab_optimisation"].append(-self.M)
-                self.artificial_vars.append(original_vars + slack_count + artificial_count)
-                artificial_count += 1
+    def basic_artificial_rows(self):
+        """Lignes dont la variable de base est artificielle (lues dans l'en-tête de base)"""
+        return np.flatnonzero(np.isin(self.engine.basis, self.artificial_vars))
+    
+    def artificial_left(self) -> bool:
+        """Vrai si une artificielle de base est non nulle"""
+        return bool((np.abs(self.engine.rhs[self.basic_artificial_rows()]) > 1e-10).any())
+    
+    def drive_out_artificials(self):
+        """
+        Sort les artificielles restées en base à zéro (pivot dégénéré sur une colonne d'origine),
+        supprime les contraintes redondantes puis les colonnes artificielles, comme la fin de
+        la phase 1 de la méthode des deux phases
+        """
+        first_artificial = min(self.artificial_vars)
+        redundant = []
+        for row in self.basic_artificial_rows().tolist():
+            candidates = np.flatnonzero(np.abs(self.engine.tableau[row, 1:first_artificial]) > self.engine.tol)
+            if len(candidates) == 0:
+                redundant.append(row)  # Contrainte combinaison des autres
+                continue
+            self.engine.pivot(row, int(candidates[0]) + 1)
         
-        # Modification des équations
-        total_new_vars = slack_count + artificial_count
-        for i, constraint_type in enumerate(constraints_info):
-            current_length = len(equations[i])
-            target_length = original_vars + total_new_vars
-            
-            # Ajouter des zéros pour toutes les nouvelles variables
-            while len(equations[i]) < target_length:
-                equations[i].append(0)
-            
-            # Placer les coefficients appropriés
-            var_index = original_vars - 1  # -1 car on compte à partir de 0
-            
-            if constraint_type == "<=":
-                var_index += 1
-                equations[i][var_index] = 1  # Variable d'écart
-            elif constraint_type == ">=":
-                var_index += 1
-                equations[i][var_index] = -1  # Variable d'écart (négative)
-                var_index += 1
-                equations[i][var_index] = 1   # Variable artificielle
-            elif constraint_type == "=":
-                var_index += 1
-                equations[i][var_index] = 1   # Variable artificielle
+        if redundant:
+            self.engine.drop_rows(redundant)
+            self.redundant_rows = redundant
+            equations = self.tableau_variables["equations"]
+            kept = [key for r, key in enumerate(equations) if r not in redundant]
+            self.tableau_variables["equations"] = {key: equations[key] for key in kept}
+            self.tableau_variables["nb_equations"] = len(kept)
         
-        # Mise à jour des équations dans variables
-        for k, equation in enumerate(equations):
-            self.variables["equations"][list(self.variables["equations"].keys())[k]] = equation
+        self.engine.drop_columns(self.artificial_vars)
+        del self.column_names[first_artificial - 1:]
+        self.artificial_vars = []
     
-    def modify_objective_function(self):
-        """Modifie la fonction objectif en ajoutant -M pour les variables artificielles"""
-        # La fonction objectif est déjà modifiée dans add_slack_and_artificial_variables
-        # On inverse le signe pour la maximisation
-        self.variables["tab_optimisation"] = [-x for x in self.variables["tab_optimisation"]]
+    def compute_duals(self):
+        """
+        Prix duaux dans l'ordre des équations d'origine : coûts réels (sans la pénalité M),
+        lignes avant changement de signe, 0 pour les contraintes redondantes
+        """
+        kept = np.array([r for r in range(self.form.m) if r not in self.redundant_rows], dtype=int)
+        y = duals_from_basis(self.form.matrix[kept], self.form.costs, self.engine.basis - 1)
+        if y is None:
+            return None
+        duals = np.zeros(self.form.m)
+        duals[kept] = y * self.form.row_sign[kept]
+        return duals.tolist()
     
-    def make_tableau_proper(self):
-        """Rend le tableau propre en éliminant les variables artificielles de la fonction objectif"""
-        equations = list(self.variables["equations"].values())
-        tab_optimisation = self.variables["tab_optimisation"].copy()
-        
-        for var_index in self.artificial_vars:
-            # Trouver la ligne où cette variable artificielle est de base
-            for i, equation in enumerate(equations):
-                if var_index < len(equation) and equation[var_index] == 1:
-                    # Éliminer cette variable de la fonction objectif
-                    coeff = tab_optimisation[var_index]
-                    for j in range(len(tab_optimisation)):
-                        if j < len(equation):
-                            tab_optimisation[j] -= coeff * equation[j]
-                    break
+    def emit_iteration(self, leaving, entering, start):
+        """Construit et diffuse l'événement de l'itération courante"""
+        basis = self.engine.basis
+        artificial = np.isin(basis, self.artificial_vars)
+        self.events.emit(IterationEvent(
+            method="Grand M",
+            iteration=self.iteration,
+            entering=self.column_names[entering - 1],
+            leaving=self.column_names[leaving - 1],
+            objective=float(self.engine.objective[0]),
+            primal_infeasibility=float(np.abs(self.engine.rhs[artificial]).sum())
+            + self.engine.primal_infeasibility(),
+            dual_infeasibility=self.engine.dual_infeasibility(),
+            elapsed=time.perf_counter() - start,
+        ))
+    
+    def print_initial_tableau(self, solver):
+        """Affiche le tableau initial (observateur de démarrage)"""
+        print("\nTableau initial après introduction des variables artificielles:")
+        self.engine.write_back(self.tableau_variables)
+        display_simplex_tableau(self.tableau_variables, 0)
+    
+    def print_iteration(self, solver, iteration, pivot_row, col):
+        """Observateur d'affichage : reproduit la sortie console historique"""
+        print(f"\n{'='*20} Itération {iteration} {'='*20}")
+        print(f"Colonne pivot : {col}")
+        print(f"Ligne pivot : {pivot_row}")
+        # Le dictionnaire du tableau n'est resynchronisé que pour l'affichage
+        self.engine.write_back(self.tableau_variables)
+        display_simplex_tableau(self.tableau_variables, iteration)
+    
+    def build_tableau(self):
+        """
+        Tableau initial (forme standard commune) : écart pour <=, surplus et artificielle pour >=,
+        artificielle pour =, puis coût -M des artificielles éliminé de la ligne objectif
+        """
+        self.form = StandardForm(self.variables)
+        self.tableau_variables = self.form.as_variables()
+        self.column_names = self.form.column_names
+        self.artificial_vars = self.form.columns(ARTIFICIAL).tolist()
+        self.initial_basis = self.form.basis.tolist()
         
-        self.variables["tab_optimisation"] = tab_optimisation
+        m = self.form.m
+        tableau = self.form.tableau.copy()
+        tableau[m, self.artificial_vars] = self.M
+        artificial_rows = np.isin(self.form.basis, self.artificial_vars)
+        tableau[m] -= self.M * tableau[:m][artificial_rows].sum(axis=0)
+        return tableau
     
     def find_pivot_column(self):
-        """Trouve la colonne pivot (coefficient le plus négatif)"""
-        min_val = min(self.variables["tab_optimisation"][1:])
-        if min_val >= 0:
-            return -1
-        return self.variables["tab_optimisation"][1:].index(min_val) + 1
+        """Trouve la colonne pivot (règle de pricing choisie)"""
+        return self.pricing.select(self.engine)
     
     def find_pivot_row(self, col):
         """Trouve la ligne pivot selon la règle du minimum des rapports"""
-        equations = list(self.variables["equations"].values())
-        min_ratio = float('inf')
-        pivot_row = -1
-        
-        for i, equation in enumerate(equations):
-            if col < len(equation) and equation[col] > 0:
-                ratio = equation[0] / equation[col]
-                if ratio < min_ratio:
-                    min_ratio = ratio
-                    pivot_row = i
-        
-        return pivot_row
+        return self.pricing.choose_row(self.engine, col)
     
     def pivot_operation(self, pivot_row, pivot_col):
         """Effectue l'opération de pivotage"""
-        equations = list(self.variables["equations"].values())
-        tab_optimisation = self.variables["tab_optimisation"].copy()
-        
-        # Normaliser la ligne pivot
-        pivot_element = equations[pivot_row][pivot_col]
-        equations[pivot_row] = [x / pivot_element for x in equations[pivot_row]]
-        
-        # Éliminer la variable pivot des autres lignes
-        for i in range(len(equations)):
-            if i != pivot_row and pivot_col < len(equations[i]):
-                factor = equations[i][pivot_col]
-                for j in range(len(equations[i])):
-                    equations[i][j] -= factor * equations[pivot_row][j]
-        
-        # Éliminer de la fonction objectif
-        factor = tab_optimisation[pivot_col]
-        for j in range(len(tab_optimisation)):
-            if j < len(equations[pivot_row]):
-                tab_optimisation[j] -= factor * equations[pivot_row][j]
-        
-        # Mise à jour
-        self.variables["tab_optimisation"] = tab_optimisation
-        for k, equation in enumerate(equations):
-            self.variables["equations"][list(self.variables["equations"].keys())[k]] = equation
+        self.engine.pivot(pivot_row, pivot_col)
+        self.engine.write_back(self.tableau_variables)
     
     def can_iterate(self):
         """Vérifie s'il faut continuer les itérations"""
-        return any(x < -1e-10 for x in self.variables["tab_optimisation"][1:])
+        return self.engine.can_iterate()
     
     def analyze_final_solution(self):
         """Analyse la solution finale"""
@@ -196,42 +267,26 @@ class GrandMMethod:
         print("ANALYSE DE LA SOLUTION FINALE")
         print(f"{'='*60}")
         
-        # Vérifier si les variables artificielles sont nulles
+        # Variables artificielles de base non nulles, lues dans l'en-tête de base
+        basis = self.engine.basis
+        artificial_rows = np.flatnonzero(np.isin(basis, self.artificial_vars))
         artificial_in_solution = False
-        equations = list(self.variables["equations"].values())
-        
-        for var_index in self.artificial_vars:
-            # Chercher si cette variable artificielle est en base avec valeur non nulle
-            for i, equation in enumerate(equations):
-                if var_index < len(equation):
-                    # Vérifier si c'est une variable de base
-                    is_basic = abs(equation[var_index] - 1.0) < 1e-10
-                    others_zero = all(abs(eq[var_index]) < 1e-10 for j, eq in enumerate(equations) if j != i)
-                    
-                    if is_basic and others_zero and abs(equation[0]) > 1e-10:
-                        artificial_in_solution = True
-                        print(f"⚠️  Variable artificielle x{var_index+1} = {equation[0]:.6f}")
+        for row in artificial_rows:
+            value = self.engine.rhs[row]
+            if abs(value) > 1e-10:
+                artificial_in_solution = True
+                print(f"⚠️  Variable artificielle {self.column_names[basis[row] - 1]} = {value:.6f}")
         
         if artificial_in_solution:
             print("\n❌ PROBLÈME NON RÉALISABLE")
             print("Au moins une variable artificielle est non nulle dans la solution optimale.")
         else:
             print("\n✅ SOLUTION OPTIMALE TROUVÉE")
-            z_opt = self.variables["tab_optimisation"][0]
+            z_opt = self.engine.objective[0]
             print(f"Valeur optimale: Z = {z_opt:.6f}")
             
-            # Extraction de la solution
-            var_values = [0] * self.variables["nombres_variables_base"]
-            for j in range(1, self.variables["nombres_variables_base"] + 1):
-                for i, eq in enumerate(equations):
-                    if j < len(eq) and abs(eq[j] - 1.0) < 1e-10:
-                        # Vérifier que c'est bien une variable de base
-                        others_zero = all(abs(other_eq[j]) < 1e-10 for k, other_eq in enumerate(equations) if k != i)
-                        if others_zero:
-                            var_values[j-1] = eq[0]
-            
             print("\nVariables de décision:")
-            for i, val in enumerate(var_values):
+            for i, val in enumerate(self.engine.primal_values(self.n)):
                 print(f"  x{i+1} = {val:.6f}")
 
 
@@ -43,9 +43,22 @@ ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark
 try:
     from tab_method import SimplexMethodTab
     from grand_M_method import GrandMMethod  
+    from two_phase_method import TwoPhaseMethod
     from dual_method import DualMethod
+    from interior_point import InteriorPointMethod
     from enhanced_variables import VariableManager
     from variables import display_simplex_tableau
+    from pricing import PRICING_RULES
+    from method_selection import select_method
+    from sensitivity import sensitivity_analysis
+    from parametric import parametric_analysis
+    from presolve import Presolve
+    from scaling import Scaling
+    from solve_budget import CancellationToken, STOPPED
+    from frozen_problem import freeze_problem
+    from sparse_problem import SparseProblem
+    from bounded_method import bounds_as_constraints
+    from lp_mps import ProblemNames, read_problem, write_problem, write_solution
 except ImportError as e:
     print(f"Erreur d'import: {e}")
     print("Assurez-vous que tous les modules sont dans le même dossier")
@@ -156,9 +169,17 @@ class SimplexGUI:
         self.setup_window()
         self.variable_manager = VariableManager()
         self.current_problem = None
+        # Version figée du problème courant, partagée sans copie par toutes les résolutions
+        self._shared_problem = None
+        self._shared_source = None
         self.solving_animation = None
         self.auto_save_enabled = True
         self.history_visualizations = []
+        # Base finale de la dernière résolution (démarrage à chaud des re-résolutions)
+        self.last_basis = None
+        self.current_history_index = None
+        # Noms des variables et contraintes du dernier modèle LP/MPS importé (pour l'export)
+        self.imported_names = None
         
         # Variables pour l'interface
         self.problem_vars = []
@@ -170,7 +191,7 @@ class SimplexGUI:
             'problems_solved': 0,
             'total_iterations': 0,
             'avg_solving_time': 0,
-            'methods_used': {'Simplexe': 0, 'Grand M': 0, 'Dual': 0}
+            'methods_used': {'Simplexe': 0, 'Grand M': 0, 'Deux Phases': 0, 'Dual': 0, 'Point Intérieur': 0}
         }
         
         self.create_main_interface()
@@ -209,6 +230,10 @@ class SimplexGUI:
         self.root.bind('<F5>', lambda e: self.solve_standard())
         self.root.bind('<F6>', lambda e: self.solve_grand_m())
         self.root.bind('<F7>', lambda e: self.solve_dual())
+        self.root.bind('<F8>', lambda e: self.solve_two_phase())
+        self.root.bind('<F9>', lambda e: self.solve_interior_point())
+        self.root.bind('<F10>', lambda e: self.solve_automatic())
+        self.root.bind('<Escape>', lambda e: self.cancel_solve())
         self.root.bind('<F11>', lambda e: self.toggle_fullscreen())
         self.root.bind('<Control-d>', lambda e: self.theme.toggle())
     
@@ -789,6 +814,14 @@ class SimplexGUI:
                 "color": "green",
                 "shortcut": "F6"
             },
+            {
+                "name": "Deux Phases",
+                "icon": "🧭",
+                "desc": "Contraintes ≥ ou = sans constante M arbitraire",
+                "command": self.solve_two_phase,
+                "color": "teal",
+                "shortcut": "F8"
+            },
             {
                 "name": "Analyse Duale",
                 "icon": "🔄",
@@ -796,6 +829,22 @@ class SimplexGUI:
                 "command": self.solve_dual,
                 "color": "orange",
                 "shortcut": "F7"
+            },
+            {
+                "name": "Point Intérieur",
+                "icon": "🎈",
+                "desc": "Grands problèmes creux (Mehrotra + crossover)",
+                "command": self.solve_interior_point,
+                "color": "brown",
+                "shortcut": "F9"
+            },
+            {
+                "name": "Automatique",
+                "icon": "🤖",
+                "desc": "Méthode choisie selon la taille, la densité et les contraintes",
+                "command": self.solve_automatic,
+                "color": "gray",
+                "shortcut": "F10"
             }
         ]
         
@@ -815,6 +864,22 @@ class SimplexGUI:
         )
         compare_btn.pack(pady=(0, 15))
         
+        # Présolve : réductions du problème avant la méthode choisie, solution reconstruite ensuite
+        self.presolve_var = tk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            methods_frame,
+            text="🧹 Présolve avant résolution (lignes/colonnes redondantes, variables fixées)",
+            variable=self.presolve_var
+        ).pack(pady=(0, 5))
+        
+        # Mise à l'échelle : coefficients ramenés autour de 1 pour les tests de rapport et les tolérances
+        self.scale_var = tk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            methods_frame,
+            text="⚖️ Mise à l'échelle des lignes et colonnes (coefficients de tailles très différentes)",
+            variable=self.scale_var
+        ).pack(pady=(0, 15))
+        
         # Progression
         self.create_progress_section(scroll_frame)
         
@@ -893,9 +958,20 @@ class SimplexGUI:
             height=20,
             corner_radius=10
         )
-        self.progress_bar.pack(pady=(10, 15))
+        self.progress_bar.pack(pady=(10, 10))
         self.progress_bar.set(0)
         
+        # Annulation coopérative : le solveur s'arrête à l'itération suivante et garde sa base
+        self.cancel_token = None
+        self.stop_button = ctk.CTkButton(
+            progress_frame,
+            text="⏹️ Arrêter (Échap)",
+            command=self.cancel_solve,
+            state="disabled",
+            width=200
+        )
+        self.stop_button.pack(pady=(0, 15))
+        
     def create_results_tab_modern(self):
         """Onglet des résultats moderne"""
         tab = self.tabview.tab("📊 Résultats")
@@ -988,12 +1064,14 @@ class SimplexGUI:
         viz_notebook.add("📊 Analyse 3D")
         viz_notebook.add("🔄 Animation")
         viz_notebook.add("📈 Sensibilité")
+        viz_notebook.add("📉 Paramétrique")
         
         # Configuration des sous-onglets
         self.create_feasible_region_viz(viz_notebook.tab("🎨 Région Réalisable"))
         self.create_3d_analysis(viz_notebook.tab("📊 Analyse 3D"))
         self.create_animation_viz(viz_notebook.tab("🔄 Animation"))
         self.create_sensitivity_analysis(viz_notebook.tab("📈 Sensibilité"))
+        self.create_parametric_analysis(viz_notebook.tab("📉 Paramétrique"))
         
     def create_feasible_region_viz(self, parent):
         """Visualisation de la région réalisable"""
@@ -1079,6 +1157,138 @@ class SimplexGUI:
         self.sensitivity_frame = ctk.CTkFrame(parent)
         self.sensitivity_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
+    def create_parametric_analysis(self, parent):
+        """Balayage paramétrique d'un second membre ou d'un coefficient de l'objectif"""
+        control_frame = ctk.CTkFrame(parent)
+        control_frame.pack(fill="x", padx=10, pady=10)
+        
+        ctk.CTkLabel(control_frame, text="Paramètre:").pack(side="left", padx=(10, 5))
+        self.parametric_target_var = tk.StringVar(value="Second membre")
+        ctk.CTkOptionMenu(
+            control_frame,
+            values=["Second membre", "Coût"],
+            variable=self.parametric_target_var,
+            width=140
+        ).pack(side="left", padx=5)
+        
+        ctk.CTkLabel(control_frame, text="N°:").pack(side="left", padx=(10, 5))
+        self.parametric_index_var = tk.StringVar(value="1")
+        ctk.CTkEntry(control_frame, textvariable=self.parametric_index_var, width=50).pack(side="left", padx=5)
+        
+        ctk.CTkLabel(control_frame, text="θ de").pack(side="left", padx=(10, 5))
+        self.parametric_min_var = tk.StringVar(value="-10")
+        ctk.CTkEntry(control_frame, textvariable=self.parametric_min_var, width=70).pack(side="left", padx=5)
+        ctk.CTkLabel(control_frame, text="à").pack(side="left", padx=5)
+        self.parametric_max_var = tk.StringVar(value="10")
+        ctk.CTkEntry(control_frame, textvariable=self.parametric_max_var, width=70).pack(side="left", padx=5)
+        
+        AnimatedButton(
+            control_frame,
+            text="📉 Balayer",
+            command=self.run_parametric_analysis,
+            width=120,
+            height=32,
+            corner_radius=8
+        ).pack(side="left", padx=10)
+        
+        self.parametric_frame = ctk.CTkFrame(parent)
+        self.parametric_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        
+    def run_parametric_analysis(self):
+        """Trace Z(θ) en un seul balayage (un pivot par point de rupture, aucune résolution à froid)"""
+        if not self.current_problem:
+            self.show_error("Veuillez d'abord définir un problème")
+            return
+        try:
+            target = "rhs" if self.parametric_target_var.get() == "Second membre" else "cost"
+            index = int(self.parametric_index_var.get()) - 1
+            theta_min = float(self.parametric_min_var.get())
+            theta_max = float(self.parametric_max_var.get())
+            size = self.current_problem["nb_equations"] if target == "rhs" \
+                else self.current_problem["nombres_variables_base"]
+            if not 0 <= index < size:
+                raise ValueError(f"Numéro hors limites (1 à {size})")
+            direction = [0.0] * size
+            direction[index] = 1.0
+            curve = parametric_analysis(self.current_problem, direction, target, theta_max, theta_min)
+        except ValueError as e:
+            self.show_error(f"Analyse paramétrique impossible:\n{e}")
+            return
+        if not curve.segments:
+            self.show_error(f"Aucune solution optimale sur l'intervalle ({curve.status})")
+            return
+        
+        for widget in self.parametric_frame.winfo_children():
+            widget.destroy()
+        
+        fig, ax = plt.subplots(figsize=(8, 5))
+        if self.theme.dark_mode:
+            plt.style.use('dark_background')
+        thetas, values = curve.points()
+        if self.current_problem.get("objective_type", "max") == "min":
+            values = [-v for v in values]  # Z stocké sous forme de maximisation
+        ax.plot(thetas, values, color='#4ECDC4', linewidth=2.5, marker='o', markersize=6)
+        label = f"b{self.subscript(index+1)}" if target == "rhs" else f"c{self.subscript(index+1)}"
+        ax.set_xlabel(f'θ ({label} + θ)', fontsize=12)
+        ax.set_ylabel('Z optimal', fontsize=12)
+        ax.set_title(f"Valeur optimale en fonction de {label} ({len(curve.segments)} segment(s), "
+                     f"{curve.pivots} pivot(s))", fontsize=13, fontweight='bold')
+        if curve.status != "optimal" and thetas:
+            ax.axvline(thetas[-1], color='#FF6B6B', linestyle='--', label=f"Au-delà : {curve.status}")
+            ax.legend()
+        ax.grid(True, alpha=0.3)
+        
+        canvas = FigureCanvasTkAgg(fig, self.parametric_frame)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        
+    def current_sensitivity_report(self):
+        """Analyse de sensibilité de la dernière base optimale (None si indisponible)"""
+        solve_result = (getattr(self, 'last_result', None) or {}).get('result')
+        if solve_result is None or not solve_result.is_optimal or not self.current_problem:
+            return None
+        try:
+            return sensitivity_analysis(self.current_problem, solve_result)
+        except ValueError:
+            return None
+        
+    def update_sensitivity_analysis(self):
+        """Affiche prix duaux, coûts réduits et intervalles de validité de la dernière solution"""
+        for widget in self.sensitivity_frame.winfo_children():
+            widget.destroy()
+        
+        report = self.current_sensitivity_report()
+        if report is None:
+            ctk.CTkLabel(
+                self.sensitivity_frame,
+                text="Aucune base optimale disponible : lancez d'abord une résolution."
+            ).pack(pady=20)
+            return
+        
+        text_widget = ctk.CTkTextbox(
+            self.sensitivity_frame,
+            font=ctk.CTkFont(family="Consolas", size=11),
+            corner_radius=10,
+            height=200
+        )
+        text_widget.pack(fill="x", padx=10, pady=10)
+        text_widget.insert("0.0", report.summary())
+        text_widget.configure(state="disabled")
+        
+        # Prix duaux : valeur marginale d'une unité supplémentaire de chaque ressource
+        fig, ax = plt.subplots(figsize=(8, 4))
+        if self.theme.dark_mode:
+            plt.style.use('dark_background')
+        labels = [f"C{i+1}" for i in range(len(report.shadow_prices))]
+        ax.bar(labels, report.shadow_prices, color=plt.cm.viridis(np.linspace(0, 1, len(labels))))
+        ax.set_ylabel('Prix dual')
+        ax.set_title('Prix duaux des contraintes', fontsize=14, fontweight='bold')
+        ax.grid(True, axis='y', alpha=0.3)
+        
+        canvas = FigureCanvasTkAgg(fig, self.sensitivity_frame)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        
     def create_files_tab_modern(self):
         """Onglet de gestion des fichiers moderne"""
         tab = self.tabview.tab("💾 Fichiers")
@@ -1169,7 +1379,7 @@ class SimplexGUI:
         export_buttons = ctk.CTkFrame(export_frame, fg_color="transparent")
         export_buttons.pack(pady=(0, 15))
         
-        export_formats = ["PDF", "Excel", "LaTeX", "HTML"]
+        export_formats = ["PDF", "Excel", "LaTeX", "HTML", "LP", "MPS"]
         for fmt in export_formats:
             btn = AnimatedButton(
                 export_buttons,
@@ -1531,11 +1741,14 @@ class SimplexGUI:
                           "F5 : Simplexe Standard\n"
                           "F6 : Grand M\n"
                           "F7 : Analyse Duale\n"
+                          "F8 : Deux Phases\n"
+                          "F9 : Point Intérieur\n"
+                          "F10 : Méthode automatique\n"
                           "F11 : Plein écran"
             },
             {
                 "title": "💡 Conseils",
-                "content": "• Utilisez Grand M pour les contraintes ≥ ou =\n"
+                "content": "• Utilisez Deux Phases (ou Grand M) pour les contraintes ≥ ou =\n"
                           "• La visualisation fonctionne mieux avec 2 variables\n"
                           "• Exportez vos résultats en PDF pour les rapports"
             }
@@ -2028,6 +2241,9 @@ class SimplexGUI:
         variables = self.variable_manager.get_problem(index)
         if variables:
             self.current_problem = variables
+            self.imported_names = None
+            self.current_history_index = index
+            self.last_basis = self.variable_manager.get_basis(index)
             self.update_solve_tab()
             self.show_success("✅ Problème chargé!")
             self.tabview.set("🔍 Résolution")
@@ -2050,7 +2266,7 @@ class SimplexGUI:
             "JSON": [("JSON", "*.json")],
             "CSV": [("CSV", "*.csv")],
             "Excel": [("Excel", "*.xlsx")],
-            "LP": [("LP", "*.lp")]
+            "LP": [("LP / MPS", "*.lp *.mps *.lp.gz *.mps.gz"), ("LP", "*.lp"), ("MPS", "*.mps")]
         }
         
         filename = filedialog.askopenfilename(
@@ -2059,18 +2275,76 @@ class SimplexGUI:
         )
         
         if filename:
+            if format == "LP":
+                self.import_model_file(filename)
+                return
             # Implémenter l'import selon le format
             self.show_success(f"✅ Fichier {format} importé!")
             
+    def import_model_file(self, filename):
+        """Charge un modèle CPLEX LP ou MPS (lecture ligne par ligne) comme problème courant"""
+        try:
+            problem, names = read_problem(filename)
+            variables = problem.to_variables()
+            if "bounds" in variables:
+                # Les méthodes de l'interface ne connaissent que x >= 0 : les bornes deviennent des lignes
+                variables = bounds_as_constraints(variables)
+        except (OSError, ValueError) as e:
+            self.show_error(f"Import impossible: {e}")
+            return
+        
+        self.current_problem = variables
+        self.imported_names = names
+        self.current_history_index = self.variable_manager.save_problem(variables, f"Import {names.name}")
+        self.last_basis = None
+        self.update_solve_tab()
+        self.show_success(f"✅ Modèle importé: {os.path.basename(filename)} "
+                          f"({problem.m} contrainte(s), {problem.n} variable(s))")
+        self.tabview.set("🔍 Résolution")
+            
     def export_file(self, format):
         """Exporte vers un fichier selon le format"""
         if not self.current_problem:
             self.show_error("Aucun problème à exporter")
             return
+        
+        if format in ("LP", "MPS"):
+            self.export_model_file(format)
+            return
             
         # Implémenter l'export selon le format
         self.show_success(f"✅ Export {format} réussi!")
         
+    def export_model_file(self, format):
+        """
+        Écrit le problème courant au format LP ou MPS et, si la dernière résolution porte sur
+        ce problème, sa solution dans un fichier .sol voisin
+        """
+        extension = ".lp" if format == "LP" else ".mps"
+        filename = filedialog.asksaveasfilename(
+            title=f"Exporter {format}",
+            defaultextension=extension,
+            filetypes=[(format, f"*{extension}"), ("Tous les fichiers", "*.*")]
+        )
+        if not filename:
+            return
+        
+        problem = SparseProblem.from_variables(self.current_problem)
+        names = self.imported_names
+        if names is None or len(names.variables) != problem.n or len(names.constraints) != problem.m:
+            names = ProblemNames.default(problem)
+        try:
+            write_problem(problem, filename, names)
+            solve_result = (getattr(self, "last_result", None) or {}).get("result")
+            if solve_result is not None and solve_result.x is not None and len(solve_result.x) == problem.n:
+                solution_file = os.path.splitext(filename)[0] + ".sol"
+                write_solution(solve_result, solution_file, names, problem)
+                filename += f" (+ {os.path.basename(solution_file)})"
+        except (OSError, ValueError) as e:
+            self.show_error(f"Export impossible: {e}")
+            return
+        self.show_success(f"✅ Export {format} réussi: {filename}")
+        
     def connect_cloud_service(self, service):
         """Connecte un service cloud"""
         self.show_notification(f"Connexion à {service}...", "info")
@@ -2141,8 +2415,9 @@ class SimplexGUI:
                 "method_type": "Interface Graphique"
             }
             
-            # Sauvegarder dans l'historique
-            self.variable_manager.save_problem(self.current_problem, "Interface Graphique")
+            # Sauvegarder dans l'historique (la base précédente sert de point de départ)
+            self.current_history_index = self.variable_manager.save_problem(
+                self.current_problem, "Interface Graphique", basis=self.last_basis)
             
             # Statistiques
             self.stats['problems_solved'] += 1
@@ -2167,12 +2442,9 @@ class SimplexGUI:
             
             info_text = f"✅ Problème défini: {nb_vars} variables, {nb_constraints} contraintes ({obj_type}imisation)"
             
-            # Suggestion de méthode
-            constraints_info = self.current_problem.get("constraints_info", [])
-            if any(c in [">=", "="] for c in constraints_info):
-                info_text += "\n💡 Méthode suggérée: Grand M"
-            else:
-                info_text += "\n💡 Méthode suggérée: Simplexe Standard"
+            # Suggestion de méthode (choix automatique et sa première raison)
+            selection = select_method(self.current_problem)
+            info_text += f"\n💡 Méthode suggérée: {selection.name} — {selection.reasons[0]}"
             
             self.problem_status_label.configure(text=info_text)
             self.status_label.configure(text="✅ Problème chargé")
@@ -2196,6 +2468,14 @@ class SimplexGUI:
         
         self.run_solver("Grand M", self._solve_grand_m_worker)
     
+    def solve_two_phase(self):
+        """Résolution par la méthode des deux phases"""
+        if not self.current_problem:
+            self.show_error("Veuillez d'abord définir un problème")
+            return
+        
+        self.run_solver("Deux Phases", self._solve_two_phase_worker)
+    
     def solve_dual(self):
         """Analyse primal-dual"""
         if not self.current_problem:
@@ -2204,11 +2484,29 @@ class SimplexGUI:
         
         self.run_solver("Analyse Duale", self._solve_dual_worker)
     
+    def solve_interior_point(self):
+        """Résolution par points intérieurs (avec crossover vers une base)"""
+        if not self.current_problem:
+            self.show_error("Veuillez d'abord définir un problème")
+            return
+        
+        self.run_solver("Point Intérieur", self._solve_interior_point_worker)
+    
+    def solve_automatic(self):
+        """Résolution par la méthode choisie automatiquement (method_selection)"""
+        if not self.current_problem:
+            self.show_error("Veuillez d'abord définir un problème")
+            return
+        
+        self.run_solver("Automatique", self._solve_automatic_worker)
+    
     def run_solver(self, method_name, worker_func):
         """Lance la résolution dans un thread séparé"""
         self.progress_var.set(f"🔄 Résolution en cours ({method_name})...")
         self.progress_bar.set(0)
         self.status_label.configure(text=f"⏳ {method_name} en cours...")
+        self.cancel_token = CancellationToken()
+        self.stop_button.configure(state="normal")
         
         # Animation de progression
         self.animate_progress = True
@@ -2219,6 +2517,12 @@ class SimplexGUI:
         thread.daemon = True
         thread.start()
     
+    def cancel_solve(self):
+        """Demande l'arrêt de la résolution en cours"""
+        if self.cancel_token is not None and not self.cancel_token.cancelled:
+            self.cancel_token.cancel()
+            self.progress_var.set("⏹️ Arrêt demandé...")
+    
     def animate_progress_bar(self):
         """Anime la barre de progression"""
         if hasattr(self, 'animate_progress') and self.animate_progress:
@@ -2229,18 +2533,44 @@ class SimplexGUI:
                 self.progress_bar.set(current + 0.05)
             self.root.after(100, self.animate_progress_bar)
     
+    def progress_subscriber(self, method_name):
+        """
+        Abonné aux événements d'itération du solveur (thread de calcul) :
+        remplace l'animation factice par l'avancement réel, au plus ~10 fois par seconde
+        """
+        state = {"last": -1.0, "initial": None}
+        
+        def on_iteration(event):
+            if state["initial"] is None:
+                state["initial"] = (event.primal_infeasibility + event.dual_infeasibility) or 1.0
+            if event.elapsed - state["last"] < 0.1:
+                return
+            state["last"] = event.elapsed
+            self.root.after(0, self._update_solver_progress, method_name, event, state["initial"])
+        
+        return on_iteration
+    
+    def _update_solver_progress(self, method_name, event, initial):
+        """Met à jour la section de progression à partir d'un IterationEvent"""
+        self.animate_progress = False
+        remaining = (event.primal_infeasibility + event.dual_infeasibility) / initial
+        self.progress_bar.set(max(self.progress_bar.get(), min(1.0, 1.0 - remaining)))
+        # Les points intérieurs n'ont pas de variable entrante ni sortante
+        detail = f"{event.entering} entre, {event.leaving} sort, " if event.entering else ""
+        self.progress_var.set(
+            f"🔄 {method_name} : itération {event.iteration}, Z = {event.objective:.4g} "
+            f"({detail}{event.elapsed:.2f}s)"
+        )
+    
     def _solve_standard_worker(self, method_name):
         """Worker pour simplexe standard"""
         try:
-            import copy
             import time
             start_time = time.time()
             
-            problem_copy = copy.deepcopy(self.current_problem)
-            solver = SimplexMethodTab(problem_copy)
-            
             # Capturer la sortie
-            result = self.capture_solver_output(solver.run)
+            result, problem_copy, solve_result = self.run_with_preprocessing(
+                method_name, lambda problem, warm_start: SimplexMethodTab(problem, warm_start=warm_start))
             
             # Calculer le temps écoulé
             elapsed_time = time.time() - start_time
@@ -2250,7 +2580,7 @@ class SimplexGUI:
             self.stats['avg_solving_time'] = (self.stats['avg_solving_time'] + elapsed_time) / 2
             
             # Mettre à jour l'interface dans le thread principal
-            self.root.after(0, self._solver_completed, method_name, result, problem_copy, elapsed_time)
+            self.root.after(0, self._solver_completed, method_name, result, problem_copy, elapsed_time, solve_result)
             
         except Exception as e:
             self.root.after(0, self._solver_error, method_name, str(e))
@@ -2258,43 +2588,159 @@ class SimplexGUI:
     def _solve_grand_m_worker(self, method_name):
         """Worker pour Grand M"""
         try:
-            import copy
             import time
             start_time = time.time()
             
-            problem_copy = copy.deepcopy(self.current_problem)
-            solver = GrandMMethod(problem_copy)
-            
-            result = self.capture_solver_output(solver.run)
+            result, problem_copy, solve_result = self.run_with_preprocessing(
+                method_name, lambda problem, warm_start: GrandMMethod(problem, warm_start=warm_start))
             
             elapsed_time = time.time() - start_time
             
             self.stats['methods_used']['Grand M'] += 1
             self.stats['avg_solving_time'] = (self.stats['avg_solving_time'] + elapsed_time) / 2
             
-            self.root.after(0, self._solver_completed, method_name, result, problem_copy, elapsed_time)
+            self.root.after(0, self._solver_completed, method_name, result, problem_copy, elapsed_time, solve_result)
+            
+        except Exception as e:
+            self.root.after(0, self._solver_error, method_name, str(e))
+    
+    def _solve_two_phase_worker(self, method_name):
+        """Worker pour la méthode des deux phases"""
+        try:
+            import time
+            start_time = time.time()
+            
+            result, problem_copy, solve_result = self.run_with_preprocessing(
+                method_name, lambda problem, warm_start: TwoPhaseMethod(problem, warm_start=warm_start))
+            
+            elapsed_time = time.time() - start_time
+            
+            self.stats['methods_used']['Deux Phases'] = self.stats['methods_used'].get('Deux Phases', 0) + 1
+            self.stats['avg_solving_time'] = (self.stats['avg_solving_time'] + elapsed_time) / 2
+            
+            self.root.after(0, self._solver_completed, method_name, result, problem_copy, elapsed_time, solve_result)
+            
+        except Exception as e:
+            self.root.after(0, self._solver_error, method_name, str(e))
+    
+    def _solve_interior_point_worker(self, method_name):
+        """Worker pour la méthode des points intérieurs"""
+        try:
+            import time
+            start_time = time.time()
+            
+            result, problem_copy, solve_result = self.run_with_preprocessing(
+                method_name, lambda problem, warm_start: InteriorPointMethod(problem))
+            
+            elapsed_time = time.time() - start_time
+            
+            self.stats['methods_used']['Point Intérieur'] = self.stats['methods_used'].get('Point Intérieur', 0) + 1
+            self.stats['avg_solving_time'] = (self.stats['avg_solving_time'] + elapsed_time) / 2
+            
+            self.root.after(0, self._solver_completed, method_name, result, problem_copy, elapsed_time, solve_result)
+            
+        except Exception as e:
+            self.root.after(0, self._solver_error, method_name, str(e))
+    
+    def _solve_automatic_worker(self, method_name):
+        """Worker pour la méthode choisie automatiquement : le choix et ses raisons précèdent la sortie"""
+        try:
+            import time
+            start_time = time.time()
+            
+            selection = select_method(self.current_problem)
+            result, problem_copy, solve_result = self.run_with_preprocessing(
+                selection.name,
+                lambda problem, warm_start: selection.make_solver(problem, warm_start=warm_start))
+            result = selection.summary() + "\n\n" + result
+            
+            elapsed_time = time.time() - start_time
+            
+            self.stats['methods_used'][selection.name] = self.stats['methods_used'].get(selection.name, 0) + 1
+            self.stats['avg_solving_time'] = (self.stats['avg_solving_time'] + elapsed_time) / 2
+            
+            self.root.after(0, self._solver_completed, f"{method_name} ({selection.name})", result,
+                            problem_copy, elapsed_time, solve_result)
             
         except Exception as e:
             self.root.after(0, self._solver_error, method_name, str(e))
     
+    def run_with_preprocessing(self, method_name, make_solver):
+        """
+        Exécute `make_solver(problème, base de départ).run()` sur le problème partagé (sans copie),
+        précédé de la présolve et/ou de la mise à l'échelle si les options sont cochées.
+        Renvoie (sortie, tableau final ou problème résolu, SolveResult exprimé dans les unités du problème).
+        """
+        base_problem = self.shared_problem()
+        if not self.presolve_var.get() and not self.scale_var.get():
+            solver = make_solver(base_problem, self.last_basis)
+            solver.budget.token = self.cancel_token
+            solver.subscribe(self.progress_subscriber(method_name))
+            output = self.capture_solver_output(solver.run)
+            return output, getattr(solver, "tableau_variables", None) or base_problem, solver.result
+        
+        output = ""
+        presolve = scaling = None
+        # Les noms du problème réduit ne correspondent plus à ceux de la base précédente
+        warm_start = self.last_basis
+        if self.presolve_var.get():
+            presolve = Presolve(base_problem)
+            base_problem = presolve.run()
+            output += presolve.report() + "\n"
+            if base_problem is None:
+                return output, presolve.variables, presolve.postsolve()
+            warm_start = None
+        problem = base_problem
+        if self.scale_var.get():
+            scaling = Scaling(base_problem)
+            problem = scaling.run()
+            output += scaling.report() + "\n"
+        solver = make_solver(problem, warm_start)
+        solver.budget.token = self.cancel_token
+        solver.subscribe(self.progress_subscriber(method_name))
+        output += self.capture_solver_output(solver.run)
+        solve_result = solver.result
+        if scaling is not None:
+            solve_result = scaling.unscale(solve_result)
+        if presolve is not None:
+            solve_result = presolve.postsolve(solve_result)
+        # Tableau final des méthodes à tableau (le problème d'entrée n'est pas modifié),
+        # sauf après mise à l'échelle : ses valeurs ne sont pas dans les unités du problème
+        final_problem = base_problem if scaling is not None else \
+            getattr(solver, "tableau_variables", None) or base_problem
+        return output + "\n" + solve_result.summary(), final_problem, solve_result
+    
+    def shared_problem(self):
+        """
+        Problème courant figé (FrozenProblem) : construit une fois par problème, puis partagé
+        sans copie par les résolutions et les comparaisons simultanées. current_problem n'est
+        jamais modifié en place (chaque édition le remplace), ce qui suffit à détecter un changement.
+        """
+        if self._shared_source is not self.current_problem:
+            self._shared_problem = freeze_problem(self.current_problem)
+            self._shared_source = self.current_problem
+        return self._shared_problem
+    
     def _solve_dual_worker(self, method_name):
         """Worker pour analyse duale"""
         try:
-            import copy
             import time
             start_time = time.time()
             
-            problem_copy = copy.deepcopy(self.current_problem)
-            analyzer = DualMethod(problem_copy)
+            problem = self.shared_problem()
+            analyzer = DualMethod(problem, cancel=self.cancel_token)
+            analyzer.subscribe(self.progress_subscriber(method_name))
             
             result = self.capture_solver_output(analyzer.run_complete_analysis)
+            solve_result = analyzer.primal_solver.result
             
             elapsed_time = time.time() - start_time
             
             self.stats['methods_used']['Dual'] += 1
             self.stats['avg_solving_time'] = (self.stats['avg_solving_time'] + elapsed_time) / 2
             
-            self.root.after(0, self._solver_completed, method_name, result, problem_copy, elapsed_time)
+            self.root.after(0, self._solver_completed, method_name, result, problem, elapsed_time,
+                            solve_result)
             
         except Exception as e:
             self.root.after(0, self._solver_error, method_name, str(e))
@@ -2310,12 +2756,18 @@ class SimplexGUI:
         
         return output.getvalue()
     
-    def _solver_completed(self, method_name, result, final_problem, elapsed_time):
+    def _solver_completed(self, method_name, result, final_problem, elapsed_time, solve_result=None):
         """Callback quand la résolution est terminée"""
         self.animate_progress = False
+        self.stop_button.configure(state="disabled")
         self.progress_bar.set(1.0)
-        self.progress_var.set(f"✅ {method_name} terminé en {elapsed_time:.2f}s!")
-        self.status_label.configure(text="✅ Résolution terminée")
+        if solve_result is not None and solve_result.status in STOPPED:
+            stopped = "interrompu" if solve_result.status == "cancelled" else "arrêté (limite atteinte)"
+            self.progress_var.set(f"⏹️ {method_name} {stopped} après {elapsed_time:.2f}s")
+            self.status_label.configure(text=f"⏹️ Résolution {stopped}")
+        else:
+            self.progress_var.set(f"✅ {method_name} terminé en {elapsed_time:.2f}s!")
+            self.status_label.configure(text="✅ Résolution terminée")
         
         # Stocker le résultat
         self.last_result = {
@@ -2323,15 +2775,27 @@ class SimplexGUI:
             'output': result,
             'problem': final_problem,
             'timestamp': datetime.now(),
-            'elapsed_time': elapsed_time
+            'elapsed_time': elapsed_time,
+            'basis': solve_result.basis if solve_result is not None else None,
+            'result': solve_result
         }
         
+        # La base optimale (ou la dernière base d'une résolution interrompue) est conservée
+        # pour démarrer à chaud la prochaine résolution
+        if solve_result is not None and solve_result.status in STOPPED and solve_result.basis:
+            self.last_basis = solve_result.basis
+        if solve_result is not None and solve_result.is_optimal:
+            self.last_basis = solve_result.basis
+            if self.current_history_index is not None:
+                self.variable_manager.set_basis(self.current_history_index, solve_result.basis)
+        
         # Mise à jour des statistiques
         self.update_stats_display()
         
         # Passer à l'onglet des résultats
         self.tabview.set("📊 Résultats")
         self.display_results()
+        self.update_sensitivity_analysis()
         
         # Notification
         self.show_success(f"✅ {method_name} terminé en {elapsed_time:.2f}s!")
@@ -2343,6 +2807,7 @@ class SimplexGUI:
     def _solver_error(self, method_name, error_msg):
         """Callback en cas d'erreur"""
         self.animate_progress = False
+        self.stop_button.configure(state="disabled")
         self.progress_bar.set(0)
         self.progress_var.set(f"❌ Erreur lors de {method_name}")
         self.status_label.configure(text="❌ Erreur")
@@ -2395,7 +2860,7 @@ class SimplexGUI:
         # Déterminer le nombre total de variables dans le tableau (base + écart + artificielles)
         # Cela dépend de comment vos solveurs stockent le tableau final.
         # Supposons que la ligne d'optimisation et les équations ont la bonne longueur.
-        if not tab_optimisation or not equations:
+        if len(tab_optimisation) == 0 or not equations:
             ctk.CTkLabel(parent_frame, text="Données du tableau final non disponibles.").pack()
             return
 
@@ -2606,63 +3071,18 @@ class SimplexGUI:
             self.create_bar_solution_graph()
     def extract_optimal_solution_values_2d(self):
         """
-        Extrait les valeurs optimales de x1 et x2 à partir du tableau final.
-        Cette fonction doit être robuste.
+        Valeurs optimales de x1 et x2, lues dans le SolveResult de la dernière résolution
+        (solution reconstruite depuis la base, sans parcourir le tableau final).
         """
-        if not hasattr(self, 'last_result') or not self.last_result.get('problem'):
+        if not hasattr(self, 'last_result'):
             return None, None
 
-        final_problem_data = self.last_result['problem']
-        equations = final_problem_data.get("equations", {})
-        # nb_vars_base_orig = final_problem_data.get("nombres_variables_base", 0) # Pas directement utilisé ici mais bon à avoir
-
-        val_x1, val_x2 = 0.0, 0.0 # Valeurs par défaut si non en base
-        
-        # Chercher x1 (colonne 1 après RHS)
-        is_x1_base = False
-        for r_idx, eq_key in enumerate(equations.keys()):
-            eq_values = equations[eq_key]
-            if len(eq_values) > 1 and abs(eq_values[1] - 1.0) < 1e-9: # x1 a coeff 1
-                # Vérifier si c'est une colonne unitaire pour x1
-                is_unit = True
-                for other_r_idx, other_eq_key in enumerate(equations.keys()):
-                    if r_idx != other_r_idx:
-                        if len(equations[other_eq_key]) > 1 and abs(equations[other_eq_key][1]) > 1e-9:
-                            is_unit = False
-                            break
-                if is_unit:
-                    val_x1 = eq_values[0] # RHS est la valeur de x1
-                    is_x1_base = True
-                    break
-        # Si x1 n'est pas en base, sa valeur est 0 (déjà initialisée)
-
-        # Chercher x2 (colonne 2 après RHS)
-        is_x2_base = False
-        if self.current_problem.get("nombres_variables_base", 0) >= 2: # S'assurer que x2 existe
-            for r_idx, eq_key in enumerate(equations.keys()):
-                eq_values = equations[eq_key]
-                if len(eq_values) > 2 and abs(eq_values[2] - 1.0) < 1e-9: # x2 a coeff 1
-                    is_unit = True
-                    for other_r_idx, other_eq_key in enumerate(equations.keys()):
-                        if r_idx != other_r_idx:
-                            if len(equations[other_eq_key]) > 2 and abs(equations[other_eq_key][2]) > 1e-9:
-                                is_unit = False
-                                break
-                    if is_unit:
-                        val_x2 = eq_values[0] # RHS est la valeur de x2
-                        is_x2_base = True
-                        break
-        # Si x2 n'est pas en base, sa valeur est 0
-        
-        # Petit print de débogage
-        print(f"DEBUG Graph: Extracted optimal values: x1={val_x1}, x2={val_x2}")
-        
-        # Il faudrait aussi vérifier si la solution est valide (e.g. pas de message d'erreur dans output)
-        output_lower = self.last_result.get('output', '').lower()
-        if "non réalisable" in output_lower or "non bornée" in output_lower or "erreur" in output_lower:
-            return None, None # Indiquer qu'une solution valide n'a pas été trouvée
+        solve_result = self.last_result.get('result')
+        if solve_result is None or not solve_result.is_optimal:
+            return None, None
+        x = list(solve_result.x) + [0.0, 0.0]
+        return x[0], x[1]
 
-        return val_x1, val_x2
     def adjust_plot_limits(self, ax, opt_x1, opt_x2, padding_factor=0.2):
         """Ajuste les limites xlim et ylim du graphique dynamiquement."""
         
@@ -2943,7 +3363,7 @@ Statut: Solution optimale trouvée"""
         return f"""Type d'optimisation: {obj_type.upper()}IMISATION
 Nombre de variables de décision: {nb_vars}
 Nombre de contraintes: {nb_constraints}
-Méthode suggérée: {"Grand M" if any(c in [">=", "="] for c in self.current_problem.get("constraints_info", [])) else "Simplexe Standard"}"""
+Méthode suggérée: {select_method(self.current_problem).name}"""
     
     def get_optimal_solution(self):
         """Extrait la solution optimale"""
@@ -2958,6 +3378,9 @@ Méthode suggérée: {"Grand M" if any(c in [">=", "="] for c in self.current_pr
     
     def get_sensitivity_analysis(self):
         """Génère l'analyse de sensibilité"""
+        report = self.current_sensitivity_report()
+        if report is not None:
+            return report.summary()
         return """L'analyse de sensibilité permet d'évaluer l'impact des variations
 des paramètres sur la solution optimale. Cette analyse est disponible
 dans la méthode d'analyse duale."""
@@ -2970,7 +3393,7 @@ dans la méthode d'analyse duale."""
             recommendations.append("• La visualisation graphique est disponible pour ce problème")
         
         if any(c in [">=", "="] for c in self.current_problem.get("constraints_info", [])):
-            recommendations.append("• La méthode Grand M est recommandée pour ce type de contraintes")
+            recommendations.append("• La méthode des deux phases est recommandée pour ce type de contraintes")
         
         recommendations.append("• Considérez l'analyse duale pour une compréhension approfondie")
         recommendations.append("• Exportez les résultats en PDF pour vos rapports")
@@ -3015,7 +3438,9 @@ dans la méthode d'analyse duale."""
         methods_data = [
             ("Simplexe Standard", self._solve_standard_worker),
             ("Grand M", self._solve_grand_m_worker),
-            ("Analyse Duale", self._solve_dual_worker)
+            ("Deux Phases", self._solve_two_phase_worker),
+            ("Analyse Duale", self._solve_dual_worker),
+            ("Point Intérieur", self._solve_interior_point_worker)
         ]
         
         # Dictionnaire pour stocker les résultats
@@ -3061,6 +3486,10 @@ dans la méthode d'analyse duale."""
             setattr(tab, 'text_widget', text_widget)
             setattr(tab, 'status_label', status_label)
         
+        # Onglet de comparaison des règles de pivot
+        comparison_notebook.add("📐 Règles de pivot")
+        self.create_pricing_comparison_tab(comparison_notebook.tab("📐 Règles de pivot"))
+        
         # Onglet de synthèse
         comparison_notebook.add("📊 Synthèse")
         synthesis_tab = comparison_notebook.tab("📊 Synthèse")
@@ -3091,6 +3520,75 @@ dans la méthode d'analyse duale."""
         )
         export_btn.pack(side="left", padx=10)
     
+    def create_pricing_comparison_tab(self, parent):
+        """Crée l'onglet comparant les règles de choix de la variable entrante"""
+        text_widget = ctk.CTkTextbox(
+            parent,
+            font=ctk.CTkFont(family="Consolas", size=11),
+            corner_radius=10
+        )
+        text_widget.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        control_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        control_frame.pack(fill="x", padx=10, pady=(0, 10))
+        
+        run_btn = AnimatedButton(
+            control_frame,
+            text="🚀 Comparer les règles",
+            command=lambda: self.run_pricing_comparison(text_widget),
+            width=200,
+            height=35,
+            corner_radius=8
+        )
+        run_btn.pack(side="left", padx=5)
+        
+        ctk.CTkLabel(
+            control_frame,
+            text="Dantzig, Devex, plus forte pente, partielle, Bland",
+            font=ctk.CTkFont(size=12),
+            text_color="gray"
+        ).pack(side="left", padx=20)
+    
+    def run_pricing_comparison(self, text_widget):
+        """Résout le problème avec chaque règle de pivot et affiche l'écart d'itérations avec Dantzig"""
+        # Simplexe Standard, ou Grand M si une phase 1 est nécessaire
+        # (les deux méthodes qui acceptent une règle de pivot)
+        constraints_info = self.current_problem.get("constraints_info", [])
+        negative_rhs = any(eq[0] < 0 for eq in self.current_problem["equations"].values())
+        solver_class = GrandMMethod if negative_rhs or any(c in (">=", "=") for c in constraints_info) \
+            else SimplexMethodTab
+        rows = []
+        try:
+            for key, rule in PRICING_RULES.items():
+                result = solver_class(self.shared_problem(), pricing=key).solve()
+                rows.append((rule.name, result))
+        except Exception as e:
+            text_widget.delete(0.0, tk.END)
+            text_widget.insert(0.0, f"❌ Erreur lors de la comparaison:\n{str(e)}")
+            return
+        
+        reference = rows[0][1].iterations
+        lines = [
+            f"📐 Règles de pivot - {rows[0][1].method}",
+            "=" * 72,
+            f"{'Règle':<20}{'Statut':<12}{'Itérations':>11}{'Δ Dantzig':>11}{'Z':>10}{'Temps (s)':>11}",
+            "-" * 72,
+        ]
+        for name, result in rows:
+            delta = result.iterations - reference
+            z = f"{result.objective:.4f}" if result.is_optimal else "-"
+            lines.append(
+                f"{name:<20}{result.status:<12}{result.iterations:>11}{delta:>+11}{z:>10}"
+                f"{result.timings.get('total', 0.0):>11.4f}"
+            )
+        best_name, best = min(rows, key=lambda row: row[1].iterations)
+        lines.append("")
+        lines.append(f"💡 Moins d'itérations : {best_name} ({best.iterations} contre {reference} pour Dantzig)")
+        
+        self.pricing_comparison = {name: result.to_dict() for name, result in rows}
+        text_widget.delete(0.0, tk.END)
+        text_widget.insert(0.0, "\n".join(lines))
+    
     def create_synthesis_tab(self, parent):
         """Crée l'onglet de synthèse de comparaison"""
         scroll_frame = ctk.CTkScrollableFrame(parent)
@@ -3126,21 +3624,34 @@ dans la méthode d'analyse duale."""
             parent.status_label.configure(text="🔄 En cours...", text_color="orange")
         
         try:
-            import copy
             import time
             start_time = time.time()
             
-            problem_copy = copy.deepcopy(self.current_problem)
-            
+            # Toutes les méthodes comparées lisent le même problème figé, sans copie
+            problem = self.shared_problem()
+            solve_result = None
+            iterations = None
+
+            # Toutes les méthodes sont résolues en mode silencieux :
+            # seul le résumé structuré est affiché, sans capturer stdout
             if method_name == "Simplexe Standard":
-                solver = SimplexMethodTab(problem_copy)
-                result = self.capture_solver_output(solver.run)
+                solve_result = SimplexMethodTab(problem).solve()
             elif method_name == "Grand M":
-                solver = GrandMMethod(problem_copy)
-                result = self.capture_solver_output(solver.run)
+                solve_result = GrandMMethod(problem).solve()
+            elif method_name == "Deux Phases":
+                solve_result = TwoPhaseMethod(problem).solve()
+            elif method_name == "Point Intérieur":
+                solve_result = InteriorPointMethod(problem).solve()
             elif method_name == "Analyse Duale":
-                analyzer = DualMethod(problem_copy)
-                result = self.capture_solver_output(analyzer.run_complete_analysis)
+                solve_result, dual_result = DualMethod(problem).solve()
+                # Deux résolutions : les pivots du primal et du dual sont comptés ensemble
+                iterations = solve_result.iterations + dual_result.iterations
+                result = f"PRIMAL\n{solve_result.summary()}\n\nDUAL (Max -W)\n{dual_result.summary()}"
+                if solve_result.is_optimal and dual_result.is_optimal:
+                    result += f"\n\n|Z - W| = {abs(solve_result.objective + dual_result.objective):.3e}"
+            if iterations is None and solve_result is not None:
+                result = solve_result.summary()
+                iterations = solve_result.iterations
             
             elapsed_time = time.time() - start_time
             
@@ -3158,7 +3669,9 @@ dans la méthode d'analyse duale."""
             self.comparison_results[method_name] = {
                 'output': result,
                 'time': elapsed_time,
-                'success': True
+                'success': True,
+                'iterations': iterations,
+                'result': solve_result
             }
             
             # Mettre à jour la synthèse
@@ -3179,7 +3692,7 @@ dans la méthode d'analyse duale."""
     
     def run_all_comparisons(self, notebook):
         """Lance toutes les méthodes de comparaison"""
-        methods = ["Simplexe Standard", "Grand M", "Analyse Duale"]
+        methods = ["Simplexe Standard", "Grand M", "Deux Phases", "Analyse Duale", "Point Intérieur"]
         
         for method in methods:
             # Trouver l'onglet
@@ -3256,8 +3769,10 @@ dans la méthode d'analyse duale."""
                 width=150
             ).grid(row=0, column=2, padx=5, pady=5)
             
-            # Itérations (à extraire de la sortie)
-            iterations = self.extract_iterations(data['output'])
+            # Itérations (fournies par SolveResult, sinon extraites de la sortie)
+            iterations = data.get('iterations')
+            if iterations is None:
+                iterations = self.extract_iterations(data['output'])
             ctk.CTkLabel(
                 row_frame,
                 text=str(iterations),
@@ -3298,9 +3813,11 @@ dans la méthode d'analyse duale."""
         
         methods = list(self.comparison_results.keys())
         times = [data['time'] for data in self.comparison_results.values()]
-        colors = ['blue', 'green', 'orange']
+        # Mêmes couleurs que les cartes de méthodes, quel que soit l'ordre d'exécution
+        colors = {'Simplexe Standard': 'blue', 'Grand M': 'green', 'Deux Phases': 'teal',
+                  'Analyse Duale': 'orange', 'Point Intérieur': 'brown'}
         
-        bars = ax.bar(methods, times, color=colors[:len(methods)])
+        bars = ax.bar(methods, times, color=[colors.get(method, 'gray') for method in methods])
         
         # Ajouter les valeurs sur les barres
         for bar, time in zip(bars, times):
@@ -3337,7 +3854,8 @@ dans la méthode d'analyse duale."""
                     'Méthode': method,
                     'Statut': 'Succès' if result['success'] else 'Erreur',
                     'Temps (s)': result['time'],
-                    'Itérations': self.extract_iterations(result['output'])
+                    'Itérations': result.get('iterations') if result.get('iterations') is not None
+                        else self.extract_iterations(result['output'])
                 })
             
             df = pd.DataFrame(data)
@@ -3354,6 +3872,7 @@ dans la méthode d'analyse duale."""
         if self.current_problem and messagebox.askyesno("Nouveau Problème", 
                                                         "Créer un nouveau problème?\n(Le problème actuel sera perdu)"):
             self.current_problem = None
+            self.imported_names = None
             self.tabview.set("📝 Définition")
             self.show_success("✅ Prêt pour un nouveau problème!")
             self.update_solve_tab()
@@ -3362,6 +3881,7 @@ dans la méthode d'analyse duale."""
         """Efface le problème actuel"""
         if messagebox.askyesno("Confirmation", "Effacer tous les champs ?"):
             self.current_problem = None
+            self.imported_names = None
             # Réinitialiser les champs
             for widget in self.fields_frame.winfo_children():
                 widget.destroy()
@@ -3489,12 +4009,10 @@ dans la méthode d'analyse duale."""
         text.append(f"• Contraintes: {self.current_problem['nb_equations']}\n")
         
         if constraints_info:
-            has_eq = "=" in constraints_info
-            has_geq = ">=" in constraints_info
-            if has_eq or has_geq:
-                text.append("• ⚠️ Méthode suggérée: Grand M\n")
-            else:
-                text.append("• ✅ Méthode suggérée: Simplexe Standard\n")
+            selection = select_method(self.current_problem)
+            text.append(f"• 💡 Méthode suggérée: {selection.name}\n")
+            for reason in selection.reasons:
+                text.append(f"    - {reason}\n")
         
         return "".join(text)
     
@@ -3521,6 +4039,8 @@ dans la méthode d'analyse duale."""
                     "constraints_types": self.current_problem.get("constraints_info", [])
                 }
             }
+            if self.last_basis:
+                problem_data["basis"] = list(self.last_basis)
             
             self.variable_manager.save_to_file(problem_data, filename)
             self.show_success(f"✅ Problème sauvegardé: {filename}")
@@ -3536,6 +4056,9 @@ dans la méthode d'analyse duale."""
             variables = self.variable_manager.load_from_file(filename)
             if variables:
                 self.current_problem = variables
+                self.imported_names = None
+                self.current_history_index = len(self.variable_manager.history) - 1
+                self.last_basis = self.variable_manager.get_basis(self.current_history_index)
                 self.update_solve_tab()
                 self.show_success(f"✅ Problème chargé: {filename}")
                 self.tabview.set("🔍 Résolution")
@@ -3711,6 +4234,7 @@ dans la méthode d'analyse duale."""
     def load_example(self, example_data, window):
         """Charge un exemple spécifique"""
         self.current_problem = example_data["variables"]
+        self.imported_names = None
         self.variable_manager.save_problem(self.current_problem, "Exemple Prédéfini")
         
         window.destroy()
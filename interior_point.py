@@ -0,0 +1,327 @@
+import time
+
+import numpy as np
+
+from revised_method import RevisedSimplexMethod
+from solver_events import IterationEvent, SolverEvents
+from solver_result import SolveResult
+from sparse_problem import SparseProblem
+from solve_budget import STOPPED, SolveBudget
+
+
+def cholesky_solve(L, r):
+    """Résout L Lᵀ z = r par descente puis remontée (L triangulaire inférieure)"""
+    m = len(r)
+    z = np.array(r, dtype=np.float64, copy=True)
+    for i in range(m):
+        z[i] = (z[i] - L[i, :i] @ z[:i]) / L[i, i]
+    for i in range(m - 1, -1, -1):
+        z[i] = (z[i] - L[i + 1:, i] @ z[i + 1:]) / L[i, i]
+    return z
+
+
+class InteriorPointMethod:
+    """
+    Méthode de points intérieurs primale-duale (prédicteur-correcteur de Mehrotra).
+
+    Forme standard : Min -c x, A x = b, x >= 0 (écart +1 pour <=, surplus -1 pour >=),
+    dual Aᵀ y + s = -c, s >= 0. Chaque itération résout deux fois les équations normales
+    (A D Aᵀ) Δy = r avec D = X S⁻¹, assemblées directement depuis les triplets creux et
+    factorisées une seule fois (Cholesky). Accepte le même dictionnaire `variables` que
+    les autres méthodes, ou un SparseProblem.
+
+    crossover : à partir de la solution intérieure, une base est choisie (plus grands x_j / s_j)
+                et le simplexe révisé la complète jusqu'à un sommet optimal ; base, prix duaux
+                et solution sont alors ceux d'un sommet, comme avec les autres méthodes.
+                Le simplexe révisé tranche aussi quand les itérations ne convergent pas
+                (problème non réalisable ou non borné).
+    """
+
+    METHOD = "Point Intérieur"
+
+    def __init__(self, variables, tol: float = 1e-8, max_iterations: int = 100, crossover: bool = True,
+                 divergence: float = 1e8, warm_start=None, time_limit: float = None, cancel=None):
+        self.variables = variables
+        self.tol = tol
+        self.max_iterations = max_iterations
+        # Seuil (relatif à |b| et |c|) au-delà duquel les itérés sont jugés divergents
+        self.divergence = divergence
+        self.crossover = crossover
+        # Limite de temps (itérations intérieures et crossover) et jeton d'annulation
+        self.budget = SolveBudget(time_limit=time_limit, token=cancel)
+        self.stopped = None
+        # Accepté pour la même signature que les autres solveurs : un point intérieur
+        # ne part pas d'une base, seul le crossover en produit une
+        self.warm_start = warm_start
+        self.warm_started = False
+        # Vrai si le simplexe du crossover a pu partir de la base issue du point intérieur
+        self.crossover_warm = False
+        self.iteration = 0
+        self.crossover_iterations = 0
+        self.converged = False
+        self.status = None
+        self.x = None
+        self.y = None
+        self.s = None
+        self.result = None
+        self.events = SolverEvents()
+        self.start = None
+
+    def subscribe(self, callback):
+        """Abonne `callback(IterationEvent)` aux itérations du solveur"""
+        return self.events.subscribe(callback)
+
+    def run(self):
+        """Exécute la méthode de points intérieurs et affiche la solution"""
+        print(f"\n{'='*60}")
+        print("MÉTHODE DES POINTS INTÉRIEURS (PRÉDICTEUR-CORRECTEUR DE MEHROTRA)")
+        print(f"{'='*60}")
+        self.solve(observer=self.print_iteration)
+        self.display_results()
+
+    def build_standard_form(self):
+        """Forme standard creuse et paires (i, k, j) qui forment A D Aᵀ = Σ_j d_j a_j a_jᵀ"""
+        problem = self.variables if isinstance(self.variables, SparseProblem) \
+            else SparseProblem.from_variables(self.variables)
+        if problem.has_bounds:
+            raise ValueError("Bornes de variables : utiliser BoundedSimplexMethod ou bounds_as_constraints")
+        self.problem = problem
+        self.n, self.m = problem.n, problem.m
+        self.slack_rows = np.array([i for i, s in enumerate(problem.constraints_info) if s in ("<=", ">=")],
+                                   dtype=int)
+        self.slack_sign = np.array([1.0 if problem.constraints_info[i] == "<=" else -1.0
+                                    for i in self.slack_rows])
+        self.names = [f"x{j+1}" for j in range(self.n)] + [f"s{i+1}" for i in self.slack_rows]
+        self.b = problem.b
+        self.c = np.concatenate((-problem.c, np.zeros(len(self.slack_rows))))
+
+        index, weight, column = [], [], []
+        for j in range(self.n):
+            idx = problem.csc_order[problem.col_ptr[j]:problem.col_ptr[j + 1]]
+            rows, vals = problem.rows[idx], problem.vals[idx]
+            index.append((rows[:, None] * self.m + rows[None, :]).ravel())
+            weight.append(np.outer(vals, vals).ravel())
+            column.append(np.full(len(rows) ** 2, j))
+        self.pair_index = np.concatenate(index) if index else np.zeros(0, dtype=np.int64)
+        self.pair_weight = np.concatenate(weight) if weight else np.zeros(0)
+        self.pair_column = np.concatenate(column) if column else np.zeros(0, dtype=np.int64)
+
+    def matvec(self, x):
+        """A x pour la matrice augmentée (structurelle + écarts)"""
+        out = self.problem.matvec(x[:self.n]).astype(np.float64)
+        out[self.slack_rows] += self.slack_sign * x[self.n:]
+        return out
+
+    def rmatvec(self, y):
+        """Aᵀ y pour la matrice augmentée"""
+        return np.concatenate((self.problem.rmatvec(y).astype(np.float64), self.slack_sign * y[self.slack_rows]))
+
+    def normal_matrix(self, d):
+        """A D Aᵀ (m x m), sans jamais former A densément"""
+        M = np.bincount(self.pair_index, weights=self.pair_weight * d[self.pair_column],
+                        minlength=self.m * self.m).astype(np.float64).reshape(self.m, self.m)
+        M[self.slack_rows, self.slack_rows] += d[self.n:]
+        return M
+
+    def factor(self, M):
+        """Cholesky de M, régularisée si des lignes sont dépendantes (égalités redondantes)"""
+        scale = max(1.0, float(np.abs(np.diag(M)).max(initial=0.0)))
+        shift = 1e-14 * scale
+        for _ in range(8):
+            try:
+                return np.linalg.cholesky(M + shift * np.eye(self.m))
+            except np.linalg.LinAlgError:
+                shift *= 100.0
+        raise np.linalg.LinAlgError("Équations normales non factorisables")
+
+    def newton(self, L, d, rb, rc, rxs):
+        """Direction de Newton pour A Δx = rb, Aᵀ Δy + Δs = rc, S Δx + X Δs = rxs"""
+        dy = cholesky_solve(L, rb + self.matvec(d * rc - rxs / self.s))
+        ds = rc - self.rmatvec(dy)
+        dx = (rxs - self.x * ds) / self.s
+        return dx, dy, ds
+
+    @staticmethod
+    def step_length(v, dv) -> float:
+        """Plus grand pas α <= 1 tel que v + α dv >= 0"""
+        falling = dv < 0
+        if not falling.any():
+            return 1.0
+        with np.errstate(over="ignore"):
+            return min(1.0, float((-v[falling] / dv[falling]).min()))
+
+    def initial_point(self):
+        """Point de départ de Mehrotra : moindres carrés, puis décalage strictement positif"""
+        L = self.factor(self.normal_matrix(np.ones(len(self.c))))
+        x = self.rmatvec(cholesky_solve(L, self.b))
+        y = cholesky_solve(L, self.matvec(self.c))
+        s = self.c - self.rmatvec(y)
+        x += max(-1.5 * x.min(), 0.0)
+        s += max(-1.5 * s.min(), 0.0)
+        if x @ s <= 0:
+            x += 1.0
+            s += 1.0
+        x += 0.5 * (x @ s) / s.sum()
+        s += 0.5 * (x @ s) / x.sum()
+        return x, y, s
+
+    def solve(self, observer=None) -> SolveResult:
+        """
+        Résout le problème sans aucune sortie console et renvoie un SolveResult.
+        `observer(solver, iteration)` est appelé après chaque itération intérieure.
+        """
+        start = self.start = time.perf_counter()
+        self.budget.begin(start)
+        self.build_standard_form()
+        setup_done = time.perf_counter()
+        self.converged = self.m > 0 and self.iterate(observer)
+        iterations_done = time.perf_counter()
+
+        basis, objective, x, duals = [], None, None, None
+        if self.stopped:
+            # Interrompu pendant les itérations intérieures : aucune base à rendre
+            self.status = self.stopped
+        elif self.crossover or not self.converged:
+            # Base candidate : colonnes les plus « basiques » (x_j grand devant s_j)
+            warm_start = None
+            if self.converged:
+                order = np.argsort(-self.x / self.s)[:self.m]
+                warm_start = [self.names[j] for j in order]
+            simplex = RevisedSimplexMethod(self.problem, tol=1e-9, warm_start=warm_start,
+                                           time_limit=self.budget.remaining_time(), cancel=self.budget.token)
+            vertex = simplex.solve()
+            self.crossover_warm = simplex.warm_started
+            self.crossover_iterations = vertex.iterations
+            self.status = vertex.status
+            if vertex.status in STOPPED:
+                self.budget.reason = simplex.budget.reason
+            objective, x, duals, basis = vertex.objective, vertex.x, vertex.duals, vertex.basis
+        else:
+            self.status = "optimal"
+            x = self.x[:self.n].tolist()
+            objective = self.problem.constant + float(self.problem.c @ self.x[:self.n])
+            # Prix duaux du problème de maximisation : opposés de ceux du Min -c x
+            duals = (-self.y).tolist()
+
+        self.result = SolveResult(method=self.METHOD, status=self.status, objective=objective,
+                                  x=x or [], duals=duals, basis=basis, iterations=self.iteration)
+        self.result.timings = {
+            "setup": setup_done - start,
+            "iterations": iterations_done - setup_done,
+            "crossover": time.perf_counter() - iterations_done,
+            "total": time.perf_counter() - start,
+        }
+        return self.result
+
+    def iterate(self, observer=None) -> bool:
+        """Itérations prédicteur-correcteur ; vrai si les résidus et le saut de dualité sont sous `tol`"""
+        self.x, self.y, self.s = self.initial_point()
+        N = len(self.c)
+        b_norm = 1.0 + np.linalg.norm(self.b)
+        c_norm = 1.0 + np.linalg.norm(self.c)
+        best, stalled = np.inf, 0
+
+        while True:
+            rb = self.b - self.matvec(self.x)
+            rc = self.c - self.rmatvec(self.y) - self.s
+            mu = float(self.x @ self.s) / N
+            primal_value = float(self.c @ self.x)
+            self.residuals = (np.linalg.norm(rb) / b_norm, np.linalg.norm(rc) / c_norm,
+                              abs(primal_value - float(self.b @ self.y)) / (1.0 + abs(primal_value)))
+            self.mu = mu
+            if self.iteration and self.events:
+                self.events.emit(IterationEvent(
+                    method=self.METHOD,
+                    iteration=self.iteration,
+                    entering="",
+                    leaving="",
+                    objective=self.problem.constant - primal_value,
+                    primal_infeasibility=float(self.residuals[0]),
+                    dual_infeasibility=float(self.residuals[1] + self.residuals[2]),
+                    elapsed=time.perf_counter() - self.start,
+                ))
+            if self.iteration and observer is not None:
+                observer(self, self.iteration)
+            if max(self.residuals) < self.tol:
+                return True
+            self.stopped = self.budget.exhausted(self.iteration)
+            if self.stopped:
+                return False
+            # Divergence : x (non borné) ou y, s (non réalisable) explosent ; stagnation :
+            # le résidu primal ne baisse plus (contraintes incompatibles)
+            size = max(np.abs(self.x).max(), np.abs(self.y).max(initial=0.0), self.s.max())
+            stalled = 0 if self.residuals[0] < 0.9 * best else stalled + 1
+            best = min(best, self.residuals[0])
+            if self.iteration >= self.max_iterations or size > self.divergence * max(b_norm, c_norm) \
+                    or stalled >= 10:
+                return False
+
+            d = self.x / self.s
+            L = self.factor(self.normal_matrix(d))
+            # Prédicteur (direction affine), puis centrage σ = (μ_aff / μ)³ et correction du second ordre
+            dx, dy, ds = self.newton(L, d, rb, rc, -self.x * self.s)
+            alpha_p, alpha_d = self.step_length(self.x, dx), self.step_length(self.s, ds)
+            mu_aff = float((self.x + alpha_p * dx) @ (self.s + alpha_d * ds)) / N
+            sigma = (mu_aff / mu) ** 3
+            dx, dy, ds = self.newton(L, d, rb, rc, sigma * mu - self.x * self.s - dx * ds)
+            alpha_p = min(1.0, 0.995 * self.step_length(self.x, dx))
+            alpha_d = min(1.0, 0.995 * self.step_length(self.s, ds))
+            self.x += alpha_p * dx
+            self.y += alpha_d * dy
+            self.s += alpha_d * ds
+            self.iteration += 1
+
+    def print_iteration(self, solver, iteration: int):
+        """Observateur d'affichage : résidus et saut de dualité relatifs"""
+        primal, dual, gap = self.residuals
+        print(f"Itération {iteration} : μ = {self.mu:.3e}, résidu primal {primal:.2e}, "
+              f"résidu dual {dual:.2e}, saut {gap:.2e}")
+
+    def display_results(self):
+        """Affiche la solution finale"""
+        print(f"\n{'='*60}")
+        print("ANALYSE DE LA SOLUTION FINALE")
+        print(f"{'='*60}")
+        print(f"Itérations intérieures: {self.iteration}"
+              + (f", pivots de crossover: {self.crossover_iterations}" if self.crossover or not self.converged else ""))
+
+        if self.status == "infeasible":
+            print("\n❌ PROBLÈME NON RÉALISABLE")
+            return
+        if self.status == "unbounded":
+            print("Solution illimitée!")
+            return
+        if self.status in STOPPED:
+            print(f"\n⏱️  Arrêt avant l'optimum : {self.budget.reason}")
+            if self.result.objective is None:
+                return
+            print(f"Meilleur sommet atteint (crossover): Z = {self.result.objective:.6f}")
+        else:
+            print("\n✅ SOLUTION OPTIMALE TROUVÉE")
+            print(f"Valeur optimale: Z = {self.result.objective:.6f}")
+        if self.result.basis:
+            print(f"Base finale (crossover): {', '.join(self.result.basis)}")
+        print("\nVariables de décision:")
+        for j, value in enumerate(self.result.x):
+            print(f"  x{j+1} = {value:.6f}")
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    # Max Z = 3x1 + 5x2
+    # x1 ≤ 4
+    # 2x2 ≤ 12
+    # 3x1 + 2x2 ≤ 18
+    variables_interieur = {
+        "tab_optimisation": [0, 3, 5],
+        "nombres_variables_base": 2,
+        "equations": {
+            "equation_1": [4, 1, 0],
+            "equation_2": [12, 0, 2],
+            "equation_3": [18, 3, 2],
+        },
+        "nb_equations": 3,
+        "constraints_info": ["<=", "<=", "<="]
+    }
+
+    InteriorPointMethod(variables_interieur).run()
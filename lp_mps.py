@@ -0,0 +1,713 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lecture et écriture des formats standard CPLEX LP et MPS (libre ou fixe) vers et depuis
+SparseProblem, ligne par ligne : le texte n'est jamais chargé en entier en mémoire et les
+coefficients sont accumulés dans des tableaux compacts (array). Les fichiers .gz sont
+décompressés à la volée.
+
+Seule la relaxation continue est lue : les marqueurs d'intégrité (MARKER, General, Binary)
+ne changent que les bornes (0 <= x <= 1 pour une variable binaire). Les variables libres
+ou de borne inférieure infinie ne sont pas prises en charge (SparseProblem exige des bornes
+inférieures finies).
+
+    python lp_mps.py modele.mps -o modele.lp
+"""
+
+import gzip
+import re
+import sys
+from array import array
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import List
+
+import numpy as np
+
+from sparse_problem import SparseProblem
+
+MPS_SENSES = {"L": "<=", "G": ">=", "E": "="}
+MPS_SECTIONS = ("NAME", "OBJSENSE", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS",
+                "SOS", "ENDATA")
+
+# Section en tête de ligne du format LP (le reste de la ligne appartient à la section)
+LP_SECTION = re.compile(
+    r"\s*(maximi[sz]e|maximum|max|minimi[sz]e|minimum|min|subject\s+to|such\s+that|s\.t\.|st|"
+    r"bounds?|generals?|gen|integers?|binar(?:y|ies)|bin|semi-continuous|semis?|sos|end)(?![\w.])(?!\s*:)",
+    re.IGNORECASE)
+LP_TOKEN = re.compile(
+    r"\s*(?:(?P<sense><=|=<|>=|=>|<|>|=)|(?P<sign>[+-])|(?P<colon>:)"
+    r"|(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+    r"|(?P<name>[^\s\d.+\-*/^<>=:\[\]][^\s+\-*/^<>=:]*)|(?P<other>\S))")
+LP_SENSES = {"<=": "<=", "=<": "<=", "<": "<=", ">=": ">=", "=>": ">=", ">": ">=", "=": "="}
+INFINITY_NAMES = ("inf", "infinity")
+INFINITE_BOUND = 1e30
+
+
+@dataclass
+class ProblemNames:
+    """Noms du problème, des variables et des contraintes (SparseProblem n'en garde aucun)"""
+    name: str = "PROBLEME"
+    variables: List[str] = field(default_factory=list)
+    constraints: List[str] = field(default_factory=list)
+    objective: str = "obj"
+
+    @classmethod
+    def default(cls, problem, name: str = "PROBLEME") -> "ProblemNames":
+        """Noms habituels : x1..xn pour les variables, c1..cm pour les contraintes"""
+        return cls(name=name, variables=[f"x{j+1}" for j in range(problem.n)],
+                   constraints=[f"c{i+1}" for i in range(problem.m)])
+
+
+def _open(target, mode: str):
+    """Fichier texte ouvert (un objet fichier est utilisé tel quel, sans être fermé)"""
+    if hasattr(target, "read" if mode == "r" else "write"):
+        return nullcontext(target)
+    if str(target).endswith(".gz"):
+        return gzip.open(target, mode + "t", encoding="utf-8")
+    return open(target, mode, encoding="utf-8")
+
+
+def _number(value: float) -> str:
+    """Écriture la plus courte qui relit exactement la même valeur"""
+    text = repr(float(value))
+    return text[:-2] if text.endswith(".0") else text
+
+
+class _ProblemBuilder:
+    """Accumule lignes, colonnes et triplets au fil de la lecture, puis construit le SparseProblem"""
+
+    def __init__(self):
+        self.names = ProblemNames(variables=[], constraints=[])
+        self.column_index = {}
+        self.row_index = {}
+        self.senses = []
+        self.rhs = array("d")
+        self.rows = array("q")
+        self.cols = array("q")
+        self.vals = array("d")
+        self.objective = array("d")
+        self.constant = 0.0
+        self.maximize = False
+        self.lower = {}
+        self.upper = {}
+        self.ranges = {}
+
+    def column(self, name: str) -> int:
+        index = self.column_index.get(name)
+        if index is None:
+            index = self.column_index[name] = len(self.names.variables)
+            self.names.variables.append(name)
+            self.objective.append(0.0)
+        return index
+
+    def add_row(self, name: str, sense: str) -> int:
+        if name in self.row_index:
+            raise ValueError(f"Contrainte {name} déclarée deux fois")
+        index = self.row_index[name] = len(self.senses)
+        self.names.constraints.append(name)
+        self.senses.append(sense)
+        self.rhs.append(0.0)
+        return index
+
+    def add_term(self, row: int, col: int, value: float):
+        if value != 0.0:
+            self.rows.append(row)
+            self.cols.append(col)
+            self.vals.append(value)
+
+    def build(self):
+        """SparseProblem (maximisation, objective_type "min" pour une minimisation) et ses noms"""
+        n, m = len(self.names.variables), len(self.senses)
+        rows = np.frombuffer(self.rows, dtype=np.int64) if len(self.rows) else np.zeros(0, dtype=np.int64)
+        cols = np.frombuffer(self.cols, dtype=np.int64) if len(self.cols) else np.zeros(0, dtype=np.int64)
+        vals = np.frombuffer(self.vals, dtype=np.float64) if len(self.vals) else np.zeros(0)
+        b = np.array(self.rhs, dtype=np.float64)
+        senses = list(self.senses)
+
+        # Contraintes à intervalle (RANGES) : une seconde ligne porte l'autre côté
+        extra = []
+        for row, width in self.ranges.items():
+            low_high = {"<=": (b[row] - abs(width), b[row]), ">=": (b[row], b[row] + abs(width)),
+                        "=": (b[row], b[row] + width) if width >= 0 else (b[row] + width, b[row])}
+            low, high = low_high[senses[row]]
+            senses[row], b[row] = ">=", low
+            extra.append((row, high))
+        if extra:
+            source = np.array([row for row, _ in extra])
+            new_rows = np.full(m, -1)
+            new_rows[source] = np.arange(m, m + len(extra))
+            copied = np.isin(rows, source)
+            rows = np.concatenate((rows, new_rows[rows[copied]]))
+            cols = np.concatenate((cols, cols[copied]))
+            vals = np.concatenate((vals, vals[copied]))
+            b = np.concatenate((b, [high for _, high in extra]))
+            senses += ["<="] * len(extra)
+            self.names.constraints += [f"{self.names.constraints[row]}_haut" for row, _ in extra]
+            m += len(extra)
+
+        # Un même couple (ligne, colonne) peut apparaître plusieurs fois : les termes s'additionnent
+        width = max(n, 1)
+        keys, inverse = np.unique(rows * width + cols, return_inverse=True)
+        vals = np.bincount(inverse, weights=vals, minlength=len(keys))
+        rows, cols = np.divmod(keys, width)
+
+        lower, upper = np.zeros(n), np.full(n, np.inf)
+        for col, value in self.lower.items():
+            lower[col] = value
+        for col, value in self.upper.items():
+            upper[col] = value
+        # 1e30 est l'infini usuel des fichiers LP et MPS
+        lower[lower <= -INFINITE_BOUND] = -np.inf
+        upper[upper >= INFINITE_BOUND] = np.inf
+        if not np.isfinite(lower).all():
+            name = self.names.variables[int(np.argmin(np.isfinite(lower)))]
+            raise ValueError(f"Borne inférieure infinie pour {name} : non prise en charge")
+        if (lower > upper).any():
+            name = self.names.variables[int(np.argmax(lower > upper))]
+            raise ValueError(f"Bornes incohérentes pour {name}")
+
+        c = np.array(self.objective, dtype=np.float64)
+        sign = 1.0 if self.maximize else -1.0
+        problem = SparseProblem(n, rows, cols, vals, b, sign * c + 0.0, senses, sign * self.constant + 0.0,
+                                "max" if self.maximize else "min", lower, upper)
+        return problem, self.names
+
+
+# ---------------------------------------------------------------------------
+# MPS
+# ---------------------------------------------------------------------------
+
+def _fixed_fields(line: str, section: str) -> list:
+    """Champs d'une ligne MPS fixe (colonnes 2-3, 5-12, 15-22, 25-36, 40-47, 50-61)"""
+    fields = [line[1:3], line[4:12], line[14:22], line[24:36], line[39:47], line[49:61]]
+    fields = [value.strip() for value in fields]
+    if section == "ROWS":
+        return fields[:2]
+    if section == "BOUNDS":
+        return [fields[0], fields[1] or "BND"] + [value for value in fields[2:4] if value]
+    if section in ("RHS", "RANGES"):
+        # Nom d'ensemble facultatif : toujours présent dans la liste renvoyée
+        return [fields[1] or "RHS"] + [value for value in fields[2:] if value]
+    return [value for value in fields[1:] if value]
+
+
+def read_mps(source, fixed: bool = False):
+    """
+    Lit un fichier MPS (libre par défaut, `fixed=True` pour le format fixe à colonnes,
+    où les noms peuvent contenir des espaces). Renvoie (SparseProblem, ProblemNames).
+    Un fichier fixe sans espace dans les noms se lit aussi en format libre.
+    """
+    builder = _ProblemBuilder()
+    section = None
+    objective_row = None
+    free_rows = set()
+
+    def row_of(name):
+        if name == objective_row:
+            return -1
+        if name in free_rows:
+            return None
+        if name not in builder.row_index:
+            raise ValueError(f"Contrainte inconnue: {name}")
+        return builder.row_index[name]
+
+    def pairs(fields):
+        return zip(fields[0::2], fields[1::2])
+
+    with _open(source, "r") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip() or line.startswith("*"):
+                continue
+            try:
+                if not line[0].isspace():
+                    words = line.split()
+                    section = words[0].upper()
+                    if section == "NAME":
+                        builder.names.name = (line[14:].strip() if fixed else " ".join(words[1:])) or "PROBLEME"
+                    elif section == "OBJSENSE" and len(words) > 1:
+                        builder.maximize = words[1].upper() in ("MAX", "MAXIMIZE")
+                    elif section == "ENDATA":
+                        break
+                    elif section not in MPS_SECTIONS:
+                        raise ValueError(f"Section inconnue {section}")
+                    continue
+
+                fields = _fixed_fields(line, section) if fixed else line.split()
+                if section == "OBJSENSE":
+                    builder.maximize = fields[0].upper() in ("MAX", "MAXIMIZE")
+                elif section == "ROWS":
+                    kind, name = fields[0].upper(), fields[1]
+                    if kind == "N":
+                        if objective_row is None:
+                            objective_row = builder.names.objective = name
+                        else:
+                            free_rows.add(name)
+                    elif kind in MPS_SENSES:
+                        builder.add_row(name, MPS_SENSES[kind])
+                    else:
+                        raise ValueError(f"Type de contrainte inconnu {kind}")
+                elif section == "COLUMNS":
+                    if len(fields) > 1 and fields[1] == "'MARKER'":
+                        continue  # Marqueurs d'intégrité : relaxation continue
+                    col = builder.column(fields[0])
+                    for row_name, value in pairs(fields[1:]):
+                        row = row_of(row_name)
+                        if row == -1:
+                            builder.objective[col] += float(value)
+                        elif row is not None:
+                            builder.add_term(row, col, float(value))
+                elif section in ("RHS", "RANGES"):
+                    # Le nom d'ensemble est facultatif en format libre (nombre de champs impair)
+                    for row_name, value in pairs(fields[1:] if len(fields) % 2 else fields):
+                        row = row_of(row_name)
+                        if section == "RANGES":
+                            if row is not None and row >= 0:
+                                builder.ranges[row] = float(value)
+                        elif row == -1:
+                            builder.constant = -float(value)
+                        elif row is not None:
+                            builder.rhs[row] = float(value)
+                elif section == "BOUNDS":
+                    _mps_bound(builder, fields)
+            except (ValueError, IndexError) as e:
+                raise ValueError(f"Ligne {line_number} ({line.strip()!r}) : {e}") from None
+    return builder.build()
+
+
+def _mps_bound(builder: _ProblemBuilder, fields: list):
+    """Applique une ligne de la section BOUNDS : type, [ensemble], colonne, [valeur]"""
+    kind = fields[0].upper()
+    if kind in ("FR", "MI", "PL", "BV"):
+        col = builder.column(fields[2] if len(fields) >= 3 else fields[1])
+        value = None
+    else:
+        col = builder.column(fields[2] if len(fields) >= 4 else fields[1])
+        value = float(fields[-1])
+    if kind in ("UP", "UI", "SC"):
+        # Une borne supérieure négative sans borne inférieure rend la variable non bornée en bas
+        if value < 0 and col not in builder.lower:
+            builder.lower[col] = -np.inf
+        builder.upper[col] = value
+    elif kind in ("LO", "LI"):
+        builder.lower[col] = value
+    elif kind == "FX":
+        builder.lower[col] = builder.upper[col] = value
+    elif kind == "FR":
+        builder.lower[col], builder.upper[col] = -np.inf, np.inf
+    elif kind == "MI":
+        builder.lower[col] = -np.inf
+    elif kind == "PL":
+        builder.upper[col] = np.inf
+    elif kind == "BV":
+        builder.lower[col], builder.upper[col] = 0.0, 1.0
+    else:
+        raise ValueError(f"Type de borne inconnu {kind}")
+
+
+def write_mps(problem: SparseProblem, target, names: ProblemNames = None, fixed: bool = False):
+    """
+    Écrit `problem` au format MPS libre (ou fixe si `fixed`), colonne par colonne (ordre CSC).
+    Une maximisation est écrite avec la section OBJSENSE MAX, une minimisation avec ses
+    coefficients d'origine.
+    """
+    names = names or ProblemNames.default(problem)
+    maximize = problem.objective_type != "min"
+    sign = 1.0 if maximize else -1.0
+    row_names = [names.objective] + list(names.constraints)
+    if fixed:
+        too_long = [name for name in row_names + list(names.variables) if len(name) > 8]
+        if too_long:
+            raise ValueError(f"Nom trop long pour le format MPS fixe (8 caractères): {too_long[0]}")
+
+    def number(value):
+        text = _number(value)
+        return text if not fixed or len(text) <= 12 else f"{value:.6g}"
+
+    def data(first, second, value):
+        if fixed:
+            return f"    {first:<8}  {second:<8}  {number(value):>12}\n"
+        return f"    {first}  {second}  {number(value)}\n"
+
+    with _open(target, "w") as f:
+        f.write(f"NAME          {names.name}\n")
+        if maximize:
+            f.write("OBJSENSE\n    MAX\n")
+        f.write(f"ROWS\n N  {names.objective}\n")
+        kinds = {sense: kind for kind, sense in MPS_SENSES.items()}
+        for name, sense in zip(names.constraints, problem.constraints_info):
+            f.write(f" {kinds[sense]}  {name}\n")
+
+        f.write("COLUMNS\n")
+        for j, column in enumerate(names.variables):
+            idx = problem.csc_order[problem.col_ptr[j]:problem.col_ptr[j + 1]]
+            if problem.c[j] != 0.0 or not len(idx):
+                f.write(data(column, names.objective, sign * problem.c[j]))
+            for row, value in zip(problem.rows[idx], problem.vals[idx]):
+                f.write(data(column, names.constraints[row], value))
+
+        f.write("RHS\n")
+        if problem.constant != 0.0:
+            f.write(data("RHS", names.objective, -sign * problem.constant))
+        for name, value in zip(names.constraints, problem.b):
+            if value != 0.0:
+                f.write(data("RHS", name, value))
+
+        if problem.has_bounds:
+            f.write("BOUNDS\n")
+            for column, low, high in zip(names.variables, problem.lower, problem.upper):
+                bounds = [("FX", low)] if low == high else \
+                    [(kind, value) for kind, value, needed in (("LO", low, low != 0.0),
+                                                               ("UP", high, np.isfinite(high))) if needed]
+                for kind, value in bounds:
+                    f.write(f" {kind} {'BND':<8}  {column:<8}  {number(value):>12}\n" if fixed
+                            else f" {kind} BND  {column}  {number(value)}\n")
+        f.write("ENDATA\n")
+
+
+# ---------------------------------------------------------------------------
+# LP (CPLEX)
+# ---------------------------------------------------------------------------
+
+def _lp_tokens(text: str):
+    """Jetons (type, texte) d'un morceau de ligne LP"""
+    for match in LP_TOKEN.finditer(text):
+        kind = match.lastgroup
+        if kind == "other":
+            raise ValueError(f"Caractère non pris en charge {match.group(kind)!r} "
+                             "(termes quadratiques et opérateurs * / ^ exclus)")
+        yield kind, match.group(kind)
+
+
+def _lp_value(tokens: list) -> float:
+    """Valeur d'un second membre ou d'une borne : [signe] nombre ou [signe] inf"""
+    sign = 1.0
+    for kind, text in tokens[:-1]:
+        if kind != "sign":
+            raise ValueError("Valeur attendue")
+        sign = -sign if text == "-" else sign
+    kind, text = tokens[-1]
+    if kind == "number":
+        return sign * float(text)
+    if kind == "name" and text.lower() in INFINITY_NAMES:
+        return sign * np.inf
+    raise ValueError(f"Valeur attendue, lu {text!r}")
+
+
+def _lp_expression(tokens: list, builder: _ProblemBuilder):
+    """Termes (colonne, coefficient) et constante d'une expression linéaire LP"""
+    terms = []
+    constant = 0.0
+    sign, coefficient = 1.0, None
+    for kind, text in tokens:
+        if kind == "sign":
+            if coefficient is not None:
+                constant += sign * coefficient
+                coefficient = None
+                sign = 1.0
+            sign = -sign if text == "-" else sign
+        elif kind == "number":
+            if coefficient is not None:
+                raise ValueError(f"Deux nombres consécutifs ({text})")
+            coefficient = float(text)
+        elif kind == "name":
+            terms.append((builder.column(text), sign * (1.0 if coefficient is None else coefficient)))
+            sign, coefficient = 1.0, None
+        else:
+            raise ValueError(f"Jeton inattendu {text!r}")
+    if coefficient is not None:
+        constant += sign * coefficient
+    return terms, constant
+
+
+class _LPConstraints:
+    """Découpe le flot de jetons de la section Subject To en contraintes (une ligne du problème chacune)"""
+
+    def __init__(self, builder: _ProblemBuilder):
+        self.builder = builder
+        self.tokens = []
+
+    def feed(self, kind: str, text: str):
+        self.tokens.append((kind, text))
+        if kind != "number" and not (kind == "name" and text.lower() in INFINITY_NAMES):
+            return
+        senses = [i for i, (k, _) in enumerate(self.tokens) if k == "sense"]
+        # Complète quand le dernier sens est suivi d'une valeur ([signe] nombre) ; une contrainte
+        # qui commence par une valeur suivie d'un sens est à intervalle et en attend un second
+        if not senses or any(k != "sign" for k, _ in self.tokens[senses[-1] + 1:-1]):
+            return
+        body = self.tokens[2:] if len(self.tokens) > 1 and self.tokens[1][0] == "colon" else self.tokens
+        start = 1 if body[0][0] == "sign" else 0
+        ranged = len(body) > start + 1 and body[start][0] == "number" and body[start + 1][0] == "sense"
+        if len(senses) == (2 if ranged else 1):
+            self.finish()
+
+    def finish(self):
+        tokens, self.tokens = self.tokens, []
+        if not tokens:
+            return
+        builder = self.builder
+        if len(tokens) > 1 and tokens[1][0] == "colon":
+            name, tokens = tokens[0][1], tokens[2:]
+        else:
+            name = f"c{len(builder.senses) + 1}"
+        senses = [i for i, (kind, _) in enumerate(tokens) if kind == "sense"]
+        if len(senses) == 2:
+            # Contrainte à intervalle : bas <= expression <= haut (ou >=)
+            first, second = senses
+            low, high = _lp_value(tokens[:first]), _lp_value(tokens[second + 1:])
+            if LP_SENSES[tokens[first][1]] == ">=":
+                low, high = high, low
+            terms, constant = _lp_expression(tokens[first + 1:second], builder)
+            rows = [(name, ">=", low - constant), (f"{name}_haut", "<=", high - constant)]
+        elif len(senses) == 1:
+            terms, constant = _lp_expression(tokens[:senses[0]], builder)
+            rows = [(name, LP_SENSES[tokens[senses[0]][1]], _lp_value(tokens[senses[0] + 1:]) - constant)]
+        else:
+            raise ValueError(f"Contrainte {name} incomplète")
+        for row_name, sense, rhs in rows:
+            row = builder.add_row(row_name, sense)
+            builder.rhs[row] = rhs
+            for col, value in terms:
+                builder.add_term(row, col, value)
+
+
+def _lp_bound(builder: _ProblemBuilder, tokens: list):
+    """Ligne de la section Bounds : x <= u, x >= l, l <= x <= u, x = v ou x free"""
+    if len(tokens) == 2 and tokens[0][0] == "name" and tokens[1][1].lower() == "free":
+        col = builder.column(tokens[0][1])
+        builder.lower[col], builder.upper[col] = -np.inf, np.inf
+        return
+    names = [i for i, (kind, text) in enumerate(tokens)
+             if kind == "name" and text.lower() not in INFINITY_NAMES]
+    if len(names) != 1:
+        raise ValueError("Borne illisible")
+    at = names[0]
+    col = builder.column(tokens[at][1])
+    bounds = []
+    if at > 0:
+        # valeur <= x (ou >=) : le sens est inversé
+        if at < 2 or tokens[at - 1][0] != "sense":
+            raise ValueError("Borne illisible")
+        flipped = {"<=": ">=", ">=": "<=", "=": "="}[LP_SENSES[tokens[at - 1][1]]]
+        bounds.append((flipped, _lp_value(tokens[:at - 1])))
+    if at < len(tokens) - 1:
+        if len(tokens) < at + 3 or tokens[at + 1][0] != "sense":
+            raise ValueError("Borne illisible")
+        bounds.append((LP_SENSES[tokens[at + 1][1]], _lp_value(tokens[at + 2:])))
+    if not bounds:
+        raise ValueError("Borne illisible")
+    for sense, value in bounds:
+        if sense in ("<=", "="):
+            builder.upper[col] = value
+        if sense in (">=", "="):
+            builder.lower[col] = value
+
+
+def read_lp(source):
+    """
+    Lit un fichier au format CPLEX LP (Maximize/Minimize, Subject To, Bounds, General,
+    Binary, End). Renvoie (SparseProblem, ProblemNames).
+    """
+    builder = _ProblemBuilder()
+    section = None
+    objective = []
+    constraints = _LPConstraints(builder)
+    in_block_comment = False
+
+    with _open(source, "r") as f:
+        for line_number, line in enumerate(f, start=1):
+            try:
+                if in_block_comment or line.lstrip().startswith("\\*"):
+                    in_block_comment = "*\\" not in line
+                    continue
+                line = line.split("\\", 1)[0]
+                match = LP_SECTION.match(line)
+                if match:
+                    keyword = match.group(1).lower()
+                    if section == "constraints":
+                        constraints.finish()
+                    elif section == "objective":
+                        _lp_objective(builder, objective)
+                    if keyword.startswith("max") or keyword.startswith("min"):
+                        section, builder.maximize = "objective", keyword.startswith("max")
+                    elif keyword in ("st", "s.t.") or keyword.startswith(("subject", "such")):
+                        section = "constraints"
+                    elif keyword.startswith("bound"):
+                        section = "bounds"
+                    elif keyword.startswith("bin"):
+                        section = "binary"
+                    elif keyword == "end":
+                        break
+                    else:
+                        section = "ignored"  # Intégrité, semi-continues, SOS : relaxation continue
+                    line = line[match.end():]
+                if not line.strip():
+                    continue
+
+                if section == "objective":
+                    objective.extend(_lp_tokens(line))
+                elif section == "constraints":
+                    for kind, text in _lp_tokens(line):
+                        constraints.feed(kind, text)
+                elif section == "bounds":
+                    _lp_bound(builder, list(_lp_tokens(line)))
+                elif section == "binary":
+                    for name in line.split():
+                        col = builder.column(name)
+                        builder.lower[col], builder.upper[col] = 0.0, 1.0
+                elif section is None:
+                    raise ValueError("Contenu avant la section Maximize / Minimize")
+            except ValueError as e:
+                raise ValueError(f"Ligne {line_number} ({line.strip()!r}) : {e}") from None
+        if section == "objective":
+            _lp_objective(builder, objective)
+        constraints.finish()
+    return builder.build()
+
+
+def _lp_objective(builder: _ProblemBuilder, tokens: list):
+    """Objectif lu en entier (avant les contraintes : ses variables passent en tête)"""
+    if len(tokens) > 1 and tokens[1][0] == "colon":
+        builder.names.objective, tokens = tokens[0][1], tokens[2:]
+    terms, builder.constant = _lp_expression(tokens, builder)
+    for col, value in terms:
+        builder.objective[col] += value
+    tokens.clear()
+
+
+def _write_terms(f, head: str, cols, values, variables, keep_zeros: bool = False):
+    """Écrit une expression linéaire, coupée en lignes de longueur raisonnable
+
+    `keep_zeros` écrit aussi les termes nuls (« + 0 xj ») : l'objectif déclare ainsi
+    toutes les colonnes dans leur ordre, y compris celles sans coût ni coefficient.
+    """
+    line = head
+    written = False
+    for col, value in zip(cols, values):
+        if value == 0.0 and not keep_zeros:
+            continue
+        coefficient = "" if abs(value) == 1.0 else f"{_number(abs(value))} "
+        term = f" {'-' if value < 0 else '+'} {coefficient}{variables[col]}"
+        if len(line) + len(term) > 200:
+            f.write(line + "\n")
+            line = "  "
+        line += term
+        written = True
+    if not written and len(variables):
+        line += f" 0 {variables[0]}"
+    f.write(line)
+
+
+def write_lp(problem: SparseProblem, target, names: ProblemNames = None):
+    """Écrit `problem` au format CPLEX LP, contrainte par contrainte (ordre CSR)"""
+    names = names or ProblemNames.default(problem)
+    maximize = problem.objective_type != "min"
+    sign = 1.0 if maximize else -1.0
+    with _open(target, "w") as f:
+        f.write(f"\\ Problème {names.name}\n")
+        f.write("Maximize\n" if maximize else "Minimize\n")
+        _write_terms(f, f" {names.objective}:", range(problem.n), sign * problem.c, names.variables,
+                     keep_zeros=True)
+        if problem.constant != 0.0:
+            constant = sign * problem.constant
+            f.write(f" {'-' if constant < 0 else '+'} {_number(abs(constant))}")
+        f.write("\nSubject To\n")
+        for i, name in enumerate(names.constraints):
+            cols, vals = problem.row(i)
+            _write_terms(f, f" {name}:", cols, vals, names.variables)
+            f.write(f" {problem.constraints_info[i]} {_number(problem.b[i])}\n")
+        if problem.has_bounds:
+            f.write("Bounds\n")
+            for column, low, high in zip(names.variables, problem.lower, problem.upper):
+                if low == high:
+                    f.write(f" {column} = {_number(low)}\n")
+                elif np.isfinite(high):
+                    f.write(f" {_number(low)} <= {column} <= {_number(high)}\n" if low != 0.0
+                            else f" {column} <= {_number(high)}\n")
+                elif low != 0.0:
+                    f.write(f" {column} >= {_number(low)}\n")
+        f.write("End\n")
+
+
+# ---------------------------------------------------------------------------
+# Fichiers quelconques et solutions
+# ---------------------------------------------------------------------------
+
+def _format_of(path: str) -> str:
+    name = str(path).lower()
+    name = name[:-3] if name.endswith(".gz") else name
+    if name.endswith(".lp"):
+        return "lp"
+    if name.endswith(".mps"):
+        return "mps"
+    raise ValueError(f"Format inconnu pour {path} (extensions .lp, .mps, éventuellement .gz)")
+
+
+def read_problem(path: str):
+    """Lit un fichier .lp ou .mps (éventuellement .gz) : (SparseProblem, ProblemNames)"""
+    return read_lp(path) if _format_of(path) == "lp" else read_mps(path)
+
+
+def write_problem(problem: SparseProblem, path: str, names: ProblemNames = None):
+    """Écrit un fichier .lp ou .mps (éventuellement .gz) selon l'extension"""
+    if _format_of(path) == "lp":
+        write_lp(problem, path, names)
+    else:
+        write_mps(problem, path, names)
+
+
+def write_solution(result, target, names: ProblemNames = None, problem: SparseProblem = None):
+    """
+    Écrit un SolveResult au format .sol courant (« # Objective value = z » puis une ligne
+    « nom valeur » par variable), relu par read_solution et par la plupart des solveurs.
+    `problem` rétablit le signe de l'objectif d'une minimisation.
+    """
+    x = list(result.x or [])
+    variables = names.variables if names is not None else [f"x{j+1}" for j in range(len(x))]
+    with _open(target, "w") as f:
+        f.write(f"# Méthode = {result.method}\n# Statut = {result.status}\n")
+        if result.objective is not None:
+            objective = -result.objective if problem is not None and problem.objective_type == "min" \
+                else result.objective
+            f.write(f"# Objective value = {_number(objective)}\n")
+        for name, value in zip(variables, x):
+            f.write(f"{name} {_number(value)}\n")
+        if result.duals is not None and names is not None:
+            f.write("# Prix duaux\n")
+            for name, value in zip(names.constraints, result.duals):
+                f.write(f"# {name} {_number(value)}\n")
+
+
+def read_solution(source):
+    """Relit un fichier .sol : (valeur de l'objectif ou None, {nom: valeur})"""
+    objective, values = None, {}
+    with _open(source, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line.lower().startswith("# objective value"):
+                objective = float(line.split("=", 1)[1])
+            elif line and not line.startswith("#"):
+                name, value = line.rsplit(None, 1)
+                values[name] = float(value)
+    return objective, values
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Conversion entre les formats LP et MPS")
+    parser.add_argument("source", help="fichier .lp ou .mps (éventuellement .gz)")
+    parser.add_argument("-o", "--output", required=True, help="fichier .lp ou .mps à écrire")
+    parser.add_argument("--fixed", action="store_true", help="lire un MPS au format fixe")
+    args = parser.parse_args(argv)
+
+    problem, names = read_mps(args.source, fixed=True) if args.fixed else read_problem(args.source)
+    write_problem(problem, args.output, names)
+    print(f"{args.source} -> {args.output} : {problem.m} contrainte(s), {problem.n} variable(s), "
+          f"{problem.nnz} coefficient(s) non nul(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,628 @@
+import numbers
+from bisect import bisect_right
+
+import numpy as np
+
+from sparse_problem import SparseProblem
+from problem import Problem
+from bounded_method import bounds_as_constraints
+from method_selection import METHODS, select_method
+
+SENSES = ("<=", ">=", "=")
+# Méthodes (clés de METHODS) qui acceptent directement un SparseProblem
+SPARSE_METHODS = ("4", "7", "8")
+
+
+def _expr(value):
+    """LinExpr équivalent à une variable, une expression ou un nombre (None sinon)"""
+    if isinstance(value, LinExpr):
+        return value
+    if isinstance(value, Variable):
+        return LinExpr(np.array([value.index]), np.ones(1))
+    if isinstance(value, numbers.Real):
+        return LinExpr(constant=float(value))
+    return None
+
+
+def _block(value, size: int):
+    """LinExprArray de `size` lignes pour un bloc, une famille ou un nombre / vecteur de constantes"""
+    if isinstance(value, LinExprArray):
+        block = value
+    elif isinstance(value, VarFamily):
+        block = value.as_block()
+    else:
+        constants = np.asarray(value, dtype=np.float64) if isinstance(value, (numbers.Real, list, tuple, np.ndarray)) \
+            else None
+        if constants is None or constants.ndim > 1:
+            return None
+        empty = np.zeros(0, dtype=np.int64)
+        block = LinExprArray(empty, empty, np.zeros(0), np.broadcast_to(constants, (size,)).copy())
+    if len(block) != size:
+        raise ValueError(f"Blocs de tailles différentes : {len(block)} et {size}")
+    return block
+
+
+class _Linear:
+    """Opérateurs communs aux variables et aux expressions (+, -, *, /, <=, >=, ==)"""
+
+    __slots__ = ()
+    # numpy renvoie NotImplemented : `np.float64(2) * x` passe par __rmul__
+    __array_ufunc__ = None
+    __hash__ = None
+
+    def __add__(self, other):
+        other = _expr(other)
+        return NotImplemented if other is None else _expr(self).combine(other, 1.0)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = _expr(other)
+        return NotImplemented if other is None else _expr(self).combine(other, -1.0)
+
+    def __rsub__(self, other):
+        other = _expr(other)
+        return NotImplemented if other is None else other.combine(_expr(self), -1.0)
+
+    def __neg__(self):
+        return _expr(self).scaled(-1.0)
+
+    def __mul__(self, other):
+        if not isinstance(other, numbers.Real):
+            return NotImplemented
+        return _expr(self).scaled(float(other))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not isinstance(other, numbers.Real):
+            return NotImplemented
+        return _expr(self).scaled(1.0 / float(other))
+
+    def __le__(self, other):
+        return self._compare(other, "<=")
+
+    def __ge__(self, other):
+        return self._compare(other, ">=")
+
+    def __eq__(self, other):
+        return self._compare(other, "=")
+
+    def _compare(self, other, sense):
+        other = _expr(other)
+        if other is None:
+            return NotImplemented
+        return Constraint(_expr(self).combine(other, -1.0), sense)
+
+
+class LinExpr(_Linear):
+    """
+    Expression linéaire sum a_j x_j + constante, stockée en tableaux (indices de colonnes,
+    coefficients) et non en un objet par terme. Les termes en double ne sont additionnés
+    qu'à la compilation du modèle.
+
+    Les blocs de termes sont rangés dans une liste partagée dont l'expression n'utilise que
+    les `_size` premiers éléments : `a + b` prolonge sur place la liste de `a` si personne
+    ne l'a déjà fait (sinon il la recopie), et `+=` fait de même. Une somme de k termes, par
+    `sum(...)` ou par une boucle, coûte donc O(k) et non O(k²) ; `a` reste inchangé.
+    """
+
+    __slots__ = ("_cols", "_coefs", "_size", "constant")
+
+    def __init__(self, cols=(), coefs=(), constant: float = 0.0):
+        self._cols = [np.asarray(cols, dtype=np.int64)]
+        self._coefs = [np.asarray(coefs, dtype=np.float64)]
+        self._size = 1
+        self.constant = float(constant)
+        if self._cols[0].shape != self._coefs[0].shape:
+            raise ValueError("Autant de coefficients que d'indices de variables sont attendus")
+
+    def __repr__(self) -> str:
+        cols, coefs = self.terms()
+        return f"LinExpr({len(cols)} terme(s), constante {self.constant:g})"
+
+    def terms(self):
+        """Indices de colonnes et coefficients (non agrégés) de l'expression"""
+        if self._size > 1:
+            self._cols = [np.concatenate(self._cols[:self._size])]
+            self._coefs = [np.concatenate(self._coefs[:self._size])]
+            self._size = 1
+        return self._cols[0], self._coefs[0]
+
+    def _extend(self, other: "LinExpr", sign: float):
+        """Ajoute sign * (termes de other) ; la liste partagée n'est recopiée que si une autre expression l'a prolongée"""
+        cols, coefs = other._cols[:other._size], other._coefs[:other._size]
+        if len(self._cols) != self._size:
+            self._cols = self._cols[:self._size]
+            self._coefs = self._coefs[:self._size]
+        self._cols.extend(cols)
+        self._coefs.extend(coefs if sign == 1.0 else [sign * c for c in coefs])
+        self._size = len(self._cols)
+        self.constant += sign * other.constant
+
+    def combine(self, other: "LinExpr", sign: float) -> "LinExpr":
+        """Nouvelle expression self + sign * other"""
+        combined = LinExpr.__new__(LinExpr)
+        combined._cols, combined._coefs, combined._size = self._cols, self._coefs, self._size
+        combined.constant = self.constant
+        combined._extend(other, sign)
+        return combined
+
+    def scaled(self, factor: float) -> "LinExpr":
+        """Nouvelle expression factor * self"""
+        scaled = LinExpr.__new__(LinExpr)
+        scaled._cols = self._cols[:self._size]
+        scaled._coefs = [factor * c for c in self._coefs[:self._size]]
+        scaled._size = self._size
+        scaled.constant = factor * self.constant
+        return scaled
+
+    def __iadd__(self, other):
+        other = _expr(other)
+        if other is None:
+            return NotImplemented
+        self._extend(other, 1.0)
+        return self
+
+    def __isub__(self, other):
+        other = _expr(other)
+        if other is None:
+            return NotImplemented
+        self._extend(other, -1.0)
+        return self
+
+
+class Variable(_Linear):
+    """Variable de décision : colonne `index` du modèle (le nom est calculé à la demande)"""
+
+    __slots__ = ("model", "index")
+
+    def __init__(self, model: "Model", index: int):
+        self.model = model
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        return self.model.variable_name(self.index)
+
+    def __repr__(self) -> str:
+        return self.name
+
+    def value(self, result) -> float:
+        """Valeur de la variable dans un SolveResult"""
+        return float(result.x[self.index])
+
+
+class Constraint:
+    """Contrainte expr (<=, >=, =) 0, c'est-à-dire termes (sens) -constante"""
+
+    __slots__ = ("expr", "sense")
+
+    def __init__(self, expr: LinExpr, sense: str):
+        self.expr = expr
+        self.sense = sense
+
+    @property
+    def rhs(self) -> float:
+        return -self.expr.constant
+
+    def __repr__(self) -> str:
+        return f"Constraint({self.expr!r} {self.sense} 0)"
+
+    def __bool__(self):
+        raise TypeError("Une contrainte n'a pas de valeur de vérité : une comparaison enchaînée "
+                        "(2 <= x <= 4) ne garderait que la dernière, écrire deux contraintes")
+
+
+class LinExprArray:
+    """
+    Vecteur de k expressions linéaires (résultat de `matrice @ famille`), stocké en triplets
+    (ligne locale, colonne, coefficient) et en un vecteur de constantes. Comparé à un nombre ou à
+    un vecteur, il donne un ConstraintBlock de k lignes, ajouté au modèle d'un seul coup.
+    """
+
+    __slots__ = ("rows", "cols", "coefs", "constants")
+    __array_ufunc__ = None
+    __hash__ = None
+
+    def __init__(self, rows, cols, coefs, constants):
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.cols = np.asarray(cols, dtype=np.int64)
+        self.coefs = np.asarray(coefs, dtype=np.float64)
+        self.constants = np.asarray(constants, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.constants)
+
+    def __repr__(self) -> str:
+        return f"LinExprArray({len(self)} expression(s), {len(self.coefs)} terme(s))"
+
+    def combine(self, other: "LinExprArray", sign: float) -> "LinExprArray":
+        return LinExprArray(np.concatenate((self.rows, other.rows)), np.concatenate((self.cols, other.cols)),
+                            np.concatenate((self.coefs, sign * other.coefs)),
+                            self.constants + sign * other.constants)
+
+    def __add__(self, other):
+        other = _block(other, len(self))
+        return NotImplemented if other is None else self.combine(other, 1.0)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = _block(other, len(self))
+        return NotImplemented if other is None else self.combine(other, -1.0)
+
+    def __rsub__(self, other):
+        other = _block(other, len(self))
+        return NotImplemented if other is None else other.combine(self, -1.0)
+
+    def __neg__(self):
+        return self * -1.0
+
+    def __mul__(self, other):
+        if not isinstance(other, numbers.Real):
+            return NotImplemented
+        return LinExprArray(self.rows, self.cols, float(other) * self.coefs, float(other) * self.constants)
+
+    __rmul__ = __mul__
+
+    def __le__(self, other):
+        return self._compare(other, "<=")
+
+    def __ge__(self, other):
+        return self._compare(other, ">=")
+
+    def __eq__(self, other):
+        return self._compare(other, "=")
+
+    def _compare(self, other, sense):
+        other = _block(other, len(self))
+        if other is None:
+            return NotImplemented
+        return ConstraintBlock(self.combine(other, -1.0), sense)
+
+
+class ConstraintBlock:
+    """k contraintes de même sens : block (sens) 0"""
+
+    __slots__ = ("block", "sense")
+
+    def __init__(self, block: LinExprArray, sense: str):
+        self.block = block
+        self.sense = sense
+
+    def __len__(self) -> int:
+        return len(self.block)
+
+    def __repr__(self) -> str:
+        return f"ConstraintBlock({len(self)} contrainte(s) {self.sense})"
+
+    __bool__ = Constraint.__bool__
+
+
+class VarFamily:
+    """
+    Famille indexée de variables, aux colonnes consécutives start..start+size-1.
+
+    `keys` : nombre de variables (y[0]..y[k-1]), forme (y[i, j]) ou liste de clés (y["a"]).
+    Aucune Variable n'est créée à l'avance : y[i] en construit une à la demande, et les
+    opérations vectorisées (sum, dot, `matrice @ y`, `y <= u`) travaillent sur les indices.
+    """
+
+    __slots__ = ("model", "name", "start", "shape", "keys", "positions")
+    __array_ufunc__ = None
+    __hash__ = None
+
+    def __init__(self, model: "Model", name: str, start: int, keys):
+        self.model = model
+        self.name = name
+        self.start = start
+        self.keys = self.positions = None
+        if isinstance(keys, numbers.Integral):
+            self.shape = (int(keys),)
+        elif isinstance(keys, tuple) and all(isinstance(k, numbers.Integral) for k in keys):
+            self.shape = tuple(int(k) for k in keys)
+        else:
+            self.keys = list(keys)
+            self.shape = (len(self.keys),)
+            self.positions = {key: i for i, key in enumerate(self.keys)}
+            if len(self.positions) != len(self.keys):
+                raise ValueError(f"Clés en double dans la famille {name}")
+        if any(k < 0 for k in self.shape):
+            raise ValueError(f"Forme invalide pour la famille {name}: {self.shape}")
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Colonnes des variables de la famille (ordre de stockage)"""
+        return np.arange(self.start, self.start + self.size)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return f"VarFamily({self.name}, {self.size} variable(s))"
+
+    def offset(self, key) -> int:
+        """Position de la clé `key` dans la famille"""
+        if self.keys is not None:
+            if key not in self.positions:
+                raise KeyError(f"Clé inconnue pour {self.name}: {key!r}")
+            return self.positions[key]
+        index = key if isinstance(key, tuple) else (key,)
+        try:
+            return int(np.ravel_multi_index(index, self.shape))
+        except (ValueError, TypeError):
+            raise KeyError(f"Indice invalide pour {self.name}: {key!r}") from None
+
+    def label(self, offset: int) -> str:
+        """Nom de la variable à la position `offset`"""
+        if self.keys is not None:
+            key = self.keys[offset]
+        else:
+            index = np.unravel_index(offset, self.shape)
+            key = ",".join(str(int(i)) for i in index)
+        return f"{self.name}[{key}]"
+
+    def __getitem__(self, key) -> Variable:
+        return Variable(self.model, self.start + self.offset(key))
+
+    def __iter__(self):
+        return (Variable(self.model, index) for index in range(self.start, self.start + self.size))
+
+    def sum(self) -> LinExpr:
+        """Somme des variables de la famille"""
+        return LinExpr(self.indices, np.ones(self.size))
+
+    def dot(self, coefs) -> LinExpr:
+        """Produit scalaire sum coefs_k * y_k (coefs de la forme de la famille)"""
+        coefs = np.asarray(coefs, dtype=np.float64).reshape(-1)
+        if len(coefs) != self.size:
+            raise ValueError(f"{len(coefs)} coefficient(s) pour {self.size} variable(s) dans {self.name}")
+        return LinExpr(self.indices, coefs)
+
+    __matmul__ = dot
+
+    def __rmatmul__(self, matrix):
+        """`matrice @ y` : une expression par ligne de la matrice (seuls les non-zéros sont gardés)"""
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if matrix.ndim == 1:
+            return self.dot(matrix)
+        if matrix.ndim != 2 or matrix.shape[1] != self.size:
+            raise ValueError(f"Matrice de forme {matrix.shape} incompatible avec {self.size} variable(s)")
+        rows, cols = np.nonzero(matrix)
+        return LinExprArray(rows, self.start + cols, matrix[rows, cols], np.zeros(matrix.shape[0]))
+
+    def sparse_product(self, rows, cols, vals, nb_rows: int) -> LinExprArray:
+        """
+        `A @ y` pour une matrice A donnée en triplets (ligne, position dans la famille, valeur),
+        sans jamais la densifier.
+        """
+        cols = np.asarray(cols, dtype=np.int64)
+        if len(cols) and (cols.min() < 0 or cols.max() >= self.size):
+            raise ValueError(f"Position hors de la famille {self.name} ({self.size} variable(s))")
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) and (rows.min() < 0 or rows.max() >= nb_rows):
+            raise ValueError(f"Indice de ligne hors limites ({nb_rows} ligne(s))")
+        return LinExprArray(rows, self.start + cols, vals, np.zeros(nb_rows))
+
+    def as_block(self) -> LinExprArray:
+        """Vecteur des variables (une expression y_k par ligne)"""
+        rows = np.arange(self.size)
+        return LinExprArray(rows, self.start + rows, np.ones(self.size), np.zeros(self.size))
+
+    def __mul__(self, coefs):
+        """Produit terme à terme par un nombre ou un vecteur : une expression coefs_k y_k par ligne"""
+        coefs = np.broadcast_to(np.asarray(coefs, dtype=np.float64).reshape(-1), (self.size,))
+        block = self.as_block()
+        return LinExprArray(block.rows, block.cols, block.coefs * coefs, block.constants)
+
+    __rmul__ = __mul__
+
+    def __add__(self, other):
+        return self.as_block() + other
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self.as_block() - other
+
+    def __rsub__(self, other):
+        return other - self.as_block()
+
+    def __le__(self, other):
+        return self.as_block() <= other
+
+    def __ge__(self, other):
+        return self.as_block() >= other
+
+    def __eq__(self, other):
+        return self.as_block() == other
+
+    def values(self, result) -> np.ndarray:
+        """Valeurs des variables dans un SolveResult, à la forme de la famille"""
+        return np.asarray(result.x, dtype=np.float64)[self.start:self.start + self.size].reshape(self.shape)
+
+
+class Model:
+    """
+    Modèle algébrique : variables nommées ou familles indexées, contraintes écrites
+    comme des inégalités, compilé en un SparseProblem (ou en Problem dense).
+
+        model = Model()
+        x = model.add_var("x")
+        y = model.add_vars("y", 3, ub=4)
+        model.add(x + 2 * y[0] <= 10)
+        model.add(A @ y >= b)          # une contrainte par ligne de A, en un seul bloc
+        model.maximize(3 * x + y.dot([1, 2, 3]))
+        result = model.solve()
+
+    Les contraintes sont stockées en triplets (ligne, colonne, coefficient) par bloc ;
+    compile() les concatène et additionne les termes en double en une seule passe vectorisée.
+    """
+
+    def __init__(self, name: str = "Modèle"):
+        self.name = name
+        self.n = 0
+        self.m = 0
+        self.objective = LinExpr()
+        self.objective_type = "max"
+        # Colonne de départ et famille (ou nom de variable isolée) de chaque déclaration
+        self._starts = []
+        self._owners = []
+        self._names = set()
+        self._lower = []
+        self._upper = []
+        # Blocs de contraintes : lignes (globales), colonnes, coefficients, seconds membres, sens
+        self._rows = []
+        self._cols = []
+        self._coefs = []
+        self._rhs = []
+        self._senses = []
+
+    def __repr__(self) -> str:
+        return f"Model({self.name!r}, {self.m} contrainte(s), {self.n} variable(s))"
+
+    def _declare(self, name: str, owner, size: int, lb, ub):
+        if name in self._names:
+            raise ValueError(f"Nom de variable déjà utilisé: {name}")
+        lower = np.broadcast_to(np.asarray(lb, dtype=np.float64), (size,)).copy()
+        upper = np.broadcast_to(np.asarray(np.inf if ub is None else ub, dtype=np.float64), (size,)).copy()
+        if not np.isfinite(lower).all():
+            raise ValueError(f"Les bornes inférieures de {name} doivent être finies")
+        if (lower > upper).any():
+            raise ValueError(f"Bornes incohérentes pour {name}")
+        self._names.add(name)
+        self._starts.append(self.n)
+        self._owners.append(owner)
+        self._lower.append(lower)
+        self._upper.append(upper)
+        self.n += size
+
+    def add_var(self, name: str = None, lb: float = 0.0, ub: float = None) -> Variable:
+        """Nouvelle variable lb <= x <= ub (ub=None : pas de borne supérieure)"""
+        name = name or f"x{self.n + 1}"
+        variable = Variable(self, self.n)
+        self._declare(name, name, 1, lb, ub)
+        return variable
+
+    def add_vars(self, name: str, keys, lb=0.0, ub=None) -> VarFamily:
+        """
+        Famille de variables `name[...]` : `keys` est un nombre, une forme (tuple d'entiers)
+        ou une liste de clés ; lb et ub sont des nombres ou des vecteurs (ordre de stockage).
+        """
+        family = VarFamily(self, name, self.n, keys)
+        self._declare(name, family, family.size, lb, ub)
+        return family
+
+    def variable_name(self, index: int) -> str:
+        """Nom de la variable de la colonne `index`"""
+        if not 0 <= index < self.n:
+            raise IndexError(f"Variable {index} hors du modèle ({self.n} variable(s))")
+        k = bisect_right(self._starts, index) - 1
+        owner = self._owners[k]
+        return owner if isinstance(owner, str) else owner.label(index - self._starts[k])
+
+    def variable_names(self) -> list:
+        return [self.variable_name(j) for j in range(self.n)]
+
+    def add(self, constraint):
+        """
+        Ajoute une contrainte (`expr <= rhs`, `expr >= rhs`, `expr == rhs`) ou un bloc
+        (`A @ y <= b`). Renvoie l'indice de la ligne (range de lignes pour un bloc),
+        qui sert aussi d'indice dans `result.duals`.
+        """
+        if isinstance(constraint, Constraint):
+            cols, coefs = constraint.expr.terms()
+            rows = np.zeros(len(cols), dtype=np.int64)
+            rhs = np.array([constraint.rhs])
+        elif isinstance(constraint, ConstraintBlock):
+            block = constraint.block
+            rows, cols, coefs, rhs = block.rows, block.cols, block.coefs, -block.constants
+        else:
+            raise TypeError(f"Contrainte attendue (expression <=, >= ou == second membre), "
+                            f"reçu {type(constraint).__name__}")
+        if constraint.sense not in SENSES:
+            raise ValueError(f"Sens de contrainte inconnu: {constraint.sense}")
+        if len(cols) and (cols.min() < 0 or cols.max() >= self.n):
+            raise ValueError("La contrainte utilise une variable qui n'appartient pas au modèle")
+        first = self.m
+        self._rows.append(rows + first)
+        self._cols.append(cols)
+        self._coefs.append(coefs)
+        self._rhs.append(rhs)
+        self._senses.extend([constraint.sense] * len(rhs))
+        self.m += len(rhs)
+        return first if isinstance(constraint, Constraint) else range(first, self.m)
+
+    def maximize(self, expr):
+        self._objective(expr, "max")
+
+    def minimize(self, expr):
+        self._objective(expr, "min")
+
+    def _objective(self, expr, objective_type: str):
+        objective = _expr(expr)
+        if objective is None:
+            raise TypeError(f"Expression linéaire attendue, reçu {type(expr).__name__}")
+        self.objective = objective
+        self.objective_type = objective_type
+
+    def compile(self) -> SparseProblem:
+        """
+        SparseProblem du modèle, en une passe vectorisée : les termes de toutes les
+        contraintes sont concaténés et ceux d'un même couple (ligne, colonne) additionnés.
+        Une minimisation est écrite en maximisation de -objectif (objective_type "min").
+        """
+        n = self.n
+        if self._rows:
+            rows, cols = np.concatenate(self._rows), np.concatenate(self._cols)
+            keys, inverse = np.unique(rows * max(n, 1) + cols, return_inverse=True)
+            vals = np.bincount(inverse, weights=np.concatenate(self._coefs), minlength=len(keys))
+            rows, cols = np.divmod(keys, max(n, 1))
+            b = np.concatenate(self._rhs)
+        else:
+            rows = cols = np.zeros(0, dtype=np.int64)
+            vals, b = np.zeros(0), np.zeros(0)
+
+        obj_cols, obj_coefs = self.objective.terms()
+        if len(obj_cols) and obj_cols.max() >= n:
+            raise ValueError("L'objectif utilise une variable qui n'appartient pas au modèle")
+        sign = 1.0 if self.objective_type == "max" else -1.0
+        c = sign * np.bincount(obj_cols, weights=obj_coefs, minlength=n)
+        lower = np.concatenate(self._lower) if self._lower else np.zeros(0)
+        upper = np.concatenate(self._upper) if self._upper else np.zeros(0)
+        return SparseProblem(n, rows, cols, vals, b, c, list(self._senses), sign * self.objective.constant,
+                             self.objective_type, lower, upper)
+
+    def to_problem(self) -> Problem:
+        """Problème dense typé (méthodes à tableau, sauvegarde au format JSON habituel)"""
+        return Problem.from_sparse(self.compile())
+
+    def solve(self, method: str = None, **kwargs):
+        """
+        Résout le modèle compilé : méthode `method` (clé de method_selection.METHODS) ou choix
+        automatique (select_method, joint au résultat dans `result.selection`).
+        Pour une minimisation, l'objectif du résultat est celui de -objectif (voir objective_value).
+        """
+        problem = self.compile()
+        selection = None
+        if method is None:
+            selection = select_method(problem)
+            method, kwargs = selection.key, {**selection.options, **kwargs}
+        if method not in SPARSE_METHODS or (problem.has_bounds and method != "7"):
+            # Dictionnaire dense pour les autres méthodes ; seul le simplexe borné gère les bornes
+            problem = Problem.from_sparse(problem).freeze()
+            if "bounds" in problem:
+                problem = bounds_as_constraints(problem)
+        result = METHODS[method][1](problem, **kwargs).solve()
+        if selection is not None:
+            result.selection = selection
+        return result
+
+    def objective_value(self, result) -> float:
+        """Valeur de l'objectif du modèle (signe rétabli pour une minimisation)"""
+        return result.objective if self.objective_type == "max" else -result.objective
@@ -0,0 +1,306 @@
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+import numpy as np
+
+from dual_simplex_method import DualSimplexMethod
+from revised_method import RevisedSimplexMethod
+
+# Un point de rupture à moins de SNAP·(1 + |θ|) d'une borne de l'intervalle est ramené sur la borne
+SNAP = 1e-8
+
+
+@dataclass
+class ParametricSegment:
+    """Intervalle de θ sur lequel une même base reste optimale (Z y est affine)"""
+    theta_start: float
+    theta_end: float
+    value_start: float
+    value_end: float
+    basis: List[str] = field(default_factory=list)
+
+    @property
+    def slope(self) -> float:
+        width = self.theta_end - self.theta_start
+        return 0.0 if width == 0 else (self.value_end - self.value_start) / width
+
+
+@dataclass
+class ParametricCurve:
+    """
+    Valeur optimale Z(θ) du problème b + θ·d (target="rhs") ou c + θ·d (target="cost"),
+    linéaire par morceaux entre les points de rupture.
+
+    status : "optimal" si la courbe couvre tout l'intervalle demandé, sinon l'état du
+             problème juste après le dernier point ("infeasible" ou "unbounded")
+    pivots : nombre de pivots effectués pour parcourir les points de rupture
+    """
+    target: str
+    direction: List[float]
+    segments: List[ParametricSegment] = field(default_factory=list)
+    status: str = "optimal"
+    pivots: int = 0
+
+    @property
+    def breakpoints(self) -> List[float]:
+        """Valeurs de θ où la base optimale change (bornes de l'intervalle comprises)"""
+        if not self.segments:
+            return []
+        return [self.segments[0].theta_start] + [s.theta_end for s in self.segments]
+
+    def points(self) -> Tuple[List[float], List[float]]:
+        """Sommets de la courbe (θ, Z), prêts à être tracés"""
+        if not self.segments:
+            return [], []
+        thetas = [self.segments[0].theta_start]
+        values = [self.segments[0].value_start]
+        for segment in self.segments:
+            thetas.append(segment.theta_end)
+            values.append(segment.value_end)
+        return thetas, values
+
+    def value(self, theta: float) -> float:
+        """Z(θ) par interpolation sur le segment qui contient θ (à SNAP près aux extrémités)"""
+        if self.segments:
+            margin = SNAP * (1.0 + abs(theta))
+            first, last = self.segments[0], self.segments[-1]
+            if first.theta_start - margin <= theta < first.theta_start:
+                theta = first.theta_start
+            elif last.theta_end < theta <= last.theta_end + margin:
+                theta = last.theta_end
+        for segment in self.segments:
+            if segment.theta_start <= theta <= segment.theta_end:
+                return segment.value_start + segment.slope * (theta - segment.theta_start)
+        raise ValueError(f"θ = {theta} hors de la courbe")
+
+    def summary(self) -> str:
+        """Liste des segments de la courbe"""
+        lines = [f"Analyse paramétrique ({'seconds membres' if self.target == 'rhs' else 'coûts'}), "
+                 f"{len(self.segments)} segment(s), {self.pivots} pivot(s)"]
+        for segment in self.segments:
+            lines.append(f"  θ ∈ [{segment.theta_start:.6g} ; {segment.theta_end:.6g}] : "
+                         f"Z = {segment.value_start:.6g} → {segment.value_end:.6g} "
+                         f"(pente {segment.slope:.6g}), base {', '.join(segment.basis)}")
+        if self.status != "optimal":
+            lines.append(f"  Au-delà : {self.status}")
+        return "\n".join(lines)
+
+
+def parametric_analysis(variables: dict, direction, target: str = "rhs", theta_max: float = 1.0,
+                        theta_min: float = 0.0, max_pivots: int = 10000) -> ParametricCurve:
+    """
+    Balaye θ de `theta_min` à `theta_max` pour le problème b + θ·d ou c + θ·d.
+
+    Une seule résolution (simplexe dual) à θ = theta_min ; ensuite chaque point de rupture
+    est franchi par un pivot depuis la base courante : pivot dual quand une variable de base
+    s'annule (seconds membres), pivot primal quand un coût réduit s'annule (coûts).
+    `direction` a une composante par contrainte (rhs) ou par variable de décision (cost).
+    Le dictionnaire `variables` n'est pas modifié.
+    """
+    if target not in ("rhs", "cost"):
+        raise ValueError(f"Cible inconnue: {target}")
+    if theta_max < theta_min:
+        raise ValueError("theta_max doit être supérieur ou égal à theta_min")
+    direction = np.asarray(direction, dtype=np.float64)
+
+    solver = DualSimplexMethod(_shifted(variables, direction, target, theta_min))
+    result = solver.solve()
+    theta_solved = theta_min
+    if result.status == ("infeasible" if target == "rhs" else "unbounded"):
+        # L'ensemble des θ admissibles est un intervalle : on cherche où il commence
+        first = _first_theta(variables, direction, target, theta_min, theta_max)
+        if first is not None:
+            # Au bord exact, le problème est dégénéré : on résout juste à l'intérieur, mais la
+            # courbe commence bien à `first` (la base trouvée y reste optimale par continuité)
+            theta_min = first
+            theta_solved = min(theta_max, first + 1e-9 * (1.0 + abs(first)))
+            solver = DualSimplexMethod(_shifted(variables, direction, target, theta_solved))
+            result = solver.solve()
+    curve = ParametricCurve(target=target, direction=direction.tolist(), status=result.status)
+    if not result.is_optimal:
+        return curve
+
+    walk = _walk_rhs if target == "rhs" else _walk_cost
+    walk(solver, curve, direction, theta_solved, theta_min, theta_max, max_pivots)
+    return curve
+
+
+def _shifted(variables: dict, direction, target: str, theta: float) -> dict:
+    """Copie du problème avec b + θ·d ou c + θ·d"""
+    shifted = {
+        **variables,
+        "equations": {key: list(eq) for key, eq in variables["equations"].items()},
+        "tab_optimisation": list(variables["tab_optimisation"]),
+    }
+    if target == "rhs":
+        for key, d in zip(shifted["equations"], direction):
+            shifted["equations"][key][0] += theta * d
+    else:
+        for j, d in enumerate(direction):
+            shifted["tab_optimisation"][j + 1] += theta * d
+    return shifted
+
+
+def _first_theta(variables: dict, direction, target: str, theta_min: float, theta_max: float):
+    """
+    Plus petit θ de [theta_min, theta_max] pour lequel le problème est réalisable (rhs)
+    ou borné (cost, réalisabilité du dual), par un seul PL en (x, t) avec θ = theta_min + t.
+    Renvoie None si aucun θ ne convient.
+    """
+    n = variables["nombres_variables_base"]
+    equations = list(variables["equations"].values())
+    senses = variables.get("constraints_info") or ["<="] * len(equations)
+    rows, rhs, kinds = [], [], []
+    if target == "rhs":
+        for eq, sense, d in zip(equations, senses, direction):
+            rows.append(list(eq[1:n + 1]) + [-d])
+            rhs.append(eq[0] + theta_min * d)
+            kinds.append(sense)
+    else:
+        # Dual : A^T y >= c + θ e, y >= 0 (<=), y <= 0 (>=), y libre (=, y = y+ - y-)
+        signs = []
+        for sense in senses:
+            signs.append([{"<=": 1.0, ">=": -1.0}[sense]] if sense != "=" else [1.0, -1.0])
+        c = variables["tab_optimisation"]
+        for j in range(n):
+            row = [sign * eq[j + 1] for eq, column in zip(equations, signs) for sign in column]
+            rows.append(row + [-direction[j]])
+            rhs.append(c[j + 1] + theta_min * direction[j])
+            kinds.append(">=")
+    width = len(rows[0]) if rows else 1
+    rows.append([0.0] * (width - 1) + [1.0])
+    rhs.append(theta_max - theta_min)
+    kinds.append("<=")
+
+    auxiliary = {
+        "tab_optimisation": [0.0] * width + [-1.0],
+        "nombres_variables_base": width,
+        "equations": {f"equation_{i+1}": [b] + row for i, (b, row) in enumerate(zip(rhs, rows))},
+        "nb_equations": len(rows),
+        "constraints_info": kinds,
+    }
+    result = RevisedSimplexMethod(auxiliary).solve()
+    if not result.is_optimal:
+        return None
+    return theta_min + result.x[-1]
+
+
+def _objective(solver, x) -> float:
+    return float(solver.constant + solver.c @ x)
+
+
+def _basis_names(solver) -> List[str]:
+    return [solver.names[col - 1] for col in solver.engine.basis if solver.names[col - 1] != "sM"]
+
+
+def _segment_end(hit: float, theta: float, theta_max: float) -> float:
+    """Fin du segment : le point de rupture ramené dans [θ, theta_max], et sur theta_max s'il en est à SNAP près"""
+    end = min(max(float(hit), theta), theta_max)
+    return theta_max if theta_max - end <= SNAP * (1.0 + abs(theta_max)) else end
+
+
+def _walk_rhs(solver, curve, direction, theta_solved, theta_min, theta_max, max_pivots):
+    """
+    x_B(θ) = B⁻¹b + (θ - θ0) B⁻¹d, θ0 = `theta_solved` : le point de rupture est le premier
+    x_B qui s'annule. La courbe part de `theta_min`.
+    """
+    engine, n, tol = solver.engine, solver.n, solver.tol
+    d_rows = np.zeros(engine.m)
+    for i, rows in enumerate(solver.constraint_rows):
+        for row, sign in rows:
+            d_rows[row] = sign * direction[i]
+    slack = solver.slack_columns()
+    theta = theta_min
+
+    while True:
+        delta = engine.tableau[:engine.m, slack] @ d_rows
+        beta = engine.rhs.copy()
+        falling = delta < -tol
+        hits = np.full(engine.m, np.inf)
+        hits[falling] = theta_solved - beta[falling] / delta[falling]
+        row = int(np.argmin(hits))
+        end = _segment_end(hits[row], theta, theta_max)
+
+        def values_at(t):
+            x = np.zeros(n)
+            basic = np.flatnonzero((engine.basis >= 1) & (engine.basis <= n))
+            x[engine.basis[basic] - 1] = beta[basic] + (t - theta_solved) * delta[basic]
+            return _objective(solver, x)
+
+        # Un point de rupture dégénéré (segment de longueur nulle) n'ajoute pas de segment
+        if end > theta or not curve.segments:
+            curve.segments.append(ParametricSegment(theta, end, values_at(theta), values_at(end),
+                                                    _basis_names(solver)))
+        if end >= theta_max or curve.pivots >= max_pivots:
+            return
+        theta = end
+
+        col = engine.dual_ratio_test(row)
+        if col == -1:
+            curve.status = "infeasible"
+            return
+        engine.pivot(row, col)
+        curve.pivots += 1
+        if solver.bound_row is not None and engine.objective[1 + n + solver.bound_row] > tol:
+            curve.status = "unbounded"
+            return
+
+
+def _walk_cost(solver, curve, direction, theta_solved, theta_min, theta_max, max_pivots):
+    """
+    d(θ) = d + (θ - θ0) g, θ0 = `theta_solved` : le point de rupture est le premier coût
+    réduit qui s'annule. La courbe part de `theta_min`.
+    """
+    engine, n, tol = solver.engine, solver.n, solver.tol
+    e = np.zeros(engine.tableau.shape[1] - 1)
+    e[:n] = direction
+    theta = theta_min
+
+    while True:
+        g = e[engine.basis - 1] @ engine.tableau[:engine.m, 1:] - e
+        if solver.bound_row is not None:
+            price = engine.objective[1 + n + solver.bound_row] + (theta - theta_solved) * g[n + solver.bound_row]
+            if price > tol or g[n + solver.bound_row] > tol:
+                curve.status = "unbounded"
+                return
+        reduced = engine.objective[1:]
+        falling = g < -tol
+        hits = np.full(len(g), np.inf)
+        hits[falling] = theta_solved - reduced[falling] / g[falling]
+        col = int(np.argmin(hits)) + 1
+        end = _segment_end(hits[col - 1], theta, theta_max)
+
+        x = engine.primal_values(n)
+        costs = solver.c + (np.array([theta, end])[:, None] - theta_solved) * direction
+        value_start, value_end = (float(solver.constant + v @ x) for v in costs)
+        if end > theta or not curve.segments:
+            curve.segments.append(ParametricSegment(theta, end, value_start, value_end, _basis_names(solver)))
+        if end >= theta_max or curve.pivots >= max_pivots:
+            return
+        theta = end
+
+        row = engine.ratio_test(col)
+        if row == -1:
+            curve.status = "unbounded"
+            return
+        engine.pivot(row, col)
+        curve.pivots += 1
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    # Max Z = 3x1 + 5x2, x1 <= 4, 2x2 <= 12, 3x1 + 2x2 <= 18 ; capacité 3 : 18 + θ
+    variables_parametrique = {
+        "tab_optimisation": [0, 3, 5],
+        "nombres_variables_base": 2,
+        "equations": {
+            "equation_1": [4, 1, 0],
+            "equation_2": [12, 0, 2],
+            "equation_3": [18, 3, 2],
+        },
+        "nb_equations": 3,
+        "constraints_info": ["<=", "<=", "<="]
+    }
+
+    print(parametric_analysis(variables_parametrique, [0, 0, 1], "rhs", theta_min=-18, theta_max=20).summary())
+    print(parametric_analysis(variables_parametrique, [1, 0], "cost", theta_max=10).summary())
@@ -0,0 +1,464 @@
+import time
+from typing import Optional
+
+import numpy as np
+
+from solver_result import SolveResult
+
+
+class Presolve:
+    """
+    Réductions du problème avant résolution, et reconstruction (postsolve) de la solution.
+
+    Les contraintes >= sont retournées en interne (lignes <= ou =) ; `sign[i]` vaut -1 pour
+    une ligne retournée. Chaque réduction est empilée avec de quoi la défaire :
+    valeurs des variables supprimées, prix duaux des lignes supprimées, noms de base.
+
+    Réductions : lignes vides, colonnes vides, lignes singletons (variable fixée, borne,
+    translation d'une borne inférieure), colonnes singletons sans coût dans une égalité
+    (variable d'écart implicite), lignes en double, lignes dominées (activité maximale
+    sous le second membre), colonnes dominées, détection précoce de non-réalisabilité
+    (activité minimale, bornes resserrées contradictoires) et de non-bornitude.
+    """
+
+    REDUCTIONS = {
+        "empty_rows": "Lignes vides",
+        "empty_columns": "Colonnes vides",
+        "singleton_rows": "Lignes singletons",
+        "fixed_variables": "Variables fixées",
+        "singleton_columns": "Colonnes singletons",
+        "duplicate_rows": "Lignes en double",
+        "dominated_rows": "Lignes dominées",
+        "dominated_columns": "Colonnes dominées",
+        "tightened_bounds": "Bornes resserrées",
+    }
+
+    def __init__(self, variables: dict, tol: float = 1e-9, max_passes: int = 20):
+        self.variables = variables
+        self.tol = tol
+        self.max_passes = max_passes
+        self.status = None
+        # Une colonne de coût positif que rien ne borne : non borné dès que le reste est réalisable
+        self.unbounded_if_feasible = False
+        self.counts = {key: 0 for key in self.REDUCTIONS}
+        self.log = []
+        self.stack = []
+        self.elapsed = 0.0
+
+    def run(self) -> Optional[dict]:
+        """
+        Applique les réductions jusqu'à stabilité et renvoie le problème réduit
+        (dictionnaire habituel), ou None si la présolve conclut seule (`status`).
+        Le dictionnaire d'origine n'est pas modifié.
+        """
+        start = time.perf_counter()
+        self.load()
+        rules = (self.remove_empty_rows, self.remove_empty_columns, self.remove_singleton_rows,
+                 self.remove_singleton_columns, self.remove_duplicate_rows,
+                 self.remove_dominated_rows, self.remove_dominated_columns)
+        for _ in range(self.max_passes):
+            changed = False
+            for rule in rules:
+                changed = rule() or changed
+                if self.status is not None:
+                    self.elapsed = time.perf_counter() - start
+                    return None
+            if not changed:
+                break
+
+        if not self.rows.any() and not self.cols.any():
+            self.status = "unbounded" if self.unbounded_if_feasible else "optimal"
+            self.log.append("Tout le problème a été résolu par la présolve")
+        self.elapsed = time.perf_counter() - start
+        return None if self.status is not None else self.reduced_problem()
+
+    def load(self):
+        """Copie de travail : lignes <= ou = (les >= sont multipliées par -1)"""
+        if self.variables.get("bounds") is not None:
+            raise ValueError("Présolve : bornes de variables non prises en charge (voir bounds_as_constraints)")
+        n = self.variables["nombres_variables_base"]
+        equations = list(self.variables["equations"].values())
+        senses = list(self.variables.get("constraints_info") or ["<="] * len(equations))
+        self.n, self.m = n, len(equations)
+        self.senses = senses
+        self.A0 = np.array([eq[1:n + 1] for eq in equations], dtype=np.float64).reshape(self.m, n)
+        self.b0 = np.array([eq[0] for eq in equations], dtype=np.float64)
+        self.sign = np.array([-1.0 if s == ">=" else 1.0 for s in senses])
+        self.A = self.A0 * self.sign[:, None]
+        self.b = self.b0 * self.sign
+        self.eq = np.array([s == "=" for s in senses])
+        self.c = np.array(self.variables["tab_optimisation"][1:n + 1], dtype=np.float64)
+        self.constant0 = float(self.variables["tab_optimisation"][0])
+        self.constant = self.constant0
+        self.rows = np.ones(self.m, dtype=bool)
+        self.cols = np.ones(n, dtype=bool)
+        self.x = np.zeros(n)
+        self.shift = np.zeros(n)
+        # Bornes supérieures explicites (lignes singletons conservées) et ligne qui les porte
+        self.upper = np.full(n, np.inf)
+        self.upper_row = np.full(n, -1)
+        # Bornes impliquées par les lignes à plusieurs variables : elles ne servent qu'à détecter
+        # une non-réalisabilité, jamais à supprimer une ligne (raisonnement circulaire)
+        self.implied_upper = np.full(n, np.inf)
+
+    def row_name(self, i: int) -> str:
+        """Nom de la variable de base d'une ligne supprimée (écart, ou artificielle pour =)"""
+        return f"a{i+1}" if self.senses[i] == "=" else f"s{i+1}"
+
+    def alive_nonzeros(self, i: int):
+        """Colonnes vivantes où la ligne i a un coefficient non nul"""
+        return np.flatnonzero(self.cols & (np.abs(self.A[i]) > self.tol))
+
+    def fix_column(self, j: int, value: float):
+        """Fixe x_j : le second membre et la constante de l'objectif absorbent sa contribution"""
+        self.b[self.rows] -= self.A[self.rows, j] * value
+        self.constant += self.c[j] * value
+        self.cols[j] = False
+        self.x[j] = value
+
+    def drop_row(self, i: int, key: str, name: str = None):
+        """Supprime une ligne redondante : son prix dual est nul, son écart est en base"""
+        self.rows[i] = False
+        self.counts[key] += 1
+        self.stack.append(("free_row", i, name or self.row_name(i)))
+
+    def infeasible(self, message: str) -> bool:
+        self.status = "infeasible"
+        self.log.append(message)
+        return True
+
+    def remove_empty_rows(self) -> bool:
+        changed = False
+        for i in np.flatnonzero(self.rows):
+            if len(self.alive_nonzeros(i)):
+                continue
+            if self.b[i] < -self.tol or (self.eq[i] and self.b[i] > self.tol):
+                return self.infeasible(f"Contrainte {i+1} vide et non satisfaite")
+            self.drop_row(i, "empty_rows")
+            changed = True
+        return changed
+
+    def remove_empty_columns(self) -> bool:
+        changed = False
+        for j in np.flatnonzero(self.cols):
+            if (np.abs(self.A[self.rows, j]) > self.tol).any():
+                continue
+            if self.c[j] > self.tol:
+                self.unbounded_if_feasible = True
+                self.log.append(f"x{j+1} n'apparaît dans aucune contrainte et augmente Z : non borné si réalisable")
+            self.fix_column(j, 0.0)
+            self.stack.append(("fixed", j))
+            self.counts["empty_columns"] += 1
+            changed = True
+        return changed
+
+    def remove_singleton_rows(self) -> bool:
+        changed = False
+        for i in np.flatnonzero(self.rows):
+            cols = self.alive_nonzeros(i)
+            if len(cols) != 1:
+                continue
+            j = int(cols[0])
+            a, value = self.A[i, j], self.b[i] / self.A[i, j]
+            if self.eq[i]:
+                if value < -self.tol:
+                    return self.infeasible(f"Contrainte {i+1} : x{j+1} = {value:.6g} < 0")
+                self.rows[i] = False
+                self.fix_column(j, max(value, 0.0))
+                self.stack.append(("eq_singleton", i, j, np.flatnonzero(self.rows)))
+                self.counts["singleton_rows"] += 1
+                self.counts["fixed_variables"] += 1
+                changed = True
+            elif a > 0:
+                # x_j <= value
+                if value < -self.tol:
+                    return self.infeasible(f"Contrainte {i+1} : x{j+1} <= {value:.6g} < 0")
+                if value <= self.tol:
+                    self.rows[i] = False
+                    self.fix_column(j, 0.0)
+                    self.stack.append(("bound_singleton", i, j, np.flatnonzero(self.rows)))
+                    self.counts["singleton_rows"] += 1
+                    self.counts["fixed_variables"] += 1
+                    changed = True
+                elif value < self.upper[j] - self.tol:
+                    self.upper[j], self.upper_row[j] = value, i
+            else:
+                # x_j >= value : redondante si value <= 0, sinon translation x_j = value + x'_j
+                if value > self.tol:
+                    if value > min(self.upper[j], self.implied_upper[j]) + self.tol:
+                        return self.infeasible(f"x{j+1} >= {value:.6g} et x{j+1} <= {self.upper[j]:.6g}")
+                    self.b[self.rows] -= self.A[self.rows, j] * value
+                    self.constant += self.c[j] * value
+                    self.shift[j] += value
+                    self.upper[j] -= value
+                    self.implied_upper[j] -= value
+                    # Prix dual reconstruit comme pour une borne : x_j peut rester sur value
+                    self.rows[i] = False
+                    self.stack.append(("bound_singleton", i, j, np.flatnonzero(self.rows)))
+                    self.counts["singleton_rows"] += 1
+                else:
+                    self.drop_row(i, "singleton_rows")
+                changed = True
+        return changed
+
+    def remove_singleton_columns(self) -> bool:
+        """Colonne sans coût présente dans une seule égalité : c'est un écart, l'égalité devient <= ou >="""
+        changed = False
+        for j in np.flatnonzero(self.cols):
+            rows = np.flatnonzero(self.rows & (np.abs(self.A[:, j]) > self.tol))
+            if len(rows) != 1 or abs(self.c[j]) > self.tol or self.upper_row[j] >= 0:
+                continue
+            r = int(rows[0])
+            if not self.eq[r] or len(self.alive_nonzeros(r)) < 2:
+                continue
+            if self.A[r, j] < 0:
+                self.A[r] = -self.A[r]
+                self.b[r] = -self.b[r]
+                self.sign[r] = -self.sign[r]
+            self.eq[r] = False
+            self.cols[j] = False
+            self.stack.append(("slack_column", r, j))
+            self.counts["singleton_columns"] += 1
+            changed = True
+        return changed
+
+    def remove_duplicate_rows(self) -> bool:
+        """Lignes proportionnelles : on garde la plus contraignante, une incohérence est une non-réalisabilité"""
+        changed = False
+        inequalities, equalities = {}, {}
+        for i in np.flatnonzero(self.rows):
+            row = np.where(self.cols, self.A[i], 0.0)
+            scale = np.abs(row).max()
+            if scale <= self.tol:
+                continue
+            if self.eq[i]:
+                first = row[np.flatnonzero(np.abs(row) > self.tol)[0]]
+                scale = scale if first > 0 else -scale
+            normalized, beta = row / scale, self.b[i] / scale
+            key = tuple(np.round(normalized, 9))
+            if self.eq[i]:
+                if key in equalities:
+                    other, other_beta = equalities[key]
+                    if abs(beta - other_beta) > self.tol * (1.0 + abs(beta)):
+                        return self.infeasible(f"Contraintes {other+1} et {i+1} proportionnelles et incompatibles")
+                    self.drop_row(i, "duplicate_rows")
+                    changed = True
+                    continue
+                equalities[key] = (i, beta)
+                equalities[tuple(-v for v in key)] = (i, -beta)
+            elif key in inequalities:
+                other, other_beta = inequalities[key]
+                if beta < other_beta:
+                    self.drop_row(other, "duplicate_rows")
+                    inequalities[key] = (i, beta)
+                else:
+                    self.drop_row(i, "duplicate_rows")
+                changed = True
+            else:
+                inequalities[key] = (i, beta)
+
+        # Une inégalité parallèle à une égalité est redondante ou contradictoire
+        for key, (i, beta) in list(inequalities.items()):
+            if key in equalities and self.rows[i]:
+                other, value = equalities[key]
+                if value > beta + self.tol * (1.0 + abs(beta)):
+                    return self.infeasible(f"Contrainte {i+1} incompatible avec l'égalité {other+1}")
+                self.drop_row(i, "duplicate_rows")
+                changed = True
+        return changed
+
+    def activity_bounds(self, i: int):
+        """Activité minimale et maximale de la ligne i avec 0 <= x_j <= upper_j"""
+        row = np.where(self.cols, self.A[i], 0.0)
+        positive, negative = row > self.tol, row < -self.tol
+        with np.errstate(invalid="ignore"):
+            low = (row[negative] * self.upper[negative]).sum() if negative.any() else 0.0
+            high = (row[positive] * self.upper[positive]).sum() if positive.any() else 0.0
+        return row, low, high
+
+    def remove_dominated_rows(self) -> bool:
+        changed = False
+        for i in np.flatnonzero(self.rows):
+            if len(self.alive_nonzeros(i)) < 2:
+                continue
+            row, low, high = self.activity_bounds(i)
+            slack = self.tol * (1.0 + abs(self.b[i]))
+            if low > self.b[i] + slack or (self.eq[i] and high < self.b[i] - slack):
+                return self.infeasible(f"Contrainte {i+1} : activité hors de portée du second membre")
+            if not self.eq[i] and high <= self.b[i] + slack:
+                self.drop_row(i, "dominated_rows")
+                changed = True
+                continue
+            if np.isfinite(low):
+                # Borne impliquée x_j <= (b - activité minimale des autres) / a_ij
+                for j in np.flatnonzero(row > self.tol):
+                    implied = (self.b[i] - low) / row[j]
+                    if implied < -self.tol:
+                        return self.infeasible(f"Contrainte {i+1} impose x{j+1} < 0")
+                    if implied < min(self.upper[j], self.implied_upper[j]) - self.tol:
+                        self.implied_upper[j] = implied
+                        self.counts["tightened_bounds"] += 1
+        return changed
+
+    def remove_dominated_columns(self) -> bool:
+        changed = False
+        for j in np.flatnonzero(self.cols):
+            rows = np.flatnonzero(self.rows & (np.abs(self.A[:, j]) > self.tol))
+            if len(rows) == 0 or self.eq[rows].any():
+                continue
+            column = self.A[rows, j]
+            if self.c[j] <= self.tol and (column > 0).all():
+                # x_j ne rapporte rien et consomme des ressources : x_j = 0
+                self.fix_column(j, 0.0)
+                self.stack.append(("fixed", j))
+                self.counts["dominated_columns"] += 1
+                changed = True
+            elif self.c[j] > self.tol and (column < 0).all():
+                # x_j augmente Z et relâche toutes ses contraintes : elles disparaissent avec lui
+                self.unbounded_if_feasible = True
+                self.log.append(f"x{j+1} augmente Z sans limite : non borné si le reste est réalisable")
+                for i in rows:
+                    self.drop_row(int(i), "dominated_rows")
+                self.fix_column(j, 0.0)
+                self.stack.append(("fixed", j))
+                self.counts["dominated_columns"] += 1
+                changed = True
+        return changed
+
+    def reduced_problem(self) -> dict:
+        """Problème réduit au format habituel (les lignes retournées redeviennent des >=)"""
+        self.row_index = np.flatnonzero(self.rows)
+        self.col_index = np.flatnonzero(self.cols)
+        equations, constraints_info = {}, []
+        for k, i in enumerate(self.row_index):
+            s = self.sign[i]
+            equations[f"equation_{k+1}"] = [float(s * self.b[i])] + (s * self.A[i, self.col_index]).tolist()
+            constraints_info.append("=" if self.eq[i] else ("<=" if s > 0 else ">="))
+        reduced = {
+            "tab_optimisation": [self.constant] + self.c[self.col_index].tolist(),
+            "nombres_variables_base": len(self.col_index),
+            "equations": equations,
+            "nb_equations": len(self.row_index),
+            "constraints_info": constraints_info,
+        }
+        if "objective_type" in self.variables:
+            reduced["objective_type"] = self.variables["objective_type"]
+        return reduced
+
+    def postsolve(self, result: SolveResult = None) -> SolveResult:
+        """
+        Solution du problème d'origine à partir de celle du problème réduit
+        (`result` peut être None si la présolve a conclu seule).
+        """
+        start = time.perf_counter()
+        if self.status is not None and self.status != "optimal":
+            return SolveResult(method="Présolve", status=self.status, timings={"presolve": self.elapsed})
+
+        method = "Présolve" if result is None else result.method
+        status = "optimal" if result is None else result.status
+        if status == "optimal" and self.unbounded_if_feasible:
+            status = "unbounded"
+        if status != "optimal":
+            timings = {"presolve": self.elapsed, **(result.timings if result else {})}
+            return SolveResult(method=method, status=status, iterations=result.iterations if result else 0,
+                               timings=timings)
+
+        x = self.x.copy()
+        y = np.zeros(self.m)
+        basis = []
+        if result is not None:
+            x[self.col_index] = result.x
+            if result.duals is not None:
+                y[self.row_index] = result.duals
+            names = {f"x{k+1}": f"x{j+1}" for k, j in enumerate(self.col_index)}
+            names.update({f"{p}{k+1}": self.row_name(i) if p == "a" else f"s{i+1}"
+                          for k, i in enumerate(self.row_index) for p in ("s", "a")})
+            basis = [names.get(name, name) for name in result.basis]
+        x += self.shift
+
+        for op in reversed(self.stack):
+            kind = op[0]
+            if kind == "free_row":
+                basis.append(op[2])
+            elif kind == "slack_column":
+                r, j = op[1], op[2]
+                others = [k for k in range(self.n) if k != j]
+                x[j] = (self.b0[r] - self.A0[r, others] @ x[others]) / self.A0[r, j]
+                basis = [f"x{j+1}" if name == f"s{r+1}" else name for name in basis]
+            elif kind in ("eq_singleton", "bound_singleton"):
+                r, j, alive = op[1], op[2], op[3]
+                # Coût réduit de x_j nul (égalité) ou de signe compatible avec la borne
+                value = (self.c[j] - self.A0[alive, j] @ y[alive]) / self.A0[r, j]
+                if kind == "bound_singleton":
+                    value = self.sign[r] * max(0.0, self.sign[r] * value)
+                y[r] = value
+                basis.append(f"x{j+1}" if kind == "eq_singleton" or value != 0 else self.row_name(r))
+
+        timings = {"presolve": self.elapsed, "postsolve": time.perf_counter() - start}
+        if result is not None:
+            timings = {**result.timings, **timings}
+        return SolveResult(
+            method=method,
+            status="optimal",
+            objective=float(self.constant0 + self.c @ x),
+            x=x.tolist(),
+            duals=y.tolist() if result is None or result.duals is not None else None,
+            basis=basis,
+            iterations=result.iterations if result else 0,
+            timings=timings,
+        )
+
+    def report(self) -> str:
+        """Bilan des réductions"""
+        rows_left = int(self.rows.sum()) if self.status is None else 0
+        cols_left = int(self.cols.sum()) if self.status is None else 0
+
+        def shrink(before, after):
+            return f"{before} → {after} (-{100.0 * (before - after) / before:.1f}%)" if before else "0"
+
+        lines = [f"Présolve en {self.elapsed:.4f}s",
+                 f"  Contraintes: {shrink(self.m, rows_left)}",
+                 f"  Variables: {shrink(self.n, cols_left)}"]
+        lines.extend(f"  {label}: {self.counts[key]}" for key, label in self.REDUCTIONS.items() if self.counts[key])
+        lines.extend(f"  ⚠️ {message}" for message in self.log)
+        if self.status is not None:
+            lines.append(f"  Conclusion: {self.status}")
+        return "\n".join(lines)
+
+
+def solve_with_presolve(variables: dict, solver_class, **kwargs) -> SolveResult:
+    """Présolve, résolution silencieuse du problème réduit par `solver_class`, puis postsolve"""
+    presolve = Presolve(variables)
+    reduced = presolve.run()
+    if reduced is None:
+        return presolve.postsolve()
+    return presolve.postsolve(solver_class(reduced, **kwargs).solve())
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    from two_phase_method import TwoPhaseMethod
+
+    # Max Z = 3x1 + 5x2 + x3 + 0x4
+    # x1 <= 4 ; 2x2 <= 12 ; 3x1 + 2x2 <= 18 ; 6x1 + 4x2 <= 40 (double de la précédente, moins serrée)
+    # x3 = 2 ; x2 + x4 = 5
+    variables_presolve = {
+        "tab_optimisation": [0, 3, 5, 1, 0],
+        "nombres_variables_base": 4,
+        "equations": {
+            "equation_1": [4, 1, 0, 0, 0],
+            "equation_2": [12, 0, 2, 0, 0],
+            "equation_3": [18, 3, 2, 0, 0],
+            "equation_4": [40, 6, 4, 0, 0],
+            "equation_5": [2, 0, 0, 1, 0],
+            "equation_6": [5, 0, 1, 0, 1],
+        },
+        "nb_equations": 6,
+        "constraints_info": ["<=", "<=", "<=", "<=", "=", "="]
+    }
+
+    presolve = Presolve(variables_presolve)
+    reduced = presolve.run()
+    print(presolve.report())
+    result = presolve.postsolve(TwoPhaseMethod(reduced).solve())
+    print(result.summary())
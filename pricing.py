@@ -0,0 +1,180 @@
+import math
+
+import numpy as np
+
+
+class PricingRule:
+    """
+    Règle de choix de la variable entrante sur un TableauEngine.
+
+    Les coûts réduits sont lus dans la ligne objectif (négatif = Z peut encore augmenter).
+    `select` renvoie la colonne entrante (indices 1..), ou -1 si le tableau est optimal ;
+    `choose_row` applique le test du minimum des rapports ;
+    `update` est appelé juste avant le pivot (tableau encore inchangé) pour mettre
+    à jour les poids de la règle.
+    """
+
+    name = "Dantzig"
+
+    def reset(self, engine) -> None:
+        pass
+
+    def select(self, engine) -> int:
+        return engine.pivot_column()
+
+    def choose_row(self, engine, col: int) -> int:
+        return engine.ratio_test(col)
+
+    def update(self, engine, row: int, col: int) -> None:
+        pass
+
+
+class DantzigPricing(PricingRule):
+    """Coût réduit le plus négatif (règle historique)"""
+
+    name = "Dantzig"
+
+
+class BlandPricing(PricingRule):
+    """
+    Règle de Bland (anti-cyclage) : plus petit indice parmi les colonnes améliorantes,
+    et en cas d'égalité des rapports, la variable de base de plus petit indice sort.
+    """
+
+    name = "Bland"
+
+    def select(self, engine) -> int:
+        improving = np.flatnonzero(engine.objective[1:] < -engine.tol)
+        return int(improving[0]) + 1 if len(improving) else -1
+
+    def choose_row(self, engine, col: int) -> int:
+        column = engine.tableau[:engine.m, col]
+        positive = column > engine.tol
+        if not positive.any():
+            return -1
+        ratios = np.full(engine.m, np.inf)
+        np.divide(engine.rhs, column, out=ratios, where=positive)
+        best = ratios.min()
+        ties = np.flatnonzero(ratios <= best + engine.tol * (1.0 + abs(best)))
+        return int(ties[np.argmin(engine.basis[ties])])
+
+
+class PartialPricing(PricingRule):
+    """
+    Tarification partielle : les colonnes sont découpées en `sections` segments ;
+    on choisit le meilleur coût réduit du premier segment améliorant, en repartant
+    du segment qui suit le dernier choix.
+    """
+
+    name = "Partielle"
+
+    def __init__(self, sections: int = 4):
+        self.sections = max(1, sections)
+        self.next_section = 0
+
+    def reset(self, engine) -> None:
+        self.next_section = 0
+
+    def select(self, engine) -> int:
+        costs = engine.objective[1:]
+        size = math.ceil(len(costs) / self.sections)
+        for k in range(self.sections):
+            section = (self.next_section + k) % self.sections
+            segment = costs[section * size:(section + 1) * size]
+            if len(segment) == 0:
+                continue
+            best = int(np.argmin(segment))
+            if segment[best] < -engine.tol:
+                self.next_section = (section + 1) % self.sections
+                return section * size + best + 1
+        return -1
+
+
+class DevexPricing(PricingRule):
+    """
+    Devex (Forrest-Goldfarb) : approximation des poids de plus forte pente dans un
+    cadre de référence, remis à 1 lorsque les poids deviennent trop grands.
+    """
+
+    name = "Devex"
+
+    def __init__(self, reset_threshold: float = 1e6):
+        self.reset_threshold = reset_threshold
+        self.weights = None
+
+    def reset(self, engine) -> None:
+        self.weights = np.ones(engine.tableau.shape[1] - 1)
+
+    def select(self, engine) -> int:
+        costs = engine.objective[1:]
+        improving = costs < -engine.tol
+        if not improving.any():
+            return -1
+        scores = np.where(improving, costs * costs / self.weights, -1.0)
+        return int(np.argmax(scores)) + 1
+
+    def update(self, engine, row: int, col: int) -> None:
+        pivot_row = engine.tableau[row, 1:]
+        leaving = engine.basis[row]
+        ratio = pivot_row / pivot_row[col - 1]
+        weight_q = self.weights[col - 1]
+        np.maximum(self.weights, ratio * ratio * weight_q, out=self.weights)
+        if leaving >= 1:
+            self.weights[leaving - 1] = max(weight_q / pivot_row[col - 1] ** 2, 1.0)
+        self.weights[col - 1] = 1.0
+        if self.weights.max() > self.reset_threshold:
+            self.weights.fill(1.0)
+
+
+class SteepestEdgePricing(PricingRule):
+    """
+    Plus forte pente : maximise d_j² / γ_j avec γ_j = 1 + ||B⁻¹ a_j||².
+    Les poids sont calculés exactement au départ puis mis à jour à chaque pivot
+    (formule de Goldfarb-Reid) au lieu d'être recalculés.
+    """
+
+    name = "Plus forte pente"
+
+    def __init__(self):
+        self.weights = None
+
+    def reset(self, engine) -> None:
+        columns = engine.tableau[:engine.m, 1:]
+        self.weights = 1.0 + np.einsum("ij,ij->j", columns, columns)
+
+    def select(self, engine) -> int:
+        costs = engine.objective[1:]
+        improving = costs < -engine.tol
+        if not improving.any():
+            return -1
+        scores = np.where(improving, costs * costs / self.weights, -1.0)
+        return int(np.argmax(scores)) + 1
+
+    def update(self, engine, row: int, col: int) -> None:
+        columns = engine.tableau[:engine.m, 1:]
+        alpha = columns[:, col - 1]
+        ratio = columns[row] / alpha[row]
+        weight_q = self.weights[col - 1]
+        self.weights += ratio * (ratio * weight_q - 2.0 * (alpha @ columns))
+        # γ_j >= 1 + ρ_j² : garde-fou contre les erreurs d'arrondi accumulées
+        np.maximum(self.weights, 1.0 + ratio * ratio, out=self.weights)
+
+
+PRICING_RULES = {
+    "dantzig": DantzigPricing,
+    "devex": DevexPricing,
+    "steepest_edge": SteepestEdgePricing,
+    "partial": PartialPricing,
+    "bland": BlandPricing,
+}
+
+
+def make_pricing(rule=None) -> PricingRule:
+    """Instance de règle à partir d'un nom de PRICING_RULES, d'une instance ou de None (Dantzig)"""
+    if rule is None:
+        return DantzigPricing()
+    if isinstance(rule, PricingRule):
+        return rule
+    if rule not in PRICING_RULES:
+        raise ValueError(f"Règle de pivot inconnue: {rule}")
+    return PRICING_RULES[rule]()
@@ -0,0 +1,195 @@
+from datetime import datetime
+
+import numpy as np
+
+from frozen_problem import FrozenProblem
+from sparse_problem import SparseProblem, format_bounds, parse_bounds
+
+SENSES = ("<=", ">=", "=")
+
+
+def _vector(values, name: str) -> np.ndarray:
+    vector = np.array(values, dtype=np.float64)
+    if vector.ndim != 1:
+        raise ValueError(f"{name} doit être un vecteur (forme {vector.shape})")
+    return vector
+
+
+class Problem:
+    """
+    Problème linéaire dense typé : Max Z = constante + c x, A x (<=, >=, =) b, lower <= x <= upper.
+
+    Les données tiennent dans quelques tableaux contigus (A : ndarray m x n, c, b, lower, upper :
+    vecteurs float64, senses : vecteur de chaînes) au lieu d'une liste Python par ligne indexée
+    par "equation_i". Les dimensions sont vérifiées une seule fois, à la construction :
+    nombre de variables, de contraintes et de sens ne peuvent plus diverger.
+
+    Conversions vers et depuis le dictionnaire `variables` habituel (to_variables /
+    from_variables), le format JSON de VariableManager.save_problem (to_json_dict /
+    from_json_dict), SparseProblem (to_sparse / from_sparse) et FrozenProblem (freeze).
+    """
+
+    __slots__ = ("c", "A", "b", "senses", "constant", "objective_type", "lower", "upper")
+
+    def __init__(self, c, A, b, senses=None, constant: float = 0.0, objective_type: str = "max",
+                 lower=None, upper=None):
+        self.c = _vector(c, "c")
+        self.b = _vector(b, "b")
+        n, m = len(self.c), len(self.b)
+        A = np.array(A, dtype=np.float64)
+        if A.size == 0:
+            A = A.reshape(m, n)
+        if A.shape != (m, n):
+            raise ValueError(f"A est de forme {A.shape}, attendu ({m}, {n}) d'après b et c")
+        self.A = np.ascontiguousarray(A)
+        self.senses = np.array(["<="] * m if senses is None else list(senses), dtype="<U2")
+        self.constant = float(constant)
+        self.objective_type = objective_type
+        self.lower = np.zeros(n) if lower is None else _vector(lower, "lower")
+        self.upper = np.full(n, np.inf) if upper is None else _vector(upper, "upper")
+
+        if len(self.senses) != m:
+            raise ValueError(f"{len(self.senses)} sens de contrainte pour {m} contrainte(s)")
+        unknown = set(self.senses.tolist()) - set(SENSES)
+        if unknown:
+            raise ValueError(f"Sens de contrainte inconnu(s): {', '.join(sorted(unknown))}")
+        if objective_type not in ("max", "min"):
+            raise ValueError(f"Type d'objectif inconnu: {objective_type}")
+        if not (np.isfinite(self.A).all() and np.isfinite(self.b).all() and np.isfinite(self.c).all()):
+            raise ValueError("Les coefficients de c, A et b doivent être finis")
+        if len(self.lower) != n or len(self.upper) != n:
+            raise ValueError("Dimensions incohérentes entre c et les bornes")
+        if not np.isfinite(self.lower).all():
+            raise ValueError("Les bornes inférieures doivent être finies")
+        if (self.lower > self.upper).any():
+            j = int(np.argmax(self.lower > self.upper))
+            raise ValueError(f"Bornes incohérentes pour x{j+1}: {self.lower[j]:.6g} > {self.upper[j]:.6g}")
+
+    def __repr__(self) -> str:
+        return f"Problem({self.m} contrainte(s), {self.n} variable(s))"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Problem):
+            return NotImplemented
+        return (self.constant == other.constant and self.objective_type == other.objective_type
+                and np.array_equal(self.senses, other.senses)
+                and all(np.array_equal(getattr(self, name), getattr(other, name))
+                        for name in ("c", "A", "b", "lower", "upper")))
+
+    __hash__ = None
+
+    @property
+    def n(self) -> int:
+        return len(self.c)
+
+    @property
+    def m(self) -> int:
+        return len(self.b)
+
+    @property
+    def nnz(self) -> int:
+        return int(np.count_nonzero(self.A))
+
+    @property
+    def constraints_info(self) -> list:
+        return self.senses.tolist()
+
+    @property
+    def has_bounds(self) -> bool:
+        """Vrai si une variable a une borne autre que 0 <= x"""
+        return bool(self.lower.any() or np.isfinite(self.upper).any())
+
+    @classmethod
+    def from_variables(cls, variables):
+        """
+        Lit le dictionnaire `variables` (ou un FrozenProblem, sans recopier ses lignes).
+        Les compteurs "nombres_variables_base" et "nb_equations" doivent correspondre
+        aux lignes effectivement présentes.
+        """
+        n = variables["nombres_variables_base"]
+        equations = variables["equations"]
+        m = len(equations)
+        if variables.get("nb_equations", m) != m:
+            raise ValueError(f"nb_equations vaut {variables['nb_equations']} pour {m} équation(s)")
+        objective = variables["tab_optimisation"]
+        if len(objective) != n + 1:
+            raise ValueError(f"tab_optimisation a {len(objective)} coefficient(s), attendu {n + 1}")
+        if isinstance(variables, FrozenProblem):
+            rows = variables.rows
+        else:
+            for name, equation in equations.items():
+                if len(equation) != n + 1:
+                    raise ValueError(f"{name} a {len(equation)} coefficient(s), attendu {n + 1}")
+            rows = np.array(list(equations.values()), dtype=np.float64).reshape(m, n + 1)
+        senses = variables.get("constraints_info") or None
+        lower, upper = parse_bounds(variables.get("bounds"), n)
+        return cls(objective[1:], rows[:, 1:], rows[:, 0], senses, objective[0],
+                   variables.get("objective_type", "max"), lower, upper)
+
+    def to_variables(self) -> dict:
+        """Dictionnaire `variables` habituel (listes Python neuves)"""
+        rows = np.column_stack((self.b, self.A)).tolist()
+        variables = {
+            "tab_optimisation": [self.constant] + self.c.tolist(),
+            "nombres_variables_base": self.n,
+            "equations": {f"equation_{i+1}": row for i, row in enumerate(rows)},
+            "nb_equations": self.m,
+            "constraints_info": self.constraints_info,
+            "objective_type": self.objective_type,
+        }
+        if self.has_bounds:
+            variables["bounds"] = format_bounds(self.lower, self.upper)
+        return variables
+
+    @classmethod
+    def from_json_dict(cls, data: dict):
+        """
+        Lit un enregistrement JSON de VariableManager (bloc "variables" ou "sparse", voir
+        probleme_test.json) ou directement un dictionnaire `variables`. Les métadonnées
+        nb_variables / nb_contraintes, si elles sont présentes, doivent correspondre.
+        """
+        if "sparse" in data:
+            problem = cls.from_sparse(SparseProblem.from_json_dict(data["sparse"]))
+        else:
+            problem = cls.from_variables(data.get("variables", data))
+        metadata = data.get("metadata") or {}
+        for key, expected in (("nb_variables", problem.n), ("nb_contraintes", problem.m)):
+            if metadata.get(key, expected) != expected:
+                raise ValueError(f"Métadonnée {key} = {metadata[key]} incohérente (attendu {expected})")
+        return problem
+
+    def to_json_dict(self, method: str = "Problème", timestamp: str = None) -> dict:
+        """Enregistrement JSON au format de VariableManager.save_problem"""
+        return {
+            "timestamp": timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "method": method,
+            "variables": self.to_variables(),
+            "metadata": {
+                "nb_variables": self.n,
+                "nb_contraintes": self.m,
+                "constraints_types": self.constraints_info,
+            },
+        }
+
+    @classmethod
+    def from_sparse(cls, sparse: SparseProblem):
+        """Densifie un SparseProblem (les triplets en double s'additionnent)"""
+        A = np.zeros((sparse.m, sparse.n))
+        np.add.at(A, (sparse.rows, sparse.cols), sparse.vals)
+        return cls(sparse.c, A, sparse.b, sparse.constraints_info, sparse.constant,
+                   sparse.objective_type, sparse.lower, sparse.upper)
+
+    def to_sparse(self) -> SparseProblem:
+        """SparseProblem équivalent (seuls les coefficients non nuls sont conservés)"""
+        rows, cols = np.nonzero(self.A)
+        return SparseProblem(self.n, rows, cols, self.A[rows, cols], self.b, self.c,
+                             self.constraints_info, self.constant, self.objective_type,
+                             self.lower, self.upper)
+
+    def freeze(self) -> FrozenProblem:
+        """FrozenProblem (lecture seule) à passer aux solveurs, construit directement depuis les tableaux"""
+        extra = {"constraints_info": self.constraints_info, "objective_type": self.objective_type}
+        if self.has_bounds:
+            extra["bounds"] = format_bounds(self.lower, self.upper)
+        return FrozenProblem.from_rows(np.column_stack((self.b, self.A)),
+                                       np.concatenate(([self.constant], self.c)), **extra)
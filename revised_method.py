@@ -0,0 +1,347 @@
+import copy
+import time
+
+import numpy as np
+
+from basis_factor import BasisFactorization
+from solver_events import IterationEvent, SolverEvents
+from solver_result import SolveResult, basis_columns
+from solve_budget import STOPPED, SolveBudget
+from sparse_problem import SparseProblem
+
+
+class RevisedSimplexMethod:
+    """
+    Simplexe révisé : seule la factorisation de la base est conservée
+    (LU + mises à jour sous forme produit, refactorisation périodique).
+    Accepte le même dictionnaire `variables` que les autres méthodes,
+    ou directement un SparseProblem.
+    """
+
+    def __init__(self, variables: dict, refactor_every: int = 50, tol: float = 1e-9, warm_start=None,
+                 max_iterations: int = None, time_limit: float = None, cancel=None):
+        self.variables = variables
+        # Base (et éventuellement factorisation) d'une résolution précédente
+        self.warm_start = warm_start
+        self.warm_started = False
+        self.n = variables.n if isinstance(variables, SparseProblem) else variables["nombres_variables_base"]
+        self.refactor_every = refactor_every
+        self.tol = tol
+        # Limites d'itérations / de temps et jeton d'annulation (CancellationToken)
+        self.budget = SolveBudget(max_iterations, time_limit, cancel)
+        self.iteration = 0
+        self.status = None
+        self.x = None
+        self.z = None
+        self.duals = None
+        self.basis = None
+        self.result = None
+        self.events = SolverEvents()
+        self.start = None
+
+    def subscribe(self, callback):
+        """Abonne `callback(IterationEvent)` aux itérations du solveur"""
+        return self.events.subscribe(callback)
+
+    def run(self):
+        """Exécute le simplexe révisé et affiche la solution"""
+        print(f"\n{'='*60}")
+        print("MÉTHODE DU SIMPLEXE RÉVISÉ (FACTORISATION LU)")
+        print(f"{'='*60}")
+        self.solve(observer=self.print_iteration)
+        self.display_results()
+
+    def build_standard_form(self):
+        """
+        Met le problème sous forme standard A x = b, b >= 0 :
+        écart (+1) pour <=, surplus (-1) pour >=, artificielle pour >= et =.
+        Les colonnes d'écart et artificielles restent implicites (colonnes identité),
+        seule la matrice creuse des variables structurelles est stockée.
+        """
+        self.problem = self.load_problem()
+        problem = self.problem
+        m = problem.m
+
+        # Second membre positif : on multiplie la ligne par -1 et on inverse le sens
+        self.row_sign = np.where(problem.b < 0, -1.0, 1.0)
+        self.b = problem.b * self.row_sign
+        senses = [{"<=": ">=", ">=": "<=", "=": "="}[s] if sign < 0 else s
+                  for s, sign in zip(problem.constraints_info, self.row_sign)]
+
+        self.slack_rows = np.array([i for i, s in enumerate(senses) if s in ("<=", ">=")], dtype=int)
+        self.slack_sign = np.array([1.0 if senses[i] == "<=" else -1.0 for i in self.slack_rows])
+        self.artificial_rows = np.array([i for i, s in enumerate(senses) if s in (">=", "=")], dtype=int)
+        n_slack = len(self.slack_rows)
+        n_total = self.n + n_slack + len(self.artificial_rows)
+
+        self.names = [f"x{j+1}" for j in range(self.n)]
+        self.names += [f"s{i+1}" for i in self.slack_rows]
+        self.names += [f"a{i+1}" for i in self.artificial_rows]
+        self.basis = np.full(m, -1, dtype=int)
+        for k, i in enumerate(self.slack_rows):
+            if self.slack_sign[k] > 0:
+                self.basis[i] = self.n + k
+        for k, i in enumerate(self.artificial_rows):
+            self.basis[i] = self.n + n_slack + k
+
+        self.artificial = np.zeros(n_total, dtype=bool)
+        self.artificial[self.n + n_slack:] = True
+        self.c = np.zeros(n_total)
+        self.c[:self.n] = problem.c
+
+    def load_problem(self) -> SparseProblem:
+        """Problème à résoudre sous forme creuse"""
+        problem = self.variables if isinstance(self.variables, SparseProblem) \
+            else SparseProblem.from_variables(self.variables)
+        if problem.has_bounds:
+            raise ValueError("Bornes de variables : utiliser BoundedSimplexMethod ou bounds_as_constraints")
+        return problem
+
+    def basic_rhs(self):
+        """Second membre dont B⁻¹ donne les valeurs des variables de base"""
+        return self.b
+
+    def primal_values(self):
+        """Valeurs de toutes les colonnes (structurelles, écarts, artificielles)"""
+        x = np.zeros(len(self.c))
+        x[self.basis] = self.xB
+        return x
+
+    def column(self, j: int):
+        """Colonne j de la matrice augmentée (structurelle, écart ou artificielle)"""
+        if j < self.n:
+            return self.problem.column(j) * self.row_sign
+        out = np.zeros(self.problem.m)
+        k = j - self.n
+        if k < len(self.slack_rows):
+            out[self.slack_rows[k]] = self.slack_sign[k]
+        else:
+            out[self.artificial_rows[k - len(self.slack_rows)]] = 1.0
+        return out
+
+    def basis_matrix(self):
+        """Matrice de base dense B (m x m)"""
+        return np.column_stack([self.column(j) for j in self.basis])
+
+    def price(self, y):
+        """Calcule y A pour toutes les colonnes de la matrice augmentée"""
+        structural = self.problem.rmatvec(y * self.row_sign)
+        return np.concatenate((structural, y[self.slack_rows] * self.slack_sign, y[self.artificial_rows]))
+
+    def solve(self, observer=None) -> SolveResult:
+        """
+        Résout le problème (phase 1 si des variables artificielles sont présentes)
+        sans aucune sortie console et renvoie un SolveResult.
+        `observer(solver, iteration, row, col)` est appelé après chaque changement de base.
+        """
+        start = self.start = time.perf_counter()
+        self.budget.begin(start)
+        self.build_standard_form()
+        self.factor = BasisFactorization(self.basis_matrix(), self.refactor_every)
+        self.xB = self.factor.ftran(self.basic_rhs())
+        if self.warm_start is not None:
+            self.warm_started = self.apply_warm_start()
+        setup_done = time.perf_counter()
+
+        self.status = None
+        if self.artificial[self.basis].any():
+            phase1_cost = -self.artificial.astype(np.float64)
+            self.status = self.optimize(phase1_cost, np.ones_like(self.artificial), observer)
+            infeasibility = float(self.xB[self.artificial[self.basis]].sum())
+            if self.status in STOPPED:
+                pass
+            elif infeasibility > 1e-7:
+                self.status = "infeasible"
+            else:
+                self.drive_out_artificials()
+
+        phase_two = self.status != "infeasible" and self.status not in STOPPED
+        if phase_two:
+            self.status = self.optimize(self.c, ~self.artificial, observer)
+        if self.status == "optimal" or (phase_two and self.status in STOPPED):
+            # Interruption en phase 2 : la dernière base visitée est réalisable
+            self.x = self.primal_values()
+            self.z = self.problem.constant + float(self.c @ self.x)
+            # Prix duaux exprimés pour les lignes d'origine (avant changement de signe)
+            self.duals = self.factor.btran(self.c[self.basis]) * self.row_sign
+        iterations_done = time.perf_counter()
+
+        self.result = SolveResult(
+            method="Simplexe Révisé",
+            status=self.status,
+            iterations=self.iteration,
+            basis=[self.names[j] for j in self.basis],
+            factorization=self.factor,
+        )
+        if self.x is not None:
+            self.result.objective = self.z
+            self.result.x = self.x[:self.n].tolist()
+        if self.status == "optimal":
+            self.result.duals = self.duals.tolist()
+        self.result.timings = {
+            "setup": setup_done - start,
+            "iterations": iterations_done - setup_done,
+            "total": time.perf_counter() - start,
+        }
+        return self.result
+
+    def apply_warm_start(self) -> bool:
+        """
+        Remplace la base initiale par celle du démarrage à chaud. La factorisation fournie
+        est réutilisée telle quelle si elle correspond à la même base et reste exacte
+        (seconds membres modifiés) ; sinon les colonnes sont échangées une à une puis la base
+        est refactorisée. Faux (base initiale conservée) si la base n'est pas réalisable.
+        """
+        default = self.basis.copy()
+        target = [j - 1 for j in basis_columns(self.warm_start, self.names) if not self.artificial[j - 1]]
+        factorization = getattr(self.warm_start, "factorization", None)
+
+        if factorization is not None and len(target) == len(self.basis):
+            self.basis = np.array(target, dtype=int)
+            self.factor = copy.deepcopy(factorization)
+            self.xB = self.factor.ftran(self.basic_rhs())
+            residual = self.basis_matrix() @ self.xB - self.basic_rhs()
+            if np.abs(residual).max(initial=0.0) > 1e-8 * (1.0 + np.abs(self.b).max(initial=0.0)):
+                self.refactorize()
+        else:
+            for q in target:
+                if q in self.basis:
+                    continue
+                direction = self.factor.ftran(self.column(q))
+                free = ~np.isin(self.basis, target)
+                candidates = np.flatnonzero(free & (np.abs(direction) > self.tol))
+                if len(candidates) == 0:
+                    continue
+                r = int(candidates[np.argmax(np.abs(direction[candidates]))])
+                self.basis[r] = q
+                self.factor.update(r, direction)
+            self.refactorize()
+
+        if (self.xB < -self.tol).any() or self.artificial[self.basis].any():
+            self.basis = default
+            self.refactorize()
+            return False
+        return True
+
+    def print_iteration(self, solver, iteration: int, row: int, col: int):
+        """Observateur d'affichage : variable entrante/sortante et valeur courante"""
+        print(f"Itération {iteration} : entrante {self.names[col]}, "
+              f"sortante {self.names[self.leaving]}, Z = {self.current_objective:.6f}")
+
+    def optimize(self, cost, allowed, observer=None) -> str:
+        """Boucle du simplexe révisé pour un vecteur de coûts donné (maximisation)"""
+        while True:
+            stop = self.budget.exhausted(self.iteration)
+            if stop:
+                return stop
+            if self.factor.needs_refactor:
+                self.refactorize()
+
+            y = self.factor.btran(cost[self.basis])
+            reduced = cost - self.price(y)
+            reduced[self.basis] = 0.0
+            reduced[~allowed] = 0.0
+            q = int(np.argmax(reduced))
+            if reduced[q] <= self.tol:
+                return "optimal"
+
+            direction = self.factor.ftran(self.column(q))
+            positive = direction > self.tol
+            if not positive.any():
+                return "unbounded"
+            ratios = np.full(len(direction), np.inf)
+            np.divide(self.xB, direction, out=ratios, where=positive)
+            r = int(np.argmin(ratios))
+            theta = ratios[r]
+
+            leaving = self.basis[r]
+            self.xB -= theta * direction
+            self.xB[r] = theta
+            self.basis[r] = q
+            self.factor.update(r, direction)
+            self.iteration += 1
+
+            if self.events:
+                phase_one = allowed.all() and self.artificial.any()
+                self.events.emit(IterationEvent(
+                    method="Simplexe Révisé",
+                    iteration=self.iteration,
+                    entering=self.names[q],
+                    leaving=self.names[leaving],
+                    objective=float(cost[self.basis] @ self.xB),
+                    primal_infeasibility=float(self.xB[self.artificial[self.basis]].sum()),
+                    dual_infeasibility=float(reduced[reduced > self.tol].sum()),
+                    elapsed=time.perf_counter() - self.start,
+                    phase=1 if phase_one else 2,
+                ))
+            if observer is not None:
+                self.leaving = leaving
+                self.current_objective = float(cost[self.basis] @ self.xB)
+                observer(self, self.iteration, r, q)
+
+    def refactorize(self):
+        """Refactorise la base courante et recalcule les valeurs de base"""
+        self.factor.refactor(self.basis_matrix())
+        self.xB = self.factor.ftran(self.basic_rhs())
+
+    def drive_out_artificials(self):
+        """Sort de la base les variables artificielles restées à zéro après la phase 1"""
+        for r in np.flatnonzero(self.artificial[self.basis]):
+            row = self.price(self.factor.btran(np.eye(len(self.basis))[r]))
+            candidates = np.flatnonzero((np.abs(row) > self.tol) & ~self.artificial)
+            candidates = candidates[~np.isin(candidates, self.basis)]
+            if len(candidates) == 0:
+                continue  # Contrainte redondante : l'artificielle reste nulle
+            q = int(candidates[0])
+            direction = self.factor.ftran(self.column(q))
+            self.basis[r] = q
+            self.factor.update(r, direction)
+            self.xB = self.factor.ftran(self.basic_rhs())
+
+    def display_results(self):
+        """Affiche la solution finale"""
+        print(f"\n{'='*60}")
+        print("ANALYSE DE LA SOLUTION FINALE")
+        print(f"{'='*60}")
+
+        if self.status == "infeasible":
+            print("\n❌ PROBLÈME NON RÉALISABLE")
+            print("La phase 1 n'a pas pu annuler les variables artificielles.")
+            return
+        if self.status == "unbounded":
+            print("Solution illimitée!")
+            return
+        if self.status in STOPPED:
+            print(f"\n⏱️  Arrêt avant l'optimum : {self.budget.reason}")
+            if self.x is None:
+                return
+            print(f"Meilleur sommet atteint: Z = {self.z:.6f}")
+        else:
+            print("\n✅ SOLUTION OPTIMALE TROUVÉE")
+            print(f"Valeur optimale: Z = {self.z:.6f}")
+        print(f"Itérations: {self.iteration}")
+        print("\nVariables de décision:")
+        for j in range(self.n):
+            print(f"  x{j+1} = {self.x[j]:.6f}")
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    # Max Z = 3x1 + 5x2
+    # x1 ≤ 4
+    # 2x2 ≤ 12
+    # 3x1 + 2x2 = 18
+    variables_revised = {
+        "tab_optimisation": [0, 3, 5],
+        "nombres_variables_base": 2,
+        "equations": {
+            "equation_1": [4, 1, 0],
+            "equation_2": [12, 0, 2],
+            "equation_3": [18, 3, 2],
+        },
+        "nb_equations": 3,
+        "constraints_info": ["<=", "<=", "="]
+    }
+
+    revised = RevisedSimplexMethod(variables_revised)
+    revised.run()
@@ -0,0 +1,151 @@
+import time
+from typing import Optional
+
+import numpy as np
+
+from solver_result import SolveResult
+from sparse_problem import format_bounds, parse_bounds
+
+
+class Scaling:
+    """
+    Mise à l'échelle des lignes et des colonnes : Â = R A S, b̂ = R b, ĉ = S c.
+
+    Plusieurs passes de moyenne géométrique (chaque ligne puis chaque colonne divisée par
+    sqrt(min |a| · max |a|) de ses coefficients non nuls) ramènent les coefficients autour
+    de 1, puis une passe d'équilibrage ramène le plus grand coefficient de chaque ligne et de
+    chaque colonne à 1. Les facteurs sont arrondis à des puissances de 2 : la mise à
+    l'échelle n'introduit alors aucune erreur d'arrondi.
+
+    Solution d'origine : x = S x̂, prix duaux y = R ŷ, valeur de Z inchangée.
+    Les bornes éventuelles (clé "bounds") deviennent lower / s, upper / s.
+    """
+
+    def __init__(self, variables: dict, passes: int = 4, equilibrate: bool = True, tol: float = 1e-12):
+        self.variables = variables
+        self.passes = passes
+        self.equilibrate = equilibrate
+        self.tol = tol
+        self.row_scale = None
+        self.col_scale = None
+        self.before = {}
+        self.after = {}
+        self.elapsed = 0.0
+
+    def run(self) -> dict:
+        """Calcule les facteurs et renvoie le problème mis à l'échelle (l'original n'est pas modifié)"""
+        start = time.perf_counter()
+        n = self.variables["nombres_variables_base"]
+        equations = list(self.variables["equations"].values())
+        A = np.array([eq[1:n + 1] for eq in equations], dtype=np.float64).reshape(len(equations), n)
+        b = np.array([eq[0] for eq in equations], dtype=np.float64)
+        c = np.array(self.variables["tab_optimisation"][1:n + 1], dtype=np.float64)
+
+        self.before = self.measure(A)
+        nonzero = np.abs(A) > self.tol
+        magnitude = np.where(nonzero, np.abs(A), 1.0)
+        rows, cols = np.ones(A.shape[0]), np.ones(n)
+
+        def geometric(values, mask, axis):
+            # sqrt(min · max) des |a| non nuls, 1 pour une ligne ou une colonne vide
+            high = np.where(mask, values, 0.0).max(axis=axis, initial=0.0)
+            low = np.where(mask, values, np.inf).min(axis=axis, initial=np.inf)
+            empty = high <= 0
+            return np.sqrt(np.where(empty, 1.0, low) * np.where(empty, 1.0, high))
+
+        for _ in range(self.passes):
+            scaled = magnitude * rows[:, None] * cols[None, :]
+            rows /= geometric(scaled, nonzero, 1)
+            scaled = magnitude * rows[:, None] * cols[None, :]
+            cols /= geometric(scaled, nonzero, 0)
+        if self.equilibrate:
+            scaled = magnitude * rows[:, None] * cols[None, :]
+            rows /= np.where(nonzero, scaled, 0.0).max(axis=1, initial=0.0).clip(min=self.tol)
+            scaled = magnitude * rows[:, None] * cols[None, :]
+            cols /= np.where(nonzero, scaled, 0.0).max(axis=0, initial=0.0).clip(min=self.tol)
+
+        self.row_scale = np.exp2(np.round(np.log2(rows)))
+        self.col_scale = np.exp2(np.round(np.log2(cols)))
+        A_scaled = A * self.row_scale[:, None] * self.col_scale[None, :]
+        self.after = self.measure(A_scaled)
+        self.elapsed = time.perf_counter() - start
+
+        scaled_problem = {
+            **self.variables,
+            "tab_optimisation": [self.variables["tab_optimisation"][0]] + (c * self.col_scale).tolist(),
+            "equations": {key: [float(bi)] + row.tolist()
+                          for key, bi, row in zip(self.variables["equations"], b * self.row_scale, A_scaled)},
+        }
+        if "bounds" in self.variables:
+            lower, upper = parse_bounds(self.variables["bounds"], n)
+            scaled_problem["bounds"] = format_bounds(lower / self.col_scale, upper / self.col_scale)
+        return scaled_problem
+
+    def measure(self, A) -> dict:
+        """Dispersion des coefficients (max |a| / min |a| non nuls) et conditionnement de A"""
+        values = np.abs(A[np.abs(A) > self.tol])
+        spread = float(values.max() / values.min()) if len(values) else 1.0
+        condition = None
+        if A.size and max(A.shape) <= 500:
+            singular = np.linalg.svd(A, compute_uv=False)
+            condition = float(singular[0] / singular[-1]) if singular[-1] > 0 else float("inf")
+        return {"spread": spread, "condition": condition}
+
+    def unscale(self, result: SolveResult) -> SolveResult:
+        """Solution du problème d'origine : x = S x̂, y = R ŷ (Z et la base sont inchangés)"""
+        if not result.is_optimal:
+            return result
+        duals = None if result.duals is None else (np.asarray(result.duals) * self.row_scale).tolist()
+        return SolveResult(
+            method=result.method,
+            status=result.status,
+            objective=result.objective,
+            x=(np.asarray(result.x) * self.col_scale).tolist(),
+            duals=duals,
+            basis=list(result.basis),
+            iterations=result.iterations,
+            timings={**result.timings, "scaling": self.elapsed},
+            factorization=result.factorization,
+        )
+
+    def report(self) -> str:
+        """Effet de la mise à l'échelle sur la dispersion des coefficients et le conditionnement"""
+        def condition(value: Optional[float]):
+            return "n/d" if value is None else f"{value:.3g}"
+        lines = [f"Mise à l'échelle en {self.elapsed:.4f}s",
+                 f"  Dispersion des coefficients: {self.before['spread']:.3g} → {self.after['spread']:.3g}",
+                 f"  Conditionnement de A: {condition(self.before['condition'])} → {condition(self.after['condition'])}"]
+        if self.row_scale is not None and len(self.row_scale):
+            lines.append(f"  Facteurs de lignes: {self.row_scale.min():.3g} à {self.row_scale.max():.3g}")
+        if self.col_scale is not None and len(self.col_scale):
+            lines.append(f"  Facteurs de colonnes: {self.col_scale.min():.3g} à {self.col_scale.max():.3g}")
+        return "\n".join(lines)
+
+
+def solve_scaled(variables: dict, solver_class, **kwargs) -> SolveResult:
+    """Mise à l'échelle, résolution silencieuse par `solver_class`, puis retour aux unités d'origine"""
+    scaling = Scaling(variables)
+    return scaling.unscale(solver_class(scaling.run(), **kwargs).solve())
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    from grand_M_method import GrandMMethod
+
+    # Coefficients de 1e-3 à 1e6 (unités hétérogènes : tonnes, grammes, euros...)
+    variables_echelle = {
+        "tab_optimisation": [0, 3000, 0.005],
+        "nombres_variables_base": 2,
+        "equations": {
+            "equation_1": [4, 0.001, 0],
+            "equation_2": [12e6, 0, 2e6],
+            "equation_3": [9, 0.003, 2e-6],
+        },
+        "nb_equations": 3,
+        "constraints_info": ["<=", "<=", ">="]
+    }
+
+    scaling = Scaling(variables_echelle)
+    scaled = scaling.run()
+    print(scaling.report())
+    print(scaling.unscale(GrandMMethod(scaled).solve()).summary())
@@ -0,0 +1,146 @@
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+import numpy as np
+
+from solver_result import basis_columns
+from standard_form import ARTIFICIAL, StandardForm
+
+
+@dataclass
+class SensitivityReport:
+    """
+    Analyse de sensibilité autour d'une base optimale (problème de maximisation).
+
+    shadow_prices : prix duaux y = c_B B⁻¹ des contraintes
+    reduced_costs : coûts réduits d_j = y·a_j - c_j des variables de décision (0 si en base)
+    rhs_ranges : intervalle de chaque second membre b_i sur lequel la base reste optimale
+    cost_ranges : intervalle de chaque coefficient c_j sur lequel la base reste optimale
+    """
+    objective: float
+    x: List[float]
+    shadow_prices: List[float]
+    reduced_costs: List[float]
+    rhs_ranges: List[Tuple[float, float]]
+    cost_ranges: List[Tuple[float, float]]
+    basis: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Représentation sérialisable en JSON (les bornes infinies deviennent None)"""
+        def bound(value):
+            return None if np.isinf(value) else value
+        return {
+            "objective": self.objective,
+            "x": list(self.x),
+            "shadow_prices": list(self.shadow_prices),
+            "reduced_costs": list(self.reduced_costs),
+            "rhs_ranges": [[bound(lo), bound(hi)] for lo, hi in self.rhs_ranges],
+            "cost_ranges": [[bound(lo), bound(hi)] for lo, hi in self.cost_ranges],
+            "basis": list(self.basis),
+        }
+
+    def summary(self) -> str:
+        """Tableau texte des prix duaux, coûts réduits et intervalles de validité"""
+        def interval(lo, hi):
+            return f"[{'-∞' if np.isinf(lo) else f'{lo:.6g}'} ; {'+∞' if np.isinf(hi) else f'{hi:.6g}'}]"
+        lines = [f"Valeur optimale: Z = {self.objective:.6f}", "", "Contraintes (prix dual, second membre):"]
+        for i, (y, (lo, hi)) in enumerate(zip(self.shadow_prices, self.rhs_ranges)):
+            lines.append(f"  C{i+1}: y = {y:.6g}, b ∈ {interval(lo, hi)}")
+        lines.extend(["", "Variables (valeur, coût réduit, coefficient objectif):"])
+        for j, (value, d, (lo, hi)) in enumerate(zip(self.x, self.reduced_costs, self.cost_ranges)):
+            lines.append(f"  x{j+1} = {value:.6g}, d = {d:.6g}, c ∈ {interval(lo, hi)}")
+        return "\n".join(lines)
+
+
+def sensitivity_analysis(variables: dict, basis, tol: float = 1e-9) -> SensitivityReport:
+    """
+    Analyse de sensibilité à partir de la base optimale d'une résolution.
+
+    `variables` est le problème d'origine (dictionnaire habituel, non modifié) et `basis`
+    un SolveResult ou une liste de noms (x1.., s1.. écarts/surplus, a1.. artificielles),
+    comme produits par SimplexMethodTab, GrandMMethod, TwoPhaseMethod ou le simplexe révisé.
+
+    B⁻¹ est calculé une seule fois ; tous les intervalles en sont déduits par des
+    tests de rapports vectorisés, sans aucune nouvelle résolution.
+    """
+    n = variables["nombres_variables_base"]
+    objective = variables["tab_optimisation"]
+    # Forme standard avec les noms de colonnes communs à tous les solveurs (sans changer le signe
+    # des lignes : les intervalles portent sur les seconds membres tels qu'ils sont écrits)
+    form = StandardForm(variables, normalize_rhs=False)
+    m = form.m
+    A, b, names = form.matrix, form.rhs, form.column_names
+    costs = form.costs
+    c = costs[:n]
+    artificial = form.columns(ARTIFICIAL) - 1
+
+    basic = np.array(basis_columns(basis, names), dtype=np.int64) - 1
+    if len(basic) != m:
+        raise ValueError(f"Base incomplète: {len(basic)} variable(s) reconnue(s) pour {m} contrainte(s)")
+    try:
+        B_inv = np.linalg.inv(A[:, basic])
+    except np.linalg.LinAlgError:
+        raise ValueError("Base singulière: analyse de sensibilité impossible")
+
+    x_B = B_inv @ b
+    y = costs[basic] @ B_inv
+    d = y @ A - costs
+    x = np.zeros(len(names))
+    x[basic] = x_B
+
+    # Seconds membres : x_B + δ B⁻¹ e_i >= 0, une colonne de B⁻¹ par contrainte
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = -x_B[:, None] / B_inv
+    upper = np.where(B_inv < -tol, ratios, np.inf).min(axis=0, initial=np.inf)
+    lower = np.where(B_inv > tol, ratios, -np.inf).max(axis=0, initial=-np.inf)
+    rhs_ranges = [(float(b[i] + lower[i]), float(b[i] + upper[i])) for i in range(m)]
+
+    # Coûts : variable hors base -> c_j <= c_j + d_j ; variable de base en ligne r ->
+    # d_k + δ α_rk >= 0 pour toute colonne hors base k (α = B⁻¹ N, calculé une fois)
+    is_basic = np.zeros(len(names), dtype=bool)
+    is_basic[basic] = True
+    nonbasic = np.flatnonzero(~is_basic & ~np.isin(np.arange(len(names)), artificial))
+    alpha = B_inv @ A[:, nonbasic]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = -d[nonbasic][None, :] / alpha
+    row_upper = np.where(alpha < -tol, ratios, np.inf).min(axis=1, initial=np.inf)
+    row_lower = np.where(alpha > tol, ratios, -np.inf).max(axis=1, initial=-np.inf)
+    row_of = {int(col): r for r, col in enumerate(basic)}
+    cost_ranges = []
+    for j in range(n):
+        if j in row_of:
+            r = row_of[j]
+            cost_ranges.append((float(c[j] + row_lower[r]), float(c[j] + row_upper[r])))
+        else:
+            cost_ranges.append((-np.inf, float(c[j] + d[j])))
+
+    return SensitivityReport(
+        objective=float(objective[0] + costs[basic] @ x_B),
+        x=x[:n].tolist(),
+        shadow_prices=y.tolist(),
+        reduced_costs=np.where(is_basic[:n], 0.0, d[:n]).tolist(),
+        rhs_ranges=rhs_ranges,
+        cost_ranges=cost_ranges,
+        basis=[names[col] for col in basic],
+    )
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    from tab_method import SimplexMethodTab
+
+    # Max Z = 3x1 + 5x2, x1 <= 4, 2x2 <= 12, 3x1 + 2x2 <= 18
+    variables_sensibilite = {
+        "tab_optimisation": [0, 3, 5],
+        "nombres_variables_base": 2,
+        "equations": {
+            "equation_1": [4, 1, 0],
+            "equation_2": [12, 0, 2],
+            "equation_3": [18, 3, 2],
+        },
+        "nb_equations": 3,
+        "constraints_info": ["<=", "<=", "<="]
+    }
+
+    result = SimplexMethodTab(variables_sensibilite).solve()
+    print(sensitivity_analysis(variables_sensibilite, result).summary())
@@ -11,7 +11,32 @@ build_exe_options = {
         "grand_M_method.py",
         "dual_method.py",
         "enhanced_variables.py",
-        "gui.py"
+        "gui.py",
+        "tableau_engine.py",
+        "basis_factor.py",
+        "revised_method.py",
+        "sparse_problem.py",
+        "two_phase_method.py",
+        "solver_result.py",
+        "solver_events.py",
+        "batch_solve.py",
+        "pricing.py",
+        "dual_simplex_method.py",
+        "exact_method.py",
+        "sensitivity.py",
+        "parametric.py",
+        "presolve.py",
+        "scaling.py",
+        "bounded_method.py",
+        "interior_point.py",
+        "method_selection.py",
+        "degeneracy.py",
+        "solve_budget.py",
+        "standard_form.py",
+        "frozen_problem.py",
+        "problem.py",
+        "modeling.py",
+        "lp_mps.py"
     ],
     "excludes": ["test", "unittest"],
 }
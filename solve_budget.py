@@ -0,0 +1,85 @@
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+# Statuts d'une résolution interrompue avant l'optimum (la dernière base est conservée)
+STOPPED = ("limit_reached", "cancelled")
+
+
+class CancellationToken:
+    """
+    Jeton d'annulation coopérative : l'appelant (bouton de la GUI, Ctrl+C en ligne de commande)
+    appelle cancel() depuis n'importe quel thread, les boucles des solveurs le consultent
+    à chaque itération et s'arrêtent proprement avec le statut "cancelled".
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def reset(self) -> None:
+        self._event.clear()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class SolveBudget:
+    """
+    Budget d'une résolution : nombre d'itérations, durée en secondes et jeton d'annulation
+    (chacun facultatif). `exhausted(iteration)` est appelé en tête de chaque itération ;
+    il renvoie le statut d'arrêt ("cancelled" ou "limit_reached") ou None, la raison
+    lisible étant dans `reason`.
+    """
+
+    def __init__(self, max_iterations: int = None, time_limit: float = None,
+                 token: Optional[CancellationToken] = None):
+        self.max_iterations = max_iterations
+        self.time_limit = time_limit
+        self.token = token
+        self.start = None
+        self.reason = None
+
+    def begin(self, start: float = None) -> None:
+        """Point de départ de la limite de temps (début de la résolution)"""
+        self.start = time.perf_counter() if start is None else start
+        self.reason = None
+
+    def remaining_time(self) -> Optional[float]:
+        """Temps restant (None sans limite), pour un solveur lancé en sous-traitance"""
+        if self.time_limit is None:
+            return None
+        return max(0.0, self.time_limit - (time.perf_counter() - self.start))
+
+    def exhausted(self, iteration: int) -> Optional[str]:
+        if self.token is not None and self.token.cancelled:
+            self.reason = "résolution annulée"
+            return "cancelled"
+        if self.max_iterations is not None and iteration >= self.max_iterations:
+            self.reason = f"limite de {self.max_iterations} itérations atteinte"
+            return "limit_reached"
+        if self.time_limit is not None and time.perf_counter() - self.start >= self.time_limit:
+            self.reason = f"limite de temps de {self.time_limit:g}s atteinte"
+            return "limit_reached"
+        return None
+
+
+@contextmanager
+def cancel_on_interrupt(token: CancellationToken):
+    """
+    Pendant le bloc, Ctrl+C annule `token` au lieu d'interrompre le programme : le solveur
+    s'arrête à l'itération suivante et renvoie sa dernière base. Sans effet hors du thread principal.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield token
+        return
+    previous = signal.signal(signal.SIGINT, lambda signum, frame: token.cancel())
+    try:
+        yield token
+    finally:
+        signal.signal(signal.SIGINT, previous)
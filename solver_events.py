@@ -0,0 +1,86 @@
+import logging
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+
+@dataclass
+class IterationEvent:
+    """
+    Événement émis après chaque changement de base.
+
+    entering / leaving : noms des variables entrante et sortante
+    objective : valeur courante de la ligne objectif
+    primal_infeasibility : somme des violations primales (seconds membres négatifs,
+                           artificielles encore en base)
+    dual_infeasibility : somme des coûts réduits qui permettent encore d'améliorer Z
+    elapsed : secondes écoulées depuis le début de solve()
+    """
+    method: str
+    iteration: int
+    entering: str
+    leaving: str
+    objective: float
+    primal_infeasibility: float
+    dual_infeasibility: float
+    elapsed: float
+    phase: int = 2
+
+
+class SolverEvents:
+    """
+    Liste d'abonnés aux événements d'itération.
+    Une instance sans abonné est fausse : les solveurs testent `if self.events:`
+    avant de construire l'événement, ce qui rend le coût nul sans abonné.
+    """
+
+    __slots__ = ("subscribers",)
+
+    def __init__(self):
+        self.subscribers: List[Callable[[IterationEvent], None]] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.subscribers)
+
+    def subscribe(self, callback: Callable[[IterationEvent], None]):
+        """Ajoute un abonné ; renvoie le callback pour pouvoir le désabonner"""
+        self.subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback) -> None:
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def emit(self, event: IterationEvent) -> None:
+        for callback in tuple(self.subscribers):
+            callback(event)
+
+
+def logging_subscriber(logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+    """Abonné qui écrit une ligne par itération dans un logger"""
+    logger = logger or logging.getLogger("simplex")
+
+    def log(event: IterationEvent) -> None:
+        logger.log(level, "%s it.%d : entrante %s, sortante %s, Z = %.6f, "
+                   "inf. primale %.3g, inf. duale %.3g, %.4fs",
+                   event.method, event.iteration, event.entering, event.leaving,
+                   event.objective, event.primal_infeasibility,
+                   event.dual_infeasibility, event.elapsed)
+    return log
+
+
+class IterationMetrics:
+    """Abonné « puits de métriques » : garde l'historique compact des itérations"""
+
+    def __init__(self):
+        self.iterations = 0
+        self.objective: List[float] = []
+        self.primal_infeasibility: List[float] = []
+        self.dual_infeasibility: List[float] = []
+        self.elapsed = 0.0
+
+    def __call__(self, event: IterationEvent) -> None:
+        self.iterations = event.iteration
+        self.objective.append(event.objective)
+        self.primal_infeasibility.append(event.primal_infeasibility)
+        self.dual_infeasibility.append(event.dual_infeasibility)
+        self.elapsed = event.elapsed
@@ -0,0 +1,83 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+@dataclass
+class SolveResult:
+    """
+    Résultat structuré d'une résolution, sans aucune mise en forme console.
+
+    status : "optimal", "infeasible", "unbounded" ou "limit_reached" (limite d'itérations ou de temps)
+    objective : valeur de Z (None si pas de solution optimale ; dernier sommet réalisable
+                visité pour "limit_reached")
+    x : valeurs des variables de décision x1..xn
+    duals : prix duaux des contraintes (ordre des équations)
+    basis : noms des variables de base, ligne par ligne
+    factorization : factorisation de la base finale (simplexe révisé), réutilisable
+                    pour un démarrage à chaud ; jamais sérialisée
+    """
+    method: str
+    status: str
+    objective: Optional[float] = None
+    x: List[float] = field(default_factory=list)
+    duals: Optional[List[float]] = None
+    basis: List[str] = field(default_factory=list)
+    iterations: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+    factorization: Optional[object] = field(default=None, repr=False, compare=False)
+
+    @property
+    def is_optimal(self) -> bool:
+        return self.status == "optimal"
+
+    def to_dict(self) -> dict:
+        """Représentation sérialisable en JSON"""
+        return {
+            "method": self.method,
+            "status": self.status,
+            "objective": self.objective,
+            "x": list(self.x),
+            "duals": None if self.duals is None else list(self.duals),
+            "basis": list(self.basis),
+            "iterations": self.iterations,
+            "timings": dict(self.timings),
+        }
+
+    def summary(self) -> str:
+        """Résumé texte court (à la place de la sortie détaillée des itérations)"""
+        lines = [f"Méthode: {self.method}", f"Statut: {self.status}", f"Itérations: {self.iterations}"]
+        if self.is_optimal:
+            lines.append(f"Valeur optimale: Z = {self.objective:.6f}")
+            lines.extend(f"  x{j+1} = {value:.6f}" for j, value in enumerate(self.x))
+        elif self.status == "limit_reached" and self.objective is not None:
+            lines.append(f"Meilleur sommet atteint: Z = {self.objective:.6f}")
+            lines.extend(f"  x{j+1} = {value:.6f}" for j, value in enumerate(self.x))
+        if "total" in self.timings:
+            lines.append(f"Temps: {self.timings['total']:.6f}s")
+        return "\n".join(lines)
+
+
+def basis_columns(warm_start, names) -> List[int]:
+    """
+    Colonnes (indices 1.. du tableau) des variables de base d'un démarrage à chaud.
+    `warm_start` est un SolveResult ou une liste de noms ; `names[j]` est le nom de la colonne j+1.
+    Les noms inconnus du problème courant (contrainte supprimée, etc.) sont ignorés.
+    """
+    basis = warm_start.basis if isinstance(warm_start, SolveResult) else warm_start
+    index = {name: j + 1 for j, name in enumerate(names)}
+    return [index[name] for name in basis or [] if name in index]
+
+
+def duals_from_basis(matrix, costs, basis):
+    """
+    Prix duaux y = c_B B^-1 en résolvant B^T y = c_B.
+    `matrix` est la matrice des contraintes initiale (sans second membre),
+    `basis` les indices de colonnes de base (0 = première variable).
+    """
+    B = np.asarray(matrix, dtype=np.float64)[:, basis]
+    try:
+        return np.linalg.solve(B.T, np.asarray(costs, dtype=np.float64)[basis])
+    except np.linalg.LinAlgError:
+        return None
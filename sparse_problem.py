@@ -0,0 +1,184 @@
+import numpy as np
+
+
+class SparseProblem:
+    """
+    Problème linéaire creux : Max Z = c x + constante, A x (<=, >=, =) b, lower <= x <= upper
+    (par défaut 0 <= x, upper = +∞).
+
+    A est stockée en triplets (ligne, colonne, valeur) triés par ligne (CSR),
+    avec une permutation vers l'ordre par colonne (CSC). Les variables
+    d'écart ne sont jamais stockées : ce sont des colonnes identité implicites
+    que les solveurs ajoutent eux-mêmes.
+    """
+
+    def __init__(self, n: int, rows, cols, vals, b, c, constraints_info=None,
+                 constant: float = 0.0, objective_type: str = "max", lower=None, upper=None):
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        vals = np.asarray(vals, dtype=np.float64)
+        keep = vals != 0.0
+        order = np.lexsort((cols[keep], rows[keep]))
+        self.rows = rows[keep][order]
+        self.cols = cols[keep][order]
+        self.vals = vals[keep][order]
+        self.n = int(n)
+        self.b = np.asarray(b, dtype=np.float64)
+        self.c = np.asarray(c, dtype=np.float64)
+        self.m = len(self.b)
+        self.constraints_info = list(constraints_info or ["<="] * self.m)
+        self.constant = float(constant)
+        self.objective_type = objective_type
+        self.lower = np.zeros(self.n) if lower is None else np.asarray(lower, dtype=np.float64)
+        self.upper = np.full(self.n, np.inf) if upper is None else np.asarray(upper, dtype=np.float64)
+
+        if len(self.c) != self.n or len(self.constraints_info) != self.m:
+            raise ValueError("Dimensions incohérentes entre c, b et constraints_info")
+        if len(self.lower) != self.n or len(self.upper) != self.n:
+            raise ValueError("Dimensions incohérentes entre c et les bornes")
+        if not np.isfinite(self.lower).all():
+            raise ValueError("Les bornes inférieures doivent être finies")
+        if len(self.rows) and (self.rows.max() >= self.m or self.cols.max() >= self.n
+                               or self.rows.min() < 0 or self.cols.min() < 0):
+            raise ValueError("Indice de ligne ou de colonne hors limites")
+
+        self.row_ptr = np.searchsorted(self.rows, np.arange(self.m + 1))
+        self.csc_order = np.argsort(self.cols, kind="stable")
+        self.col_ptr = np.searchsorted(self.cols[self.csc_order], np.arange(self.n + 1))
+
+    @classmethod
+    def from_variables(cls, variables: dict):
+        """Convertit le dictionnaire `variables` habituel (les zéros ne sont pas conservés)"""
+        n = variables["nombres_variables_base"]
+        equations = list(variables["equations"].values())
+        rows, cols, vals, b = [], [], [], []
+        for i, equation in enumerate(equations):
+            b.append(equation[0])
+            for j, value in enumerate(equation[1:n + 1]):
+                if value != 0:
+                    rows.append(i)
+                    cols.append(j)
+                    vals.append(value)
+        tab = variables["tab_optimisation"]
+        lower, upper = parse_bounds(variables.get("bounds"), n)
+        return cls(n, rows, cols, vals, b, tab[1:n + 1], variables.get("constraints_info"),
+                   tab[0], variables.get("objective_type", "max"), lower, upper)
+
+    def to_variables(self) -> dict:
+        """Densifie vers le dictionnaire `variables` (utile pour les méthodes tabulaires)"""
+        equations = {}
+        for i in range(self.m):
+            equation = [float(self.b[i])] + [0.0] * self.n
+            for j, value in zip(*self.row(i)):
+                equation[j + 1] = float(value)
+            equations[f"equation_{i+1}"] = equation
+        variables = {
+            "tab_optimisation": [self.constant] + self.c.tolist(),
+            "nombres_variables_base": self.n,
+            "equations": equations,
+            "nb_equations": self.m,
+            "constraints_info": list(self.constraints_info),
+            "objective_type": self.objective_type,
+        }
+        if self.has_bounds:
+            variables["bounds"] = format_bounds(self.lower, self.upper)
+        return variables
+
+    @classmethod
+    def from_json_dict(cls, data: dict):
+        """Lit le bloc "sparse" du format JSON creux"""
+        lower, upper = parse_bounds(data.get("bounds"), data["n"])
+        return cls(data["n"], data["rows"], data["cols"], data["vals"], data["b"], data["c"],
+                   data.get("constraints_info"), data.get("constant", 0.0),
+                   data.get("objective_type", "max"), lower, upper)
+
+    def to_json_dict(self) -> dict:
+        """Bloc "sparse" du format JSON creux (triplets, sans colonnes d'écart)"""
+        data = {
+            "n": self.n,
+            "m": self.m,
+            "rows": self.rows.tolist(),
+            "cols": self.cols.tolist(),
+            "vals": self.vals.tolist(),
+            "b": self.b.tolist(),
+            "c": self.c.tolist(),
+            "constraints_info": list(self.constraints_info),
+            "constant": self.constant,
+            "objective_type": self.objective_type,
+        }
+        if self.has_bounds:
+            data["bounds"] = format_bounds(self.lower, self.upper)
+        return data
+
+    @property
+    def has_bounds(self) -> bool:
+        """Vrai si une variable a une borne autre que 0 <= x"""
+        return bool(self.lower.any() or np.isfinite(self.upper).any())
+
+    @property
+    def nnz(self) -> int:
+        return len(self.vals)
+
+    @property
+    def density(self) -> float:
+        return self.nnz / max(self.m * self.n, 1)
+
+    def row(self, i: int):
+        """Indices de colonnes et valeurs non nulles de la ligne i"""
+        start, end = self.row_ptr[i], self.row_ptr[i + 1]
+        return self.cols[start:end], self.vals[start:end]
+
+    def column(self, j: int):
+        """Colonne j de A sous forme dense (vecteur de taille m)"""
+        idx = self.csc_order[self.col_ptr[j]:self.col_ptr[j + 1]]
+        out = np.zeros(self.m)
+        # Les triplets en double s'additionnent, comme dans matvec
+        np.add.at(out, self.rows[idx], self.vals[idx])
+        return out
+
+    def matvec(self, x):
+        """Calcule A x"""
+        return np.bincount(self.rows, weights=self.vals * np.asarray(x)[self.cols], minlength=self.m)
+
+    def rmatvec(self, y):
+        """Calcule y A (équivalent à A^T y)"""
+        return np.bincount(self.cols, weights=self.vals * np.asarray(y)[self.rows], minlength=self.n)
+
+    def dual(self):
+        """
+        Dual d'un problème de maximisation à contraintes <= :
+        Min W = b y, A^T y >= c, y >= 0, écrit en maximisation de -b y.
+        La transposition se fait en échangeant lignes et colonnes, sans densifier.
+        """
+        if any(sense != "<=" for sense in self.constraints_info):
+            raise ValueError("Le dual creux suppose des contraintes primales de type <=")
+        if self.has_bounds:
+            raise ValueError("Le dual creux suppose des variables sans bornes (x >= 0)")
+        return SparseProblem(self.m, self.cols, self.rows, self.vals, self.c, -self.b,
+                             [">="] * self.n, -self.constant, "min")
+
+
+def parse_bounds(bounds, n: int):
+    """
+    Bornes du dictionnaire `variables` : une paire [inférieure, supérieure] par variable de
+    décision, None pour une borne supérieure infinie (clé "bounds" absente : 0 <= x).
+    Les bornes inférieures doivent être finies.
+    """
+    lower, upper = np.zeros(n), np.full(n, np.inf)
+    if bounds is None:
+        return lower, upper
+    if len(bounds) != n:
+        raise ValueError(f"{len(bounds)} paire(s) de bornes pour {n} variable(s)")
+    for j, (low, high) in enumerate(bounds):
+        if low is None:
+            raise ValueError(f"Borne inférieure infinie pour x{j+1} : non prise en charge")
+        lower[j] = low
+        upper[j] = np.inf if high is None else high
+        if lower[j] > upper[j]:
+            raise ValueError(f"Bornes incohérentes pour x{j+1}: {lower[j]:.6g} > {upper[j]:.6g}")
+    return lower, upper
+
+
+def format_bounds(lower, upper) -> list:
+    """Inverse de parse_bounds (sérialisable en JSON)"""
+    return [[float(low), None if np.isinf(high) else float(high)] for low, high in zip(lower, upper)]
@@ -0,0 +1,114 @@
+import numpy as np
+
+# Nature des colonnes de la forme standard
+ORIGINAL, SLACK, SURPLUS, ARTIFICIAL = "original", "slack", "surplus", "artificial"
+
+FLIPPED = {"<=": ">=", ">=": "<=", "=": "="}
+
+
+class StandardForm:
+    """
+    Forme standard A x = b d'un problème `variables` (dictionnaire habituel, jamais modifié),
+    construite en une seule allocation du tableau augmenté.
+
+    Disposition des colonnes (celle du simplexe révisé), commune aux méthodes à tableau
+    et à l'analyse de sensibilité :
+        0 : second membre | x1..xn | écarts s_i (+1, <=) et surplus s_i (-1, >=) dans l'ordre
+        des lignes | artificielles a_i (>= et =) dans l'ordre des lignes
+
+    - `senses` : sens imposés (par exemple "<=" partout pour le simplexe standard),
+      sinon ceux de "constraints_info" ;
+    - `normalize_rhs` : une ligne de second membre négatif est multipliée par -1 et son sens
+      inversé (`row_sign` garde le signe appliqué, pour les prix duaux).
+
+    La ligne objectif (ligne m) vaut [c0, -c, 0...] ; la base initiale est l'écart des lignes <=
+    et l'artificielle des lignes >= et =.
+    """
+
+    def __init__(self, variables: dict, senses=None, normalize_rhs: bool = True):
+        n = variables["nombres_variables_base"]
+        equations = list(variables["equations"].values())
+        m = len(equations)
+        if senses is None:
+            senses = variables.get("constraints_info") or ["<="] * m
+        elif isinstance(senses, str):
+            senses = [senses] * m
+        objective = variables["tab_optimisation"]
+        self.n = n
+        self.m = m
+        self.objective_coefficients = [float(v) for v in objective[:n + 1]]
+
+        b = np.array([eq[0] for eq in equations], dtype=np.float64)
+        self.row_sign = np.where(b < 0, -1.0, 1.0) if normalize_rhs else np.ones(m)
+        self.senses = [FLIPPED[s] if sign < 0 else s for s, sign in zip(senses, self.row_sign)]
+
+        slack_rows = [i for i, s in enumerate(self.senses) if s in ("<=", ">=")]
+        artificial_rows = [i for i, s in enumerate(self.senses) if s in (">=", "=")]
+        self.first_slack = 1 + n
+        self.first_artificial = self.first_slack + len(slack_rows)
+        width = self.first_artificial + len(artificial_rows)
+
+        # Seule allocation du tableau : les lignes d'origine y sont recopiées une fois
+        tableau = np.zeros((m + 1, width))
+        for i, equation in enumerate(equations):
+            tableau[i, :n + 1] = equation[:n + 1]
+        tableau[:m] *= self.row_sign[:, None]
+        tableau[m, 0] = self.objective_coefficients[0]
+        tableau[m, 1:n + 1] = [-v for v in self.objective_coefficients[1:]]
+
+        self.column_names = [f"x{j+1}" for j in range(n)]
+        self.column_kinds = [ORIGINAL] * n
+        self.basis = np.zeros(m, dtype=np.int64)
+        for k, i in enumerate(slack_rows):
+            col = self.first_slack + k
+            slack = self.senses[i] == "<="
+            tableau[i, col] = 1.0 if slack else -1.0
+            self.column_names.append(f"s{i+1}")
+            self.column_kinds.append(SLACK if slack else SURPLUS)
+            if slack:
+                self.basis[i] = col
+        for k, i in enumerate(artificial_rows):
+            col = self.first_artificial + k
+            tableau[i, col] = 1.0
+            self.column_names.append(f"a{i+1}")
+            self.column_kinds.append(ARTIFICIAL)
+            self.basis[i] = col
+        self.tableau = tableau
+
+    @property
+    def width(self) -> int:
+        return self.tableau.shape[1]
+
+    def columns(self, *kinds) -> np.ndarray:
+        """Indices (dans le tableau) des colonnes des natures `kinds`"""
+        return np.array([j + 1 for j, kind in enumerate(self.column_kinds) if kind in kinds], dtype=np.int64)
+
+    @property
+    def matrix(self):
+        """Matrice des contraintes A (sans second membre ni ligne objectif, vue)"""
+        return self.tableau[:self.m, 1:]
+
+    @property
+    def rhs(self):
+        """Seconds membres b >= 0 si `normalize_rhs` (vue)"""
+        return self.tableau[:self.m, 0]
+
+    @property
+    def costs(self) -> np.ndarray:
+        """Coûts d'origine de chaque colonne (0 pour les écarts, surplus et artificielles)"""
+        costs = np.zeros(self.width - 1)
+        costs[:self.n] = self.objective_coefficients[1:]
+        return costs
+
+    def as_variables(self) -> dict:
+        """
+        Dictionnaire `variables` (listes Python neuves) du tableau initial, que les solveurs
+        tiennent à jour pour l'affichage des itérations et du tableau final.
+        """
+        return {
+            "tab_optimisation": self.tableau[self.m].tolist(),
+            "nombres_variables_base": self.n,
+            "equations": {f"equation_{i+1}": row.tolist() for i, row in enumerate(self.tableau[:self.m])},
+            "nb_equations": self.m,
+            "constraints_info": list(self.senses),
+        }
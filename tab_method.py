@@ -1,79 +1,171 @@
 from variables import display_simplex_tableau
+from tableau_engine import TableauEngine
+from solver_result import SolveResult, basis_columns, duals_from_basis
+from solver_events import IterationEvent, SolverEvents
+from pricing import make_pricing
+from degeneracy import DegeneracyGuard
+from solve_budget import STOPPED, SolveBudget
+from standard_form import StandardForm
+import time
 
 class SimplexMethodTab:
-    def __init__(self, variables:dict):
+    def __init__(self, variables:dict, pricing=None, warm_start=None, max_iterations=None, time_limit=None,
+                 perturbation="auto", cancel=None):
         self.variables = variables
+        # Base d'une résolution précédente (SolveResult ou liste de noms) pour un démarrage à chaud
+        self.warm_start = warm_start
+        self.warm_started = False
+        # Règle de choix de la variable entrante (nom de pricing.PRICING_RULES ou instance)
+        self.pricing = make_pricing(pricing)
+        # Stagnation (perturbation puis Bland)
+        self.guard = DegeneracyGuard(perturbation)
+        # Limites d'itérations / de temps et jeton d'annulation (CancellationToken)
+        self.budget = SolveBudget(max_iterations, time_limit, cancel)
         self.n = variables["nombres_variables_base"]
-        
+        # Forme standard (le dictionnaire `variables` n'est jamais modifié) et son tableau
+        # courant sous forme de dictionnaire, pour l'affichage
+        self.form = None
+        self.tableau_variables = None
+        self.engine = None
+        self.iteration = 0
+        self.status = None
+        self.result = None
+        self.events = SolverEvents()
+
+    def subscribe(self, callback):
+        """Abonne `callback(IterationEvent)` aux itérations du solveur"""
+        return self.events.subscribe(callback)
+
     def run(self):
-        self.add_ecart_variables()
-        self.variables["tab_optimisation"] = [-x for x in self.variables["tab_optimisation"]]
-        iteration = 0
+        self.solve(observer=self.print_iteration)
+        for note in self.guard.notes:
+            print(f"⚠️  {note}")
+        if self.status == "unbounded":
+            print("Solution illimitée!")
+            return
+        if self.status in STOPPED:
+            print(f"⏱️  Arrêt avant l'optimum : {self.budget.reason}")
+            return
+        self.display_results()
+
+    def solve(self, observer=None) -> SolveResult:
+        """
+        Résout sans aucune entrée/sortie et renvoie un SolveResult.
+        `observer(solver, iteration, row, col)` est appelé après chaque pivot s'il est fourni.
+        """
+        start = time.perf_counter()
+        # Le simplexe standard traite toutes les contraintes comme des <= (un écart par ligne)
+        senses = self.variables.get("constraints_info") or []
+        if any(sense != "<=" for sense in senses):
+            raise ValueError("Le simplexe standard ne traite que des contraintes <= : "
+                             "utiliser la méthode des Deux Phases (ou du Grand M)")
+        self.form = StandardForm(self.variables, senses="<=", normalize_rhs=False)
+        self.tableau_variables = self.form.as_variables()
+        self.engine = TableauEngine(self.form.tableau.copy(), basis=self.form.basis)
+        if self.warm_start is not None:
+            self.warm_started = self.engine.warm_start(basis_columns(self.warm_start, self.form.column_names))
+        if self.engine.primal_infeasibility() > 0.0:
+            # Second membre négatif : la base d'écarts n'est pas un sommet, il faudrait une phase 1
+            raise ValueError("Second membre négatif : la base de départ n'est pas réalisable, "
+                             "utiliser la méthode des Deux Phases (ou du Grand M)")
+        self.pricing.reset(self.engine)
+        self.guard.reset(self.engine)
+        self.budget.begin(start)
+        setup_done = time.perf_counter()
+
+        self.iteration = 0
+        self.status = "optimal"
         while self.can_iterate():
-            iteration += 1
-            print(f"\n===== Itération {iteration} =====")
+            stop = self.budget.exhausted(self.iteration)
+            if stop:
+                self.status = stop
+                break
             col = self.find_pivot_column()
             pivot = self.row_pivot(col)
-            print(f"colonne pivot : {col}")
-            print(f"ligne pivot : {pivot}")
-            self.new_tableau(pivot, col)
-            display_simplex_tableau(self.variables, iteration)
-        self.display_results()
-        
+            if pivot == -1:
+                self.status = "unbounded"
+                break
+            self.iteration += 1
+            leaving = self.engine.basis[pivot]
+            self.pricing.update(self.engine, pivot, col)
+            self.engine.pivot(pivot, col)
+            self.pricing = self.guard.after_pivot(self.engine, self.pricing)
+            if self.events:
+                self.events.emit(IterationEvent(
+                    method="Simplexe Standard",
+                    iteration=self.iteration,
+                    entering=self.column_name(col),
+                    leaving=self.column_name(leaving),
+                    objective=float(self.engine.objective[0]),
+                    primal_infeasibility=self.engine.primal_infeasibility(),
+                    dual_infeasibility=self.engine.dual_infeasibility(),
+                    elapsed=time.perf_counter() - start,
+                ))
+            if observer is not None:
+                observer(self, self.iteration, pivot, col)
+        # Un optimum est dual-réalisable : le simplexe dual retire la perturbation
+        if not self.guard.finish(self.engine, optimal=self.status == "optimal"):
+            self.status = "infeasible"
+        self.iteration += self.guard.cleanup_pivots
+        self.guard.cleanup_pivots = 0
+        iterations_done = time.perf_counter()
+
+        self.engine.write_back(self.tableau_variables)
+        self.result = SolveResult(
+            method="Simplexe Standard",
+            status=self.status,
+            iterations=self.iteration,
+            basis=[self.column_name(col) for col in self.engine.basis],
+        )
+        if self.status == "optimal":
+            duals = duals_from_basis(self.form.matrix, self.form.costs, self.engine.basis - 1)
+            self.result.objective = float(self.engine.objective[0])
+            self.result.x = self.engine.primal_values(self.n).tolist()
+            self.result.duals = None if duals is None else duals.tolist()
+        elif self.status in STOPPED and self.engine.primal_infeasibility() == 0.0:
+            # Dernier sommet visité (une perturbation retirée peut le rendre légèrement non réalisable)
+            self.result.objective = float(self.engine.objective[0])
+            self.result.x = self.engine.primal_values(self.n).tolist()
+        self.result.timings = {
+            "setup": setup_done - start,
+            "iterations": iterations_done - setup_done,
+            "total": time.perf_counter() - start,
+        }
+        return self.result
+
+    def column_name(self, col:int)->str:
+        """Nom de la variable associée à une colonne du tableau"""
+        if self.form is not None:
+            return self.form.column_names[col - 1]
+        if col <= self.n:
+            return f"x{col}"
+        return f"s{col - self.n}"
+
+    def print_iteration(self, solver, iteration:int, pivot:int, col:int)->None:
+        """Observateur d'affichage : reproduit la sortie console historique"""
+        print(f"\n===== Itération {iteration} =====")
+        print(f"colonne pivot : {col}")
+        print(f"ligne pivot : {pivot}")
+        # Le dictionnaire du tableau n'est resynchronisé que pour l'affichage
+        self.engine.write_back(self.tableau_variables)
+        display_simplex_tableau(self.tableau_variables, iteration)
+
     def find_pivot_column(self):
-        min_val = min(self.variables["tab_optimisation"][1:])
-        if min_val >= 0:
-            return -1 
-        return self.variables["tab_optimisation"][1:].index(min_val) + 1
-    
+        return self.pricing.select(self.engine)
+
     def new_tableau(self, pivot:int, col:int)->None:
-        equations = list(self.variables["equations"].values())
-        tab_optimisation = self.variables["tab_optimisation"].copy()
-        equations[pivot] = [x / equations[pivot][col] for x in equations[pivot]]
-        for i in range(len(equations)):
-            if i != pivot:
-                equations[i] = [x - (equations[i][col] * equations[pivot][j]) for j, x in enumerate(equations[i])]
-        tab_optimisation = [x - (tab_optimisation[col] * equations[pivot][j])  for j, x in enumerate(tab_optimisation)]
-        self.variables["tab_optimisation"] = tab_optimisation
-        for k, equation in enumerate(equations):
-            self.variables["equations"][list(self.variables["equations"].keys())[k]] = equation
-        return None
+        self.engine.pivot(pivot, col)
+        self.engine.write_back(self.tableau_variables)
     
     def maximum(self, table:list)->int:
         abs_tab = [abs(x) for x in table]
         return abs_tab.index(max(abs_tab))
     
     def row_pivot(self,col):
-        temp = []
-        for row in self.variables["equations"].values():
-            if row[col] > 0:
-                temp.append(row[0] / row[col])
-            else:
-                temp.append(float('inf'))
-
-        return temp.index(min(temp))
-    
-    def add_ecart_variables(self)->None:
-        equations = list(self.variables["equations"].values())
-        for _ in range(len(equations)):
-            self.variables["tab_optimisation"].append(0)
-            
-        for i, equation in enumerate(equations):
-            init_len = len(equations[i])
-            for k in range(len(equations[i]), self.variables["nombres_variables_base"] + self.variables["nb_equations"]+1):
-                if len(equations[i]) == init_len+i:
-                    equations[i].append(1)
-                else:
-                    equations[i].append(0)
-        for k, equation in enumerate(equations):
-            self.variables["equations"][list(self.variables["equations"].keys())[k]] = equation
-        return
+        return self.pricing.choose_row(self.engine, col)
     
     def can_iterate(self)->bool:
-        for value in self.variables["tab_optimisation"][1:]:
-            if value < 0:
-                return True
-        return False
+        return self.engine.can_iterate()
     
     def ajout_variables_ecart(self):
         if(self.n >=len(self.variables['equations'])):
@@ -85,25 +177,11 @@ class SimplexMethodTab:
     
     def display_results(self):
         print("\n===== Solution Optimale =====")
-        z_opt = self.variables["tab_optimisation"][0]
+        z_opt = self.engine.objective[0]
         print(f"Valeur optimale: {z_opt}")
         
-        var_values = [0] * (self.variables["nombres_variables_base"])
-        # On cherche les colonnes qui ont exactement un '1' et le reste des '0'
-        for j in range(1, self.variables["nombres_variables_base"] + 1):
-            ones_count = 0
-            one_position = -1
-            for i, eq in enumerate(self.variables["equations"].values()):
-                if abs(eq[j] - 1.0) < 1e-10:
-                    ones_count += 1
-                    one_position = i
-                elif abs(eq[j]) > 1e-10:
-                    ones_count = 0
-                    break
-            
-            if ones_count == 1:
-                var_values[j-1] = list(self.variables["equations"].values())[one_position][0]
-        for i, val in enumerate(var_values):
+        # Valeurs lues dans l'en-tête de base (ligne -> variable de base), mis à jour à chaque pivot
+        for i, val in enumerate(self.engine.primal_values(self.n)):
             print(f"x{i+1} = {val}")
         
 if __name__ == "__main__":
@@ -0,0 +1,175 @@
+import numpy as np
+
+
+class TableauEngine:
+    """
+    Tableau du simplexe stocké dans un seul ndarray float64 contigu.
+
+    Lignes 0..m-1 : contraintes, ligne m : fonction objectif.
+    Colonne 0 : second membre (ou valeur de Z pour la ligne objectif).
+    `basis[i]` est la colonne de la variable de base de la ligne i (mise à jour à chaque pivot).
+    `shadow` est une colonne facultative (m+1 valeurs) transformée par les pivots sans faire
+    partie du tableau, par exemple une perturbation des seconds membres à retirer ensuite.
+    """
+
+    def __init__(self, tableau, tol: float = 1e-10, basis=None):
+        self.tableau = np.ascontiguousarray(tableau, dtype=np.float64)
+        self.m = self.tableau.shape[0] - 1
+        self.tol = tol
+        self.basis = np.full(self.m, -1, dtype=np.int64) if basis is None \
+            else np.array(basis, dtype=np.int64)
+        self.shadow = None
+
+    @classmethod
+    def from_variables(cls, variables: dict, tol: float = 1e-10, basis=None):
+        """Construit le moteur à partir du dictionnaire `variables` habituel"""
+        rows = list(variables["equations"].values())
+        rows.append(variables["tab_optimisation"])
+        return cls(np.array(rows, dtype=np.float64), tol, basis)
+
+    def write_back(self, variables: dict) -> None:
+        """Recopie le tableau dans le dictionnaire `variables` (mêmes clés, listes Python)"""
+        variables["tab_optimisation"] = self.tableau[self.m].tolist()
+        equations = variables["equations"]
+        for key, row in zip(list(equations.keys()), self.tableau[:self.m]):
+            equations[key] = row.tolist()
+
+    @property
+    def objective(self):
+        """Ligne de la fonction objectif (vue, pas une copie)"""
+        return self.tableau[self.m]
+
+    @property
+    def rhs(self):
+        """Seconds membres des contraintes (vue, pas une copie)"""
+        return self.tableau[:self.m, 0]
+
+    def can_iterate(self) -> bool:
+        """Vrai s'il reste un coût réduit négatif"""
+        return bool((self.objective[1:] < -self.tol).any())
+
+    def pivot_column(self) -> int:
+        """Colonne du coût réduit le plus négatif (règle de Dantzig), -1 si optimal"""
+        costs = self.objective[1:]
+        col = int(np.argmin(costs))
+        if costs[col] >= -self.tol:
+            return -1
+        return col + 1
+
+    def ratio_test(self, col: int) -> int:
+        """Ligne pivot par la règle du minimum des rapports, -1 si la colonne est non bornée"""
+        column = self.tableau[:self.m, col]
+        positive = column > self.tol
+        if not positive.any():
+            return -1
+        ratios = np.full(self.m, np.inf)
+        np.divide(self.rhs, column, out=ratios, where=positive)
+        return int(np.argmin(ratios))
+
+    def pivot(self, row: int, col: int) -> None:
+        """Pivot de Gauss-Jordan par une mise à jour de rang 1 (une seule soustraction np.outer)"""
+        t = self.tableau
+        if self.shadow is not None:
+            self.shadow[row] /= t[row, col]
+        t[row] /= t[row, col]
+        factors = t[:, col].copy()
+        factors[row] = 0.0
+        t -= np.outer(factors, t[row])
+        if self.shadow is not None:
+            self.shadow -= factors * self.shadow[row]
+        self.basis[row] = col
+
+    def crash_basis(self, cols) -> None:
+        """
+        Fait entrer les colonnes `cols` en base par pivots de Gauss-Jordan, chacune sur la
+        ligne (dont la variable de base n'est pas demandée) où son coefficient est le plus grand.
+        Une colonne dépendante des précédentes est ignorée.
+        """
+        targets = set(int(col) for col in cols)
+        for col in cols:
+            if col in self.basis:
+                continue
+            free = np.array([b not in targets for b in self.basis], dtype=bool)
+            column = np.abs(self.tableau[:self.m, col])
+            candidates = np.flatnonzero(free & (column > self.tol))
+            if len(candidates) == 0:
+                continue
+            self.pivot(int(candidates[np.argmax(column[candidates])]), col)
+
+    def warm_start(self, cols, feasibility: str = "primal", basic_limit: int = None) -> bool:
+        """
+        Démarrage à chaud sur la base `cols`. Si la base obtenue n'est pas réalisable
+        (primal : seconds membres >= 0, dual : coûts réduits >= 0) ou contient encore une
+        colonne >= `basic_limit`, le tableau est remis dans son état initial et on renvoie Faux.
+        """
+        saved = (self.tableau.copy(), self.basis.copy())
+        self.crash_basis(cols)
+        feasible = self.primal_infeasibility() == 0.0 if feasibility == "primal" \
+            else self.dual_infeasibility() == 0.0
+        if basic_limit is not None:
+            feasible = feasible and bool((self.basis < basic_limit).all())
+        if not feasible:
+            self.tableau, self.basis = saved
+        return feasible
+
+    def leaving_row(self) -> int:
+        """Dual simplexe : ligne du second membre le plus négatif, -1 si la base est réalisable"""
+        row = int(np.argmin(self.rhs))
+        if self.rhs[row] >= -self.tol:
+            return -1
+        return row
+
+    def dual_ratio_test(self, row: int) -> int:
+        """
+        Dual simplexe : colonne entrante qui préserve la réalisabilité duale
+        (minimum de coût réduit / |a_rj| sur les a_rj < 0), -1 si le problème est non réalisable
+        """
+        pivot_row = self.tableau[row, 1:]
+        negative = pivot_row < -self.tol
+        if not negative.any():
+            return -1
+        ratios = np.full(len(pivot_row), np.inf)
+        np.divide(self.objective[1:], -pivot_row, out=ratios, where=negative)
+        return int(np.argmin(ratios)) + 1
+
+    def add_columns(self, count: int) -> None:
+        """Ajoute des colonnes nulles à droite (ex. nouvelles variables d'écart)"""
+        self.tableau = np.ascontiguousarray(np.hstack([self.tableau, np.zeros((self.m + 1, count))]))
+
+    def add_row(self, row, basic_col: int) -> None:
+        """Ajoute une ligne de contrainte (avant la ligne objectif) dont `basic_col` est la variable de base"""
+        self.tableau = np.ascontiguousarray(np.insert(self.tableau, self.m, row, axis=0))
+        self.basis = np.append(self.basis, basic_col)
+        if self.shadow is not None:
+            self.shadow = np.insert(self.shadow, self.m, 0.0)
+        self.m += 1
+
+    def primal_infeasibility(self) -> float:
+        """Somme des seconds membres négatifs"""
+        return float(-self.rhs[self.rhs < -self.tol].sum())
+
+    def dual_infeasibility(self) -> float:
+        """Somme des coûts réduits négatifs (amélioration encore possible)"""
+        costs = self.objective[1:]
+        return float(-costs[costs < -self.tol].sum())
+
+    def primal_values(self, n: int):
+        """Valeurs des colonnes 1..n lues directement dans l'en-tête de base"""
+        values = np.zeros(n)
+        rows = np.flatnonzero((self.basis >= 1) & (self.basis <= n))
+        values[self.basis[rows] - 1] = self.rhs[rows]
+        return values
+
+    def drop_columns(self, cols) -> None:
+        """Supprime des colonnes du tableau (ex. variables artificielles sorties de la base)"""
+        self.tableau = np.ascontiguousarray(np.delete(self.tableau, cols, axis=1))
+        removed = np.sort(np.atleast_1d(cols))
+        self.basis -= np.searchsorted(removed, self.basis, side="left")
+
+    def drop_rows(self, rows) -> None:
+        """Supprime des lignes de contraintes (ex. contraintes redondantes)"""
+        self.tableau = np.ascontiguousarray(np.delete(self.tableau, rows, axis=0))
+        self.basis = np.delete(self.basis, rows)
+        if self.shadow is not None:
+            self.shadow = np.delete(self.shadow, rows)
+        self.m = self.tableau.shape[0] - 1
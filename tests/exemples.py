@@ -0,0 +1,21 @@
+"""Problèmes d'exemple partagés par les tests"""
+
+
+def probleme_cours(constraints=("<=", "<=", "<="), capacity=18, costs=(3, 5)):
+    """
+    Exemple du cours : Max Z = 3x1 + 5x2, x1 <= 4, 2x2 <= 12, 3x1 + 2x2 <= 18
+    (optimum Z = 36 en x = (2, 6)). `constraints` donne les sens des trois contraintes,
+    `capacity` le second membre de la troisième et `costs` les coûts de x1 et x2.
+    Un nouveau dictionnaire est renvoyé à chaque appel.
+    """
+    return {
+        "tab_optimisation": [0] + list(costs),
+        "nombres_variables_base": 2,
+        "equations": {
+            "equation_1": [4, 1, 0],
+            "equation_2": [12, 0, 2],
+            "equation_3": [capacity, 3, 2],
+        },
+        "nb_equations": 3,
+        "constraints_info": list(constraints),
+    }
@@ -0,0 +1,77 @@
+import unittest
+import io
+import json
+import os
+import tempfile
+
+from batch_solve import batch_solve, solve_record, suggest_method
+from exemples import probleme_cours
+
+
+def probleme(rhs, constraints):
+    return probleme_cours(constraints, capacity=rhs)
+
+
+class TestBatchSolve(unittest.TestCase):
+
+    def test_method_rule_matches_cli(self):
+        self.assertEqual(suggest_method(probleme(18, ["<=", "<=", "<="])), "1")
+        self.assertEqual(suggest_method(probleme(18, ["<=", "<=", "="])), "3")
+
+    def test_directory_in_input_order(self):
+        with tempfile.TemporaryDirectory() as folder:
+            for k, rhs in enumerate([18, 12, 30, 6]):
+                with open(os.path.join(folder, f"p{k}.json"), "w", encoding="utf-8") as f:
+                    json.dump({"variables": probleme(rhs, ["<=", "<=", "="])}, f)
+            output = io.StringIO()
+            counts = batch_solve(folder, output, workers=2, max_pending=2)
+
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([r["index"] for r in results], [0, 1, 2, 3])
+        self.assertEqual(counts, {"optimal": 3, "infeasible": 1})
+        self.assertAlmostEqual(results[0]["objective"], 36.0)
+        self.assertEqual(results[0]["method"], "Deux Phases")
+
+    def test_jsonl_completion_order_reports_errors(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "problemes.jsonl")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"variables": probleme(18, ["<=", "<=", "<="])}) + "\n")
+                f.write(json.dumps({"nombres_variables_base": 2}) + "\n")
+            output = io.StringIO()
+            counts = batch_solve(path, output, workers=2, order="completion")
+
+        results = sorted((json.loads(line) for line in output.getvalue().splitlines()),
+                         key=lambda r: r["index"])
+        self.assertEqual(counts, {"optimal": 1, "error": 1})
+        self.assertEqual(results[0]["method"], "Simplexe Standard")
+        self.assertTrue(results[1]["source"].endswith(":2"))
+
+    def test_presolve_option(self):
+        record = {"variables": probleme(18, ["<=", "<=", "="])}
+        plain = solve_record(0, "p", record)
+        reduced = solve_record(0, "p", record, presolve=True)
+        self.assertEqual(reduced["status"], "optimal")
+        self.assertAlmostEqual(reduced["objective"], plain["objective"])
+        self.assertIn("presolve", reduced["timings"])
+
+    def test_bounds_select_bounded_simplex(self):
+        variables = probleme(18, ["<="] * 3)
+        variables["bounds"] = [[0, 1], [0, None]]
+        self.assertEqual(suggest_method(variables), "7")
+        bounded = solve_record(0, "p", {"variables": variables})
+        rows = solve_record(0, "p", {"variables": variables}, method="3")
+        self.assertEqual(bounded["method"], "Simplexe Borné")
+        self.assertAlmostEqual(bounded["objective"], 33.0)
+        self.assertAlmostEqual(rows["objective"], 33.0)
+
+    def test_scale_option(self):
+        plain = solve_record(0, "p", {"variables": probleme(18, ["<=", "<=", "<="])})
+        scaled = solve_record(0, "p", {"variables": probleme(18, ["<=", "<=", "<="])}, scale=True)
+        self.assertEqual(scaled["status"], "optimal")
+        self.assertAlmostEqual(scaled["objective"], plain["objective"])
+        self.assertIn("scaling", scaled["timings"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import copy
+
+import numpy as np
+
+from bounded_method import BoundedSimplexMethod, bounds_as_constraints
+from revised_method import RevisedSimplexMethod
+from sparse_problem import SparseProblem
+
+
+def probleme_borne():
+    # Max Z = 3x1 + 5x2, 3x1 + 2x2 <= 18, 0 <= x1 <= 4, 0 <= x2 <= 6 (bornes sans lignes)
+    return {
+        "tab_optimisation": [0, 3, 5],
+        "nombres_variables_base": 2,
+        "equations": {
+            "equation_1": [18, 3, 2],
+        },
+        "nb_equations": 1,
+        "constraints_info": ["<="],
+        "bounds": [[0, 4], [0, 6]],
+    }
+
+
+class TestBoundedSimplexMethod(unittest.TestCase):
+
+    def test_upper_bounds_without_rows(self):
+        variables = probleme_borne()
+        solver = BoundedSimplexMethod(variables)
+        result = solver.solve()
+        self.assertEqual(variables, probleme_borne())
+        self.assertEqual(result.method, "Simplexe Borné")
+        self.assertAlmostEqual(result.objective, 36.0)
+        np.testing.assert_allclose(result.x, [2, 6])
+        np.testing.assert_allclose(result.duals, [1.0])
+        # Une seule ligne : la base reste de taille 1, x2 est hors base à sa borne supérieure
+        self.assertEqual(result.basis, ["x1"])
+        self.assertTrue(solver.at_upper[1])
+
+    def test_lower_bounds_and_equalities(self):
+        variables = probleme_borne()
+        variables["tab_optimisation"] = [1, -2, -1]
+        variables["equations"]["equation_2"] = [5, 1, 1]
+        variables["nb_equations"] = 2
+        variables["constraints_info"] = ["<=", "="]
+        variables["bounds"] = [[-1, 4], [2.5, None]]
+        result = BoundedSimplexMethod(variables).solve()
+        self.assertEqual(result.status, "optimal")
+        # x1 + x2 = 5 donne Z = -4 - x1 : x1 descend à sa borne -1, d'où x2 = 6
+        np.testing.assert_allclose(result.x, [-1, 6])
+        self.assertAlmostEqual(result.objective, 1 + 2 - 6)
+
+    def test_matches_bounds_as_rows(self):
+        rng = np.random.default_rng(7)
+        for _ in range(40):
+            n, m = 4, 3
+            variables = {
+                "tab_optimisation": [0] + rng.integers(-2, 6, n).tolist(),
+                "nombres_variables_base": n,
+                "equations": {f"equation_{i+1}": [int(rng.integers(5, 20))] + rng.integers(-2, 5, n).tolist()
+                              for i in range(m)},
+                "nb_equations": m,
+                "constraints_info": ["<=", ">=", "<="],
+                "bounds": [[int(lo), None if hi > 5 else int(lo + hi)]
+                           for lo, hi in zip(rng.integers(0, 3, n), rng.integers(0, 8, n))],
+            }
+            with self.subTest(variables=variables):
+                expected = RevisedSimplexMethod(bounds_as_constraints(variables)).solve()
+                result = BoundedSimplexMethod(copy.deepcopy(variables)).solve()
+                self.assertEqual(result.status, expected.status)
+                if expected.is_optimal:
+                    self.assertAlmostEqual(result.objective, expected.objective)
+
+    def test_unbounded_and_sparse_bounds(self):
+        variables = probleme_borne()
+        variables["bounds"] = [[0, 4], [0, None]]
+        variables["equations"]["equation_1"] = [18, 3, -2]
+        self.assertEqual(BoundedSimplexMethod(variables).solve().status, "unbounded")
+
+        problem = SparseProblem.from_variables(probleme_borne())
+        self.assertTrue(problem.has_bounds)
+        self.assertEqual(problem.to_variables()["bounds"], [[0.0, 4.0], [0.0, 6.0]])
+        self.assertEqual(SparseProblem.from_json_dict(problem.to_json_dict()).upper.tolist(), [4.0, 6.0])
+        with self.assertRaises(ValueError):
+            RevisedSimplexMethod(probleme_borne()).solve()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import copy
+
+from tab_method import SimplexMethodTab
+from grand_M_method import GrandMMethod
+from two_phase_method import TwoPhaseMethod
+from tableau_engine import TableauEngine
+from degeneracy import DegeneracyGuard
+
+# Exemple de Beale : la règle de Dantzig cycle indéfiniment sur ce problème
+BEALE = {
+    "tab_optimisation": [0, 0.75, -20, 0.5, -6],
+    "nombres_variables_base": 4,
+    "equations": {
+        "equation_1": [0, 0.25, -8, -1, 9],
+        "equation_2": [0, 0.5, -12, -0.5, 3],
+        "equation_3": [1, 0, 0, 1, 0],
+    },
+    "nb_equations": 3,
+    "constraints_info": ["<=", "<=", "<="],
+}
+
+
+class TestDegeneracy(unittest.TestCase):
+
+    def test_cycling_problem_terminates(self):
+        for cls in (SimplexMethodTab, GrandMMethod, TwoPhaseMethod):
+            for perturbation in ("off", "auto", "always"):
+                with self.subTest(method=cls.__name__, perturbation=perturbation):
+                    solver = cls(copy.deepcopy(BEALE), perturbation=perturbation)
+                    result = solver.solve()
+                    self.assertEqual(result.status, "optimal")
+                    self.assertAlmostEqual(result.objective, 1.25)
+                    self.assertEqual(bool(solver.guard.notes), perturbation != "always")
+
+    def test_iteration_and_time_limits(self):
+        result = SimplexMethodTab(copy.deepcopy(BEALE), perturbation="off", max_iterations=10).solve()
+        self.assertEqual((result.status, result.iterations), ("limit_reached", 10))
+        # Le dernier sommet visité reste disponible
+        self.assertEqual(len(result.x), 4)
+        self.assertIn("Meilleur sommet", result.summary())
+        result = GrandMMethod(copy.deepcopy(BEALE), time_limit=0).solve()
+        self.assertEqual((result.status, result.iterations), ("limit_reached", 0))
+
+    def test_cleanup_status_and_pivot_count(self):
+        class FailingCleanup(DegeneracyGuard):
+            def finish(self, engine, optimal=True):
+                self.cleanup_pivots += 2
+                return False
+
+        for cls in (SimplexMethodTab, GrandMMethod, TwoPhaseMethod):
+            with self.subTest(method=cls.__name__):
+                pivots = cls(copy.deepcopy(BEALE), perturbation="off").solve().iterations
+                solver = cls(copy.deepcopy(BEALE), perturbation="off")
+                solver.guard = FailingCleanup("off")
+                result = solver.solve()
+                self.assertEqual((result.status, result.iterations), ("infeasible", pivots + 2))
+                self.assertEqual(solver.guard.cleanup_pivots, 0)
+
+    def test_perturbation_is_removed(self):
+        engine = TableauEngine([[0.0, 1.0, 1.0, 1.0, 0.0],
+                                [0.0, 1.0, -1.0, 0.0, 1.0],
+                                [0.0, -1.0, -1.0, 0.0, 0.0]], basis=[3, 4])
+        guard = DegeneracyGuard("always")
+        guard.reset(engine)
+        self.assertTrue((engine.rhs > 0).all())
+        engine.pivot(0, 1)
+        self.assertTrue(guard.finish(engine))
+        self.assertIsNone(engine.shadow)
+        self.assertEqual(engine.rhs.tolist(), [0.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
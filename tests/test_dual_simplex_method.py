@@ -0,0 +1,73 @@
+import unittest
+import copy
+
+from dual_simplex_method import DualSimplexMethod
+from revised_method import RevisedSimplexMethod
+from exemples import probleme_cours
+
+
+class TestDualSimplexMethod(unittest.TestCase):
+
+    def test_minimization_from_slack_basis(self):
+        # Min 2x1 + 3x2, x1 + x2 >= 4, x1 + 3x2 >= 6 : base d'écart déjà duale-réalisable
+        variables = {
+            "tab_optimisation": [0, -2, -3],
+            "nombres_variables_base": 2,
+            "equations": {"equation_1": [4, 1, 1], "equation_2": [6, 1, 3]},
+            "nb_equations": 2,
+            "constraints_info": [">=", ">="],
+        }
+        result = DualSimplexMethod(variables).solve()
+        self.assertEqual(result.status, "optimal")
+        self.assertAlmostEqual(result.objective, -9.0)
+        self.assertEqual([round(v, 6) for v in result.x], [3.0, 1.0])
+        self.assertEqual([round(v, 6) for v in result.duals], [-1.5, -0.5])
+
+    def test_maximization_uses_bounding_constraint(self):
+        result = DualSimplexMethod(probleme_cours()).solve()
+        self.assertAlmostEqual(result.objective, 36.0)
+        self.assertEqual([round(v, 6) for v in result.duals], [0.0, 1.5, 1.0])
+
+        variables = probleme_cours()
+        variables["equations"] = {"equation_1": [4, 1, -1]}
+        variables["nb_equations"] = 1
+        variables["constraints_info"] = ["<="]
+        self.assertEqual(DualSimplexMethod(variables).solve().status, "unbounded")
+
+    def test_rhs_change_reoptimizes_from_previous_basis(self):
+        solver = DualSimplexMethod(probleme_cours())
+        solver.solve()
+        for capacity in (16, 20, 10, 30):
+            solver.change_rhs(2, capacity)
+            warm = solver.reoptimize()
+            variables = probleme_cours()
+            variables["equations"]["equation_3"][0] = capacity
+            cold = RevisedSimplexMethod(variables).solve()
+            self.assertAlmostEqual(warm.objective, cold.objective)
+            self.assertLessEqual(warm.iterations, 2)
+
+    def test_added_constraint(self):
+        solver = DualSimplexMethod(probleme_cours())
+        solver.solve()
+        solver.add_constraint([1, 1], 7)
+        result = solver.reoptimize()
+        variables = probleme_cours()
+        variables["equations"]["equation_4"] = [7, 1, 1]
+        variables["nb_equations"] = 4
+        variables["constraints_info"].append("<=")
+        cold = RevisedSimplexMethod(variables).solve()
+        self.assertAlmostEqual(result.objective, cold.objective)
+        self.assertEqual(len(result.duals), 4)
+
+        solver.add_constraint([1, 0], 5, ">=")
+        self.assertEqual(solver.reoptimize().status, "infeasible")
+
+    def test_input_is_not_modified(self):
+        variables = probleme_cours()
+        reference = copy.deepcopy(variables)
+        DualSimplexMethod(variables).solve()
+        self.assertEqual(variables, reference)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import copy
+from fractions import Fraction
+
+from exact_method import ExactSimplexMethod, to_fraction
+from revised_method import RevisedSimplexMethod
+from exemples import probleme_cours
+
+
+def probleme():
+    # Exemple du cours, la troisième contrainte en égalité
+    return probleme_cours(("<=", "<=", "="))
+
+
+class TestExactSimplexMethod(unittest.TestCase):
+
+    def test_certified_optimum_with_exact_duals(self):
+        variables = probleme()
+        solver = ExactSimplexMethod(variables)
+        result = solver.solve()
+        self.assertEqual(result.status, "optimal")
+        self.assertTrue(solver.certified)
+        self.assertEqual(solver.exact_objective, 36)
+        self.assertEqual(solver.exact_x, [2, 6])
+        self.assertEqual(solver.exact_duals, [0, Fraction(3, 2), 1])
+        self.assertEqual(result.x, [2.0, 6.0])
+        self.assertEqual(variables, probleme())
+
+    def test_decimal_data_read_exactly(self):
+        self.assertEqual(to_fraction(0.1), Fraction(1, 10))
+        # Max x1 + x2, 0.1x1 + 0.2x2 <= 0.3, 0.3x1 + 0.1x2 <= 0.4
+        variables = {
+            "tab_optimisation": [0, 1, 1],
+            "nombres_variables_base": 2,
+            "equations": {"equation_1": [0.3, 0.1, 0.2], "equation_2": [0.4, 0.3, 0.1]},
+            "nb_equations": 2,
+            "constraints_info": ["<=", "<="],
+        }
+        solver = ExactSimplexMethod(variables)
+        solver.solve()
+        self.assertTrue(solver.certified)
+        self.assertEqual(solver.exact_x, [1, 1])
+        self.assertEqual(solver.exact_objective, 2)
+
+    def test_cold_start_matches_float_start(self):
+        # Données mal échelonnées : coefficients de 1e-6 à 1e6
+        variables = {
+            "tab_optimisation": [0, 1e-6, 2.5, 1e3],
+            "nombres_variables_base": 3,
+            "equations": {
+                "equation_1": [1e6, 1e6, 3, 1e-3],
+                "equation_2": [7, 1e-6, 1, 2e3],
+                "equation_3": [0.5, 1, 0, 1e-6],
+            },
+            "nb_equations": 3,
+            "constraints_info": ["<=", "<=", ">="],
+        }
+        warm = ExactSimplexMethod(copy.deepcopy(variables))
+        cold = ExactSimplexMethod(copy.deepcopy(variables), float_start=False)
+        warm.solve()
+        cold.solve()
+        self.assertTrue(warm.certified and cold.certified)
+        self.assertEqual(warm.exact_objective, cold.exact_objective)
+        reference = RevisedSimplexMethod(copy.deepcopy(variables)).solve()
+        self.assertAlmostEqual(float(warm.exact_objective), reference.objective, places=6)
+
+    def test_wrong_warm_start_is_repaired(self):
+        solver = ExactSimplexMethod(probleme(), warm_start=["s1", "s2", "x1"])
+        solver.solve()
+        self.assertTrue(solver.certified)
+        self.assertEqual(solver.exact_objective, 36)
+
+    def test_infeasible_and_unbounded(self):
+        infeasible = probleme()
+        infeasible["equations"]["equation_3"] = [40, 3, 2]
+        self.assertEqual(ExactSimplexMethod(infeasible).solve().status, "infeasible")
+
+        unbounded = {
+            "tab_optimisation": [0, 1, 1],
+            "nombres_variables_base": 2,
+            "equations": {"equation_1": [1, 1, -1]},
+            "nb_equations": 1,
+            "constraints_info": ["<="],
+        }
+        self.assertEqual(ExactSimplexMethod(unbounded, float_start=False).solve().status, "unbounded")
+
+
+if __name__ == "__main__":
+    unittest.main()
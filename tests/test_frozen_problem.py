@@ -0,0 +1,88 @@
+import unittest
+import contextlib
+import copy
+import io
+import pickle
+import threading
+
+from frozen_problem import FrozenProblem, freeze_problem
+from method_selection import METHODS
+from dual_method import DualMethod
+from presolve import Presolve
+from sparse_problem import SparseProblem
+from exemples import probleme_cours
+
+
+def probleme():
+    # Exemple du cours, la troisième contrainte en égalité
+    return probleme_cours(("<=", "<=", "="))
+
+
+class TestFrozenProblem(unittest.TestCase):
+
+    def test_read_only(self):
+        frozen = freeze_problem(probleme())
+        self.assertIs(freeze_problem(frozen), frozen)
+        self.assertIs(copy.deepcopy(frozen), frozen)
+        with self.assertRaises(TypeError):
+            frozen["nb_equations"] = 4
+        with self.assertRaises(TypeError):
+            frozen["equations"]["equation_4"] = [1, 1, 1]
+        with self.assertRaises(ValueError):
+            frozen["equations"]["equation_1"][0] = 5
+        with self.assertRaises(ValueError):
+            frozen["tab_optimisation"][1] = 0
+        self.assertEqual(frozen.to_variables(), probleme())
+        self.assertEqual(pickle.loads(pickle.dumps(frozen)).to_variables(), probleme())
+
+    def test_every_method_solves_the_shared_problem(self):
+        frozen = freeze_problem(probleme())
+        for key, (name, cls) in METHODS.items():
+            with self.subTest(method=name):
+                if key == "1":
+                    # Égalité : le simplexe standard renvoie vers une méthode à phase 1
+                    with self.assertRaisesRegex(ValueError, "Deux Phases"):
+                        cls(frozen).solve()
+                    continue
+                result = cls(frozen).solve()
+                self.assertTrue(result.is_optimal)
+                self.assertAlmostEqual(result.objective, 36.0, places=6)
+        reduced = Presolve(frozen).run()
+        self.assertIsInstance(SparseProblem.from_variables(frozen), SparseProblem)
+        self.assertEqual(reduced["nombres_variables_base"], 2)
+
+    def test_concurrent_solves_share_the_data(self):
+        frozen = freeze_problem(probleme())
+        objectives = []
+
+        def solve(cls):
+            objectives.append(cls(frozen).solve().objective)
+
+        threads = [threading.Thread(target=solve, args=(cls,)) for key, (_, cls) in METHODS.items() if key != "1"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(objectives), len(threads))
+        for value in objectives:
+            self.assertAlmostEqual(value, 36.0, places=6)
+        # L'analyse duale suppose un primal en <= (duales y >= 0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            analyzer = DualMethod(freeze_problem(probleme() | {"constraints_info": ["<=", "<=", "<="]}))
+            analyzer.run_complete_analysis()
+        self.assertAlmostEqual(analyzer.primal_solver.result.objective, 36.0)
+
+    def test_copy_on_write(self):
+        frozen = freeze_problem(probleme())
+        changed = frozen.replace(tab_optimisation=[0, 4, 5])
+        self.assertIs(changed.rows, frozen.rows)
+        self.assertEqual(list(frozen["tab_optimisation"]), [0, 3, 5])
+        self.assertAlmostEqual(METHODS["3"][1](changed).solve().objective, 38.0)
+        grown = frozen.replace(equations={**probleme()["equations"], "equation_4": [1, 1, 0]},
+                               constraints_info=["<=", "<=", "=", ">="])
+        self.assertIsInstance(grown, FrozenProblem)
+        self.assertEqual(grown["nb_equations"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
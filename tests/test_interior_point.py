@@ -0,0 +1,70 @@
+import unittest
+import copy
+
+import numpy as np
+
+from interior_point import InteriorPointMethod
+from revised_method import RevisedSimplexMethod
+from sparse_problem import SparseProblem
+from exemples import probleme_cours
+
+
+class TestInteriorPointMethod(unittest.TestCase):
+
+    def test_crossover_gives_vertex_and_duals(self):
+        variables = probleme_cours()
+        solver = InteriorPointMethod(variables)
+        result = solver.solve()
+        self.assertEqual(variables, probleme_cours())
+        self.assertEqual(result.method, "Point Intérieur")
+        self.assertTrue(solver.converged)
+        self.assertTrue(solver.crossover_warm)
+        self.assertAlmostEqual(result.objective, 36.0)
+        np.testing.assert_allclose(result.x, [2, 6], atol=1e-9)
+        np.testing.assert_allclose(result.duals, [0, 1.5, 1], atol=1e-9)
+        self.assertEqual(sorted(result.basis), ["s1", "x1", "x2"])
+        self.assertIn("crossover", result.timings)
+
+    def test_without_crossover(self):
+        variables = probleme_cours()
+        variables["constraints_info"] = ["<=", "<=", "="]
+        variables["equations"]["equation_4"] = [1, 1, 0]
+        variables["nb_equations"] = 4
+        variables["constraints_info"].append(">=")
+        result = InteriorPointMethod(variables, crossover=False).solve()
+        self.assertEqual(result.status, "optimal")
+        self.assertEqual(result.basis, [])
+        self.assertAlmostEqual(result.objective, 36.0, places=6)
+        np.testing.assert_allclose(result.x, [2, 6], atol=1e-6)
+
+    def test_matches_revised_simplex(self):
+        rng = np.random.default_rng(3)
+        for _ in range(30):
+            n, m = 5, 4
+            rows, cols = np.nonzero(rng.random((m, n)) < 0.6)
+            problem = SparseProblem(n, rows, cols, rng.integers(1, 6, len(rows)), rng.integers(5, 30, m),
+                                    rng.integers(-2, 8, n), rng.choice(["<=", "<=", ">=", "="], m).tolist())
+            with self.subTest(problem=problem.to_json_dict()):
+                expected = RevisedSimplexMethod(problem).solve()
+                result = InteriorPointMethod(problem).solve()
+                self.assertEqual(result.status, expected.status)
+                if expected.is_optimal:
+                    self.assertAlmostEqual(result.objective, expected.objective, places=6)
+
+    def test_infeasible_and_unbounded(self):
+        infeasible = probleme_cours()
+        infeasible["equations"]["equation_4"] = [20, 1, 1]
+        infeasible["nb_equations"] = 4
+        infeasible["constraints_info"] = ["<=", "<=", "<=", ">="]
+        solver = InteriorPointMethod(infeasible, crossover=False)
+        self.assertEqual(solver.solve().status, "infeasible")
+        self.assertFalse(solver.converged)
+
+        unbounded = copy.deepcopy(probleme_cours())
+        unbounded["equations"]["equation_2"] = [12, 0, -2]
+        unbounded["equations"]["equation_3"] = [18, 3, -2]
+        self.assertEqual(InteriorPointMethod(unbounded).solve().status, "unbounded")
+
+
+if __name__ == "__main__":
+    unittest.main()
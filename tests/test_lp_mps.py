@@ -0,0 +1,157 @@
+import unittest
+import io
+import os
+import tempfile
+
+import numpy as np
+
+from lp_mps import ProblemNames, read_lp, read_mps, read_problem, read_solution, write_lp, write_mps, \
+    write_problem, write_solution
+from bounded_method import BoundedSimplexMethod
+from method_selection import solve_auto
+from sparse_problem import SparseProblem
+
+LP_TEXT = r"""\ Exemple du cours, avec une contrainte à intervalle
+Maximize
+ obj: 3 x1 + 5x2
+   + 0 x3 + 7
+Subject To
+ c1: x1 <= 4
+ c2: 2 x2
+   <= 12 c3: 3 x1 + 2 x2 = 18
+ r: -2 <= x1 - x3 <= 8
+Bounds
+ x3 <= 5
+ 0 <= x2 <= 1e30
+Binary
+ y
+End
+"""
+
+MPS_TEXT = """NAME          TESTLP
+* Minimisation, marqueurs d'intégrité et intervalle (colonnes du format fixe)
+ROWS
+ N  COST
+ L  LIM1
+ G  LIM2
+ E  MYEQN
+COLUMNS
+    X1        COST               1.0   LIM1               1.0
+    X1        LIM2               1.0
+    MARKER    'MARKER'                 'INTORG'
+    X2        COST               2.0   LIM1               1.0
+    X2        MYEQN             -1.0
+    MARKER    'MARKER'                 'INTEND'
+    X3        COST              -1.0   MYEQN              1.0
+RHS
+    RHS       LIM1               4.0   LIM2               1.0
+    RHS       MYEQN              7.0
+RANGES
+    RNG       LIM1               2.5
+BOUNDS
+ UP BND       X1                 4.0
+ LO BND       X2                -1.0
+ UP BND       X2                 1.0
+ENDATA
+"""
+
+
+def roundtrip(writer, reader, problem, names, **options):
+    buffer = io.StringIO()
+    writer(problem, buffer, names, **options)
+    buffer.seek(0)
+    return reader(buffer, **options)
+
+
+class TestLPFormat(unittest.TestCase):
+
+    def test_read_lp(self):
+        problem, names = read_lp(io.StringIO(LP_TEXT))
+        self.assertEqual(names.variables, ["x1", "x2", "x3", "y"])
+        self.assertEqual(names.constraints, ["c1", "c2", "c3", "r", "r_haut"])
+        variables = problem.to_variables()
+        self.assertEqual(variables["tab_optimisation"], [7.0, 3.0, 5.0, 0.0, 0.0])
+        self.assertEqual(variables["equations"]["equation_4"], [-2.0, 1.0, 0.0, -1.0, 0.0])
+        self.assertEqual(variables["constraints_info"], ["<=", "<=", "=", ">=", "<="])
+        self.assertEqual(variables["bounds"], [[0.0, None], [0.0, None], [0.0, 5.0], [0.0, 1.0]])
+        result = BoundedSimplexMethod(problem).solve()
+        self.assertAlmostEqual(result.objective, 43.0)
+
+    def test_lp_round_trip(self):
+        problem, names = read_lp(io.StringIO(LP_TEXT))
+        again, again_names = roundtrip(write_lp, read_lp, problem, names)
+        self.assertEqual(again.to_variables(), problem.to_variables())
+        self.assertEqual(again_names, names)
+
+    def test_zero_cost_and_unused_columns(self):
+        # x1 sans coût, x3 sans coût ni coefficient ni borne : l'ordre et le nombre de colonnes sont conservés
+        problem = SparseProblem(4, [0, 0, 1], [1, 3, 0], [1.0, 2.0, -1.0], [4.0, 2.0], [0.0, 3.0, 0.0, 1.0],
+                                constraints_info=["<=", ">="], objective_type="min")
+        names = ProblemNames.default(problem)
+        for writer, reader in ((write_lp, read_lp), (write_mps, read_mps)):
+            with self.subTest(writer=writer.__name__):
+                again, again_names = roundtrip(writer, reader, problem, names)
+                self.assertEqual(again.n, 4)
+                self.assertEqual(again_names.variables, names.variables)
+                self.assertEqual(again.to_variables(), problem.to_variables())
+
+    def test_unsupported_lp(self):
+        with self.assertRaisesRegex(ValueError, "Ligne 4"):
+            read_lp(io.StringIO("Minimize\n obj: x\nSubject To\n c1: [ x ^ 2 ] <= 4\nEnd\n"))
+        with self.assertRaisesRegex(ValueError, "infinie"):
+            read_lp(io.StringIO("Minimize\n obj: x\nSubject To\n c1: x >= 1\nBounds\n x free\nEnd\n"))
+
+
+class TestMPSFormat(unittest.TestCase):
+
+    def test_read_mps(self):
+        for fixed in (False, True):
+            with self.subTest(fixed=fixed):
+                problem, names = read_mps(io.StringIO(MPS_TEXT), fixed=fixed)
+                self.assertEqual(names.name, "TESTLP")
+                self.assertEqual(names.constraints, ["LIM1", "LIM2", "MYEQN", "LIM1_haut"])
+                self.assertEqual(problem.objective_type, "min")
+                self.assertEqual(problem.c.tolist(), [-1.0, -2.0, 1.0])
+                self.assertEqual(problem.b.tolist(), [1.5, 1.0, 7.0, 4.0])
+                self.assertEqual(problem.lower.tolist(), [0.0, -1.0, 0.0])
+                result = solve_auto(problem)
+                self.assertAlmostEqual(-result.objective, -5.5)
+
+    def test_mps_round_trip(self):
+        problem, names = read_lp(io.StringIO(LP_TEXT))
+        for fixed in (False, True):
+            with self.subTest(fixed=fixed):
+                again, again_names = roundtrip(write_mps, read_mps, problem, names, fixed=fixed)
+                self.assertEqual(again.to_variables(), problem.to_variables())
+                self.assertEqual(again_names.constraints, names.constraints)
+        with self.assertRaises(ValueError):
+            write_mps(problem, io.StringIO(), ProblemNames("P", ["une_variable_longue"] + names.variables[1:],
+                                                         names.constraints), fixed=True)
+
+    def test_files_and_solutions(self):
+        rng = np.random.default_rng(5)
+        m, n, nnz = 40, 60, 400
+        keys = rng.choice(m * n, nnz, replace=False)
+        costs = rng.random(n)
+        costs[::7] = 0.0
+        problem = SparseProblem(n, keys // n, keys % n, rng.random(nnz) + 0.1, rng.random(m) * 10 + 1, costs)
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ("modele.mps.gz", "modele.lp"):
+                path = os.path.join(directory, name)
+                write_problem(problem, path)
+                again, names = read_problem(path)
+                np.testing.assert_array_equal(again.vals, problem.vals)
+                np.testing.assert_array_equal(again.b, problem.b)
+                np.testing.assert_array_equal(again.c, problem.c)
+                self.assertEqual(names.variables, ProblemNames.default(problem).variables)
+            result = solve_auto(again)
+            path = os.path.join(directory, "modele.sol")
+            write_solution(result, path, names, again)
+            objective, values = read_solution(path)
+        self.assertAlmostEqual(objective, result.objective)
+        self.assertEqual(list(values), names.variables)
+        self.assertEqual(list(values.values()), result.x)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+import numpy as np
+
+from method_selection import analyze_problem, select_method, solve_auto
+from sparse_problem import SparseProblem
+from exemples import probleme_cours
+
+
+def probleme(costs, rhs, constraints):
+    return probleme_cours(constraints, capacity=rhs, costs=costs)
+
+
+def grand_probleme_creux(m=400, n=1000, density=0.005, seed=0):
+    rng = np.random.default_rng(seed)
+    nnz = int(m * n * density)
+    rows = np.concatenate([np.arange(m), rng.integers(0, m, nnz)])
+    cols = np.concatenate([rng.integers(0, n, m), rng.integers(0, n, nnz)])
+    vals = rng.uniform(1, 10, len(rows))
+    return SparseProblem(n, rows, cols, vals, rng.uniform(10, 100, m), rng.uniform(1, 10, n))
+
+
+class TestMethodSelection(unittest.TestCase):
+
+    def test_small_problems(self):
+        self.assertEqual(select_method(probleme([3, 5], 18, ["<=", "<=", "<="])).key, "1")
+        choice = select_method(probleme([3, 5], 18, ["<=", "<=", "="]))
+        self.assertEqual(choice.key, "3")
+        self.assertTrue(any("Grand M" in reason for reason in choice.reasons))
+
+    def test_dual_feasible_problem_uses_dual_simplex(self):
+        # Min 3x1 + 5x2 écrit en maximisation : coûts <= 0, contraintes >=
+        choice = select_method(probleme([-3, -5], 18, [">=", ">=", ">="]))
+        self.assertEqual(choice.key, "5")
+        result = solve_auto(probleme([-3, -5], 18, [">=", ">=", ">="]))
+        self.assertTrue(result.is_optimal)
+        self.assertEqual(result.selection.key, "5")
+
+    def test_degenerate_problem_uses_bland(self):
+        variables = probleme([3, 5], 0, ["<=", "<=", "<="])
+        features = analyze_problem(variables)
+        self.assertEqual(features.zero_rhs, 1)
+        choice = select_method(variables)
+        self.assertEqual((choice.key, choice.options), ("1", {"pricing": "bland"}))
+        self.assertTrue(solve_auto(variables).is_optimal)
+
+    def test_structure_of_sparse_problems(self):
+        large = grand_probleme_creux()
+        self.assertEqual(select_method(large).key, "8")
+        small = SparseProblem.from_variables(probleme([3, 5], 18, ["<=", "<=", "<="]))
+        self.assertEqual(select_method(small).key, "4")
+        bounded = SparseProblem(small.n, small.rows, small.cols, small.vals, small.b, small.c,
+                                upper=[2.0, np.inf])
+        choice = select_method(bounded)
+        self.assertEqual(choice.key, "7")
+        self.assertIn("Simplexe Borné", choice.summary())
+
+
+if __name__ == "__main__":
+    unittest.main()
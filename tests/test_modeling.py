@@ -0,0 +1,110 @@
+import unittest
+
+import numpy as np
+
+from modeling import Model
+from problem import Problem
+from exemples import probleme_cours
+
+
+def probleme():
+    # Exemple du cours, la troisième contrainte en égalité
+    return probleme_cours(("<=", "<=", "="))
+
+
+class TestModeling(unittest.TestCase):
+
+    def test_compiles_to_the_usual_problem(self):
+        model = Model()
+        x1, x2 = model.add_var("x1"), model.add_var("x2")
+        model.add(x1 <= 4)
+        model.add(2 * x2 <= 12)
+        row = model.add(18 == 3 * x1 + x2 + x2)
+        model.maximize(3 * x1 + 5 * x2)
+        self.assertEqual(row, 2)
+        self.assertEqual(model.to_problem(), Problem.from_variables(probleme()))
+        for method in ("2", "3", "4", "6"):
+            with self.subTest(method=method):
+                result = model.solve(method)
+                self.assertAlmostEqual(result.objective, 36.0)
+                self.assertAlmostEqual(x2.value(result), 6.0)
+        self.assertEqual(model.solve().selection.key, "4")
+
+    def test_families_and_minimization(self):
+        model = Model()
+        z = model.add_vars("z", ["a", "b"], ub=[5, None])
+        model.add(z.sum() >= 3)
+        model.add(np.array([1.0, -1.0]) @ z <= 1)
+        model.minimize(2 * z["a"] + 3 * z["b"] + 1)
+        compiled = model.compile()
+        self.assertEqual(compiled.objective_type, "min")
+        self.assertEqual(compiled.c.tolist(), [-2.0, -3.0])
+        self.assertEqual(model.variable_names(), ["z[a]", "z[b]"])
+        for method in (None, "3"):
+            with self.subTest(method=method):
+                result = model.solve(method)
+                self.assertAlmostEqual(model.objective_value(result), 8.0)
+                np.testing.assert_allclose(z.values(result), [2.0, 1.0], atol=1e-8)
+
+    def test_vectorized_blocks(self):
+        rng = np.random.default_rng(3)
+        model = Model()
+        y = model.add_vars("y", (4, 5), ub=2)
+        A = rng.integers(0, 3, size=(6, 20)).astype(float)
+        rows = model.add(A @ y + y.sparse_product([0, 5], [0, 19], [1.0, 1.0], 6) <= 10)
+        model.add(y * 2 >= 0.5)
+        objective = 0
+        for k in range(20):
+            objective += y[divmod(k, 5)]
+        model.maximize(objective)
+        self.assertEqual(rows, range(0, 6))
+        compiled = model.compile()
+        self.assertEqual(compiled.m, 26)
+        expected = A.copy()
+        expected[0, 0] += 1
+        expected[5, 19] += 1
+        np.testing.assert_array_equal(Problem.from_sparse(compiled).A[:6], expected)
+        self.assertEqual(y.label(7), "y[1,2]")
+        result = model.solve("4")
+        self.assertEqual(result.status, "optimal")
+        self.assertTrue((y.values(result) <= 2 + 1e-9).all())
+
+    def test_sums_share_term_storage(self):
+        model = Model()
+        y = model.add_vars("y", 20000)
+        total = sum(2 * v for v in y)
+        cols, coefs = total.terms()
+        np.testing.assert_array_equal(cols, np.arange(20000))
+        self.assertTrue((coefs == 2.0).all())
+        # a + b prolonge la liste de a sans la recopier, et a reste inchangé
+        x, z, w = y[0], y[1], y[2]
+        e = x + z
+        f = e + w
+        self.assertIs(f._cols, e._cols)
+        g = e - x
+        e += 3 * w
+        self.assertEqual(f.terms()[0].tolist(), [0, 1, 2])
+        self.assertEqual(g.terms()[1].tolist(), [1.0, 1.0, -1.0])
+        self.assertEqual(e.terms()[1].tolist(), [1.0, 1.0, 3.0])
+
+    def test_invalid_input(self):
+        model = Model()
+        x = model.add_var("x")
+        with self.assertRaises(ValueError):
+            model.add_var("x")
+        with self.assertRaises(TypeError):
+            model.add(3 <= 5)
+        # 2 <= x <= 4 ne garderait que x <= 4
+        with self.assertRaises(TypeError):
+            model.add(2 <= x <= 4)
+        with self.assertRaises(TypeError):
+            bool(Model().add_vars("t", 3) <= 1)
+        other = Model()
+        other.add_var("u")
+        foreign = other.add_var("v")
+        with self.assertRaises(ValueError):
+            model.add(x + foreign <= 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
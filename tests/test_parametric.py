@@ -0,0 +1,95 @@
+import unittest
+import copy
+
+from parametric import parametric_analysis
+from revised_method import RevisedSimplexMethod
+from exemples import probleme_cours
+
+
+class TestParametric(unittest.TestCase):
+
+    def test_rhs_sweep_breakpoints(self):
+        variables = probleme_cours()
+        curve = parametric_analysis(variables, [0, 0, 1], "rhs", theta_min=-18, theta_max=20)
+        self.assertEqual(curve.status, "optimal")
+        self.assertEqual(curve.pivots, 2)
+        thetas, values = curve.points()
+        self.assertEqual([round(t, 9) for t in thetas], [-18, -6, 6, 20])
+        self.assertEqual([round(v, 9) for v in values], [0, 30, 36 + 6, 42])
+        self.assertAlmostEqual(curve.value(0), 36.0)
+        self.assertEqual(variables, probleme_cours())
+
+    def test_cost_sweep_matches_cold_solves(self):
+        variables = probleme_cours()
+        curve = parametric_analysis(variables, [1, 0], "cost", theta_max=10)
+        self.assertEqual([round(t, 9) for t in curve.breakpoints], [0, 4.5, 10])
+        for theta in (0, 2, 4.5, 7, 10):
+            changed = copy.deepcopy(variables)
+            changed["tab_optimisation"][1] += theta
+            self.assertAlmostEqual(curve.value(theta), RevisedSimplexMethod(changed).solve().objective)
+
+    def test_curve_starts_where_problem_becomes_feasible(self):
+        # x1 + x2 >= 6 - θ avec x1 + x2 <= 4 : réalisable à partir de θ = 2
+        variables = {
+            "tab_optimisation": [0, -1, -2],
+            "nombres_variables_base": 2,
+            "equations": {"equation_1": [6, 1, 1], "equation_2": [4, 1, 1]},
+            "nb_equations": 2,
+            "constraints_info": [">=", "<="],
+        }
+        curve = parametric_analysis(variables, [-1, 0], "rhs", theta_max=5)
+        self.assertAlmostEqual(curve.breakpoints[0], 2.0, places=6)
+        self.assertAlmostEqual(curve.value(5), -1.0)
+
+    def test_curve_keeps_the_first_feasible_theta(self):
+        # 3x1 + 5x2 = θ : réalisable à partir de θ = 0, point où la courbe doit commencer
+        variables = {
+            "tab_optimisation": [0, 3, 5],
+            "nombres_variables_base": 2,
+            "equations": {"equation_1": [10, 3, 0], "equation_2": [10, 0, 2], "equation_3": [0, 3, 5]},
+            "nb_equations": 3,
+            "constraints_info": ["<=", "<=", "="],
+        }
+        curve = parametric_analysis(variables, [-1, -1, 1], "rhs", theta_min=-5, theta_max=5)
+        self.assertEqual(curve.status, "optimal")
+        self.assertAlmostEqual(curve.breakpoints[0], 0.0, places=9)
+        self.assertTrue(all(s.theta_end > s.theta_start for s in curve.segments))
+        self.assertAlmostEqual(curve.value(0), 0.0, places=6)
+        self.assertAlmostEqual(curve.value(5), 5.0, places=6)
+
+    def test_curve_reaches_the_last_feasible_theta(self):
+        # x1 >= -2 - θ et 3x1 <= -θ : réalisable pour θ ∈ [-3, 0], Z(0) = 2,4
+        variables = {
+            "tab_optimisation": [0, 3, 2],
+            "nombres_variables_base": 2,
+            "equations": {"equation_1": [6, 0, 5], "equation_2": [10, 1, -1], "equation_3": [0, 3, 0],
+                          "equation_4": [-2, 1, 0]},
+            "nb_equations": 4,
+            "constraints_info": ["<=", "<=", "<=", ">="],
+        }
+        curve = parametric_analysis(variables, [1, -1, -1, -1], "rhs", theta_min=-5, theta_max=0)
+        self.assertEqual(curve.status, "optimal")
+        self.assertEqual(curve.breakpoints[-1], 0)
+        self.assertAlmostEqual(curve.value(-3), 4.2, places=6)
+        self.assertAlmostEqual(curve.value(0), 2.4, places=6)
+        curve = parametric_analysis(variables, [1, -1, -1, -1], "rhs", theta_min=-5, theta_max=5)
+        self.assertEqual(curve.status, "infeasible")
+        self.assertAlmostEqual(curve.value(0), 2.4, places=6)
+
+    def test_unbounded_beyond_breakpoint(self):
+        # Max x1 + (θ - 1) x2, x1 <= 4, x1 - x2 <= 2 : x2 n'est plus borné dès que θ > 1
+        variables = {
+            "tab_optimisation": [0, 1, -1],
+            "nombres_variables_base": 2,
+            "equations": {"equation_1": [4, 1, 0], "equation_2": [2, 1, -1]},
+            "nb_equations": 2,
+            "constraints_info": ["<=", "<="],
+        }
+        curve = parametric_analysis(variables, [0, 1], "cost", theta_max=3)
+        self.assertEqual(curve.status, "unbounded")
+        self.assertEqual([round(t, 9) for t in curve.breakpoints], [0, 1])
+        self.assertAlmostEqual(curve.value(0), 2.0)
+        self.assertAlmostEqual(curve.value(1), 4.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import copy
+
+from presolve import Presolve, solve_with_presolve
+from two_phase_method import TwoPhaseMethod
+from revised_method import RevisedSimplexMethod
+
+
+def probleme():
+    # Max Z = 3x1 + 5x2 + x3 ; x1 <= 4 ; 2x2 <= 12 ; 3x1 + 2x2 <= 18 ;
+    # 6x1 + 4x2 <= 40 (double moins serré) ; x3 = 2 ; x2 + x4 = 5 (x4 : écart implicite)
+    return {
+        "tab_optimisation": [0, 3, 5, 1, 0],
+        "nombres_variables_base": 4,
+        "equations": {
+            "equation_1": [4, 1, 0, 0, 0],
+            "equation_2": [12, 0, 2, 0, 0],
+            "equation_3": [18, 3, 2, 0, 0],
+            "equation_4": [40, 6, 4, 0, 0],
+            "equation_5": [2, 0, 0, 1, 0],
+            "equation_6": [5, 0, 1, 0, 1],
+        },
+        "nb_equations": 6,
+        "constraints_info": ["<=", "<=", "<=", "<=", "=", "="],
+    }
+
+
+class TestPresolve(unittest.TestCase):
+
+    def test_reductions_and_postsolve(self):
+        variables = probleme()
+        presolve = Presolve(variables)
+        reduced = presolve.run()
+        self.assertEqual(reduced["nb_equations"], 3)
+        self.assertEqual(reduced["nombres_variables_base"], 2)
+        self.assertEqual(presolve.counts["duplicate_rows"], 2)
+        self.assertEqual(presolve.counts["fixed_variables"], 1)
+        self.assertEqual(presolve.counts["singleton_columns"], 1)
+        self.assertIn("Contraintes: 6 → 3 (-50.0%)", presolve.report())
+
+        result = presolve.postsolve(TwoPhaseMethod(reduced).solve())
+        reference = RevisedSimplexMethod(copy.deepcopy(variables)).solve()
+        self.assertEqual(result.status, "optimal")
+        self.assertAlmostEqual(result.objective, reference.objective)
+        for value, expected in zip(result.x, reference.x):
+            self.assertAlmostEqual(value, expected)
+        for value, expected in zip(result.duals, reference.duals):
+            self.assertAlmostEqual(value, expected)
+        self.assertEqual(len(result.basis), 6)
+        self.assertEqual(variables, probleme())
+
+    def test_early_infeasibility(self):
+        variables = probleme()
+        variables["equations"]["equation_5"] = [-2, 0, 0, 1, 0]
+        presolve = Presolve(variables)
+        self.assertIsNone(presolve.run())
+        self.assertEqual(presolve.status, "infeasible")
+        self.assertEqual(presolve.postsolve().status, "infeasible")
+
+    def test_unbounded_column_needs_feasibility(self):
+        # x3 augmente Z et ne fait que relâcher la contrainte 1
+        variables = {
+            "tab_optimisation": [0, 1, 1, 2],
+            "nombres_variables_base": 3,
+            "equations": {"equation_1": [4, 1, 1, -1], "equation_2": [3, 1, 0, 0]},
+            "nb_equations": 2,
+            "constraints_info": ["<=", "<="],
+        }
+        self.assertEqual(solve_with_presolve(variables, RevisedSimplexMethod).status, "unbounded")
+
+        variables["equations"]["equation_2"] = [-3, 1, 0, 0]
+        self.assertEqual(solve_with_presolve(variables, RevisedSimplexMethod).status, "infeasible")
+
+    def test_fully_presolved(self):
+        # x1 = 3, x2 <= 0 : la présolve conclut sans solveur
+        variables = {
+            "tab_optimisation": [1, 2, 4],
+            "nombres_variables_base": 2,
+            "equations": {"equation_1": [3, 1, 0], "equation_2": [0, 0, 5]},
+            "nb_equations": 2,
+            "constraints_info": ["=", "<="],
+        }
+        presolve = Presolve(variables)
+        self.assertIsNone(presolve.run())
+        result = presolve.postsolve()
+        self.assertEqual(result.status, "optimal")
+        self.assertEqual(result.x, [3.0, 0.0])
+        self.assertAlmostEqual(result.objective, 7.0)
+        self.assertEqual(result.duals, [2.0, 0.8])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import copy
+
+import numpy as np
+
+from tab_method import SimplexMethodTab
+from grand_M_method import GrandMMethod
+from pricing import PRICING_RULES, BlandPricing, make_pricing
+
+
+def probleme_aleatoire(seed, n=20, m=15):
+    rng = np.random.default_rng(seed)
+    return {
+        "tab_optimisation": [0] + rng.integers(1, 8, n).tolist(),
+        "nombres_variables_base": n,
+        "equations": {f"equation_{i+1}": [50] + rng.integers(0, 6, n).tolist() for i in range(m)},
+        "nb_equations": m,
+    }
+
+
+class TestPricing(unittest.TestCase):
+
+    def test_all_rules_reach_same_optimum(self):
+        variables = probleme_aleatoire(0)
+        objectives = {key: SimplexMethodTab(copy.deepcopy(variables), pricing=key).solve().objective
+                      for key in PRICING_RULES}
+        for value in objectives.values():
+            self.assertAlmostEqual(value, objectives["dantzig"], places=6)
+
+    def test_grand_m_accepts_pricing(self):
+        variables = {
+            "tab_optimisation": [0, 3, 5],
+            "nombres_variables_base": 2,
+            "equations": {"equation_1": [4, 1, 0], "equation_2": [12, 0, 2], "equation_3": [18, 3, 2]},
+            "nb_equations": 3,
+            "constraints_info": ["<=", "<=", "="],
+        }
+        for key in PRICING_RULES:
+            with self.subTest(rule=key):
+                result = GrandMMethod(copy.deepcopy(variables), pricing=key).solve()
+                self.assertAlmostEqual(result.objective, 36.0)
+
+    def test_steepest_edge_weights_stay_exact(self):
+        solver = SimplexMethodTab(probleme_aleatoire(1), pricing="steepest_edge")
+        solver.solve()
+        columns = solver.engine.tableau[:solver.engine.m, 1:]
+        exact = 1.0 + (columns * columns).sum(axis=0)
+        nonbasic = np.setdiff1d(np.arange(columns.shape[1]), solver.engine.basis - 1)
+        np.testing.assert_allclose(solver.pricing.weights[nonbasic], exact[nonbasic], rtol=1e-8)
+
+    def test_bland_terminates_on_beale_cycling_example(self):
+        # Exemple de Beale : la règle de Dantzig y cycle indéfiniment
+        variables = {
+            "tab_optimisation": [0, 0.75, -20, 0.5, -6],
+            "nombres_variables_base": 4,
+            "equations": {
+                "equation_1": [0, 0.25, -8, -1, 9],
+                "equation_2": [0, 0.5, -12, -0.5, 3],
+                "equation_3": [1, 0, 0, 1, 0],
+            },
+            "nb_equations": 3,
+        }
+        result = SimplexMethodTab(variables, pricing=BlandPricing()).solve()
+        self.assertEqual(result.status, "optimal")
+        self.assertAlmostEqual(result.objective, 1.25)
+
+    def test_unknown_rule(self):
+        with self.assertRaises(ValueError):
+            make_pricing("plus_rapide")
+
+
+if __name__ == "__main__":
+    unittest.main()
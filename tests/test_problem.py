@@ -0,0 +1,77 @@
+import unittest
+import json
+import os
+
+import numpy as np
+
+from problem import Problem
+from frozen_problem import FrozenProblem, freeze_problem
+from method_selection import METHODS, solve_auto
+from batch_solve import problem_from_record
+from exemples import probleme_cours
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def probleme():
+    # Exemple du cours, la troisième contrainte en égalité
+    return probleme_cours(("<=", "<=", "="))
+
+
+class TestProblem(unittest.TestCase):
+
+    def test_arrays_and_slots(self):
+        problem = Problem.from_variables(probleme())
+        self.assertEqual((problem.m, problem.n, problem.nnz), (3, 2, 4))
+        np.testing.assert_array_equal(problem.A, [[1, 0], [0, 2], [3, 2]])
+        np.testing.assert_array_equal(problem.b, [4, 12, 18])
+        self.assertEqual(problem.constraints_info, ["<=", "<=", "="])
+        with self.assertRaises(AttributeError):
+            problem.equations = {}
+        variables = problem.to_variables()
+        self.assertEqual(variables["equations"], probleme()["equations"])
+        self.assertEqual(Problem.from_variables(variables), problem)
+        self.assertEqual(Problem.from_sparse(problem.to_sparse()), problem)
+        self.assertEqual(Problem.from_variables(freeze_problem(probleme())), problem)
+
+    def test_counts_out_of_sync(self):
+        for key, value in (("nb_equations", 4), ("constraints_info", ["<=", "<="]),
+                           ("tab_optimisation", [0, 3, 5, 1])):
+            with self.subTest(key=key):
+                with self.assertRaises(ValueError):
+                    Problem.from_variables({**probleme(), key: value})
+        broken = probleme()
+        broken["equations"]["equation_2"] = [12, 0]
+        with self.assertRaises(ValueError):
+            Problem.from_variables(broken)
+        with self.assertRaises(ValueError):
+            Problem([1, 2], [[1, 2, 3]], [4])
+        with self.assertRaises(ValueError):
+            Problem([1], [[1]], [4], senses=["<"])
+
+    def test_json_schema(self):
+        with open(os.path.join(ROOT, "probleme_test.json"), "r", encoding="utf-8") as f:
+            record = json.load(f)
+        problem = Problem.from_json_dict(record)
+        data = problem.to_json_dict(record["method"], record["timestamp"])
+        self.assertEqual(data["metadata"], record["metadata"])
+        for key in ("tab_optimisation", "equations", "nb_equations", "constraints_info"):
+            self.assertEqual(data["variables"][key], record["variables"][key])
+        self.assertEqual(Problem.from_json_dict(json.loads(json.dumps(data))), problem)
+        record["metadata"]["nb_contraintes"] = 5
+        with self.assertRaises(ValueError):
+            Problem.from_json_dict(record)
+
+    def test_solves_through_frozen_view(self):
+        problem = Problem.from_variables({**probleme(), "bounds": [[0, None], [0, 4.5]]})
+        frozen = problem.freeze()
+        self.assertIsInstance(frozen, FrozenProblem)
+        self.assertEqual(Problem.from_variables(frozen), problem)
+        self.assertAlmostEqual(METHODS["7"][1](frozen).solve().objective, 31.5)
+        plain = Problem.from_variables(probleme())
+        self.assertAlmostEqual(solve_auto(plain).objective, 36.0)
+        self.assertAlmostEqual(METHODS["3"][1](problem_from_record({"variables": probleme()})).solve().objective, 36.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
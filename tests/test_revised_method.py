@@ -0,0 +1,71 @@
+import unittest
+
+import numpy as np
+
+from basis_factor import BasisFactorization
+from revised_method import RevisedSimplexMethod
+
+
+class TestBasisFactorization(unittest.TestCase):
+
+    def test_ftran_btran_after_product_form_update(self):
+        rng = np.random.default_rng(1)
+        B = rng.normal(size=(5, 5))
+        a = rng.normal(size=5)
+        factor = BasisFactorization(B)
+
+        direction = rng.normal(size=5)
+        B[:, 3] = B @ direction
+        factor.update(3, direction)
+
+        np.testing.assert_allclose(B @ factor.ftran(a), a)
+        np.testing.assert_allclose(B.T @ factor.btran(a), a)
+
+
+class TestRevisedSimplexMethod(unittest.TestCase):
+
+    def test_standard_problem(self):
+        variables = {
+            "tab_optimisation": [0, 3, 5],
+            "nombres_variables_base": 2,
+            "equations": {
+                "equation_1": [4, 1, 0],
+                "equation_2": [12, 0, 2],
+                "equation_3": [18, 3, 2],
+            },
+            "nb_equations": 3,
+        }
+        solver = RevisedSimplexMethod(variables, refactor_every=1)
+        self.assertEqual(solver.solve().status, "optimal")
+        self.assertAlmostEqual(solver.z, 36.0)
+        np.testing.assert_allclose(solver.x[:2], [2.0, 6.0])
+        np.testing.assert_allclose(solver.duals, [0.0, 1.5, 1.0])
+
+    def test_equality_constraints_need_phase_one(self):
+        variables = {
+            "tab_optimisation": [0, -7, -6, -5],
+            "nombres_variables_base": 3,
+            "equations": {
+                "equation_1": [18, 3, 8, 6],
+                "equation_2": [15, 1, 2, 6],
+            },
+            "nb_equations": 2,
+            "constraints_info": ["=", "="],
+        }
+        solver = RevisedSimplexMethod(variables)
+        self.assertEqual(solver.solve().status, "optimal")
+        self.assertAlmostEqual(solver.z, -44.0 / 3.0)
+
+    def test_infeasible_problem(self):
+        variables = {
+            "tab_optimisation": [0, 1],
+            "nombres_variables_base": 1,
+            "equations": {"equation_1": [2, 1], "equation_2": [5, 1]},
+            "nb_equations": 2,
+            "constraints_info": ["<=", ">="],
+        }
+        self.assertEqual(RevisedSimplexMethod(variables).solve().status, "infeasible")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import copy
+
+import numpy as np
+
+from scaling import Scaling, solve_scaled
+from grand_M_method import GrandMMethod
+from revised_method import RevisedSimplexMethod
+from bounded_method import BoundedSimplexMethod
+
+
+def probleme():
+    # Max Z = 3000x1 + 0.005x2 ; 0.001x1 <= 4 ; 2e6 x2 <= 12e6 ; 0.003x1 + 2e-6 x2 >= 9
+    return {
+        "tab_optimisation": [0, 3000, 0.005],
+        "nombres_variables_base": 2,
+        "equations": {
+            "equation_1": [4, 0.001, 0],
+            "equation_2": [12e6, 0, 2e6],
+            "equation_3": [9, 0.003, 2e-6],
+        },
+        "nb_equations": 3,
+        "constraints_info": ["<=", "<=", ">="],
+    }
+
+
+class TestScaling(unittest.TestCase):
+
+    def test_scaled_coefficients(self):
+        variables = probleme()
+        scaling = Scaling(variables)
+        scaled = scaling.run()
+        self.assertEqual(variables, probleme())
+        # Facteurs puissances de 2 : mise à l'échelle exacte
+        for factor in np.concatenate([scaling.row_scale, scaling.col_scale]):
+            self.assertEqual(np.log2(factor), np.round(np.log2(factor)))
+        A = np.array([eq[1:] for eq in scaled["equations"].values()])
+        self.assertLessEqual(np.abs(A).max(), 2.0)
+        self.assertLess(scaling.after["spread"], 4.0)
+        self.assertLess(scaling.after["condition"], scaling.before["condition"] / 1e6)
+        self.assertIn("Dispersion des coefficients: 1e+12 →", scaling.report())
+
+    def test_unscaled_solution(self):
+        reference = RevisedSimplexMethod(probleme()).solve()
+        scaling = Scaling(probleme())
+        result = scaling.unscale(GrandMMethod(scaling.run()).solve())
+        self.assertEqual(result.status, "optimal")
+        self.assertAlmostEqual(result.objective, reference.objective, places=4)
+        np.testing.assert_allclose(result.x, [4000, 6])
+        np.testing.assert_allclose(result.duals, reference.duals, rtol=1e-9)
+        self.assertIn("scaling", result.timings)
+
+    def test_solve_scaled_statuses(self):
+        infeasible = copy.deepcopy(probleme())
+        infeasible["equations"]["equation_3"][0] = 18
+        self.assertEqual(solve_scaled(infeasible, RevisedSimplexMethod).status, "infeasible")
+        empty_column = probleme()
+        empty_column["tab_optimisation"].append(-1)
+        empty_column["nombres_variables_base"] = 3
+        for eq in empty_column["equations"].values():
+            eq.append(0)
+        result = solve_scaled(empty_column, RevisedSimplexMethod)
+        self.assertEqual(result.status, "optimal")
+        self.assertEqual(result.x[2], 0)
+
+    def test_bounds_are_scaled(self):
+        variables = probleme()
+        variables["bounds"] = [[0, 3000], [1, None]]
+        scaling = Scaling(variables)
+        scaled = scaling.run()
+        self.assertEqual(scaled["bounds"][0][1], 3000 / scaling.col_scale[0])
+        self.assertIsNone(scaled["bounds"][1][1])
+        result = scaling.unscale(BoundedSimplexMethod(scaled).solve())
+        np.testing.assert_allclose(result.x, [3000, 6])
+
+
+if __name__ == "__main__":
+    unittest.main()
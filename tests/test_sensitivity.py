@@ -0,0 +1,66 @@
+import unittest
+import copy
+import math
+
+from sensitivity import sensitivity_analysis
+from tab_method import SimplexMethodTab
+from grand_M_method import GrandMMethod
+from revised_method import RevisedSimplexMethod
+from exemples import probleme_cours
+
+
+class TestSensitivity(unittest.TestCase):
+
+    def test_textbook_ranges_from_tableau_basis(self):
+        variables = probleme_cours()
+        result = SimplexMethodTab(copy.deepcopy(variables)).solve()
+        report = sensitivity_analysis(variables, result)
+        self.assertAlmostEqual(report.objective, 36.0)
+        self.assertEqual([round(y, 9) for y in report.shadow_prices], [0.0, 1.5, 1.0])
+        self.assertEqual(report.reduced_costs, [0.0, 0.0])
+        self.assertAlmostEqual(report.rhs_ranges[0][0], 2.0)
+        self.assertEqual(report.rhs_ranges[0][1], math.inf)
+        self.assertEqual([tuple(round(v, 9) for v in r) for r in report.rhs_ranges[1:]], [(6.0, 18.0), (12.0, 24.0)])
+        self.assertEqual([round(v, 9) for v in report.cost_ranges[0]], [0.0, 7.5])
+        self.assertAlmostEqual(report.cost_ranges[1][0], 2.0)
+        self.assertEqual(report.cost_ranges[1][1], math.inf)
+        self.assertEqual(variables, probleme_cours())
+
+    def test_grand_m_basis_and_nonbasic_cost(self):
+        # Max Z = x1 + 4x2 - x3, x1 + x2 + x3 >= 2, x1 + 2x2 <= 6, x2 + x3 = 3
+        variables = {
+            "tab_optimisation": [0, 1, 4, -1],
+            "nombres_variables_base": 3,
+            "equations": {
+                "equation_1": [2, 1, 1, 1],
+                "equation_2": [6, 1, 2, 0],
+                "equation_3": [3, 0, 1, 1],
+            },
+            "nb_equations": 3,
+            "constraints_info": [">=", "<=", "="],
+        }
+        result = GrandMMethod(copy.deepcopy(variables)).solve()
+        report = sensitivity_analysis(variables, result)
+        reference = RevisedSimplexMethod(copy.deepcopy(variables)).solve()
+        self.assertAlmostEqual(report.objective, reference.objective)
+        for y, expected in zip(report.shadow_prices, reference.duals):
+            self.assertAlmostEqual(y, expected)
+
+        # Chaque borne d'intervalle finie garde la base : Z varie linéairement jusqu'à elle
+        for i, (low, high) in enumerate(report.rhs_ranges):
+            for bound in (low, high):
+                if math.isinf(bound):
+                    continue
+                changed = copy.deepcopy(variables)
+                delta = bound - changed["equations"][f"equation_{i+1}"][0]
+                changed["equations"][f"equation_{i+1}"][0] = bound
+                resolved = RevisedSimplexMethod(changed).solve()
+                self.assertAlmostEqual(resolved.objective, report.objective + report.shadow_prices[i] * delta)
+
+    def test_incomplete_basis(self):
+        with self.assertRaises(ValueError):
+            sensitivity_analysis(probleme_cours(), ["x1", "x2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
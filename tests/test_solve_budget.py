@@ -0,0 +1,73 @@
+import unittest
+import copy
+
+from tab_method import SimplexMethodTab
+from grand_M_method import GrandMMethod
+from two_phase_method import TwoPhaseMethod
+from revised_method import RevisedSimplexMethod
+from dual_simplex_method import DualSimplexMethod
+from exact_method import ExactSimplexMethod
+from interior_point import InteriorPointMethod
+from batch_solve import solve_record
+from solve_budget import CancellationToken, SolveBudget
+
+PROBLEME = {
+    "tab_optimisation": [0, 3, 5],
+    "nombres_variables_base": 2,
+    "equations": {
+        "equation_1": [4, 1, 0],
+        "equation_2": [12, 0, 2],
+        "equation_3": [18, 3, 2],
+    },
+    "nb_equations": 3,
+    "constraints_info": ["<=", "<=", "<="],
+}
+
+
+class TestSolveBudget(unittest.TestCase):
+
+    def test_budget(self):
+        token = CancellationToken()
+        budget = SolveBudget(max_iterations=3, token=token)
+        budget.begin()
+        self.assertIsNone(budget.exhausted(2))
+        self.assertEqual(budget.exhausted(3), "limit_reached")
+        token.cancel()
+        self.assertEqual(budget.exhausted(0), "cancelled")
+        self.assertIn("annulée", budget.reason)
+        self.assertIsNone(budget.remaining_time())
+
+    def test_cancelled_solvers_keep_last_basis(self):
+        token = CancellationToken()
+        token.cancel()
+        for cls in (SimplexMethodTab, GrandMMethod, TwoPhaseMethod, RevisedSimplexMethod,
+                    DualSimplexMethod, ExactSimplexMethod, InteriorPointMethod):
+            with self.subTest(method=cls.__name__):
+                result = cls(copy.deepcopy(PROBLEME), cancel=token).solve()
+                self.assertEqual(result.status, "cancelled")
+                self.assertFalse(result.is_optimal)
+                if cls is not InteriorPointMethod:
+                    # Le simplexe dual ajoute une ligne de borne artificielle (coûts positifs)
+                    self.assertGreaterEqual(len(result.basis), 3)
+
+    def test_iteration_limit_and_resume(self):
+        result = RevisedSimplexMethod(copy.deepcopy(PROBLEME), max_iterations=1).solve()
+        self.assertEqual((result.status, result.iterations), ("limit_reached", 1))
+        self.assertGreater(result.objective, 0)
+        # Reprise depuis la dernière base atteinte
+        resumed = RevisedSimplexMethod(copy.deepcopy(PROBLEME), warm_start=result.basis).solve()
+        self.assertTrue(resumed.is_optimal)
+        self.assertAlmostEqual(resumed.objective, 36)
+        self.assertLess(resumed.iterations, 3)
+
+    def test_time_limit(self):
+        for cls in (TwoPhaseMethod, DualSimplexMethod, ExactSimplexMethod):
+            with self.subTest(method=cls.__name__):
+                result = cls(copy.deepcopy(PROBLEME), time_limit=0).solve()
+                self.assertEqual(result.status, "limit_reached")
+        solved = solve_record(0, "test", {"variables": PROBLEME}, method="4", max_iterations=1)
+        self.assertEqual(solved["status"], "limit_reached")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import io
+import contextlib
+
+from tab_method import SimplexMethodTab
+from grand_M_method import GrandMMethod
+from dual_method import DualMethod
+from solver_events import IterationMetrics, SolverEvents
+from exemples import probleme_cours
+
+
+class TestSolverEvents(unittest.TestCase):
+
+    def test_empty_hub_is_falsy(self):
+        events = SolverEvents()
+        self.assertFalse(events)
+        callback = events.subscribe(lambda event: None)
+        self.assertTrue(events)
+        events.unsubscribe(callback)
+        self.assertFalse(events)
+
+    def test_simplex_emits_one_event_per_pivot(self):
+        events = []
+        solver = SimplexMethodTab(probleme_cours())
+        solver.subscribe(events.append)
+        result = solver.solve()
+        self.assertEqual(len(events), result.iterations)
+        self.assertEqual([e.iteration for e in events], list(range(1, result.iterations + 1)))
+        self.assertEqual(events[0].entering, "x2")
+        self.assertEqual(events[0].leaving, "s2")
+        self.assertAlmostEqual(events[-1].objective, 36.0)
+        self.assertEqual(events[-1].dual_infeasibility, 0.0)
+        self.assertTrue(all(e.elapsed >= 0 for e in events))
+
+    def test_grand_m_reports_artificial_infeasibility(self):
+        metrics = IterationMetrics()
+        solver = GrandMMethod(probleme_cours(("<=", "<=", "=")))
+        solver.subscribe(metrics)
+        solver.solve()
+        self.assertGreater(metrics.primal_infeasibility[0], 0.0)
+        self.assertEqual(metrics.primal_infeasibility[-1], 0.0)
+        self.assertAlmostEqual(metrics.objective[-1], 36.0)
+
+    def test_dual_method_forwards_both_solves(self):
+        events = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            analyzer = DualMethod(probleme_cours())
+            analyzer.subscribe(events.append)
+            analyzer.run_complete_analysis()
+        methods = {e.method for e in events}
+        self.assertEqual(methods, {"Simplexe Standard (primal)", "Simplexe Dual (dual)"})
+
+    def test_dual_method_solve_is_silent(self):
+        output = io.StringIO()
+        events = []
+        with contextlib.redirect_stdout(output):
+            analyzer = DualMethod(probleme_cours())
+            analyzer.subscribe(events.append)
+            primal, dual = analyzer.solve()
+        self.assertEqual(output.getvalue(), "")
+        self.assertAlmostEqual(primal.objective, 36.0)
+        self.assertAlmostEqual(-dual.objective, 36.0)
+        self.assertEqual(len(events), primal.iterations + dual.iterations)
+        self.assertIs(analyzer.dual_solver.result, dual)
+
+
+if __name__ == "__main__":
+    unittest.main()
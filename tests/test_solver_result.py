@@ -0,0 +1,93 @@
+import unittest
+import io
+import contextlib
+
+from tab_method import SimplexMethodTab
+from grand_M_method import GrandMMethod
+from two_phase_method import TwoPhaseMethod
+from revised_method import RevisedSimplexMethod
+from exemples import probleme_cours
+
+
+class TestSolveResult(unittest.TestCase):
+
+    def test_solve_is_silent_and_structured(self):
+        for method in (SimplexMethodTab, GrandMMethod, TwoPhaseMethod, RevisedSimplexMethod):
+            with self.subTest(method=method.__name__):
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    result = method(probleme_cours()).solve()
+                self.assertEqual(output.getvalue(), "")
+                self.assertEqual(result.status, "optimal")
+                self.assertAlmostEqual(result.objective, 36.0)
+                self.assertEqual([round(v, 6) for v in result.x], [2.0, 6.0])
+                self.assertEqual([round(v, 6) for v in result.duals], [0.0, 1.5, 1.0])
+                self.assertEqual(sorted(result.basis), ["s1", "x1", "x2"])
+                self.assertGreater(result.iterations, 0)
+                self.assertIn("total", result.timings)
+
+    def test_equality_duals_and_to_dict(self):
+        variables = probleme_cours(("<=", "<=", "="))
+        result = TwoPhaseMethod(variables).solve()
+        reference = RevisedSimplexMethod(probleme_cours(("<=", "<=", "="))).solve()
+        self.assertAlmostEqual(result.objective, reference.objective)
+        for a, b in zip(result.duals, reference.duals):
+            self.assertAlmostEqual(a, b)
+        data = result.to_dict()
+        self.assertEqual(data["method"], "Deux Phases")
+        self.assertEqual(data["status"], "optimal")
+
+    def test_infeasible_result_has_no_solution(self):
+        variables = {
+            "tab_optimisation": [0, 1, 1],
+            "nombres_variables_base": 2,
+            "equations": {"equation_1": [1, 1, 1], "equation_2": [3, 1, 1]},
+            "nb_equations": 2,
+            "constraints_info": ["<=", ">="],
+        }
+        result = TwoPhaseMethod(variables).solve()
+        self.assertEqual(result.status, "infeasible")
+        self.assertIsNone(result.objective)
+        self.assertIn("Statut: infeasible", result.summary())
+
+    def test_standard_simplex_needs_a_feasible_slack_basis(self):
+        # Max Z = x1 + 4x2 - x3, x1 + x2 + x3 >= 2, x1 + 2x2 <= 6, x2 + x3 = 3
+        variables = {
+            "tab_optimisation": [0, 1, 4, -1],
+            "nombres_variables_base": 3,
+            "equations": {"equation_1": [2, 1, 1, 1], "equation_2": [6, 1, 2, 0], "equation_3": [3, 0, 1, 1]},
+            "nb_equations": 3,
+            "constraints_info": [">=", "<=", "="],
+        }
+        with self.assertRaisesRegex(ValueError, "Deux Phases"):
+            SimplexMethodTab(variables).solve()
+        self.assertAlmostEqual(TwoPhaseMethod(variables).solve().objective, 12.0)
+        # -x1 - x2 <= -1 : second membre négatif, l'origine n'est pas réalisable
+        variables = probleme_cours() | {"equations": {"equation_1": [-1, -1, -1], "equation_2": [12, 0, 2],
+                                                "equation_3": [18, 3, 2]}}
+        with self.assertRaisesRegex(ValueError, "Second membre négatif"):
+            SimplexMethodTab(variables).solve()
+
+    def test_grand_m_artificial_in_basis(self):
+        # 0·x1 >= 3 : aucune ligne pivot, mais l'artificielle vaut encore 3
+        variables = {
+            "tab_optimisation": [0, 2],
+            "nombres_variables_base": 1,
+            "equations": {"equation_1": [3, 0]},
+            "nb_equations": 1,
+            "constraints_info": [">="],
+        }
+        self.assertEqual(GrandMMethod(variables).solve().status, "infeasible")
+        # -x1 >= 0 : l'artificielle reste en base à zéro, les prix duaux sont ceux des deux phases
+        variables["equations"]["equation_1"] = [0, -1]
+        variables["tab_optimisation"] = [0, 1]
+        for method in (GrandMMethod, TwoPhaseMethod):
+            with self.subTest(method=method.__name__):
+                result = method(variables).solve()
+                self.assertEqual(result.status, "optimal")
+                self.assertEqual(result.basis, ["x1"])
+                self.assertEqual(result.duals, [-1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
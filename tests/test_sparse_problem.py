@@ -0,0 +1,74 @@
+import unittest
+import io
+import os
+import contextlib
+import tempfile
+
+import numpy as np
+
+from sparse_problem import SparseProblem
+from revised_method import RevisedSimplexMethod
+from dual_method import DualMethod
+from enhanced_variables import VariableManager
+from exemples import probleme_cours
+
+
+class TestSparseProblem(unittest.TestCase):
+
+    def test_from_variables_drops_zeros_and_round_trips(self):
+        problem = SparseProblem.from_variables(probleme_cours())
+        self.assertEqual(problem.nnz, 4)
+        np.testing.assert_allclose(problem.column(1), [0, 2, 2])
+        np.testing.assert_allclose(problem.matvec([1, 1]), [1, 2, 5])
+        np.testing.assert_allclose(problem.rmatvec([1, 1, 1]), [4, 4])
+        self.assertEqual(problem.to_variables()["equations"]["equation_3"], [18.0, 3.0, 2.0])
+
+    def test_duplicate_triplets_are_summed(self):
+        problem = SparseProblem(2, [0, 0, 1], [1, 1, 0], [2.0, 3.0, 1.0], [1, 1], [1, 1])
+        np.testing.assert_allclose(problem.column(1), [5, 0])
+        np.testing.assert_allclose(problem.matvec([0, 1]), [5, 0])
+
+    def test_dual_is_a_transpose(self):
+        dual = SparseProblem.from_variables(probleme_cours()).dual()
+        self.assertEqual((dual.m, dual.n), (2, 3))
+        np.testing.assert_allclose(dual.column(2), [3, 2])
+        np.testing.assert_allclose(dual.c, [-4, -12, -18])
+
+    def test_revised_solver_on_sparse_problem(self):
+        # Problème diagonal : max sum x_j, x_j <= j+1 ; aucune colonne d'écart n'est stockée
+        n = 200
+        problem = SparseProblem(n, np.arange(n), np.arange(n), np.ones(n),
+                                np.arange(1, n + 1), np.ones(n))
+        solver = RevisedSimplexMethod(problem)
+        self.assertEqual(solver.solve().status, "optimal")
+        self.assertEqual(problem.nnz, n)
+        self.assertAlmostEqual(solver.z, n * (n + 1) / 2)
+
+    def test_sparse_dual_analysis(self):
+        problem = SparseProblem.from_variables(probleme_cours())
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            analyzer = DualMethod(problem)
+            primal = analyzer.solve_primal()
+            dual = analyzer.solve_dual()
+            analyzer.compare_solutions(primal, dual)
+        self.assertAlmostEqual(primal.z, -dual.z)
+        self.assertIn("dualité forte vérifié", output.getvalue())
+
+    def test_sparse_file_round_trip(self):
+        manager = VariableManager()
+        problem = SparseProblem.from_variables(probleme_cours())
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "creux.json")
+            with contextlib.redirect_stdout(io.StringIO()):
+                manager.save_sparse_to_file(problem, filename)
+                loaded = manager.load_sparse_from_file(filename)
+                dense = manager.load_from_file(filename)
+        np.testing.assert_allclose(loaded.vals, problem.vals)
+        self.assertEqual(dense["equations"], probleme_cours()["equations"])
+        # L'entrée d'historique se relit comme un problème dense
+        self.assertEqual(manager.get_problem(len(manager.history) - 1), dense)
+
+
+if __name__ == '__main__':
+    unittest.main()
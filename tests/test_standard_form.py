@@ -0,0 +1,60 @@
+import unittest
+import copy
+
+import numpy as np
+
+from standard_form import ARTIFICIAL, SLACK, SURPLUS, StandardForm
+from grand_M_method import GrandMMethod
+
+
+def probleme():
+    return {
+        "tab_optimisation": [0, 3, 5],
+        "nombres_variables_base": 2,
+        "equations": {
+            "equation_1": [4, 1, 0],
+            "equation_2": [-12, 0, -2],
+            "equation_3": [18, 3, 2],
+        },
+        "nb_equations": 3,
+        "constraints_info": ["<=", ">=", "="],
+    }
+
+
+class TestStandardForm(unittest.TestCase):
+
+    def test_column_map(self):
+        variables = probleme()
+        form = StandardForm(variables)
+        self.assertEqual(variables, probleme())
+        # La ligne 2 (>= de second membre négatif) devient une contrainte <=
+        self.assertEqual(form.senses, ["<=", "<=", "="])
+        self.assertEqual(form.row_sign.tolist(), [1.0, -1.0, 1.0])
+        self.assertEqual(form.column_names, ["x1", "x2", "s1", "s2", "a3"])
+        self.assertEqual(form.columns(SLACK).tolist(), [3, 4])
+        self.assertEqual(form.columns(ARTIFICIAL).tolist(), [5])
+        self.assertEqual(form.basis.tolist(), [3, 4, 5])
+        np.testing.assert_allclose(form.tableau, [[4, 1, 0, 1, 0, 0],
+                                                  [12, 0, 2, 0, 1, 0],
+                                                  [18, 3, 2, 0, 0, 1],
+                                                  [0, -3, -5, 0, 0, 0]])
+
+    def test_forced_senses_without_normalization(self):
+        form = StandardForm(probleme(), senses="<=", normalize_rhs=False)
+        self.assertEqual(form.columns(SURPLUS, ARTIFICIAL).tolist(), [])
+        self.assertEqual(form.rhs.tolist(), [4, -12, 18])
+        self.assertEqual(form.as_variables()["equations"]["equation_2"], [-12, 0, -2, 0, 1, 0])
+
+    def test_solvers_leave_problem_untouched(self):
+        variables = probleme()
+        reference = copy.deepcopy(variables)
+        result = GrandMMethod(variables).solve()
+        self.assertEqual(variables, reference)
+        self.assertAlmostEqual(result.objective, 36.0)
+        # Prix duaux exprimés pour les lignes telles qu'elles sont écrites
+        b = np.array([eq[0] for eq in variables["equations"].values()])
+        self.assertAlmostEqual(float(np.dot(result.duals, b)), 36.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+import io
+import contextlib
+
+import numpy as np
+
+from tableau_engine import TableauEngine
+from tab_method import SimplexMethodTab
+from exemples import probleme_cours
+
+
+class TestTableauEngine(unittest.TestCase):
+
+    def test_pivot_rank_one_update(self):
+        engine = TableauEngine([[4.0, 2.0, 1.0], [6.0, 1.0, 3.0], [0.0, -3.0, -5.0]])
+        engine.pivot(0, 1)
+        np.testing.assert_allclose(engine.tableau[0], [2.0, 1.0, 0.5])
+        np.testing.assert_allclose(engine.tableau[1], [4.0, 0.0, 2.5])
+        np.testing.assert_allclose(engine.objective, [6.0, 0.0, -3.5])
+
+    def test_ratio_test_detects_unbounded_column(self):
+        engine = TableauEngine([[4.0, -1.0], [2.0, 0.0], [0.0, -1.0]])
+        self.assertEqual(engine.ratio_test(1), -1)
+
+    def test_simplex_tab_keeps_variables_dict_shape(self):
+        variables = probleme_cours()
+        solver = SimplexMethodTab(variables)
+        with contextlib.redirect_stdout(io.StringIO()):
+            solver.run()
+
+        # Le problème d'origine n'est pas modifié ; le tableau final garde la forme du dictionnaire
+        self.assertEqual(variables, probleme_cours())
+        final = solver.tableau_variables
+        self.assertAlmostEqual(final["tab_optimisation"][0], 36.0)
+        self.assertEqual(list(final["equations"].keys()), ["equation_1", "equation_2", "equation_3"])
+        self.assertTrue(all(isinstance(row, list) and len(row) == 6 for row in final["equations"].values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
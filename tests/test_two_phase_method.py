@@ -0,0 +1,78 @@
+import unittest
+import io
+import contextlib
+
+from two_phase_method import TwoPhaseMethod
+
+
+def resoudre(variables):
+    solver = TwoPhaseMethod(variables)
+    with contextlib.redirect_stdout(io.StringIO()):
+        solver.run()
+    return solver
+
+
+class TestTwoPhaseMethod(unittest.TestCase):
+
+    def test_equality_constraint(self):
+        variables = {
+            "tab_optimisation": [0, 3, 5],
+            "nombres_variables_base": 2,
+            "equations": {
+                "equation_1": [4, 1, 0],
+                "equation_2": [12, 0, 2],
+                "equation_3": [18, 3, 2],
+            },
+            "nb_equations": 3,
+            "constraints_info": ["<=", "<=", "="],
+        }
+        solver = resoudre(variables)
+        self.assertEqual(solver.status, "optimal")
+        final = solver.tableau_variables
+        self.assertAlmostEqual(final["tab_optimisation"][0], 36.0)
+        # Les colonnes artificielles ont été supprimées du tableau final
+        self.assertEqual(len(final["tab_optimisation"]), 1 + 2 + 2)
+        # Le problème d'origine n'est pas modifié
+        self.assertEqual(variables["tab_optimisation"], [0, 3, 5])
+        self.assertEqual(variables["equations"]["equation_3"], [18, 3, 2])
+
+    def test_large_costs_do_not_break_phase_one(self):
+        # Min 3000x1 + 2000x2, x1 + x2 >= 4, x1 >= 1 : le Grand M avec M = 1000 échoue ici
+        variables = {
+            "tab_optimisation": [0, -3000, -2000],
+            "nombres_variables_base": 2,
+            "equations": {"equation_1": [4, 1, 1], "equation_2": [1, 1, 0]},
+            "nb_equations": 2,
+            "constraints_info": [">=", ">="],
+        }
+        solver = resoudre(variables)
+        self.assertEqual(solver.status, "optimal")
+        self.assertAlmostEqual(solver.engine.objective[0], -9000.0)
+
+    def test_infeasible_problem(self):
+        variables = {
+            "tab_optimisation": [0, 1],
+            "nombres_variables_base": 1,
+            "equations": {"equation_1": [2, 1], "equation_2": [5, 1]},
+            "nb_equations": 2,
+            "constraints_info": ["<=", ">="],
+        }
+        self.assertEqual(resoudre(variables).status, "infeasible")
+
+    def test_redundant_equality_is_dropped(self):
+        variables = {
+            "tab_optimisation": [0, 1, 1],
+            "nombres_variables_base": 2,
+            "equations": {"equation_1": [2, 1, 1], "equation_2": [4, 2, 2]},
+            "nb_equations": 2,
+            "constraints_info": ["=", "="],
+        }
+        solver = resoudre(variables)
+        self.assertEqual(solver.status, "optimal")
+        self.assertAlmostEqual(solver.engine.objective[0], 2.0)
+        self.assertEqual(solver.tableau_variables["nb_equations"], 1)
+        self.assertEqual(variables["nb_equations"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
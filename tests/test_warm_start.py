@@ -0,0 +1,67 @@
+import unittest
+import copy
+
+from tab_method import SimplexMethodTab
+from grand_M_method import GrandMMethod
+from two_phase_method import TwoPhaseMethod
+from revised_method import RevisedSimplexMethod
+from dual_simplex_method import DualSimplexMethod
+from enhanced_variables import VariableManager
+from exemples import probleme_cours
+
+
+def probleme(capacity=18, last="<="):
+    return probleme_cours(("<=", "<=", last), capacity)
+
+
+class TestWarmStart(unittest.TestCase):
+
+    def test_previous_basis_skips_iterations(self):
+        for method in (SimplexMethodTab, GrandMMethod, TwoPhaseMethod, RevisedSimplexMethod, DualSimplexMethod):
+            with self.subTest(method=method.__name__):
+                first = method(probleme()).solve()
+                solver = method(probleme(capacity=19), warm_start=first)
+                result = solver.solve()
+                cold = method(probleme(capacity=19)).solve()
+                self.assertTrue(solver.warm_started)
+                self.assertEqual(result.iterations, 0)
+                self.assertGreater(cold.iterations, 0)
+                self.assertAlmostEqual(result.objective, cold.objective)
+
+    def test_two_phase_warm_start_skips_phase_one(self):
+        first = TwoPhaseMethod(probleme(last="=")).solve()
+        solver = TwoPhaseMethod(probleme(capacity=17, last="="), warm_start=first.basis)
+        result = solver.solve()
+        self.assertTrue(solver.warm_started)
+        self.assertAlmostEqual(result.objective, RevisedSimplexMethod(probleme(capacity=17, last="=")).solve().objective)
+
+    def test_infeasible_basis_falls_back_to_cold_start(self):
+        first = SimplexMethodTab(probleme()).solve()
+        # x2 = 6 n'est plus réalisable quand 2x2 <= 4 : on repart de la base d'écart
+        variables = probleme()
+        variables["equations"]["equation_2"][0] = 4
+        solver = SimplexMethodTab(variables, warm_start=first)
+        result = solver.solve()
+        self.assertFalse(solver.warm_started)
+        self.assertAlmostEqual(result.objective, 22.0)
+
+    def test_revised_reuses_factorization(self):
+        first = RevisedSimplexMethod(probleme()).solve()
+        self.assertIsNotNone(first.factorization)
+        self.assertNotIn("factorization", first.to_dict())
+        solver = RevisedSimplexMethod(probleme(capacity=20), warm_start=first)
+        result = solver.solve()
+        self.assertTrue(solver.warm_started)
+        self.assertAlmostEqual(result.objective, 38.0)
+
+    def test_history_keeps_basis(self):
+        manager = VariableManager()
+        index = manager.save_problem(probleme(), "Test")
+        self.assertIsNone(manager.get_basis(index))
+        result = TwoPhaseMethod(copy.deepcopy(manager.get_problem(index))).solve()
+        manager.set_basis(index, result.basis)
+        self.assertEqual(manager.get_basis(index), result.basis)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,311 @@
+from variables import display_simplex_tableau
+from tableau_engine import TableauEngine
+from solver_result import SolveResult, basis_columns, duals_from_basis
+from solver_events import IterationEvent, SolverEvents
+from pricing import make_pricing
+from degeneracy import DegeneracyGuard
+from solve_budget import STOPPED, SolveBudget
+from standard_form import StandardForm
+import numpy as np
+import time
+
+
+class TwoPhaseMethod:
+    """
+    Méthode des deux phases.
+    Phase 1 : maximisation de -(somme des artificielles) pour trouver une base réalisable.
+    Phase 2 : on remplace la ligne objectif dans le même tableau et on continue,
+    les colonnes artificielles étant supprimées dès qu'elles quittent la base.
+    """
+
+    def __init__(self, variables: dict, warm_start=None, max_iterations=None, time_limit=None,
+                 perturbation="auto", cancel=None):
+        self.variables = variables
+        # Base d'une résolution précédente (SolveResult ou liste de noms) pour un démarrage à chaud
+        self.warm_start = warm_start
+        self.warm_started = False
+        # Stagnation (perturbation puis Bland), pour chaque phase
+        self.guard = DegeneracyGuard(perturbation)
+        # Limites d'itérations / de temps et jeton d'annulation (CancellationToken)
+        self.budget = SolveBudget(max_iterations, time_limit, cancel)
+        self.n = variables["nombres_variables_base"]
+        self.iteration = 0
+        self.phase = 1
+        self.status = None
+        self.engine = None
+        self.column_names = []
+        # Forme standard (le dictionnaire `variables` n'est jamais modifié) et son tableau
+        # courant sous forme de dictionnaire, pour l'affichage
+        self.form = None
+        self.tableau_variables = None
+        self.first_artificial = None
+        self.tol = 1e-10
+        self.result = None
+        self.events = SolverEvents()
+        self.start = None
+
+    def subscribe(self, callback):
+        """Abonne `callback(IterationEvent)` aux itérations du solveur"""
+        return self.events.subscribe(callback)
+
+    @property
+    def basis(self):
+        """En-tête de base : colonne de la variable de base de chaque ligne"""
+        return self.engine.basis
+
+    def run(self):
+        """Exécute la méthode des deux phases"""
+        print(f"\n{'='*60}")
+        print("MÉTHODE DES DEUX PHASES")
+        print(f"{'='*60}")
+
+        self.solve(observer=self.print_iteration, on_phase=self.print_phase)
+        for note in self.guard.notes:
+            print(f"⚠️  {note}")
+        self.analyze_final_solution()
+
+    def solve(self, observer=None, on_phase=None) -> SolveResult:
+        """
+        Résout sans aucune entrée/sortie et renvoie un SolveResult.
+        `observer(solver, iteration, row, col)` est appelé après chaque pivot,
+        `on_phase(solver, phase)` au début de chaque phase.
+        """
+        start = self.start = time.perf_counter()
+        self.budget.begin(start)
+        self.build_phase_one()
+        if self.warm_start is not None:
+            # Une base précédente réalisable et sans artificielle rend la phase 1 inutile
+            self.warm_started = self.engine.warm_start(
+                basis_columns(self.warm_start, self.column_names), basic_limit=self.first_artificial)
+        setup_done = time.perf_counter()
+
+        if self.warm_started:
+            self.end_phase_one()
+        elif self.has_artificials():
+            if on_phase is not None:
+                on_phase(self, 1)
+            self.status = self.iterate(observer)
+            if self.status in STOPPED:
+                pass
+            elif self.engine.objective[0] < -1e-7:
+                self.status = "infeasible"
+            else:
+                self.end_phase_one()
+
+        if self.status != "infeasible" and self.status not in STOPPED:
+            self.start_phase_two()
+            if on_phase is not None:
+                on_phase(self, 2)
+            self.status = self.iterate(observer)
+        iterations_done = time.perf_counter()
+
+        self.engine.write_back(self.tableau_variables)
+        self.result = SolveResult(
+            method="Deux Phases",
+            status=self.status,
+            iterations=self.iteration,
+            basis=[self.column_names[col - 1] for col in self.basis],
+        )
+        if self.status == "optimal":
+            self.result.objective = float(self.engine.objective[0])
+            self.result.x = self.engine.primal_values(self.n).tolist()
+            self.result.duals = self.compute_duals()
+        elif self.status in STOPPED and self.phase == 2 and self.engine.primal_infeasibility() == 0.0:
+            # Dernier sommet visité de la phase 2 (réalisable pour le problème d'origine)
+            self.result.objective = float(self.engine.objective[0])
+            self.result.x = self.engine.primal_values(self.n).tolist()
+        self.result.timings = {
+            "setup": setup_done - start,
+            "iterations": iterations_done - setup_done,
+            "total": time.perf_counter() - start,
+        }
+        return self.result
+
+    def compute_duals(self):
+        """Prix duaux dans l'ordre des équations d'origine (0 pour les contraintes redondantes)"""
+        kept = np.array([r for r in range(len(self.row_sign)) if r not in self.redundant_rows], dtype=int)
+        costs = np.zeros(self.initial_matrix.shape[1])
+        costs[:self.n] = self.objective_coefficients[1:]
+        y = duals_from_basis(self.initial_matrix[kept], costs, self.basis - 1)
+        if y is None:
+            return None
+        duals = np.zeros(len(self.row_sign))
+        duals[kept] = y * self.row_sign[kept]
+        return duals.tolist()
+
+    def print_phase(self, solver, phase: int):
+        """Observateur d'affichage : en-tête de phase"""
+        if phase == 1:
+            print("\nTableau initial de la phase 1:")
+            self.engine.write_back(self.tableau_variables)
+            display_simplex_tableau(self.tableau_variables, 0)
+        print(f"\n{'='*20} PHASE {phase} {'='*20}")
+
+    def print_iteration(self, solver, iteration: int, row: int, col: int):
+        """Observateur d'affichage : reproduit la sortie console des autres méthodes"""
+        print(f"\n{'='*20} Itération {iteration} (phase {self.phase}) {'='*20}")
+        print(f"Colonne pivot : {col}")
+        print(f"Ligne pivot : {row}")
+        self.engine.write_back(self.tableau_variables)
+        display_simplex_tableau(self.tableau_variables, iteration)
+
+    def build_phase_one(self):
+        """Tableau de la phase 1 (forme standard commune) : écarts/surplus puis artificielles en fin de tableau"""
+        self.form = form = StandardForm(self.variables)
+        self.tableau_variables = form.as_variables()
+        m = form.m
+        # Le tableau remplace la ligne objectif pendant la phase 1 : on garde les vrais coûts
+        self.objective_coefficients = form.objective_coefficients
+        # Second membre négatif : la ligne a été multipliée par -1 et le sens inversé
+        self.row_sign = form.row_sign
+        self.redundant_rows = []
+        self.first_artificial = form.first_artificial
+        self.column_names = list(form.column_names)
+        # Matrice des contraintes sans artificielles (vue sur la forme), pour les prix duaux
+        self.initial_matrix = form.tableau[:m, 1:self.first_artificial]
+
+        # Max W = -somme(a) : coût +1 dans la ligne objectif, puis on la rend propre
+        tableau = form.tableau.copy()
+        tableau[m] = 0.0
+        tableau[m, self.first_artificial:] = 1.0
+        artificial_rows = form.basis >= self.first_artificial
+        if artificial_rows.any():
+            tableau[m] -= tableau[:m][artificial_rows].sum(axis=0)
+        self.engine = TableauEngine(tableau, self.tol, form.basis)
+
+    def has_artificials(self) -> bool:
+        return self.engine.tableau.shape[1] > self.first_artificial
+
+    def iterate(self, observer=None) -> str:
+        """Itérations du simplexe sur la ligne objectif courante"""
+        pricing = make_pricing()
+        self.guard.reset(self.engine)
+        status = "optimal"
+        while self.engine.can_iterate():
+            stop = self.budget.exhausted(self.iteration)
+            if stop:
+                status = stop
+                break
+            col = pricing.select(self.engine)
+            row = pricing.choose_row(self.engine, col)
+            if row == -1:
+                status = "unbounded"
+                break
+
+            self.iteration += 1
+            leaving = self.basis[row]
+            self.engine.pivot(row, col)
+            pricing = self.guard.after_pivot(self.engine, pricing)
+            if self.events:
+                self.events.emit(IterationEvent(
+                    method="Deux Phases",
+                    iteration=self.iteration,
+                    entering=self.column_names[col - 1],
+                    leaving=self.column_names[leaving - 1],
+                    objective=float(self.engine.objective[0]),
+                    # En phase 1, -W est exactement la somme des artificielles
+                    primal_infeasibility=-float(self.engine.objective[0]) if self.phase == 1 else 0.0,
+                    dual_infeasibility=self.engine.dual_infeasibility(),
+                    elapsed=time.perf_counter() - self.start,
+                    phase=self.phase,
+                ))
+            if self.phase == 1 and leaving >= self.first_artificial:
+                # Une artificielle hors base ne peut plus être utile
+                self.drop_column(leaving)
+
+            if observer is not None:
+                observer(self, self.iteration, row, col)
+        # Un optimum de phase 1 ou 2 est dual-réalisable : le simplexe dual retire la perturbation
+        if not self.guard.finish(self.engine, optimal=status == "optimal"):
+            status = "infeasible"
+        self.iteration += self.guard.cleanup_pivots
+        self.guard.cleanup_pivots = 0
+        return status
+
+    def drop_column(self, col: int):
+        """Supprime une colonne (l'en-tête de base est renuméroté par le moteur)"""
+        self.engine.drop_columns([col])
+        del self.column_names[col - 1]
+
+    def end_phase_one(self):
+        """Sort les artificielles restées en base (à zéro) puis supprime leurs colonnes"""
+        redundant = []
+        for row, col in enumerate(self.basis.tolist()):
+            if col < self.first_artificial:
+                continue
+            candidates = np.flatnonzero(np.abs(self.engine.tableau[row, 1:self.first_artificial]) > self.tol)
+            if len(candidates) == 0:
+                redundant.append(row)  # Contrainte combinaison des autres
+                continue
+            entering = int(candidates[0]) + 1
+            self.engine.pivot(row, entering)
+
+        if redundant:
+            self.engine.drop_rows(redundant)
+            self.redundant_rows = redundant
+            equations = self.tableau_variables["equations"]
+            kept = [key for r, key in enumerate(equations) if r not in redundant]
+            self.tableau_variables["equations"] = {key: equations[key] for key in kept}
+            self.tableau_variables["nb_equations"] = len(kept)
+
+        artificial_cols = list(range(self.first_artificial, self.engine.tableau.shape[1]))
+        self.engine.drop_columns(artificial_cols)
+        del self.column_names[self.first_artificial - 1:]
+
+    def start_phase_two(self):
+        """Remplace la ligne objectif par la vraie fonction objectif, exprimée dans la base courante"""
+        self.phase = 2
+        objective = np.zeros(self.engine.tableau.shape[1])
+        objective[0] = self.objective_coefficients[0]
+        objective[1:self.n + 1] = [-x for x in self.objective_coefficients[1:]]
+        objective -= objective[self.basis] @ self.engine.tableau[:self.engine.m]
+        self.engine.tableau[self.engine.m] = objective
+
+    def analyze_final_solution(self):
+        """Analyse la solution finale à partir de l'en-tête de base"""
+        print(f"\n{'='*60}")
+        print("ANALYSE DE LA SOLUTION FINALE")
+        print(f"{'='*60}")
+
+        if self.status == "infeasible":
+            print("\n❌ PROBLÈME NON RÉALISABLE")
+            print("La phase 1 se termine avec des variables artificielles non nulles.")
+            return
+        if self.status == "unbounded":
+            print("Solution illimitée!")
+            return
+        if self.status in STOPPED:
+            print(f"⏱️  Arrêt avant l'optimum : {self.budget.reason}")
+            return
+
+        print("\n✅ SOLUTION OPTIMALE TROUVÉE")
+        z_opt = self.engine.objective[0]
+        print(f"Valeur optimale: Z = {z_opt:.6f}")
+
+        var_values = self.result.x
+
+        print("\nVariables de décision:")
+        for i, val in enumerate(var_values):
+            print(f"  x{i+1} = {val:.6f}")
+
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    # Max Z = 3x1 + 5x2
+    # x1 ≤ 4
+    # 2x2 ≤ 12
+    # 3x1 + 2x2 = 18
+    variables_deux_phases = {
+        "tab_optimisation": [0, 3, 5],
+        "nombres_variables_base": 2,
+        "equations": {
+            "equation_1": [4, 1, 0],
+            "equation_2": [12, 0, 2],
+            "equation_3": [18, 3, 2],
+        },
+        "nb_equations": 3,
+        "constraints_info": ["<=", "<=", "="]
+    }
+
+    deux_phases = TwoPhaseMethod(variables_deux_phases)
+    deux_phases.run()